@@ -40,7 +40,7 @@ func _update_display() -> void:
 	var level := GameManager.get_artist_level(_tier)
 
 	name_label.text = data["name"]
-	icon_rect.texture = load(data["sprite"])
+	icon_rect.texture = SpriteAtlas.get_texture(data["sprite"])
 
 	if not unlocked:
 		lock_overlay.visible = true
@@ -63,7 +63,7 @@ func _make_game_card(title: String, desc: String, icon_path: String, on_press: C
 	icon.custom_minimum_size = Vector2(80, 80)
 	icon.expand_mode = 1
 	icon.stretch_mode = 5
-	var tex = load(icon_path)
+	var tex = SpriteAtlas.get_texture(icon_path)
 	if tex:
 		icon.texture = tex
 	hbox.add_child(icon)
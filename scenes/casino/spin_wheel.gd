@@ -4,6 +4,10 @@ extends Control
 
 signal spin_complete(prize: Dictionary)
 
+## Wheel face pre-rendered by tools/bake_spin_wheel.py (base, tints, icons, labels).
+const BAKED_WHEEL_TEXTURE := "res://assets/baked/spin_wheel.png"
+const BAKED_WHEEL_META := "res://assets/baked/spin_wheel.json"
+
 @onready var wheel_container: Control = %WheelContainer
 @onready var spin_button: Button = %SpinButton
 @onready var result_label: Label = %ResultLabel
@@ -46,8 +50,39 @@ func _build_wheel() -> void:
 	wheel_container.clip_contents = true
 	wheel_container.pivot_offset = center  # Rotate around center
 
+	if not _add_baked_wheel(ws):
+		_add_wheel_nodes(ws, center)
+
+	# Pointer arrow — NOT a child of wheel_container so it doesn't spin
+	var pointer_tex = SpriteAtlas.get_texture("res://assets/sprites/casino/spin_wheel_pointer.png")
+	if pointer_tex:
+		# Position above the wheel center-top
+		var ptr := _make_tex_rect(pointer_tex, wheel_container.position.x + center.x - 16, wheel_container.position.y - 24, 32, 32)
+		add_child(ptr)
+
+## One TextureRect for the whole face, if a bake matching PRIZES exists.
+func _add_baked_wheel(ws: Vector2) -> bool:
+	if not FileAccess.file_exists(BAKED_WHEEL_META):
+		return false
+	var meta = JSON.parse_string(FileAccess.get_file_as_string(BAKED_WHEEL_META))
+	if not meta is Dictionary:
+		return false
+	var segments: Array = meta.get("segments", [])
+	if segments.size() != SpinWheelData.PRIZES.size():
+		return false
+	for i in segments.size():
+		if segments[i].get("label") != SpinWheelData.PRIZES[i]["label"]:
+			return false  # Prize table changed since the last bake
+	var tex = load(BAKED_WHEEL_TEXTURE)
+	if tex == null:
+		return false
+	wheel_container.add_child(_make_tex_rect(tex, 0, 0, ws.x, ws.y))
+	return true
+
+## Fallback: base image plus an icon and label node per segment.
+func _add_wheel_nodes(ws: Vector2, center: Vector2) -> void:
 	# Wheel base image — fills the entire container
-	var base_tex = load("res://assets/sprites/casino/spin_wheel_base.png")
+	var base_tex = SpriteAtlas.get_texture("res://assets/sprites/casino/spin_wheel_base.png")
 	if base_tex:
 		var base := _make_tex_rect(base_tex, 0, 0, ws.x, ws.y)
 		wheel_container.add_child(base)
@@ -65,7 +100,7 @@ func _build_wheel() -> void:
 		# Prize icon
 		var sprite_path: String = SpinWheelData.PRIZES[i].get("sprite", "")
 		if sprite_path != "":
-			var tex = load(sprite_path)
+			var tex = SpriteAtlas.get_texture(sprite_path)
 			if tex:
 				var icon := _make_tex_rect(tex, ix, iy, icon_sz, icon_sz)
 				wheel_container.add_child(icon)
@@ -84,13 +119,6 @@ func _build_wheel() -> void:
 		lbl.mouse_filter = Control.MOUSE_FILTER_IGNORE
 		wheel_container.add_child(lbl)
 
-	# Pointer arrow — NOT a child of wheel_container so it doesn't spin
-	var pointer_tex = load("res://assets/sprites/casino/spin_wheel_pointer.png")
-	if pointer_tex:
-		# Position above the wheel center-top
-		var ptr := _make_tex_rect(pointer_tex, wheel_container.position.x + center.x - 16, wheel_container.position.y - 24, 32, 32)
-		add_child(ptr)
-
 func can_spin() -> bool:
 	var now := Time.get_unix_time_from_system()
 	return (now - GameManager.last_spin_time) >= GameConfig.SPIN_WHEEL_COOLDOWN
@@ -19,7 +19,7 @@ func _ready() -> void:
 	add_to_group("cd_pickup")
 	# Apply tier visuals
 	var tier_data: Dictionary = CdData.TIERS[_tier]
-	sprite.texture = load(tier_data["sprite"])
+	sprite.texture = SpriteAtlas.get_texture(tier_data["sprite"])
 	label.text = GameConfig.format_number(tier_data["value"])
 	# Scale based on tier
 	var base_scale := 0.8 + (_tier * 0.1)
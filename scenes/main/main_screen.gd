@@ -63,23 +63,8 @@ func _spawn_cd() -> void:
 	tap_area.add_child(cd)
 
 func _pick_weighted_tier() -> int:
-	var marketing_bonus := GameManager.get_marketing_bonus()
-	# Marketing shifts weights: reduce common, increase rare
-	var roll := randf() * CdData.total_drop_weight()
-	var cumulative := 0.0
-	var last_tier := CdData.CdTier.DEMO
-	for tier_id in CdData.TIERS:
-		var weight: float = CdData.TIERS[tier_id]["drop_weight"]
-		# Marketing bonus reduces weight of low tiers, increases high tiers
-		if tier_id <= CdData.CdTier.EP:
-			weight *= max(0.1, 1.0 - marketing_bonus)
-		else:
-			weight *= (1.0 + marketing_bonus)
-		cumulative += weight
-		last_tier = tier_id
-		if roll <= cumulative:
-			return tier_id
-	return last_tier
+	# Marketing shifts weights: reduce common, increase rare (tables baked per level)
+	return CdData.pick_tier_for_marketing(GameManager.get_upgrade_level(UpgradeData.UpgradeId.MARKETING_REACH))
 
 func _on_cd_collected(tier: int, pos: Vector2) -> void:
 	var value: float = CdData.TIERS[tier]["value"]
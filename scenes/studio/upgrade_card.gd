@@ -30,7 +30,7 @@ func _update_display() -> void:
 	desc_label.text = data["description"]
 	var sprite_path: String = data.get("sprite", "")
 	if sprite_path != "":
-		icon_rect.texture = load(sprite_path)
+		icon_rect.texture = SpriteAtlas.get_texture(sprite_path)
 
 	if level >= max_level:
 		level_label.text = "MAX (Lv. %d)" % level
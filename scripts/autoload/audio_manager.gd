@@ -6,7 +6,7 @@ var _bgm_player: AudioStreamPlayer
 var _sfx_players: Array[AudioStreamPlayer] = []
 const MAX_SFX_PLAYERS := 4
 
-## Preloaded SFX
+## Loaded SFX streams, by key
 var _sfx_cache: Dictionary = {}
 
 ## Cooldown tracking — prevents the same SFX from stacking
@@ -27,6 +27,10 @@ const SFX: Dictionary = {
 	"gacha_reveal": "res://assets/audio/sfx/gacha_reveal.wav",
 }
 
+## Loop points written by tools/process_audio.py, keyed by WAV path
+const AUDIO_META_PATH := "res://assets/audio/audio_meta.json"
+var _audio_meta: Dictionary = {}
+
 var _current_bgm_key: String = ""
 
 func _ready() -> void:
@@ -43,11 +47,10 @@ func _ready() -> void:
 		add_child(player)
 		_sfx_players.append(player)
 
-	# Preload all SFX into cache
-	for key in SFX:
-		var stream = load(SFX[key])
-		if stream:
-			_sfx_cache[key] = stream
+	_audio_meta = _load_audio_meta()
+
+	# Preload the SFX available at boot; the rest arrive with their resource pack
+	warm_sfx()
 
 	# Start main theme after a short delay (let scene load)
 	call_deferred("play_bgm", "main")
@@ -58,13 +61,13 @@ func play_bgm(track_key: String) -> void:
 		return
 	if track_key not in BGM_TRACKS:
 		return
-	var stream = load(BGM_TRACKS[track_key])
+	var stream = _load_stream(BGM_TRACKS[track_key])
 	if not stream:
 		return
 	_bgm_player.stream = stream
 	_bgm_player.play()
 	_current_bgm_key = track_key
-	# Loop by reconnecting finished signal
+	# Streams without loop metadata loop by replaying on finished
 	if not _bgm_player.finished.is_connected(_on_bgm_finished):
 		_bgm_player.finished.connect(_on_bgm_finished)
 
@@ -72,15 +75,54 @@ func _on_bgm_finished() -> void:
 	if _bgm_player.stream:
 		_bgm_player.play()
 
+## Load an audio path, preferring a processed .ogg sibling when one exists.
+## Looping tracks get their loop offset from the processing metadata; WAVs
+## carry it themselves in their smpl chunk.
+func _load_stream(path: String) -> AudioStream:
+	var meta: Dictionary = _audio_meta.get(path, {})
+	var ogg_path := path.get_basename() + ".ogg"
+	if ResourceLoader.exists(ogg_path):
+		var ogg := load(ogg_path) as AudioStreamOggVorbis
+		if ogg:
+			if meta.has("loop_offset"):
+				ogg.loop = true
+				ogg.loop_offset = meta["loop_offset"]
+			return ogg
+	if not ResourceLoader.exists(path):
+		return null
+	return load(path)
+
+func _load_audio_meta() -> Dictionary:
+	if not FileAccess.file_exists(AUDIO_META_PATH):
+		return {}
+	var parsed = JSON.parse_string(FileAccess.get_file_as_string(AUDIO_META_PATH))
+	return parsed if parsed is Dictionary else {}
+
 ## Stop background music.
 func stop_bgm() -> void:
 	_bgm_player.stop()
 	_current_bgm_key = ""
 
+## Cache every SFX that can be loaded now. Sounds in a resource pack that
+## SceneRouter has not mounted yet are skipped until the next call.
+func warm_sfx() -> void:
+	for key in SFX:
+		var path: String = SFX[key]
+		if key in _sfx_cache or not (ResourceLoader.exists(path) or ResourceLoader.exists(path.get_basename() + ".ogg")):
+			continue
+		var stream = _load_stream(path)
+		if stream:
+			_sfx_cache[key] = stream
+
 ## Play a sound effect by key. Prevents rapid stacking of the same sound.
 func play_sfx(sfx_key: String) -> void:
 	if sfx_key not in _sfx_cache:
-		return
+		if sfx_key not in SFX:
+			return
+		var stream = _load_stream(SFX[sfx_key])
+		if not stream:
+			return
+		_sfx_cache[sfx_key] = stream
 	# Cooldown: skip if same SFX played too recently
 	var now := Time.get_ticks_msec() / 1000.0
 	if sfx_key in _sfx_last_played:
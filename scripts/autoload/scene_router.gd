@@ -19,9 +19,81 @@ const SCREEN_BGM: Dictionary = {
 	"gacha": "casino",
 }
 
+## Resource packs split off the web boot pack by tools/boot_pack_analyzer.py:
+## {"packs": {name: {"url", "probe"}}, "screens": {screen: [pack names]}}
+const PACK_INDEX_PATH := "res://assets/packs.json"
+const PACK_CACHE_DIR := "user://packs"
+var _packs: Dictionary = {}
+var _screen_packs: Dictionary = {}
+
+## Pack name -> true once mounted, false if the last fetch failed
+var _mounted: Dictionary = {}
+var _fetching: Dictionary = {}
+
+signal pack_finished(pack_name: String)
+
+func _ready() -> void:
+	var parsed = null
+	if FileAccess.file_exists(PACK_INDEX_PATH):
+		parsed = JSON.parse_string(FileAccess.get_file_as_string(PACK_INDEX_PATH))
+	if parsed is Dictionary:
+		_packs = parsed.get("packs", {})
+		_screen_packs = parsed.get("screens", {})
+	call_deferred("_prefetch_packs")
+
 func go_to(screen_name: String) -> void:
 	var path: String = SCENES.get(screen_name, SCENES["main"])
+	await ensure_packs(screen_name)
 	# Switch BGM based on destination screen
 	var bgm_key: String = SCREEN_BGM.get(screen_name, "main")
 	AudioManager.play_bgm(bgm_key)
 	get_tree().change_scene_to_file(path)
+
+## Mount every pack a screen needs, fetching the ones not downloaded yet.
+func ensure_packs(screen_name: String) -> void:
+	for pack_name in _screen_packs.get(screen_name, []):
+		await _mount(pack_name)
+
+## Fetch the remaining packs one at a time once the first screen is up.
+func _prefetch_packs() -> void:
+	await get_tree().process_frame
+	for pack_name in _packs:
+		await _mount(pack_name)
+
+func _mount(pack_name: String) -> bool:
+	if _mounted.get(pack_name, false):
+		return true
+	var pack: Dictionary = _packs[pack_name]
+	# Builds that were not split (desktop, Android, the editor) already have every file
+	if ResourceLoader.exists(pack["probe"]) or FileAccess.file_exists(pack["probe"]):
+		_mounted[pack_name] = true
+		return true
+	if pack_name in _fetching:
+		while _fetching.has(pack_name):
+			await pack_finished
+		return _mounted.get(pack_name, false)
+	if not OS.has_feature("web"):
+		push_warning("Resource pack %s is missing and can only be fetched on the web" % pack_name)
+		return false
+
+	_fetching[pack_name] = true
+	DirAccess.make_dir_recursive_absolute(PACK_CACHE_DIR)
+	var file := "%s/%s.pck" % [PACK_CACHE_DIR, pack_name]
+	var request := HTTPRequest.new()
+	request.download_file = file
+	add_child(request)
+	var url: String = JavaScriptBridge.eval("new URL('%s', document.baseURI).href" % pack["url"])
+	var ok := request.request(url) == OK
+	if ok:
+		var response: Array = await request.request_completed
+		ok = response[0] == HTTPRequest.RESULT_SUCCESS and response[1] == 200
+	request.queue_free()
+	ok = ok and ProjectSettings.load_resource_pack(file)
+	if not ok:
+		push_warning("Could not fetch resource pack %s" % pack_name)
+	else:
+		AudioManager.warm_sfx()
+	_mounted[pack_name] = ok
+	_fetching.erase(pack_name)
+	pack_finished.emit(pack_name)
+	return ok
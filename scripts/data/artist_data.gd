@@ -94,16 +94,25 @@ const LEVEL_PRODUCTION_BOOST := 0.10
 
 ## Calculate cost to buy the Nth artist of a tier.
 static func purchase_cost(tier: int, owned_count: int) -> float:
+	var baked: Array = BakedTables.ARTIST_PURCHASE_COST[tier]
+	if owned_count < baked.size():
+		return baked[owned_count]
 	var base: float = TIERS[tier]["base_cost"]
 	return base * pow(COST_GROWTH_RATE, owned_count)
 
 ## Calculate cost to upgrade an artist to the next level.
 static func upgrade_cost(tier: int, current_level: int) -> float:
+	var baked: Array = BakedTables.ARTIST_LEVEL_COST[tier]
+	if current_level < baked.size():
+		return baked[current_level]
 	var base: float = TIERS[tier]["base_cost"]
 	return base * pow(LEVEL_COST_GROWTH, current_level) * 0.5
 
 ## Calculate production for an artist at a given level.
 static func production_at_level(tier: int, level: int) -> float:
+	var baked: Array = BakedTables.ARTIST_PRODUCTION[tier]
+	if level < baked.size():
+		return baked[level]
 	var base: float = TIERS[tier]["base_production"]
 	var level_boost := 1.0 + (level * LEVEL_PRODUCTION_BOOST)
 	var milestone_mult := 1.0
@@ -0,0 +1,476 @@
+class_name BakedTables
+extends RefCounted
+
+## GENERATED by tools/bake_data_tables.py from scripts/data and
+## scripts/systems/gambling. Do not edit: change the source table and rebake.
+
+## UpgradeData.cost_at_level(): {upgrade_id: [cost at level 0 .. max_level - 1]}
+const UPGRADE_COST: Dictionary = {
+	0: [
+		100.0, 150.0, 225.0, 337.5, 506.25, 759.375, 1139.0625, 1708.59375,
+		2562.890625, 3844.3359375, 5766.50390625, 8649.755859375, 12974.6337890625, 19461.95068359375, 29192.926025390625, 43789.38903808594,
+		65684.0835571289, 98526.12533569336, 147789.18800354004, 221683.78200531006, 332525.6730079651, 498788.50951194763, 748182.7642679214, 1122274.1464018822,
+		1683411.2196028233, 2525116.829404235, 3787675.2441063523, 5681512.8661595285, 8522269.299239293, 12783403.94885894, 19175105.92328841, 28762658.884932615,
+		43143988.32739892, 64715982.49109838, 97073973.73664758, 145610960.60497135, 218416440.90745705, 327624661.36118555, 491436992.04177827, 737155488.0626675,
+		1105733232.0940013, 1658599848.141002, 2487899772.211503, 3731849658.3172536, 5597774487.475881, 8396661731.213821, 12594992596.820732, 18892488895.2311,
+		28338733342.84665, 42508100014.26997,
+	],
+	1: [
+		200.0, 300.0, 450.0, 675.0, 1012.5, 1518.75, 2278.125, 3417.1875,
+		5125.78125, 7688.671875, 11533.0078125, 17299.51171875, 25949.267578125, 38923.9013671875, 58385.85205078125, 87578.77807617188,
+		131368.1671142578, 197052.25067138672, 295578.3760070801, 443367.5640106201, 665051.3460159302, 997577.0190238953, 1496365.528535843, 2244548.2928037643,
+		3366822.4392056465, 5050233.65880847, 7575350.488212705, 11363025.732319057, 17044538.598478585, 25566807.89771788, 38350211.84657682, 57525317.76986523,
+		86287976.65479784, 129431964.98219676, 194147947.47329515, 291221921.2099427, 436832881.8149141, 655249322.7223711, 982873984.0835565, 1474310976.125335,
+		2211466464.1880026, 3317199696.282004, 4975799544.423006, 7463699316.634507, 11195548974.951761, 16793323462.427643, 25189985193.641464, 37784977790.4622,
+		56677466685.6933, 85016200028.53995,
+	],
+}
+
+## ArtistData.purchase_cost(): {tier: [cost with 0 .. 99 owned]}
+const ARTIST_PURCHASE_COST: Dictionary = {
+	1: [
+		50.0, 57.49999999999999, 66.12499999999999, 76.04374999999999, 87.45031249999997, 100.56785937499997, 115.65303828124995, 133.00099402343744,
+		152.95114312695304, 175.893814595996, 202.27788678539534, 232.61956980320463, 267.5125052736853, 307.6393810647381, 353.7852882244488, 406.8530814581161,
+		467.8810436768334, 538.0632002283585, 618.7726802626121, 711.5885823020038, 818.3268696473044, 941.0759000943999, 1082.2372851085597, 1244.5728778748437,
+		1431.2588095560702, 1645.9476309894808, 1892.8397756379027, 2176.7657419835878, 2503.280603281126, 2878.7726937732946, 3310.5885978392885, 3807.176887515181,
+		4378.253420642458, 5034.991433738826, 5790.24014879965, 6658.776171119596, 7657.592596787536, 8806.231486305665, 10127.166209251514, 11646.24114063924,
+		13393.177311735128, 15402.153908495393, 17712.476994769702, 20369.348543985154, 23424.750825582927, 26938.463449420364, 30979.232966833417, 35626.117911858426,
+		40970.03559863719, 47115.54093843276, 54182.872079197674, 62310.302891077314, 71656.84832473891, 82405.37557344974, 94766.1819094672, 108981.10919588726,
+		125328.27557527035, 144127.51691156087, 165746.644448295, 190608.64111553924, 219199.9372828701, 252079.9278753006, 289891.9170565957, 333375.704615085,
+		383382.06030734774, 440889.36935344985, 507022.77475646726, 583076.1909699372, 670537.6196154279, 771118.262557742, 886786.0019414033, 1019803.9022326136,
+		1172774.4875675056, 1348690.6607026313, 1550994.2598080258, 1783643.3987792297, 2051189.908596114, 2358868.3948855307, 2712698.6541183605, 3119603.452236114,
+		3587543.970071531, 4125675.56558226, 4744526.900419598, 5456205.935482538, 6274636.825804918, 7215832.349675655, 8298207.202127004, 9542938.282446053,
+		10974379.024812961, 12620535.878534904, 14513616.260315137, 16690658.699362408, 19194257.504266765, 22073396.12990678, 25384405.549392793, 29192066.38180171,
+		33570876.33907197, 38606507.78993276, 44397483.95842267, 51057106.552186064,
+	],
+	2: [
+		500.0, 575.0, 661.2499999999999, 760.4374999999999, 874.5031249999997, 1005.6785937499997, 1156.5303828124995, 1330.0099402343744,
+		1529.5114312695305, 1758.9381459599597, 2022.7788678539534, 2326.195698032046, 2675.125052736853, 3076.3938106473806, 3537.852882244488, 4068.530814581161,
+		4678.810436768334, 5380.632002283584, 6187.726802626121, 7115.8858230200385, 8183.268696473045, 9410.759000944, 10822.372851085598, 12445.728778748437,
+		14312.588095560703, 16459.476309894806, 18928.39775637903, 21767.65741983588, 25032.80603281126, 28787.726937732943, 33105.885978392886, 38071.768875151814,
+		43782.53420642458, 50349.91433738826, 57902.401487996496, 66587.76171119597, 76575.92596787536, 88062.31486305666, 101271.66209251514, 116462.4114063924,
+		133931.77311735126, 154021.53908495393, 177124.76994769703, 203693.48543985153, 234247.50825582928, 269384.6344942036, 309792.32966833416, 356261.17911858426,
+		409700.35598637187, 471155.4093843276, 541828.7207919767, 623103.0289107731, 716568.4832473891, 824053.7557344973, 947661.819094672, 1089811.0919588725,
+		1253282.7557527034, 1441275.1691156088, 1657466.44448295, 1906086.4111553924, 2191999.372828701, 2520799.278753006, 2898919.1705659567, 3333757.0461508497,
+		3833820.6030734773, 4408893.693534498, 5070227.7475646725, 5830761.909699373, 6705376.196154279, 7711182.625577419, 8867860.019414032, 10198039.022326136,
+		11727744.875675056, 13486906.607026313, 15509942.598080259, 17836433.9877923, 20511899.08596114, 23588683.948855307, 27126986.541183602, 31196034.52236114,
+		35875439.70071531, 41256755.6558226, 47445269.00419599, 54562059.354825385, 62746368.25804918, 72158323.49675655, 82982072.02127004, 95429382.82446052,
+		109743790.2481296, 126205358.78534903, 145136162.60315138, 166906586.9936241, 191942575.04266766, 220733961.2990678, 253844055.49392793, 291920663.8180171,
+		335708763.39071965, 386065077.8993276, 443974839.58422667, 510571065.52186066,
+	],
+	3: [
+		5000.0, 5750.0, 6612.499999999999, 7604.374999999999, 8745.031249999996, 10056.785937499997, 11565.303828124996, 13300.099402343743,
+		15295.114312695303, 17589.381459599597, 20227.788678539535, 23261.95698032046, 26751.25052736853, 30763.938106473808, 35378.528822444874, 40685.30814581161,
+		46788.104367683336, 53806.32002283584, 61877.268026261205, 71158.85823020038, 81832.68696473044, 94107.59000944, 108223.72851085599, 124457.28778748437,
+		143125.88095560702, 164594.76309894808, 189283.97756379028, 217676.57419835878, 250328.0603281126, 287877.26937732944, 331058.85978392884, 380717.6887515181,
+		437825.3420642458, 503499.14337388263, 579024.014879965, 665877.6171119596, 765759.2596787537, 880623.1486305665, 1012716.6209251514, 1164624.114063924,
+		1339317.7311735128, 1540215.3908495393, 1771247.6994769701, 2036934.8543985155, 2342475.082558293, 2693846.344942036, 3097923.2966833417, 3562611.791185843,
+		4097003.5598637187, 4711554.093843276, 5418287.207919767, 6231030.289107731, 7165684.832473891, 8240537.557344974, 9476618.190946719, 10898110.919588726,
+		12532827.557527034, 14412751.691156087, 16574664.4448295, 19060864.111553922, 21919993.728287008, 25207992.78753006, 28989191.70565957, 33337570.461508498,
+		38338206.03073477, 44088936.93534498, 50702277.47564673, 58307619.09699373, 67053761.961542785, 77111826.2557742, 88678600.19414033, 101980390.22326137,
+		117277448.75675057, 134869066.07026312, 155099425.9808026, 178364339.87792298, 205118990.8596114, 235886839.48855308, 271269865.411836, 311960345.2236114,
+		358754397.0071531, 412567556.558226, 474452690.0419599, 545620593.5482538, 627463682.5804918, 721583234.9675655, 829820720.2127004, 954293828.2446053,
+		1097437902.481296, 1262053587.8534904, 1451361626.0315137, 1669065869.9362407, 1919425750.4266765, 2207339612.990678, 2538440554.9392796, 2919206638.180171,
+		3357087633.9071965, 3860650778.9932756, 4439748395.842267, 5105710655.218607,
+	],
+	4: [
+		50000.0, 57499.99999999999, 66124.99999999999, 76043.74999999999, 87450.31249999997, 100567.85937499997, 115653.03828124996, 133000.99402343744,
+		152951.14312695304, 175893.81459599597, 202277.88678539533, 232619.56980320462, 267512.5052736853, 307639.3810647381, 353785.28822444874, 406853.08145811607,
+		467881.0436768334, 538063.2002283584, 618772.6802626121, 711588.5823020039, 818326.8696473044, 941075.9000943999, 1082237.2851085598, 1244572.8778748438,
+		1431258.8095560702, 1645947.6309894808, 1892839.7756379028, 2176765.741983588, 2503280.603281126, 2878772.6937732943, 3310588.5978392884, 3807176.887515181,
+		4378253.420642458, 5034991.433738827, 5790240.14879965, 6658776.171119597, 7657592.5967875365, 8806231.486305665, 10127166.209251514, 11646241.14063924,
+		13393177.311735127, 15402153.908495393, 17712476.994769704, 20369348.543985154, 23424750.82558293, 26938463.449420363, 30979232.966833416, 35626117.911858425,
+		40970035.598637186, 47115540.93843276, 54182872.07919767, 62310302.89107731, 71656848.3247389, 82405375.57344973, 94766181.90946719, 108981109.19588725,
+		125328275.57527034, 144127516.9115609, 165746644.448295, 190608641.11553925, 219199937.28287008, 252079927.87530062, 289891917.0565957, 333375704.615085,
+		383382060.3073477, 440889369.3534498, 507022774.7564672, 583076190.9699373, 670537619.6154279, 771118262.557742, 886786001.9414033, 1019803902.2326137,
+		1172774487.5675056, 1348690660.7026312, 1550994259.8080258, 1783643398.7792296, 2051189908.596114, 2358868394.885531, 2712698654.1183605, 3119603452.236114,
+		3587543970.071531, 4125675565.5822597, 4744526900.419599, 5456205935.482538, 6274636825.804918, 7215832349.675655, 8298207202.127004, 9542938282.446053,
+		10974379024.81296, 12620535878.534903, 14513616260.315138, 16690658699.362408, 19194257504.266766, 22073396129.90678, 25384405549.392796, 29192066381.801712,
+		33570876339.071964, 38606507789.932755, 44397483958.42267, 51057106552.186066,
+	],
+	5: [
+		500000.0, 575000.0, 661249.9999999999, 760437.4999999999, 874503.1249999998, 1005678.5937499997, 1156530.3828124995, 1330009.9402343743,
+		1529511.4312695304, 1758938.1459599598, 2022778.8678539533, 2326195.698032046, 2675125.0527368532, 3076393.8106473805, 3537852.8822444878, 4068530.814581161,
+		4678810.436768333, 5380632.002283584, 6187726.802626121, 7115885.823020038, 8183268.696473044, 9410759.000944, 10822372.851085598, 12445728.778748438,
+		14312588.095560702, 16459476.309894808, 18928397.756379027, 21767657.419835877, 25032806.032811258, 28787726.937732946, 33105885.978392884, 38071768.87515181,
+		43782534.20642458, 50349914.33738826, 57902401.487996496, 66587761.71119597, 76575925.96787536, 88062314.86305666, 101271662.09251514, 116462411.40639241,
+		133931773.11735126, 154021539.08495393, 177124769.947697, 203693485.43985155, 234247508.25582927, 269384634.4942036, 309792329.6683342, 356261179.1185843,
+		409700355.9863719, 471155409.3843276, 541828720.7919767, 623103028.9107732, 716568483.2473891, 824053755.7344974, 947661819.094672, 1089811091.9588726,
+		1253282755.7527034, 1441275169.115609, 1657466444.48295, 1906086411.1553924, 2191999372.828701, 2520799278.753006, 2898919170.565957, 3333757046.15085,
+		3833820603.0734773, 4408893693.534498, 5070227747.564672, 5830761909.699373, 6705376196.154279, 7711182625.577419, 8867860019.414032, 10198039022.326136,
+		11727744875.675056, 13486906607.026312, 15509942598.08026, 17836433987.792297, 20511899085.96114, 23588683948.85531, 27126986541.183605, 31196034522.36114,
+		35875439700.71531, 41256755655.8226, 47445269004.195984, 54562059354.82538, 62746368258.04918, 72158323496.75655, 82982072021.27003, 95429382824.46053,
+		109743790248.12961, 126205358785.34903, 145136162603.15137, 166906586993.62408, 191942575042.66766, 220733961299.0678, 253844055493.92795, 291920663818.0171,
+		335708763390.71967, 386065077899.3276, 443974839584.2267, 510571065521.86066,
+	],
+	6: [
+		5000000.0, 5750000.0, 6612499.999999999, 7604374.999999999, 8745031.249999996, 10056785.937499996, 11565303.828124996, 13300099.402343744,
+		15295114.312695304, 17589381.4595996, 20227788.678539533, 23261956.98032046, 26751250.52736853, 30763938.106473807, 35378528.82244488, 40685308.14581161,
+		46788104.367683336, 53806320.02283584, 61877268.02626121, 71158858.23020038, 81832686.96473044, 94107590.00943999, 108223728.51085599, 124457287.78748438,
+		143125880.95560703, 164594763.09894806, 189283977.56379026, 217676574.19835877, 250328060.32811257, 287877269.37732947, 331058859.7839288, 380717688.75151813,
+		437825342.06424576, 503499143.37388265, 579024014.879965, 665877617.1119597, 765759259.6787536, 880623148.6305666, 1012716620.9251515, 1164624114.063924,
+		1339317731.1735127, 1540215390.8495393, 1771247699.4769702, 2036934854.3985155, 2342475082.558293, 2693846344.942036, 3097923296.6833415, 3562611791.1858425,
+		4097003559.8637185, 4711554093.843276, 5418287207.919767, 6231030289.107731, 7165684832.47389, 8240537557.344974, 9476618190.94672, 10898110919.588726,
+		12532827557.527035, 14412751691.156088, 16574664444.8295, 19060864111.553925, 21919993728.28701, 25207992787.53006, 28989191705.65957, 33337570461.5085,
+		38338206030.73477, 44088936935.34498, 50702277475.64672, 58307619096.99373, 67053761961.542786, 77111826255.7742, 88678600194.14032, 101980390223.26137,
+		117277448756.75056, 134869066070.26312, 155099425980.80258, 178364339877.92297, 205118990859.6114, 235886839488.5531, 271269865411.83603, 311960345223.6114,
+		358754397007.1531, 412567556558.226, 474452690041.95984, 545620593548.25385, 627463682580.4918, 721583234967.5656, 829820720212.7004, 954293828244.6052,
+		1097437902481.296, 1262053587853.4902, 1451361626031.5137, 1669065869936.2407, 1919425750426.6765, 2207339612990.678, 2538440554939.2793, 2919206638180.171,
+		3357087633907.197, 3860650778993.2754, 4439748395842.267, 5105710655218.606,
+	],
+	7: [
+		50000000.0, 57499999.99999999, 66124999.99999999, 76043749.99999999, 87450312.49999997, 100567859.37499997, 115653038.28124996, 133000994.02343744,
+		152951143.12695304, 175893814.595996, 202277886.78539532, 232619569.80320463, 267512505.2736853, 307639381.0647381, 353785288.22444874, 406853081.45811605,
+		467881043.6768334, 538063200.2283584, 618772680.2626121, 711588582.3020039, 818326869.6473044, 941075900.0943999, 1082237285.1085598, 1244572877.8748438,
+		1431258809.5560703, 1645947630.9894807, 1892839775.6379027, 2176765741.9835877, 2503280603.281126, 2878772693.7732944, 3310588597.839288, 3807176887.515181,
+		4378253420.642458, 5034991433.738827, 5790240148.79965, 6658776171.1195965, 7657592596.787537, 8806231486.305666, 10127166209.251514, 11646241140.63924,
+		13393177311.735126, 15402153908.495394, 17712476994.769703, 20369348543.985153, 23424750825.582928, 26938463449.42036, 30979232966.833416, 35626117911.85843,
+		40970035598.637184, 47115540938.43276, 54182872079.19767, 62310302891.07731, 71656848324.7389, 82405375573.44974, 94766181909.4672, 108981109195.88725,
+		125328275575.27034, 144127516911.56088, 165746644448.295, 190608641115.53925, 219199937282.8701, 252079927875.3006, 289891917056.5957, 333375704615.08496,
+		383382060307.3477, 440889369353.4498, 507022774756.4672, 583076190969.9373, 670537619615.4279, 771118262557.742, 886786001941.4033, 1019803902232.6136,
+		1172774487567.5056, 1348690660702.6313, 1550994259808.026, 1783643398779.2297, 2051189908596.114, 2358868394885.531, 2712698654118.3604, 3119603452236.1143,
+		3587543970071.531, 4125675565582.26, 4744526900419.599, 5456205935482.538, 6274636825804.918, 7215832349675.655, 8298207202127.004, 9542938282446.053,
+		10974379024812.96, 12620535878534.902, 14513616260315.137, 16690658699362.408, 19194257504266.766, 22073396129906.78, 25384405549392.793, 29192066381801.71,
+		33570876339071.965, 38606507789932.76, 44397483958422.664, 51057106552186.07,
+	],
+}
+
+## ArtistData.upgrade_cost(): {tier: [cost at level 0 .. MAX_LEVEL - 1]}
+const ARTIST_LEVEL_COST: Dictionary = {
+	1: [
+		25.0, 28.749999999999996, 33.06249999999999, 38.021874999999994, 43.72515624999998, 50.283929687499985, 57.826519140624974, 66.50049701171872,
+		76.47557156347652, 87.946907297998, 101.13894339269767, 116.30978490160231, 133.75625263684265, 153.81969053236904, 176.8926441122244, 203.42654072905805,
+		233.9405218384167, 269.03160011417924, 309.38634013130604, 355.7942911510019, 409.1634348236522, 470.53795004719996, 541.1186425542799, 622.2864389374218,
+		715.6294047780351, 822.9738154947404, 946.4198878189513, 1088.3828709917939, 1251.640301640563, 1439.3863468866473, 1655.2942989196442, 1903.5884437575905,
+		2189.126710321229, 2517.495716869413, 2895.120074399825, 3329.388085559798, 3828.796298393768, 4403.115743152833, 5063.583104625757, 5823.12057031962,
+		6696.588655867564, 7701.076954247696, 8856.238497384851, 10184.674271992577, 11712.375412791464, 13469.231724710182, 15489.616483416708, 17813.058955929213,
+		20485.017799318593, 23557.77046921638, 27091.436039598837, 31155.151445538657, 35828.424162369454, 41202.68778672487, 47383.0909547336, 54490.55459794363,
+		62664.137787635176, 72063.75845578044, 82873.3222241475, 95304.32055776962, 109599.96864143504, 126039.9639376503, 144945.95852829784, 166687.8523075425,
+		191691.03015367387, 220444.68467672492, 253511.38737823363, 291538.0954849686, 335268.80980771396, 385559.131278871, 443393.0009707016, 509901.9511163068,
+		586387.2437837528, 674345.3303513157, 775497.1299040129, 891821.6993896149, 1025594.954298057, 1179434.1974427653, 1356349.3270591802, 1559801.726118057,
+		1793771.9850357655, 2062837.78279113, 2372263.450209799, 2728102.967741269, 3137318.412902459, 3607916.1748378277, 4149103.601063502, 4771469.141223026,
+		5487189.5124064805, 6310267.939267452, 7256808.1301575685, 8345329.349681204, 9597128.752133382, 11036698.06495339, 12692202.774696397, 14596033.190900855,
+		16785438.169535983, 19303253.89496638, 22198741.979211334, 25528553.276093032,
+	],
+	2: [
+		250.0, 287.5, 330.62499999999994, 380.21874999999994, 437.25156249999986, 502.83929687499983, 578.2651914062498, 665.0049701171872,
+		764.7557156347652, 879.4690729799798, 1011.3894339269767, 1163.097849016023, 1337.5625263684265, 1538.1969053236903, 1768.926441122244, 2034.2654072905805,
+		2339.405218384167, 2690.316001141792, 3093.8634013130604, 3557.9429115100193, 4091.6343482365223, 4705.379500472, 5411.186425542799, 6222.864389374218,
+		7156.294047780351, 8229.738154947403, 9464.198878189514, 10883.82870991794, 12516.40301640563, 14393.863468866472, 16552.942989196443, 19035.884437575907,
+		21891.26710321229, 25174.95716869413, 28951.200743998248, 33293.880855597985, 38287.96298393768, 44031.15743152833, 50635.83104625757, 58231.2057031962,
+		66965.88655867563, 77010.76954247696, 88562.38497384852, 101846.74271992577, 117123.75412791464, 134692.3172471018, 154896.16483416708, 178130.58955929213,
+		204850.17799318593, 235577.7046921638, 270914.36039598833, 311551.51445538655, 358284.24162369454, 412026.87786724867, 473830.909547336, 544905.5459794363,
+		626641.3778763517, 720637.5845578044, 828733.222241475, 953043.2055776962, 1095999.6864143505, 1260399.639376503, 1449459.5852829784, 1666878.5230754248,
+		1916910.3015367386, 2204446.846767249, 2535113.8737823362, 2915380.9548496865, 3352688.0980771394, 3855591.3127887095, 4433930.009707016, 5099019.511163068,
+		5863872.437837528, 6743453.303513156, 7754971.299040129, 8918216.99389615, 10255949.54298057, 11794341.974427653, 13563493.270591801, 15598017.26118057,
+		17937719.850357655, 20628377.8279113, 23722634.502097994, 27281029.677412692, 31373184.12902459, 36079161.74837828, 41491036.01063502, 47714691.41223026,
+		54871895.1240648, 63102679.39267451, 72568081.30157569, 83453293.49681205, 95971287.52133383, 110366980.6495339, 126922027.74696396, 145960331.90900856,
+		167854381.69535983, 193032538.9496638, 221987419.79211333, 255285532.76093033,
+	],
+	3: [
+		2500.0, 2875.0, 3306.2499999999995, 3802.1874999999995, 4372.515624999998, 5028.3929687499985, 5782.651914062498, 6650.049701171872,
+		7647.5571563476515, 8794.690729799799, 10113.894339269767, 11630.97849016023, 13375.625263684266, 15381.969053236904, 17689.264411222437, 20342.654072905803,
+		23394.052183841668, 26903.16001141792, 30938.634013130602, 35579.42911510019, 40916.34348236522, 47053.79500472, 54111.864255427994, 62228.643893742184,
+		71562.94047780351, 82297.38154947404, 94641.98878189514, 108838.28709917939, 125164.0301640563, 143938.63468866472, 165529.42989196442, 190358.84437575904,
+		218912.6710321229, 251749.57168694132, 289512.0074399825, 332938.8085559798, 382879.62983937684, 440311.5743152833, 506358.3104625757, 582312.057031962,
+		669658.8655867564, 770107.6954247697, 885623.8497384851, 1018467.4271992578, 1171237.5412791464, 1346923.172471018, 1548961.6483416709, 1781305.8955929214,
+		2048501.7799318593, 2355777.046921638, 2709143.6039598836, 3115515.1445538653, 3582842.4162369454, 4120268.778672487, 4738309.095473359, 5449055.459794363,
+		6266413.778763517, 7206375.845578044, 8287332.22241475, 9530432.055776961, 10959996.864143504, 12603996.39376503, 14494595.852829784, 16668785.230754249,
+		19169103.015367385, 22044468.46767249, 25351138.737823363, 29153809.548496865, 33526880.980771393, 38555913.1278871, 44339300.097070165, 50990195.111630686,
+		58638724.378375284, 67434533.03513156, 77549712.9904013, 89182169.93896149, 102559495.4298057, 117943419.74427654, 135634932.705918, 155980172.6118057,
+		179377198.50357655, 206283778.279113, 237226345.02097994, 272810296.7741269, 313731841.2902459, 360791617.48378277, 414910360.1063502, 477146914.12230265,
+		548718951.240648, 631026793.9267452, 725680813.0157568, 834532934.9681203, 959712875.2133383, 1103669806.495339, 1269220277.4696398, 1459603319.0900855,
+		1678543816.9535983, 1930325389.4966378, 2219874197.9211335, 2552855327.6093035,
+	],
+	4: [
+		25000.0, 28749.999999999996, 33062.49999999999, 38021.87499999999, 43725.156249999985, 50283.929687499985, 57826.51914062498, 66500.49701171872,
+		76475.57156347652, 87946.90729799798, 101138.94339269766, 116309.78490160231, 133756.25263684266, 153819.69053236904, 176892.64411222437, 203426.54072905803,
+		233940.5218384167, 269031.6001141792, 309386.34013130603, 355794.29115100193, 409163.4348236522, 470537.95004719996, 541118.6425542799, 622286.4389374219,
+		715629.4047780351, 822973.8154947404, 946419.8878189514, 1088382.870991794, 1251640.301640563, 1439386.3468866472, 1655294.2989196442, 1903588.4437575906,
+		2189126.710321229, 2517495.7168694134, 2895120.074399825, 3329388.0855597984, 3828796.2983937683, 4403115.743152833, 5063583.104625757, 5823120.57031962,
+		6696588.655867564, 7701076.954247696, 8856238.497384852, 10184674.271992577, 11712375.412791464, 13469231.724710181, 15489616.483416708, 17813058.955929212,
+		20485017.799318593, 23557770.46921638, 27091436.039598834, 31155151.445538655, 35828424.16236945, 41202687.786724865, 47383090.954733595, 54490554.59794363,
+		62664137.78763517, 72063758.45578045, 82873322.2241475, 95304320.55776963, 109599968.64143504, 126039963.93765031, 144945958.52829784, 166687852.3075425,
+		191691030.15367386, 220444684.6767249, 253511387.3782336, 291538095.48496866, 335268809.8077139, 385559131.278871, 443393000.97070163, 509901951.11630684,
+		586387243.7837528, 674345330.3513156, 775497129.9040129, 891821699.3896148, 1025594954.298057, 1179434197.4427655, 1356349327.0591803, 1559801726.118057,
+		1793771985.0357654, 2062837782.7911298, 2372263450.2097993, 2728102967.741269, 3137318412.902459, 3607916174.8378277, 4149103601.063502, 4771469141.223026,
+		5487189512.40648, 6310267939.267451, 7256808130.157569, 8345329349.681204, 9597128752.133383, 11036698064.95339, 12692202774.696398, 14596033190.900856,
+		16785438169.535982, 19303253894.966377, 22198741979.211334, 25528553276.093033,
+	],
+	5: [
+		250000.0, 287500.0, 330624.99999999994, 380218.74999999994, 437251.5624999999, 502839.2968749998, 578265.1914062498, 665004.9701171871,
+		764755.7156347652, 879469.0729799799, 1011389.4339269766, 1163097.849016023, 1337562.5263684266, 1538196.9053236903, 1768926.4411222439, 2034265.4072905804,
+		2339405.2183841667, 2690316.001141792, 3093863.4013130604, 3557942.911510019, 4091634.348236522, 4705379.500472, 5411186.425542799, 6222864.389374219,
+		7156294.047780351, 8229738.154947404, 9464198.878189513, 10883828.709917938, 12516403.016405629, 14393863.468866473, 16552942.989196442, 19035884.437575907,
+		21891267.10321229, 25174957.16869413, 28951200.743998248, 33293880.855597984, 38287962.98393768, 44031157.43152833, 50635831.04625757, 58231205.703196205,
+		66965886.55867563, 77010769.54247697, 88562384.9738485, 101846742.71992578, 117123754.12791464, 134692317.2471018, 154896164.8341671, 178130589.55929214,
+		204850177.99318594, 235577704.6921638, 270914360.39598835, 311551514.4553866, 358284241.62369454, 412026877.8672487, 473830909.547336, 544905545.9794363,
+		626641377.8763517, 720637584.5578045, 828733222.241475, 953043205.5776962, 1095999686.4143505, 1260399639.376503, 1449459585.2829785, 1666878523.075425,
+		1916910301.5367386, 2204446846.767249, 2535113873.782336, 2915380954.8496866, 3352688098.0771394, 3855591312.7887096, 4433930009.707016, 5099019511.163068,
+		5863872437.837528, 6743453303.513156, 7754971299.04013, 8918216993.896149, 10255949542.98057, 11794341974.427654, 13563493270.591803, 15598017261.18057,
+		17937719850.357655, 20628377827.9113, 23722634502.097992, 27281029677.41269, 31373184129.02459, 36079161748.37827, 41491036010.63502, 47714691412.23026,
+		54871895124.064804, 63102679392.674515, 72568081301.57568, 83453293496.81204, 95971287521.33383, 110366980649.5339, 126922027746.96397, 145960331909.00854,
+		167854381695.35983, 193032538949.6638, 221987419792.11334, 255285532760.93033,
+	],
+	6: [
+		2500000.0, 2875000.0, 3306249.9999999995, 3802187.4999999995, 4372515.624999998, 5028392.968749998, 5782651.914062498, 6650049.701171872,
+		7647557.156347652, 8794690.7297998, 10113894.339269767, 11630978.49016023, 13375625.263684265, 15381969.053236904, 17689264.41122244, 20342654.072905805,
+		23394052.183841668, 26903160.01141792, 30938634.013130605, 35579429.11510019, 40916343.48236522, 47053795.004719995, 54111864.255427994, 62228643.89374219,
+		71562940.47780351, 82297381.54947403, 94641988.78189513, 108838287.09917939, 125164030.16405629, 143938634.68866473, 165529429.8919644, 190358844.37575907,
+		218912671.03212288, 251749571.68694133, 289512007.4399825, 332938808.55597985, 382879629.8393768, 440311574.3152833, 506358310.46257573, 582312057.031962,
+		669658865.5867563, 770107695.4247696, 885623849.7384851, 1018467427.1992577, 1171237541.2791464, 1346923172.471018, 1548961648.3416708, 1781305895.5929213,
+		2048501779.9318593, 2355777046.921638, 2709143603.9598837, 3115515144.5538654, 3582842416.236945, 4120268778.672487, 4738309095.47336, 5449055459.794363,
+		6266413778.763517, 7206375845.578044, 8287332222.41475, 9530432055.776962, 10959996864.143505, 12603996393.76503, 14494595852.829784, 16668785230.75425,
+		19169103015.367386, 22044468467.67249, 25351138737.82336, 29153809548.496864, 33526880980.771393, 38555913127.8871, 44339300097.07016, 50990195111.630684,
+		58638724378.37528, 67434533035.13156, 77549712990.40129, 89182169938.96149, 102559495429.8057, 117943419744.27655, 135634932705.91801, 155980172611.8057,
+		179377198503.57654, 206283778279.113, 237226345020.97992, 272810296774.12692, 313731841290.2459, 360791617483.7828, 414910360106.3502, 477146914122.3026,
+		548718951240.648, 631026793926.7451, 725680813015.7568, 834532934968.1204, 959712875213.3383, 1103669806495.339, 1269220277469.6396, 1459603319090.0854,
+		1678543816953.5984, 1930325389496.6377, 2219874197921.1333, 2552855327609.303,
+	],
+	7: [
+		25000000.0, 28749999.999999996, 33062499.999999996, 38021874.99999999, 43725156.249999985, 50283929.687499985, 57826519.14062498, 66500497.01171872,
+		76475571.56347652, 87946907.297998, 101138943.39269766, 116309784.90160231, 133756252.63684265, 153819690.53236905, 176892644.11222437, 203426540.72905803,
+		233940521.8384167, 269031600.1141792, 309386340.13130605, 355794291.15100193, 409163434.8236522, 470537950.04719996, 541118642.5542799, 622286438.9374219,
+		715629404.7780352, 822973815.4947404, 946419887.8189514, 1088382870.9917939, 1251640301.640563, 1439386346.8866472, 1655294298.919644, 1903588443.7575905,
+		2189126710.321229, 2517495716.8694134, 2895120074.399825, 3329388085.5597982, 3828796298.3937683, 4403115743.152833, 5063583104.625757, 5823120570.31962,
+		6696588655.867563, 7701076954.247697, 8856238497.384851, 10184674271.992577, 11712375412.791464, 13469231724.71018, 15489616483.416708, 17813058955.929214,
+		20485017799.318592, 23557770469.21638, 27091436039.598835, 31155151445.538654, 35828424162.36945, 41202687786.72487, 47383090954.7336, 54490554597.94363,
+		62664137787.63517, 72063758455.78044, 82873322224.1475, 95304320557.76962, 109599968641.43504, 126039963937.6503, 144945958528.29785, 166687852307.54248,
+		191691030153.67386, 220444684676.7249, 253511387378.2336, 291538095484.9686, 335268809807.7139, 385559131278.871, 443393000970.70166, 509901951116.3068,
+		586387243783.7528, 674345330351.3157, 775497129904.013, 891821699389.6149, 1025594954298.057, 1179434197442.7654, 1356349327059.1802, 1559801726118.0571,
+		1793771985035.7654, 2062837782791.13, 2372263450209.7993, 2728102967741.269, 3137318412902.459, 3607916174837.8276, 4149103601063.502, 4771469141223.026,
+		5487189512406.48, 6310267939267.451, 7256808130157.568, 8345329349681.204, 9597128752133.383, 11036698064953.39, 12692202774696.396, 14596033190900.855,
+		16785438169535.982, 19303253894966.38, 22198741979211.332, 25528553276093.035,
+	],
+}
+
+## ArtistData.production_at_level(): {tier: [production at level 0 .. MAX_LEVEL]}
+const ARTIST_PRODUCTION: Dictionary = {
+	1: [
+		1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7000000000000002,
+		1.8, 1.9, 2.0, 2.1, 2.2, 2.3, 2.4000000000000004, 2.5,
+		2.6, 2.7, 2.8, 2.9000000000000004, 3.0, 3.1, 3.2, 3.3000000000000003,
+		3.4000000000000004, 7.0, 7.2, 7.4, 7.6000000000000005, 7.800000000000001, 8.0, 8.2,
+		8.4, 8.600000000000001, 8.8, 9.0, 9.2, 9.4, 9.600000000000001, 9.8,
+		10.0, 10.200000000000001, 10.4, 10.6, 10.8, 11.0, 11.200000000000001, 11.4,
+		11.600000000000001, 11.8, 18.0, 18.3, 18.6, 18.900000000000002, 19.200000000000003, 19.5,
+		19.8, 20.1, 20.400000000000002, 20.700000000000003, 21.0, 21.3, 21.6, 21.900000000000002,
+		22.200000000000003, 22.5, 22.8, 23.1, 23.400000000000002, 23.700000000000003, 24.0, 24.300000000000004,
+		24.599999999999998, 24.900000000000002, 25.200000000000003, 34.0, 34.400000000000006, 34.8, 35.2, 35.6,
+		36.0, 36.4, 36.800000000000004, 37.2, 37.6, 38.0, 38.4, 38.800000000000004,
+		39.2, 39.6, 40.0, 40.4, 40.800000000000004, 41.2, 41.6, 42.0,
+		42.400000000000006, 42.800000000000004, 43.2, 43.6, 55.0,
+	],
+	2: [
+		8.0, 8.8, 9.6, 10.4, 11.2, 12.0, 12.8, 13.600000000000001,
+		14.4, 15.2, 16.0, 16.8, 17.6, 18.4, 19.200000000000003, 20.0,
+		20.8, 21.6, 22.4, 23.200000000000003, 24.0, 24.8, 25.6, 26.400000000000002,
+		27.200000000000003, 56.0, 57.6, 59.2, 60.800000000000004, 62.400000000000006, 64.0, 65.6,
+		67.2, 68.80000000000001, 70.4, 72.0, 73.6, 75.2, 76.80000000000001, 78.4,
+		80.0, 81.60000000000001, 83.2, 84.8, 86.4, 88.0, 89.60000000000001, 91.2,
+		92.80000000000001, 94.4, 144.0, 146.4, 148.8, 151.20000000000002, 153.60000000000002, 156.0,
+		158.4, 160.8, 163.20000000000002, 165.60000000000002, 168.0, 170.4, 172.8, 175.20000000000002,
+		177.60000000000002, 180.0, 182.4, 184.8, 187.20000000000002, 189.60000000000002, 192.0, 194.40000000000003,
+		196.79999999999998, 199.20000000000002, 201.60000000000002, 272.0, 275.20000000000005, 278.4, 281.6, 284.8,
+		288.0, 291.2, 294.40000000000003, 297.6, 300.8, 304.0, 307.2, 310.40000000000003,
+		313.6, 316.8, 320.0, 323.2, 326.40000000000003, 329.6, 332.8, 336.0,
+		339.20000000000005, 342.40000000000003, 345.6, 348.8, 440.0,
+	],
+	3: [
+		50.0, 55.00000000000001, 60.0, 65.0, 70.0, 75.0, 80.0, 85.00000000000001,
+		90.0, 95.0, 100.0, 105.0, 110.00000000000001, 114.99999999999999, 120.00000000000001, 125.0,
+		130.0, 135.0, 140.0, 145.00000000000003, 150.0, 155.0, 160.0, 165.0,
+		170.00000000000003, 350.0, 360.0, 370.0, 380.0, 390.00000000000006, 400.0, 409.99999999999994,
+		420.0, 430.00000000000006, 440.00000000000006, 450.0, 459.99999999999994, 470.0, 480.00000000000006, 490.00000000000006,
+		500.0, 510.00000000000006, 520.0, 530.0, 540.0, 550.0, 560.0, 570.0,
+		580.0000000000001, 590.0, 900.0, 915.0, 930.0, 945.0000000000002, 960.0, 975.0,
+		990.0, 1005.0, 1020.0000000000002, 1035.0, 1050.0, 1065.0, 1080.0, 1095.0000000000002,
+		1110.0, 1125.0, 1140.0, 1155.0, 1170.0000000000002, 1185.0, 1200.0, 1215.0000000000002,
+		1229.9999999999998, 1245.0000000000002, 1260.0, 1700.0, 1720.0000000000002, 1739.9999999999998, 1760.0000000000002, 1780.0,
+		1800.0, 1820.0, 1840.0000000000002, 1860.0000000000002, 1880.0, 1900.0, 1920.0, 1940.0000000000002,
+		1960.0000000000002, 1980.0, 2000.0, 2020.0, 2040.0000000000002, 2060.0, 2080.0, 2100.0,
+		2120.0000000000005, 2140.0, 2160.0, 2180.0, 2750.0,
+	],
+	4: [
+		400.0, 440.00000000000006, 480.0, 520.0, 560.0, 600.0, 640.0, 680.0000000000001,
+		720.0, 760.0, 800.0, 840.0, 880.0000000000001, 919.9999999999999, 960.0000000000001, 1000.0,
+		1040.0, 1080.0, 1120.0, 1160.0000000000002, 1200.0, 1240.0, 1280.0, 1320.0,
+		1360.0000000000002, 2800.0, 2880.0, 2960.0, 3040.0, 3120.0000000000005, 3200.0, 3279.9999999999995,
+		3360.0, 3440.0000000000005, 3520.0000000000005, 3600.0, 3679.9999999999995, 3760.0, 3840.0000000000005, 3920.0000000000005,
+		4000.0, 4080.0000000000005, 4160.0, 4240.0, 4320.0, 4400.0, 4480.0, 4560.0,
+		4640.000000000001, 4720.0, 7200.0, 7320.0, 7440.0, 7560.000000000002, 7680.0, 7800.0,
+		7920.0, 8040.0, 8160.000000000002, 8280.0, 8400.0, 8520.0, 8640.0, 8760.000000000002,
+		8880.0, 9000.0, 9120.0, 9240.0, 9360.000000000002, 9480.0, 9600.0, 9720.000000000002,
+		9839.999999999998, 9960.000000000002, 10080.0, 13600.0, 13760.000000000002, 13919.999999999998, 14080.000000000002, 14240.0,
+		14400.0, 14560.0, 14720.000000000002, 14880.000000000002, 15040.0, 15200.0, 15360.0, 15520.000000000002,
+		15680.000000000002, 15840.0, 16000.0, 16160.0, 16320.000000000002, 16480.0, 16640.0, 16800.0,
+		16960.000000000004, 17120.0, 17280.0, 17440.0, 22000.0,
+	],
+	5: [
+		3500.0, 3850.0000000000005, 4200.0, 4550.0, 4900.0, 5250.0, 5600.0, 5950.000000000001,
+		6300.0, 6650.0, 7000.0, 7350.0, 7700.000000000001, 8049.999999999999, 8400.000000000002, 8750.0,
+		9100.0, 9450.0, 9800.0, 10150.000000000002, 10500.0, 10850.0, 11200.0, 11550.000000000002,
+		11900.000000000002, 24500.0, 25200.0, 25900.0, 26600.000000000004, 27300.000000000004, 28000.0, 28699.999999999996,
+		29400.0, 30100.000000000004, 30800.000000000004, 31500.0, 32199.999999999996, 32900.0, 33600.00000000001, 34300.0,
+		35000.0, 35700.00000000001, 36400.0, 37100.0, 37800.0, 38500.0, 39200.00000000001, 39900.0,
+		40600.00000000001, 41300.0, 63000.0, 64050.000000000015, 65100.0, 66150.00000000001, 67200.0, 68250.0,
+		69300.00000000001, 70350.0, 71400.00000000001, 72450.0, 73500.0, 74550.00000000001, 75600.0, 76650.00000000001,
+		77700.0, 78750.0, 79800.00000000001, 80850.0, 81900.00000000001, 82950.0, 84000.0, 85050.00000000001,
+		86099.99999999999, 87150.00000000001, 88200.0, 119000.0, 120400.00000000001, 121799.99999999999, 123200.00000000001, 124600.0,
+		126000.0, 127400.0, 128800.00000000001, 130200.00000000001, 131600.0, 133000.0, 134400.0, 135800.00000000003,
+		137200.0, 138600.0, 140000.0, 141400.0, 142800.00000000003, 144200.0, 145600.0, 147000.0,
+		148400.00000000003, 149800.00000000003, 151200.0, 152600.0, 192500.0,
+	],
+	6: [
+		30000.0, 33000.0, 36000.0, 39000.0, 42000.0, 45000.0, 48000.0, 51000.00000000001,
+		54000.0, 57000.0, 60000.0, 63000.0, 66000.0, 69000.0, 72000.00000000001, 75000.0,
+		78000.0, 81000.0, 84000.0, 87000.00000000001, 90000.0, 93000.0, 96000.0, 99000.00000000001,
+		102000.00000000001, 210000.0, 216000.0, 222000.0, 228000.00000000003, 234000.00000000003, 240000.0, 245999.99999999997,
+		252000.0, 258000.00000000003, 264000.0, 270000.0, 276000.0, 282000.0, 288000.00000000006, 294000.0,
+		300000.0, 306000.00000000006, 312000.0, 318000.0, 324000.0, 330000.0, 336000.00000000006, 342000.0,
+		348000.00000000006, 354000.0, 540000.0, 549000.0000000001, 558000.0, 567000.0000000001, 576000.0, 585000.0,
+		594000.0000000001, 603000.0, 612000.0000000001, 621000.0, 630000.0, 639000.0000000001, 648000.0, 657000.0000000001,
+		666000.0, 675000.0, 684000.0000000001, 693000.0, 702000.0000000001, 711000.0, 720000.0, 729000.0000000001,
+		737999.9999999999, 747000.0000000001, 756000.0, 1020000.0, 1032000.0000000001, 1043999.9999999999, 1056000.0, 1068000.0,
+		1080000.0, 1092000.0, 1104000.0000000002, 1116000.0, 1128000.0, 1140000.0, 1152000.0, 1164000.0000000002,
+		1176000.0, 1188000.0, 1200000.0, 1212000.0, 1224000.0000000002, 1236000.0, 1248000.0, 1260000.0,
+		1272000.0000000002, 1284000.0000000002, 1296000.0, 1308000.0, 1650000.0,
+	],
+	7: [
+		250000.0, 275000.0, 300000.0, 325000.0, 350000.0, 375000.0, 400000.0, 425000.00000000006,
+		450000.0, 475000.0, 500000.0, 525000.0, 550000.0, 575000.0, 600000.0000000001, 625000.0,
+		650000.0, 675000.0, 700000.0, 725000.0000000001, 750000.0, 775000.0, 800000.0, 825000.0000000001,
+		850000.0000000001, 1750000.0, 1800000.0, 1850000.0, 1900000.0000000002, 1950000.0000000002, 2000000.0, 2049999.9999999998,
+		2100000.0, 2150000.0000000005, 2200000.0, 2250000.0, 2300000.0, 2350000.0, 2400000.0000000005, 2450000.0,
+		2500000.0, 2550000.0000000005, 2600000.0, 2650000.0, 2700000.0, 2750000.0, 2800000.0000000005, 2850000.0,
+		2900000.0000000005, 2950000.0, 4500000.0, 4575000.000000001, 4650000.0, 4725000.000000001, 4800000.0, 4875000.0,
+		4950000.000000001, 5025000.0, 5100000.000000001, 5175000.0, 5250000.0, 5325000.000000001, 5400000.0, 5475000.000000001,
+		5550000.0, 5625000.0, 5700000.000000001, 5775000.0, 5850000.000000001, 5925000.0, 6000000.0, 6075000.000000002,
+		6149999.999999999, 6225000.000000001, 6300000.0, 8500000.0, 8600000.000000002, 8700000.0, 8800000.0, 8900000.0,
+		9000000.0, 9100000.0, 9200000.000000002, 9300000.0, 9400000.0, 9500000.0, 9600000.0, 9700000.000000002,
+		9800000.0, 9900000.0, 10000000.0, 10100000.0, 10200000.000000002, 10300000.0, 10400000.0, 10500000.0,
+		10600000.000000002, 10700000.000000002, 10800000.0, 10900000.0, 13750000.0,
+	],
+}
+
+## CD spawn roll, one alias table per Marketing Reach level (values index CD_TIER_IDS)
+const CD_TIER_IDS: Array = [1, 2, 3, 4, 5, 6]
+const CD_ALIAS_PROB: Array = [
+	[1.0, 0.7069846678023848, 0.6814310051107326, 0.17035775127768316, 0.034071550255536626, 0.003407155025553469],
+	[1.0, 0.8235093696763199, 0.6609880749574107, 0.17546848381601382, 0.035093696763202765, 0.1710391822827936],
+	[1.0, 0.9400340715502555, 0.640545144804089, 0.1805792163543445, 0.036115843270868905, 0.3386712095400341],
+	[1.0, 0.0936967632027258, 0.6201022146507662, 0.18568994889267423, 0.03713798977853504, 0.5063032367972742],
+	[1.0, 0.2112436115843268, 0.5996592844974444, 0.19080068143100493, 0.03816013628620118, 0.673935264054514],
+	[1.0, 0.3287904599659288, 0.5792163543441227, 0.1959114139693356, 0.03918228279386732, 0.8415672913117549],
+	[1.0, 0.4463373083475287, 0.5587734241908009, 0.2010221465076663, 0.04020442930153346, 0.049403747870526815],
+	[1.0, 0.5638841567291304, 0.5383304940374791, 0.206132879045997, 0.04122657580919959, 0.2180579216354337],
+	[1.0, 0.6814310051107331, 0.5178875638841564, 0.2112436115843267, 0.04224872231686573, 0.3867120954003411],
+	[1.0, 0.7989778534923347, 0.4974446337308346, 0.21635434412265736, 0.04327086882453186, 0.555366269165248],
+	[1.0, 0.916524701873935, 0.4770017035775128, 0.22146507666098808, 0.04429301533219752, 0.724020442930153],
+	[1.0, 0.2606473594548542, 0.456558773424191, 0.2265758091993188, 0.04531516183986366, 0.8926746166950584],
+	[1.0, 0.38330494037478724, 0.4361158432708687, 0.231686541737649, 0.0463373083475298, 0.2930153321976152],
+	[1.0, 0.5059625212947192, 0.41567291311754695, 0.23679727427597966, 0.04735945485519594, 0.46678023850085215],
+	[1.0, 0.9880749574105625, 0.3952299829642252, 0.24190800681430985, 0.04838160136286207, 0.640545144804088],
+	[1.0, 0.9369676320272575, 0.3747870528109029, 0.24701873935264057, 0.04940374787052821, 0.8143100511073247],
+	[1.0, 0.8858603066439523, 0.3543441226575811, 0.25212947189097124, 0.05042589437819434, 0.9880749574105621],
+	[1.0, 0.8347529812606473, 0.33390119250425887, 0.25724020442930146, 0.05144804088586048, 0.49574105621805764],
+	[1.0, 0.7836456558773424, 0.3134582623509371, 0.2623509369676321, 0.052470187393526616, 0.6490630323679726],
+	[1.0, 0.7325383304940378, 0.2930153321976154, 0.2674616695059624, 0.053492333901192284, 0.802385008517887],
+	[1.0, 0.6814310051107326, 0.272572402044293, 0.272572402044293, 0.05451448040885841, 0.955706984667803],
+	[1.0, 0.6303236797274276, 0.252129471890971, 0.2776831345826235, 0.05553662691652455, 0.7393526405451447],
+	[1.0, 0.5792163543441229, 0.2316865417376492, 0.2827938671209541, 0.05655877342419068, 0.841567291311754],
+	[1.0, 0.5281090289608179, 0.2112436115843272, 0.2879045996592846, 0.05758091993185682, 0.9437819420783646],
+	[0.9540034071550256, 0.4770017035775129, 0.19080068143100518, 0.29301533219761505, 0.058603066439522955, 1.0],
+	[0.8517887563884157, 0.42589437819420783, 0.17035775127768316, 0.2981260647359455, 0.0596252129471891, 1.0],
+	[0.7495741056218057, 0.37478705281090274, 0.1499148211243611, 0.30323679727427594, 0.060647359454855235, 1.0],
+	[0.6473594548551962, 0.3236797274275981, 0.12947189097103923, 0.3083475298126064, 0.06166950596252138, 1.0],
+	[0.5451448040885862, 0.2725724020442931, 0.10902896081771718, 0.313458262350937, 0.06269165247018751, 1.0],
+	[0.44293015332197616, 0.22146507666098808, 0.08858603066439527, 0.3185689948892675, 0.0637137989778534, 1.0],
+	[0.34071550255536664, 0.17035775127768335, 0.06814310051107327, 0.32367972742759804, 0.06473594548551956, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.3287904599659284, 0.06575809199318568, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.333901192504259, 0.06678023850085182, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.3390119250425894, 0.06780238500851783, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.34412265758092, 0.06882453151618398, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.3492333901192505, 0.06984667802385011, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.35434412265758086, 0.07086882453151613, 1.0],
+	[0.34071550255536637, 0.17035775127768318, 0.06814310051107327, 0.35945485519591136, 0.07189097103918228, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.3645655877342419, 0.0729131175468484, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.36967632027257247, 0.07393526405451453, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.3747870528109029, 0.07495741056218055, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.37989778534923335, 0.0759795570698467, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.38500851788756374, 0.07700170357751271, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.39011925042589435, 0.07802385008517884, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.39522998296422496, 0.07904599659284497, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.40034071550255534, 0.08006814310051112, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.40545144804088584, 0.08109028960817714, 1.0],
+	[0.34071550255536637, 0.17035775127768318, 0.06814310051107327, 0.4105621805792165, 0.08211243611584329, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.41567291311754684, 0.08313458262350942, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.4207836456558772, 0.08415672913117543, 1.0],
+	[0.3407155025553663, 0.17035775127768316, 0.06814310051107325, 0.42589437819420783, 0.08517887563884158, 1.0],
+]
+const CD_ALIAS: Array = [
+	[0, 0, 0, 0, 0, 1],
+	[0, 0, 0, 0, 0, 1],
+	[0, 0, 0, 0, 0, 1],
+	[0, 0, 0, 0, 1, 1],
+	[0, 0, 0, 0, 1, 1],
+	[0, 0, 0, 0, 1, 1],
+	[0, 0, 0, 0, 5, 1],
+	[0, 0, 0, 0, 5, 1],
+	[0, 0, 0, 0, 5, 1],
+	[0, 0, 0, 0, 5, 1],
+	[0, 0, 0, 0, 5, 1],
+	[0, 0, 0, 1, 5, 1],
+	[0, 0, 0, 5, 5, 1],
+	[0, 0, 0, 5, 5, 1],
+	[0, 0, 0, 5, 5, 0],
+	[0, 0, 0, 5, 5, 0],
+	[0, 0, 0, 5, 5, 0],
+	[0, 0, 5, 5, 5, 0],
+	[0, 0, 5, 5, 5, 0],
+	[0, 0, 5, 5, 5, 0],
+	[0, 0, 5, 5, 5, 0],
+	[0, 5, 5, 5, 5, 0],
+	[0, 5, 5, 5, 5, 0],
+	[0, 5, 5, 5, 5, 0],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+	[5, 5, 5, 5, 5, 5],
+]
+
+## GachaData.POOL weighted pick (values index POOL)
+const GACHA_ALIAS_PROB: Array = [1.0, 0.32258064516129037, 0.8847926267281107, 0.5898617511520737, 0.29493087557603687, 0.22119815668202766, 0.07373271889400922, 0.03686635944700461]
+const GACHA_ALIAS: Array = [0, 0, 0, 0, 0, 0, 1, 1]
+
+## SpinWheelData.PRIZES weighted pick (values index PRIZES)
+const SPIN_ALIAS_PROB: Array = [1.0, 0.9, 0.3, 0.9, 0.3, 0.8]
+const SPIN_ALIAS: Array = [0, 0, 0, 1, 5, 1]
+
+## Draw an index from an alias table in O(1).
+static func pick(prob: Array, alias: Array) -> int:
+	var i := randi() % prob.size()
+	return i if randf() < prob[i] else alias[i]
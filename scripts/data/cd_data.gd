@@ -67,10 +67,10 @@ static func total_drop_weight() -> float:
 
 ## Picks a random CD tier based on weighted probability.
 static func pick_random_tier() -> int:
-	var roll := randf() * total_drop_weight()
-	var cumulative := 0.0
-	for tier_id in TIERS:
-		cumulative += TIERS[tier_id]["drop_weight"]
-		if roll <= cumulative:
-			return tier_id
-	return CdTier.DEMO  # Fallback
+	return pick_tier_for_marketing(0)
+
+## Picks a CD tier with drop weights shifted by Marketing Reach (baked alias table, O(1)).
+static func pick_tier_for_marketing(marketing_level: int) -> int:
+	var level := clampi(marketing_level, 0, BakedTables.CD_ALIAS_PROB.size() - 1)
+	var index := BakedTables.pick(BakedTables.CD_ALIAS_PROB[level], BakedTables.CD_ALIAS[level])
+	return BakedTables.CD_TIER_IDS[index]
@@ -31,5 +31,8 @@ const UPGRADES: Dictionary = {
 
 ## Calculate cost for upgrading to next level.
 static func cost_at_level(upgrade_id: int, current_level: int) -> float:
+	var baked: Array = BakedTables.UPGRADE_COST[upgrade_id]
+	if current_level < baked.size():
+		return baked[current_level]
 	var data: Dictionary = UPGRADES[upgrade_id]
 	return data["base_cost"] * pow(data["cost_growth"], current_level)
@@ -57,16 +57,7 @@ static func pull() -> Dictionary:
 	return prize
 
 static func _weighted_pull() -> Dictionary:
-	var total_weight := 0.0
-	for item in POOL:
-		total_weight += item["weight"]
-	var roll := randf() * total_weight
-	var cumulative := 0.0
-	for item in POOL:
-		cumulative += item["weight"]
-		if roll <= cumulative:
-			return item
-	return POOL[0]
+	return POOL[BakedTables.pick(BakedTables.GACHA_ALIAS_PROB, BakedTables.GACHA_ALIAS)]
 
 static func _pick_from_rarity(rarity: int) -> Dictionary:
 	var candidates: Array = []
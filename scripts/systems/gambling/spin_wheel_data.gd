@@ -22,16 +22,7 @@ const PRIZES: Array = [
 ]
 
 static func pick_prize() -> Dictionary:
-	var total_weight := 0.0
-	for prize in PRIZES:
-		total_weight += prize["weight"]
-	var roll := randf() * total_weight
-	var cumulative := 0.0
-	for prize in PRIZES:
-		cumulative += prize["weight"]
-		if roll <= cumulative:
-			return prize
-	return PRIZES[0]
+	return PRIZES[BakedTables.pick(BakedTables.SPIN_ALIAS_PROB, BakedTables.SPIN_ALIAS)]
 
 ## Apply the prize reward to the player.
 static func apply_prize(prize: Dictionary) -> String:
@@ -0,0 +1,45 @@
+class_name SpriteAtlas
+extends RefCounted
+
+## Resolves sprite paths to regions of the packed atlases built by
+## tools/build_atlases.py. Falls back to the standalone PNG when a sprite
+## has not been packed, so scenes can always call get_texture().
+
+const INDEX_PATH := "res://assets/atlases/atlases.json"
+
+## {sprite path (String): {"atlas": String, "region": [x, y, w, h]}}
+static var _index: Dictionary = {}
+static var _index_loaded := false
+
+## {sprite path (String): Texture2D} — one AtlasTexture per sprite, shared.
+static var _textures: Dictionary = {}
+
+## Returns the texture for a sprite path, as an atlas region when available.
+static func get_texture(path: String) -> Texture2D:
+	if path in _textures:
+		return _textures[path]
+	_load_index()
+	var tex: Texture2D = null
+	if path in _index:
+		var entry: Dictionary = _index[path]
+		var atlas = load(entry["atlas"])
+		if atlas:
+			var region: Array = entry["region"]
+			var atlas_tex := AtlasTexture.new()
+			atlas_tex.atlas = atlas
+			atlas_tex.region = Rect2(region[0], region[1], region[2], region[3])
+			tex = atlas_tex
+	if tex == null:
+		tex = load(path)
+	_textures[path] = tex
+	return tex
+
+static func _load_index() -> void:
+	if _index_loaded:
+		return
+	_index_loaded = true
+	if not FileAccess.file_exists(INDEX_PATH):
+		return
+	var parsed = JSON.parse_string(FileAccess.get_file_as_string(INDEX_PATH))
+	if parsed is Dictionary:
+		_index = parsed
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the asset pipeline.
+Keeps one assetgen Pipeline alive (generation cache, cost ledger, process
+stamps, the image/Lyria clients and a warm worker pool) and polls:
+
+    tools/asset_manifest.py     prompts, sizes, variant configs, tracks
+    art_raw/, assets/           raw generator output and hand-edited sources
+    post-processing modules     process_sprites, tier_variants, process_audio,
+                                build_atlases, bake_spin_wheel (tuning
+                                constants live there)
+    spin_wheel_data.gd          the prize table the wheel face is baked from
+
+On a change only the affected part of the graph runs: the nodes of the
+manifest entries whose config changed or whose files were touched, plus
+everything downstream of them (variants built from a sprite, its atlas).
+Editing a post-processing module reloads it and reruns every node of that
+kind, since its constants are not part of the process stamps. Local-only
+steps (re-processing a raw sprite, repacking its atlas) come back in well
+under a second because nothing is re-imported or re-read beyond the
+changed entries. Change detection itself is a poll: every POLL_SECONDS
+the watched modules and every PNG/WAV under art_raw/ and assets/ are
+stat'ed.
+
+Files a run writes itself are not reported back as changes. Any other
+file edited while a run is in progress is handled right after it. The
+process stamps are held in memory, so don't run assetgen.py against the
+same tree while the daemon is up. The import stage is off unless asked
+for; the Godot editor reimports on focus anyway.
+
+Usage:
+    python3 tools/asset_daemon.py
+    python3 tools/asset_daemon.py --only "sprites/cds/*" --stage process --stage atlas
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from argparse import Namespace
+from datetime import datetime
+from pathlib import Path
+
+import asset_manifest
+import assetgen
+import bake_spin_wheel
+import build_atlases
+import generate_images
+import generate_music
+import process_audio
+import process_sprites
+import sprite_sheets
+
+# --- Configuration ---
+TOOLS_DIR = Path(__file__).parent
+DEFAULT_STAGES = ("generate", "process", "atlas")
+POLL_SECONDS = 0.2
+SETTLE_SECONDS = 0.1  # Editors save in several writes; wait until the tree stops changing
+WATCHED_SUFFIXES = {".png", ".wav"}
+PARAMETER_MODULES = {  # Module -> node prefix (and manifest) whose outputs it shapes
+    "process_sprites": ("process:", "images"),
+    "tier_variants": ("variant:", "images"),
+    "process_audio": ("process:", "tracks"),
+    "build_atlases": ("atlas:", None),
+    "bake_spin_wheel": ("bake:", None),
+}
+SCALARS = (int, float, str, bytes, bool, type(None), tuple)
+
+
+def module_path(name: str) -> Path:
+    return TOOLS_DIR / f"{name}.py"
+
+
+def data_scripts() -> dict[Path, str]:
+    """Game scripts a node is baked from -> that node."""
+    return {bake_spin_wheel.PRIZES_SCRIPT: "bake:spin_wheel"}
+
+
+def scan() -> dict[Path, tuple[int, int]]:
+    """mtime and size of every watched file."""
+    found = {}
+    for path in [module_path(name) for name in ("asset_manifest", *PARAMETER_MODULES)] + list(data_scripts()):
+        if path.exists():
+            stat = path.stat()
+            found[path] = (stat.st_mtime_ns, stat.st_size)
+    for root in (process_sprites.RAW_DIR, process_sprites.ASSETS_DIR):
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for filename in filenames:
+                if Path(filename).suffix in WATCHED_SUFFIXES:
+                    path = Path(dirpath) / filename
+                    try:
+                        stat = path.stat()
+                    except FileNotFoundError:
+                        continue  # Replaced mid-scan; the next scan sees the new file
+                    found[path] = (stat.st_mtime_ns, stat.st_size)
+    return found
+
+
+def wait_for_change(baseline: dict, poll: float) -> tuple[dict, set[Path]]:
+    """Block until watched files change and settle; return the new scan and changed paths."""
+    while True:
+        time.sleep(poll)
+        current = scan()
+        if current == baseline:
+            continue
+        while True:
+            time.sleep(SETTLE_SECONDS)
+            settled = scan()
+            if settled == current:
+                break
+            current = settled
+        return current, changed_paths(baseline, current)
+
+
+def changed_paths(before: dict, after: dict) -> set[Path]:
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def run_outputs(nodes: dict[str, assetgen.Node]) -> set[Path]:
+    """Watched files the nodes may write, so a run's own output is not taken for an edit."""
+    paths = set()
+    for name in nodes:
+        stage, _, key = name.partition(":")
+        if key in asset_manifest.TRACKS:
+            paths |= {process_audio.RAW_DIR / f"{key}.wav", generate_music.AUDIO_DIR / f"{key}.wav"}
+        elif key in asset_manifest.SHEETS:
+            paths.add(sprite_sheets.sheet_path(key))
+        elif stage == "atlas":
+            paths.add(build_atlases.ATLAS_DIR / f"{key}.png")
+        elif stage == "bake":
+            paths.add(bake_spin_wheel.TEXTURE_FILE)
+        elif key:
+            paths |= {process_sprites.RAW_DIR / f"{key}.png", process_sprites.ASSETS_DIR / f"{key}.png"}
+    return paths
+
+
+def asset_key(path: Path) -> str | None:
+    """Manifest key a raw or output file belongs to, if any."""
+    roots = ((process_audio.RAW_DIR, asset_manifest.TRACKS), (generate_music.AUDIO_DIR, asset_manifest.TRACKS),
+             (process_sprites.RAW_DIR, asset_manifest.IMAGES), (process_sprites.ASSETS_DIR, asset_manifest.IMAGES))
+    for root, entries in roots:
+        if path.is_relative_to(root):
+            key = path.relative_to(root).with_suffix("").as_posix()
+            if key in entries:
+                return key
+    return None
+
+
+def reload_module(name: str) -> None:
+    """Re-execute a tool module and point other tool modules at its new objects.
+
+    Names imported with ``from module import X`` are rebound when they are
+    the same object as before: containers and functions by identity (which
+    covers aliases such as process_sprites.ASSETS), plain values only when
+    the name matches too. A module that fails to load is left as it was.
+    """
+    module = sys.modules[name]
+    before = dict(vars(module))
+    try:
+        importlib.reload(module)
+    except BaseException:
+        vars(module).clear()
+        vars(module).update(before)
+        raise
+    old = {id(value): key for key, value in before.items() if not key.startswith("__")}
+    for other in list(sys.modules.values()):
+        path = getattr(other, "__file__", None)
+        if other is module or path is None or Path(path).parent != TOOLS_DIR:
+            continue
+        for attr, value in list(vars(other).items()):
+            source = old.get(id(value))
+            if source is None or before[source] is not value or not hasattr(module, source):
+                continue
+            if attr == source or not isinstance(value, SCALARS):
+                setattr(other, attr, getattr(module, source))
+
+
+def changed_entries(before: dict, after: dict) -> set[str]:
+    """Keys added or edited between two versions of a manifest table."""
+    def dump(config) -> str:
+        return json.dumps(config, sort_keys=True, default=str)
+    return {key for key, config in after.items() if key not in before or dump(before[key]) != dump(config)}
+
+
+def affected(nodes: dict[str, assetgen.Node], seeds: set[str], forced: set[str]) -> dict[str, assetgen.Node]:
+    """The seed nodes and everything downstream, as a standalone graph.
+
+    Dependencies outside the subgraph are taken as up to date. Forced
+    nodes report dirty regardless of their stamps.
+    """
+    dependents: dict[str, list[str]] = {}
+    for name, node in nodes.items():
+        for dep in node.deps:
+            dependents.setdefault(dep, []).append(name)
+    closure, stack = set(), [name for name in seeds | forced if name in nodes]
+    while stack:
+        name = stack.pop()
+        if name not in closure:
+            closure.add(name)
+            stack.extend(dependents.get(name, []))
+
+    def dirty() -> str:
+        return "dirty"
+    return {name: assetgen.Node(name, node.stage, dirty if name in forced else node.check, node.run,
+                                [dep for dep in node.deps if dep in closure])
+            for name, node in nodes.items() if name in closure}
+
+
+def parameter_nodes(nodes: dict[str, assetgen.Node], module: str) -> set[str]:
+    prefix, table = PARAMETER_MODULES[module]
+    entries = {"images": asset_manifest.IMAGES, "tracks": asset_manifest.TRACKS}.get(table)
+    return {name for name in nodes
+            if name.startswith(prefix) and (entries is None or name.split(":", 1)[1] in entries)}
+
+
+class Daemon:
+    """Turns batches of changed paths into minimal pipeline runs."""
+
+    def __init__(self, args):
+        self.args = args
+        self.stages = set(args.stage or DEFAULT_STAGES)
+        self.pipeline = assetgen.Pipeline(Namespace(dry_run=False, jobs=args.jobs, fake_music=args.fake_music,
+                                                    no_resume=args.no_resume, music_sessions=args.music_sessions,
+                                                    allow_similar=False, candidates=1, encode=args.encode))
+        self.nodes = assetgen.build_graph(self.pipeline, args.only)
+
+    def warm(self) -> None:
+        """Start the worker processes now rather than on the first edit."""
+        list(self.pipeline.pool().map(process_sprites.target_size, [""] * max(1, self.args.jobs)))
+
+    def run(self, nodes: dict[str, assetgen.Node]) -> None:
+        start = time.perf_counter()
+        results = assetgen.execute(nodes, self.stages, self.args.jobs, force=False,
+                                   io=assetgen.io_jobs(self.args.music_sessions))
+        self.pipeline.flush()
+        counts = {}
+        for outcome in results.values():
+            counts[outcome] = counts.get(outcome, 0) + 1
+        summary = ", ".join(f"{outcome}: {n}" for outcome, n in sorted(counts.items())) or "nothing to do"
+        print(f"  {summary} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        if any(results[name] == "ran" and nodes[name].stage == "generate" for name in results):
+            remaining = generate_images.BUDGET_CAP_USD - self.pipeline.ledger.committed(generate_images.PROVIDER)
+            print(f"  Image budget left: ${remaining:.2f}")
+
+    def handle(self, changed: set[Path]) -> set[Path]:
+        """Run what ``changed`` affects; returns the watched files that run may have written."""
+        stamp = datetime.now().strftime("%H:%M:%S")
+        seeds, forced, notes = set(), set(), []
+        if module_path("asset_manifest") in changed:
+            before = (dict(asset_manifest.IMAGES), dict(asset_manifest.TRACKS), dict(asset_manifest.SHEETS))
+            try:
+                reload_module("asset_manifest")
+            except Exception as e:
+                print(f"[{stamp}] asset_manifest.py: {type(e).__name__}: {e} (keeping the previous manifest)")
+                return set()
+            keys = (changed_entries(before[0], asset_manifest.IMAGES)
+                    | changed_entries(before[1], asset_manifest.TRACKS))
+            # A member's prompt is part of its sheet's request, so the whole sheet goes again
+            sheets = changed_entries(before[2], asset_manifest.SHEETS) | {
+                sheet for sheet in map(sprite_sheets.sheet_of, keys) if sheet is not None}
+            self.nodes = assetgen.build_graph(self.pipeline, self.args.only)
+            seeds.update(f"{stage}:{key}" for key in keys for stage in ("generate", "process", "variant"))
+            seeds.update(f"generate:{sheet}" for sheet in sheets)
+            notes.append(f"asset_manifest.py ({len(keys | sheets)} changed)")
+        for module in PARAMETER_MODULES:
+            if module_path(module) not in changed:
+                continue
+            try:
+                reload_module(module)
+            except Exception as e:
+                print(f"[{stamp}] {module}.py: {type(e).__name__}: {e} (keeping the previous version)")
+                continue
+            if module == "process_sprites":
+                self.pipeline.restart_pool()
+                self.warm()
+            forced |= parameter_nodes(self.nodes, module)
+            notes.append(f"{module}.py")
+        for path, node in data_scripts().items():
+            if path in changed:
+                self.nodes = assetgen.build_graph(self.pipeline, self.args.only)  # Sources may have moved
+                seeds.add(node)
+                notes.append(path.name)
+        for path in sorted(changed):
+            key = asset_key(path)
+            if key is not None:
+                seeds.update(f"{stage}:{key}" for stage in ("generate", "process", "variant"))
+                notes.append(path.relative_to(assetgen.PROJECT_ROOT).as_posix())
+        subgraph = affected(self.nodes, seeds, forced)
+        if not subgraph:
+            return set()
+        shown = ", ".join(notes[:4]) + (f" and {len(notes) - 4} more" if len(notes) > 4 else "")
+        print(f"[{stamp}] {shown}: {len(subgraph)} nodes")
+        self.run(subgraph)
+        return run_outputs(subgraph)
+
+    def close(self) -> None:
+        self.pipeline.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch the manifest and raw assets and rerun what changed.")
+    parser.add_argument("--only", action="append", default=[], help="Glob over asset keys (repeatable)")
+    parser.add_argument("--stage", action="append", choices=assetgen.STAGES,
+                        help=f"Limit to these stages (repeatable, default: {', '.join(DEFAULT_STAGES)})")
+    parser.add_argument("--jobs", type=int, default=assetgen.DEFAULT_JOBS, help="Nodes run in parallel")
+    parser.add_argument("--poll", type=float, default=POLL_SECONDS, help="Seconds between scans")
+    parser.add_argument("--music-sessions", type=int, default=generate_music.MAX_SESSIONS,
+                        help="Concurrent Lyria sessions")
+    parser.add_argument("--fake-music", action="store_true", default=os.environ.get("LYRIA_FAKE") == "1",
+                        help="Use the local Lyria stand-in (also LYRIA_FAKE=1)")
+    parser.add_argument("--no-resume", action="store_true", help="Discard partial Lyria captures")
+    parser.add_argument("--encode", choices=["ogg"], help="Also write compressed audio (process_audio.py)")
+    args = parser.parse_args()
+
+    daemon = Daemon(args)
+    print(f"=== Asset Daemon ===")
+    print(f"Nodes: {len(daemon.nodes)}, stages: {', '.join(s for s in assetgen.STAGES if s in daemon.stages)}")
+    try:
+        daemon.warm()
+        baseline = scan()
+        daemon.run(daemon.nodes)  # Catch up on anything changed while the daemon was down
+        current = scan()
+        changed = changed_paths(baseline, current) - run_outputs(daemon.nodes)
+        baseline = current
+        print(f"Watching {len(baseline)} files (Ctrl+C to stop)")
+        while True:
+            if not changed:
+                baseline, changed = wait_for_change(baseline, args.poll)
+            written = daemon.handle(changed)
+            current = scan()
+            # Our own outputs are not changes; anything else touched during the run goes next
+            changed = changed_paths(baseline, current) - written
+            baseline = current
+    except KeyboardInterrupt:
+        print("Stopped.")
+    finally:
+        daemon.close()
+
+
+if __name__ == "__main__":
+    main()
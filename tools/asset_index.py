@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Asset reference index for Music Label Tycoon.
+Scans every GDScript, scene, resource and project file for res:// string
+literals and joins them against the generator manifest (asset_manifest.py)
+and the files actually under assets/. Reports:
+
+    missing    referenced but not on disk (pending if the pipeline will produce it)
+    unused     on disk but never referenced, so dead weight in the export
+    oversized  over the size budget for its kind, or still at raw generator size
+    unshipped  generated by the manifest but referenced nowhere (tier variant
+               inputs such as effect overlays are exempt)
+
+References the game resolves at runtime are followed too. AudioManager
+loads the .ogg sibling of a .wav, so a referenced .wav makes that .ogg
+used, and the .wav itself is only needed when there is no .ogg. The atlas
+index used by SpriteAtlas makes its atlas textures used. Literals built
+with format placeholders ("res://assets/sprites/%s.png") act as globs.
+
+The unused set becomes the export preset's exclude_filter, so only
+referenced assets are packed; referenced non-resource data files (JSON
+indexes) go into include_filter.
+
+Usage:
+    python3 tools/asset_index.py
+    python3 tools/asset_index.py --json
+    python3 tools/asset_index.py --write-preset Web
+    python3 tools/asset_index.py --check    # exit 1 on references nothing will produce (CI)
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+import bake_spin_wheel
+import build_atlases
+import process_audio
+import tier_variants
+from asset_manifest import IMAGES, TRACKS
+from process_sprites import target_size
+
+# --- Configuration ---
+PROJECT_ROOT = Path(__file__).parent.parent
+ASSETS_DIR = PROJECT_ROOT / "assets"
+PRESETS_FILE = PROJECT_ROOT / "export_presets.cfg"
+SOURCE_SUFFIXES = {".gd", ".tscn", ".tres", ".godot", ".cfg"}
+SKIP_DIRS = {"tools", "docs", "art_raw"}  # Tool-side files, never part of the game
+REF_PATTERN = re.compile(r"res://[^\"'\s)\]]+")
+PLACEHOLDER_PATTERN = re.compile(r"%[-+0-9.]*[sdif]|\{[^}]*\}")
+SIZE_BUDGETS = {  # Bytes per file before it counts as oversized
+    ".png": 256 * 1024,
+    ".wav": 512 * 1024,
+    ".ogg": 512 * 1024,
+}
+DATA_SUFFIXES = {".json", ".txt", ".csv"}  # Read with FileAccess, not as resources
+ATLAS_INDEX = "res://assets/atlases/atlases.json"
+
+
+def res_path(path: Path) -> str:
+    return "res://" + path.relative_to(PROJECT_ROOT).as_posix()
+
+
+def local_path(res: str) -> Path:
+    return PROJECT_ROOT / res.removeprefix("res://")
+
+
+def source_files() -> list[Path]:
+    """Project files that can reference resources, skipping tool-only and .gdignore'd trees."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(PROJECT_ROOT):
+        base = Path(dirpath)
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS
+                       and not (base / d / ".gdignore").exists()]
+        files.extend(base / name for name in filenames if Path(name).suffix in SOURCE_SUFFIXES)
+    return files
+
+
+def scan_references(files: list[Path]) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+    """Literal references and placeholder globs, each mapped to "file:line" locations."""
+    literals: dict[str, list[str]] = {}
+    globs: dict[str, list[str]] = {}
+    for path in files:
+        where = path.relative_to(PROJECT_ROOT).as_posix()
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for number, line in enumerate(f, 1):
+                if "res://" not in line:
+                    continue
+                for ref in REF_PATTERN.findall(line):
+                    ref = ref.rstrip(",;")
+                    if PLACEHOLDER_PATTERN.search(ref) or ref.endswith("/"):
+                        pattern = PLACEHOLDER_PATTERN.sub("*", ref) + ("*" if ref.endswith("/") else "")
+                        globs.setdefault(pattern, []).append(f"{where}:{number}")
+                    else:
+                        literals.setdefault(ref, []).append(f"{where}:{number}")
+    return literals, globs
+
+
+def disk_assets() -> set[str]:
+    """Every shippable file under assets/ (Godot sidecars and dotfiles excluded)."""
+    found = set()
+    for dirpath, dirnames, filenames in os.walk(ASSETS_DIR):
+        base = Path(dirpath)
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and not (base / d / ".gdignore").exists()]
+        found.update(res_path(base / name) for name in filenames
+                     if not name.startswith(".") and not name.endswith(".import"))
+    return found
+
+
+def manifest_assets() -> dict[str, str]:
+    """res:// path -> manifest key for everything the generators produce."""
+    generated = {f"res://assets/{key}.png": key for key in IMAGES}
+    generated.update({f"res://assets/audio/{key}.wav": key for key in TRACKS})
+    return generated
+
+
+def pipeline_outputs() -> set[str]:
+    """Index files written by the pipeline itself rather than listed in the manifest."""
+    return {res_path(build_atlases.INDEX_FILE), res_path(process_audio.META_FILE),
+            res_path(bake_spin_wheel.TEXTURE_FILE), res_path(bake_spin_wheel.META_FILE)}
+
+
+def runtime_references(literals: dict[str, list[str]], on_disk: set[str]) -> dict[str, str]:
+    """Files the game loads indirectly, mapped to the reference that implies them."""
+    implied = {}
+    for ref in literals:
+        if ref.endswith(".wav"):
+            implied[ref[:-4] + ".ogg"] = ref  # AudioManager prefers the encoded sibling
+    if ATLAS_INDEX in literals and local_path(ATLAS_INDEX).exists():
+        with open(local_path(ATLAS_INDEX)) as f:
+            for entry in json.load(f).values():
+                implied.setdefault(entry["atlas"], ATLAS_INDEX)
+    return {path: source for path, source in implied.items() if path in on_disk}
+
+
+def oversized(path: str) -> str | None:
+    """Why a file is over budget, or None."""
+    local = local_path(path)
+    suffix = local.suffix
+    key = path.removeprefix("res://assets/").removesuffix(suffix)
+    if suffix == ".png" and key in IMAGES:
+        size = target_size(IMAGES[key]["prompt"])
+        if size is not None:
+            with Image.open(local) as image:
+                if image.width > size[0] or image.height > size[1]:
+                    return f"{image.width}x{image.height}, unprocessed (target {size[0]}x{size[1]})"
+    budget = SIZE_BUDGETS.get(suffix)
+    nbytes = local.stat().st_size
+    if budget is not None and nbytes > budget:
+        return f"{nbytes // 1024} KB (budget {budget // 1024} KB)"
+    return None
+
+
+def build_index() -> dict:
+    files = source_files()
+    literals, globs = scan_references(files)
+    on_disk = disk_assets()
+    generated = manifest_assets()
+    implied = runtime_references(literals, on_disk)
+    variant_inputs = {source for config in tier_variants.variants().values()
+                      for source in tier_variants.inputs(config)}
+
+    used = {ref for ref in literals if ref in on_disk}
+    used.update(implied)
+    for pattern in globs:
+        used.update(fnmatch.filter(on_disk, pattern))
+    # A .wav is never loaded once its .ogg exists
+    used -= {path for path in used if path.endswith(".wav") and path[:-4] + ".ogg" in used}
+
+    missing = {ref: where for ref, where in literals.items()
+               if not local_path(ref).exists() and ref[:-4] + ".ogg" not in implied}
+    return {
+        "scanned": len(files),
+        "references": len(literals),
+        "globs": {pattern: where for pattern, where in sorted(globs.items())},
+        "missing": {ref: {"pending": ref in generated or ref in pipeline_outputs(), "referenced_at": where}
+                    for ref, where in sorted(missing.items())},
+        "unused": sorted(on_disk - used),
+        "unshipped": sorted(key for path, key in generated.items()
+                            if path not in literals and path not in used and key not in variant_inputs
+                            and not any(fnmatch.fnmatch(path, g) for g in globs)),
+        "oversized": {path: reason for path in sorted(used) if (reason := oversized(path))},
+        "used_bytes": sum(local_path(path).stat().st_size for path in used),
+        "unused_bytes": sum(local_path(path).stat().st_size for path in on_disk - used),
+        "data_files": sorted(path for path in used | set(literals)
+                             if Path(path).suffix in DATA_SUFFIXES and path.startswith("res://assets/")),
+    }
+
+
+def export_filters(index: dict) -> tuple[list[str], list[str]]:
+    """(include, exclude) filter patterns for an export preset."""
+    include = [path.removeprefix("res://") for path in index["data_files"]]
+    exclude = [path.removeprefix("res://") for path in index["unused"]]
+    return include, exclude
+
+
+def write_preset(name: str, include: list[str], exclude: list[str]) -> bool:
+    """Set a preset's include/exclude filters, keeping hand-written non-asset patterns."""
+    text = PRESETS_FILE.read_text()
+    sections = re.split(r"(?m)^(?=\[)", text)
+    for i, section in enumerate(sections):
+        if not re.match(r"\[preset\.\d+\]\s", section) or f'\nname="{name}"\n' not in section:
+            continue
+        for key, generated in (("include_filter", include), ("exclude_filter", exclude)):
+            current = re.search(rf'(?m)^{key}="(.*)"$', section).group(1)
+            kept = [p.strip() for p in current.split(",") if p.strip() and not p.strip().startswith("assets/")]
+            value = ", ".join(kept + generated)
+            section = re.sub(rf'(?m)^{key}=".*"$', lambda _: f'{key}="{value}"', section)
+        sections[i] = section
+        PRESETS_FILE.write_text("".join(sections))
+        return True
+    return False
+
+
+def print_report(index: dict) -> None:
+    print(f"=== Asset Index ===")
+    print(f"Scanned {index['scanned']} files, {index['references']} references, "
+          f"{len(index['globs'])} dynamic patterns")
+    if index["missing"]:
+        print(f"\nMissing ({len(index['missing'])}):")
+        for ref, info in index["missing"].items():
+            state = "not generated yet" if info["pending"] else "NOT IN MANIFEST"
+            print(f"  {ref}  [{state}]  <- {', '.join(info['referenced_at'])}")
+    if index["unused"]:
+        print(f"\nUnused ({len(index['unused'])}, {index['unused_bytes'] / 1024:.0f} KB excluded from export):")
+        for path in index["unused"]:
+            print(f"  {path}")
+    if index["oversized"]:
+        print(f"\nOversized ({len(index['oversized'])}):")
+        for path, reason in index["oversized"].items():
+            print(f"  {path}  {reason}")
+    if index["unshipped"]:
+        print(f"\nGenerated but never referenced ({len(index['unshipped'])}):")
+        for key in index["unshipped"]:
+            print(f"  {key}")
+    print(f"\nShipped assets: {index['used_bytes'] / 1024:.0f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-check res:// references against assets and the manifest.")
+    parser.add_argument("--json", action="store_true", help="Print the index as JSON")
+    parser.add_argument("--filters", action="store_true", help="Print export include/exclude filters")
+    parser.add_argument("--write-preset", metavar="NAME", help="Write the filters into this export preset")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit 1 if a reference is missing and nothing in the pipeline produces it")
+    args = parser.parse_args()
+
+    index = build_index()
+    include, exclude = export_filters(index)
+    if args.json:
+        print(json.dumps({**index, "include_filter": include, "exclude_filter": exclude}, indent=2))
+    elif args.filters:
+        print(f'include_filter="{", ".join(include)}"')
+        print(f'exclude_filter="{", ".join(exclude)}"')
+    else:
+        print_report(index)
+
+    if args.write_preset:
+        if not write_preset(args.write_preset, include, exclude):
+            sys.exit(f"No export preset named {args.write_preset!r} in {PRESETS_FILE.name}")
+        print(f"Updated preset {args.write_preset!r}: {len(include)} included, {len(exclude)} excluded")
+    if args.check and any(not info["pending"] for info in index["missing"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Declarative manifest of every generated asset in Music Label Tycoon.
+Images are DALL-E prompts keyed by their path under assets/ (without the
+extension); tracks are Lyria prompts keyed by their path under
+assets/audio/, and short SFX carry a "synth" recipe that chiptune_synth.py
+renders locally instead. The generators, post-processors and tools/assetgen.py all
+read their work lists from here.
+"""
+
+# --- Style Anchors ---
+PIXEL_ART_ANCHOR = "16-bit pixel art style, limited color palette, black outline, transparent background, game asset, clean crisp pixels, retro video game aesthetic"
+BACKGROUND_ANCHOR = "16-bit pixel art style, detailed interior scene, limited color palette, atmospheric lighting, portrait aspect ratio, retro video game background, no characters, no text, no UI elements"
+
+# --- Image Definitions ---
+# Each image: prompt and DALL-E size. Sprite prompts name their final size
+# ("32x32 sprite"), which process_sprites.py downscales to. Entries with
+# "variant_of" are palette swaps of another sprite (tier_variants.py) and
+# are never sent to DALL-E; their prompt documents the intended look.
+CORE_IMAGES = {
+    # === CD Sprites (32x32) ===
+    "sprites/cds/cd_demo": {
+        "prompt": f"A simple plain silver compact disc, basic demo CD, minimal design, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered",
+        "size": "1024x1024",
+    },
+    "sprites/cds/cd_single": {
+        "prompt": f"A compact disc in a blue jewel case, music single release, slightly shiny, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, blue color scheme",
+        "size": "1024x1024",
+        "variant_of": "sprites/cds/cd_demo",  # Palette swap, see tier_variants.py
+        "remap": {"hue": 215, "min_saturation": 0.55},
+    },
+    "sprites/cds/cd_ep": {
+        "prompt": f"A compact disc in a green jewel case with small sparkle effects around it, EP music release, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, green color scheme, tiny star sparkles",
+        "size": "1024x1024",
+        "variant_of": "sprites/cds/cd_demo",
+        "remap": {"hue": 130, "min_saturation": 0.55},
+        "overlays": [{"effect": "sprites/effects/particle_sparkle", "at": [23, 1]},
+                     {"effect": "sprites/effects/particle_sparkle", "at": [1, 22]}],
+    },
+    "sprites/cds/cd_album": {
+        "prompt": f"A compact disc in a luxurious gold jewel case with subtle golden glow aura, full album release, premium look, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, gold color scheme",
+        "size": "1024x1024",
+        "variant_of": "sprites/cds/cd_demo",
+        "remap": {"hue": 45, "min_saturation": 0.7, "value": 1.05},
+        "overlays": [{"effect": "sprites/effects/particle_glow", "scale": 2, "mode": "under", "opacity": 0.6}],
+    },
+    "sprites/cds/cd_platinum": {
+        "prompt": f"A platinum colored compact disc with shimmering particle effects surrounding it, platinum certified record, very prestigious, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, white and silver color scheme, glowing particles",
+        "size": "1024x1024",
+        "variant_of": "sprites/cds/cd_demo",
+        "remap": {"saturation": 0.3, "value": 1.2},
+        "overlays": [{"effect": "sprites/effects/particle_glow", "scale": 2, "mode": "under", "opacity": 0.4},
+                     {"effect": "sprites/effects/particle_sparkle", "at": [23, 1]},
+                     {"effect": "sprites/effects/particle_sparkle", "at": [2, 3]},
+                     {"effect": "sprites/effects/particle_sparkle", "at": [22, 23]}],
+    },
+    "sprites/cds/cd_diamond": {
+        "prompt": f"A diamond-encrusted compact disc with rainbow prismatic aura and sparkles, legendary diamond record, most valuable, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, cyan and rainbow color scheme, brilliant shine",
+        "size": "1024x1024",
+        "variant_of": "sprites/cds/cd_demo",
+        "remap": {"hue": 180, "rainbow": True, "min_saturation": 0.6, "value": 1.1},
+        "overlays": [{"effect": "sprites/effects/particle_glow", "scale": 2, "mode": "under", "opacity": 0.7},
+                     {"effect": "sprites/effects/particle_sparkle", "at": [23, 1]},
+                     {"effect": "sprites/effects/particle_sparkle", "at": [1, 22]},
+                     {"effect": "sprites/effects/particle_sparkle", "at": [12, 0], "mode": "add"}],
+    },
+
+    # === Artist Sprites (64x64) ===
+    "sprites/artists/artist_busker": {
+        "prompt": f"A street busker character with acoustic guitar, worn casual clothes, hat for tips, humble musician, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, sandy brown warm tones",
+        "size": "1024x1024",
+    },
+    "sprites/artists/artist_garage_band": {
+        "prompt": f"A garage band rock musician with electric guitar, band t-shirt, jeans, energetic casual look, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, slate blue cool tones",
+        "size": "1024x1024",
+    },
+    "sprites/artists/artist_indie": {
+        "prompt": f"A trendy indie artist musician, unique hipster style, headphones around neck, creative outfit, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, medium purple tones",
+        "size": "1024x1024",
+    },
+    "sprites/artists/artist_studio_pro": {
+        "prompt": f"A professional studio musician with studio headphones, clean modern outfit, confident pose, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, orange-red tones",
+        "size": "1024x1024",
+    },
+    "sprites/artists/artist_chart_topper": {
+        "prompt": f"A flashy pop star musician, stylish trendy outfit, microphone, stage presence, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, hot pink tones",
+        "size": "1024x1024",
+    },
+    "sprites/artists/artist_superstar": {
+        "prompt": f"A glamorous music superstar celebrity, gold jewelry and accessories, designer clothes, sunglasses, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, gold tones",
+        "size": "1024x1024",
+    },
+    "sprites/artists/artist_legend": {
+        "prompt": f"An iconic legendary rockstar, dark mysterious aura, legendary status, dramatic cape or coat, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, dark violet purple tones, subtle glow",
+        "size": "1024x1024",
+    },
+
+    # === Backgrounds (portrait) ===
+    "sprites/backgrounds/bg_main_studio": {
+        "prompt": f"Interior of a cozy music recording studio, mixing console desk with knobs and sliders, large speakers on walls, vinyl records hanging as decoration, warm amber lighting, cables on floor, microphone stand visible, {BACKGROUND_ANCHOR}, dark blue-gray color base, warm and inviting atmosphere",
+        "size": "1024x1792",
+    },
+    "sprites/backgrounds/bg_artist_roster": {
+        "prompt": f"Backstage talent agency office interior, music posters on walls, comfortable couch, stage lights visible through a doorway, gold records on display, {BACKGROUND_ANCHOR}, dark blue-purple color base, professional yet creative atmosphere",
+        "size": "1024x1792",
+    },
+    "sprites/backgrounds/bg_studio_upgrades": {
+        "prompt": f"Recording studio control room with equipment racks full of gear, LED level meters glowing, mixing board, patch cables, audio compressors, {BACKGROUND_ANCHOR}, dark red-brown color base, technical and professional atmosphere",
+        "size": "1024x1792",
+    },
+    "sprites/backgrounds/bg_casino": {
+        "prompt": f"Neon-lit casino floor interior, slot machines with colorful lights, card table visible, flashy neon signs, exciting nightlife atmosphere, {BACKGROUND_ANCHOR}, dark green color base, exciting and energetic atmosphere, lots of neon glow",
+        "size": "1024x1792",
+    },
+    "sprites/backgrounds/bg_shop": {
+        "prompt": f"Music merchandise store interior, shelves stocked with CDs and vinyl records, band posters on walls, neon OPEN sign, display cases, {BACKGROUND_ANCHOR}, dark warm gold-brown color base, inviting retail atmosphere",
+        "size": "1024x1792",
+    },
+
+    # === UI Elements ===
+    "sprites/ui/icon_cd_currency": {
+        "prompt": f"A small shiny gold compact disc icon, currency symbol for a game, simple and recognizable, {PIXEL_ART_ANCHOR}, 16x16 sprite size, gold and yellow tones, bright and clear",
+        "size": "1024x1024",
+    },
+    "sprites/ui/icon_nav_music": {
+        "prompt": f"A music note icon, simple eighth note or treble clef, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
+        "size": "1024x1024",
+    },
+    "sprites/ui/icon_nav_artist": {
+        "prompt": f"A microphone icon, simple stage microphone, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
+        "size": "1024x1024",
+    },
+    "sprites/ui/icon_nav_studio": {
+        "prompt": f"A mixing board or equalizer icon with sliders, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
+        "size": "1024x1024",
+    },
+    "sprites/ui/icon_nav_casino": {
+        "prompt": f"A dice and playing card icon, gambling casino symbol, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
+        "size": "1024x1024",
+    },
+    "sprites/ui/icon_nav_shop": {
+        "prompt": f"A shopping bag icon, small retail bag with handle, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
+        "size": "1024x1024",
+    },
+    "sprites/ui/icon_gem_premium": {
+        "prompt": f"A small purple gemstone, premium currency gem, faceted jewel, game currency icon, {PIXEL_ART_ANCHOR}, 16x16 sprite size, purple and violet tones, shiny",
+        "size": "1024x1024",
+    },
+    "sprites/ui/mystery_crate_closed": {
+        "prompt": f"A closed treasure chest or loot box, mystery crate, wooden chest with gold trim and a question mark on front, {PIXEL_ART_ANCHOR}, 64x64 sprite size, purple and gold color scheme",
+        "size": "1024x1024",
+    },
+    "sprites/ui/mystery_crate_open": {
+        "prompt": f"An opened treasure chest or loot box with golden light beaming out, mystery crate revealing prizes, {PIXEL_ART_ANCHOR}, 64x64 sprite size, purple and gold color scheme, bright golden glow from inside",
+        "size": "1024x1024",
+    },
+
+    # === Effects ===
+    "sprites/effects/particle_sparkle": {
+        "prompt": f"A small sparkle star burst effect, white and yellow, 4-pointed star twinkle, particle effect for games, {PIXEL_ART_ANCHOR}, 8x8 sprite size, bright white and yellow",
+        "size": "1024x1024",
+    },
+    "sprites/effects/particle_glow": {
+        "prompt": f"A soft circular glow effect, radial gradient from bright center to transparent edge, warm golden light, particle effect for games, {PIXEL_ART_ANCHOR}, 16x16 sprite size, gold and white",
+        "size": "1024x1024",
+    },
+    "sprites/effects/particle_notes": {
+        "prompt": f"Small floating music notes, various musical note symbols scattered, eighth notes and quarter notes, {PIXEL_ART_ANCHOR}, 16x16 sprite size, white and pastel colors",
+        "size": "1024x1024",
+    },
+    "sprites/effects/collect_burst": {
+        "prompt": f"A radial burst explosion effect, lines emanating outward from center point, coin collect impact effect, {PIXEL_ART_ANCHOR}, 16x16 sprite size, gold and white rays",
+        "size": "1024x1024",
+    },
+    "sprites/effects/levelup_flash": {
+        "prompt": f"A bright starburst level up effect with small upward arrows, celebratory flash, upgrade complete effect, {PIXEL_ART_ANCHOR}, 32x32 sprite size, bright yellow and white with upward arrows",
+        "size": "1024x1024",
+    },
+}
+
+# Casino and studio screen extras, added after the core set
+EXTRA_IMAGES = {
+    # === Spin Wheel ===
+    "sprites/casino/spin_wheel_base": {
+        "prompt": f"A colorful circular prize wheel divided into 6 segments, carnival game wheel, bright neon colors purple gold silver orange gray, spin wheel game show, top-down view of wheel face, {PIXEL_ART_ANCHOR}, 128x128 sprite, centered",
+        "size": "1024x1024",
+    },
+    "sprites/casino/spin_wheel_pointer": {
+        "prompt": f"A small red arrow pointer triangle pointing downward, game show wheel indicator, shiny metallic red with golden border, {PIXEL_ART_ANCHOR}, 32x32 sprite, centered on transparent background",
+        "size": "1024x1024",
+    },
+    "sprites/casino/prize_cd_stack": {
+        "prompt": f"A small stack of three silver compact discs piled on top of each other, CD pile reward icon, shiny metallic, {PIXEL_ART_ANCHOR}, 32x32 sprite, single item centered",
+        "size": "1024x1024",
+    },
+    "sprites/casino/prize_boost_lightning": {
+        "prompt": f"A bright yellow lightning bolt icon with orange glow, power boost energy symbol, electric energy, {PIXEL_ART_ANCHOR}, 32x32 sprite, single item centered",
+        "size": "1024x1024",
+    },
+    "sprites/casino/prize_gem": {
+        "prompt": f"A shiny purple amethyst gemstone cut diamond shape, premium currency gem, sparkling facets, {PIXEL_ART_ANCHOR}, 32x32 sprite, single item centered",
+        "size": "1024x1024",
+    },
+    "sprites/casino/prize_empty": {
+        "prompt": f"A sad face emoji or broken empty prize box, consolation prize nothing icon, gray muted colors, disappointed, {PIXEL_ART_ANCHOR}, 32x32 sprite, single item centered",
+        "size": "1024x1024",
+    },
+    # === Studio Upgrade Icons ===
+    "sprites/studio/icon_recording_quality": {
+        "prompt": f"A professional studio microphone with headphones, high quality audio recording equipment, silver and red, {PIXEL_ART_ANCHOR}, 64x64 sprite, single item centered, music production",
+        "size": "1024x1024",
+    },
+    "sprites/studio/icon_marketing_reach": {
+        "prompt": f"A megaphone or bullhorn with sound waves emanating from it, marketing advertising promotion, blue and white, {PIXEL_ART_ANCHOR}, 64x64 sprite, single item centered, loud announcement",
+        "size": "1024x1024",
+    },
+    # === Gacha extras ===
+    "sprites/casino/gacha_crate_glow": {
+        "prompt": f"A glowing treasure chest mystery box opening with golden light rays bursting out, loot crate reveal moment, magical sparkles, {PIXEL_ART_ANCHOR}, 64x64 sprite, centered, dramatic lighting",
+        "size": "1024x1024",
+    },
+}
+
+IMAGES = {**CORE_IMAGES, **EXTRA_IMAGES}
+
+# --- Sprite Sheets ---
+# Small icons generated together: one DALL-E request draws the members as a
+# grid (in this order) and sprite_sheets.py slices it back into one raw
+# image per member. Members keep their own entry for the subject and final
+# sprite size; sheets live under art_raw/ and never ship.
+SHEETS = {
+    "sheets/ui_nav": {
+        "members": ["sprites/ui/icon_nav_music", "sprites/ui/icon_nav_artist", "sprites/ui/icon_nav_studio",
+                    "sprites/ui/icon_nav_casino", "sprites/ui/icon_nav_shop"],
+    },
+    "sheets/currency_prizes": {
+        "members": ["sprites/ui/icon_cd_currency", "sprites/ui/icon_gem_premium",
+                    "sprites/casino/prize_cd_stack", "sprites/casino/prize_boost_lightning",
+                    "sprites/casino/prize_gem", "sprites/casino/prize_empty"],
+    },
+    "sheets/effects": {
+        "members": ["sprites/effects/particle_sparkle", "sprites/effects/particle_glow",
+                    "sprites/effects/particle_notes", "sprites/effects/collect_burst",
+                    "sprites/effects/levelup_flash"],
+    },
+}
+
+# --- Track Definitions ---
+# Each track: prompt, BPM, duration in seconds, output subpath. A "synth"
+# recipe (see chiptune_synth.py) takes precedence over the Lyria prompt.
+TRACKS = {
+    "music/main_theme": {
+        "prompt": "upbeat chiptune 8-bit retro video game music, catchy melody, energetic but not frantic, positive vibes, lo-fi electronic, synthesizer lead, steady beat",
+        "bpm": 120,
+        "duration": 60,  # 1 minute loop
+        "temperature": 1.0,
+    },
+    "music/casino_theme": {
+        "prompt": "jazzy chiptune casino music, exciting slot machine vibes, playful saxophone-like synth, upbeat swing rhythm, 8-bit retro style, suspenseful but fun",
+        "bpm": 130,
+        "duration": 60,
+        "temperature": 1.0,
+    },
+    "sfx/win_jingle": {
+        "prompt": "short triumphant victory fanfare, chiptune celebration jingle, bright and exciting, level up achievement sound, 8-bit retro game",
+        "bpm": 140,
+        "duration": 8,  # Short jingle
+        "temperature": 0.8,
+        "synth": {  # Rendered locally by chiptune_synth.py instead of Lyria
+            "seed": 140,
+            "voices": [
+                {"wave": "square", "duty": 0.25, "volume": 0.45, "adsr": [0.004, 0.04, 0.7, 0.05],
+                 "notes": [["C5", 0.0, 0.15], ["E5", 0.15, 0.15], ["G5", 0.3, 0.15], ["C6", 0.45, 0.3],
+                           ["G5", 0.75, 0.15], ["F5", 1.05, 0.15], ["A5", 1.2, 0.15], ["C6", 1.35, 0.15],
+                           ["F6", 1.5, 0.3], ["E6", 1.8, 0.15],
+                           {"pitch": "G6", "start": 1.95, "length": 1.6, "arp": [0, -3, -7, -12],
+                            "arp_rate": 16, "vibrato": [0.15, 6], "adsr": [0.004, 0.2, 0.6, 0.6]}]},
+                {"wave": "square", "duty": 0.5, "volume": 0.2, "adsr": [0.004, 0.04, 0.6, 0.05],
+                 "notes": [["G4", 0.0, 0.45], ["C5", 0.45, 0.6], ["A4", 1.05, 0.45], ["C5", 1.5, 0.45],
+                           {"pitch": "E5", "start": 1.95, "length": 1.6, "adsr": [0.004, 0.2, 0.6, 0.6]}]},
+                {"wave": "triangle", "volume": 0.5, "adsr": [0.002, 0.02, 0.9, 0.05],
+                 "notes": [["C3", 0.0, 0.45], ["G3", 0.45, 0.6], ["F3", 1.05, 0.45], ["G3", 1.5, 0.45],
+                           ["C3", 1.95, 1.6]]},
+                {"wave": "noise", "volume": 0.25, "adsr": [0.0, 0.06, 0.0, 0.01],
+                 "notes": [[9000, t, 0.08] for t in (0.0, 0.3, 0.45, 0.75, 1.05, 1.35, 1.5, 1.8)]
+                          + [{"pitch": 12000, "start": 1.95, "length": 0.9, "adsr": [0.0, 0.8, 0.0, 0.05]}]},
+            ],
+        },
+    },
+    "sfx/collect_cd": {
+        "prompt": "short satisfying pickup coin collect sound, bright ping chime, single note reward sound, 8-bit retro game sound effect",
+        "bpm": 120,
+        "duration": 3,
+        "temperature": 0.5,
+        "synth": {
+            "seed": 3,
+            "voices": [
+                {"wave": "square", "duty": 0.5, "volume": 0.5, "adsr": [0.001, 0.03, 0.6, 0.25],
+                 "notes": [["B5", 0.0, 0.07], ["E6", 0.07, 0.45]]},
+                {"wave": "triangle", "volume": 0.2, "adsr": [0.001, 0.05, 0.5, 0.3],
+                 "notes": [["E7", 0.07, 0.4]]},
+            ],
+        },
+    },
+    "sfx/spin_wheel": {
+        "prompt": "spinning wheel clicking ratchet sound building suspense, carnival wheel of fortune, ticking getting slower, 8-bit retro",
+        "bpm": 160,
+        "duration": 6,
+        "temperature": 0.8,
+        "synth": {
+            "seed": 160,
+            "voices": [
+                # Ratchet ticks, each gap 6% longer than the last as the wheel slows
+                {"wave": "noise", "volume": 0.6, "adsr": [0.0005, 0.015, 0.0, 0.01],
+                 "repeat": {"count": 34, "interval": 0.05, "growth": 1.06},
+                 "notes": [[7000, 0.0, 0.03]]},
+                {"wave": "square", "duty": 0.125, "volume": 0.2, "adsr": [0.0005, 0.008, 0.0, 0.004],
+                 "repeat": {"count": 34, "interval": 0.05, "growth": 1.06},
+                 "notes": [["C7", 0.0, 0.012]]},
+            ],
+        },
+    },
+    "sfx/gacha_reveal": {
+        "prompt": "dramatic reveal unveiling sound, building anticipation then bright sparkle reveal, treasure chest opening, magical shimmer, 8-bit retro",
+        "bpm": 100,
+        "duration": 5,
+        "temperature": 0.8,
+        "synth": {
+            "seed": 100,
+            "voices": [
+                # Rising build-up, then a sparkle arpeggio over a crash at the reveal
+                {"wave": "square", "duty": 0.125, "volume": 0.35, "sweep": 24, "arp": [0, 7], "arp_rate": 16,
+                 "adsr": [2.3, 0.0, 1.0, 0.05], "notes": [["C4", 0.0, 2.5]]},
+                {"wave": "noise", "volume": 0.2, "sweep": 24, "adsr": [2.4, 0.0, 1.0, 0.05],
+                 "notes": [[3000, 0.0, 2.5]]},
+                {"wave": "triangle", "volume": 0.5, "arp": [0, 4, 7, 12], "arp_rate": 20,
+                 "adsr": [0.005, 0.2, 0.5, 1.0], "notes": [["C6", 2.5, 1.8]]},
+                {"wave": "square", "duty": 0.5, "volume": 0.3, "adsr": [0.002, 0.1, 0.5, 0.3],
+                 "notes": [["G5", 2.5, 0.6], ["E5", 2.5, 0.6]]},
+                {"wave": "noise", "volume": 0.3, "adsr": [0.0, 0.6, 0.0, 0.2],
+                 "notes": [[12000, 2.5, 0.8]]},
+            ],
+        },
+    },
+}
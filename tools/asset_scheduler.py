@@ -0,0 +1,132 @@
+"""
+Concurrent request scheduler shared by the asset generators.
+Paces API requests from any number of threads with an adaptive token
+bucket that backs off on 429/Retry-After responses. Budget reservations
+live in cost_ledger.py so they also hold across parallel runs.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import telemetry
+
+# --- Configuration ---
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BACKOFF_SECONDS = 13.0  # Old fixed sleep, used when no Retry-After is sent
+BACKOFF_FACTOR = 0.5  # Rate multiplier applied on every 429
+RECOVERY_STEP = 0.1  # Fraction of the starting rate regained per success
+
+
+class RateLimited(Exception):
+    """Raised by a worker when the provider answers 429 Too Many Requests."""
+
+    def __init__(self, retry_after: float | None = None, message: str = "rate limited"):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate adapts to 429 responses.
+
+    Starts at ``rate_per_minute``, halves on every rate-limit response and
+    creeps back up by a small step per success, never exceeding
+    ``max_rate_per_minute``.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 1,
+                 max_rate_per_minute: float | None = None,
+                 min_rate_per_minute: float = 1.0):
+        self.rate = rate_per_minute / 60.0
+        self.max_rate = (max_rate_per_minute or rate_per_minute) / 60.0
+        self.min_rate = min_rate_per_minute / 60.0
+        self.step = self.rate * RECOVERY_STEP
+        self.capacity = max(1, burst)
+        self.tokens = 1.0
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if now >= self.paused_until:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                else:
+                    wait = (1.0 - self.tokens) / self.rate
+                self._cond.wait(timeout=wait)
+
+    def backoff(self, retry_after: float | None = None) -> float:
+        """Pause every worker and lower the rate after a 429. Returns the pause."""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * BACKOFF_FACTOR)
+            pause = retry_after if retry_after is not None else DEFAULT_BACKOFF_SECONDS
+            self.paused_until = max(self.paused_until, now + pause)
+            self.tokens = 0.0
+            self._cond.notify_all()
+            return pause
+
+    def success(self) -> None:
+        """Record a successful request, nudging the rate back towards the max."""
+        with self._cond:
+            self.rate = min(self.max_rate, self.rate + self.step)
+
+    @property
+    def rate_per_minute(self) -> float:
+        return self.rate * 60.0
+
+
+def call_with_retry(fn, limiter: TokenBucket, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+    """Call ``fn()`` under ``limiter``, retrying on ``RateLimited``.
+
+    Each attempt first takes a token. A 429 pauses every caller sharing the
+    limiter for the advertised Retry-After. Other exceptions propagate.
+    """
+    for n in range(1, max_attempts + 1):
+        with telemetry.span("await rate limiter", "scheduler", attempt=n):
+            limiter.acquire()
+        try:
+            with telemetry.span("request", "scheduler", attempt=n):
+                result = fn()
+        except RateLimited as e:
+            pause = limiter.backoff(e.retry_after)
+            telemetry.mark("rate limited", "scheduler", retry_after=e.retry_after, pause=pause)
+            if n == max_attempts:
+                raise
+            print(f"  Rate limited, retrying in {pause:.1f}s "
+                  f"(now {limiter.rate_per_minute:.1f} req/min)")
+            continue
+        limiter.success()
+        return result
+    raise RateLimited()
+
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Perceptual similarity index for the generated images.
+Fingerprints every manifest image (the full-resolution original in
+art_raw/ when there is one, else the file in assets/) with a 64-bit DCT
+perceptual hash, a 64-bit difference hash and a coarse colour histogram.
+Sprites are fingerprinted as they ship: keyed and downscaled by
+process_sprites.process_sprite, so painted backdrops and fake
+transparency checkerboards don't count. The work runs in parallel and
+the results are kept in art_raw/, so only changed files are rehashed.
+
+Two kinds of duplicate are reported. Image duplicates agree on both
+hashes and on colour (the same render saved twice, or a resized or
+requantized copy). Palette swaps such as the CD tiers differ in colour
+and stay apart. Prompt duplicates were asked for with nearly the same
+words and are usually the same idea drawn twice. The hashes don't catch
+those, so they are matched by prompt (prompt_match). Each cluster comes
+with a suggested consolidation: keep the most referenced member as the
+shared texture, rewrite the others' res:// references to it and drop
+their manifest entries.
+
+assetgen.py also asks prompt_match() before paying for a new manifest
+entry: a prompt that nearly repeats one whose result already exists is
+skipped unless --allow-similar is passed.
+
+Usage:
+    python3 tools/asset_similarity.py                  # update the index, report clusters
+    python3 tools/asset_similarity.py query sprites/casino/prize_gem -k 5
+    python3 tools/asset_similarity.py query /tmp/candidate.png
+    python3 tools/asset_similarity.py clusters --json
+"""
+
+import argparse
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import asset_index
+from asset_manifest import IMAGES
+from process_sprites import ASSETS_DIR, DEFAULT_COLORS, RAW_DIR, process_sprite, target_size
+from sprite_sheets import subject
+
+# --- Configuration ---
+INDEX_FILE = RAW_DIR / "similarity_index.json"
+INDEX_VERSION = 1  # Bump when fingerprints change
+KEY_SIZE = 64  # Sprites are keyed at this size before fingerprinting
+HASH_SAMPLE = 32  # Side of the greyscale thumbnail the DCT hash is taken from
+HASH_SIZE = 8  # Low-frequency block kept, HASH_SIZE**2 bits per hash
+HIST_LEVELS = 4  # Histogram buckets per RGB channel
+PHASH_MAX = 10  # Bits two image duplicates may differ by
+DHASH_MAX = 12
+HIST_MAX = 0.35  # Histogram distance (1 - intersection) two image duplicates may differ by
+PROMPT_SIMILARITY = 0.6  # TF-IDF cosine over prompt subjects at which two entries ask for the same thing
+PROMPT_STOPWORDS = {"a", "an", "and", "or", "of", "with", "for", "in", "on", "to", "from", "out", "the", "its",
+                    "single", "item", "small", "simple", "game", "sprite", "size", "icon", "style", "color",
+                    "colors", "tones", "scheme"}
+
+
+def source_path(asset: str) -> Path | None:
+    for path in (RAW_DIR / f"{asset}.png", ASSETS_DIR / f"{asset}.png"):
+        if path.exists():
+            return path
+    return None
+
+
+def load_rgba(path: Path, keyed: bool) -> np.ndarray:
+    """Pixels to fingerprint: raw sprites keyed at KEY_SIZE, anything else as stored."""
+    if keyed:
+        with Image.open(path) as image:
+            keyed = image.width > KEY_SIZE or image.height > KEY_SIZE
+    if keyed:
+        return np.asarray(process_sprite(path, KEY_SIZE, KEY_SIZE, DEFAULT_COLORS).convert("RGBA"))
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGBA"))
+
+
+def subject_pixels(rgba: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """RGB of the opaque bounding box over mid grey, and a mask of its opaque pixels."""
+    box = Image.fromarray(rgba[..., 3]).getbbox()
+    if box is not None:
+        rgba = rgba[box[1]:box[3], box[0]:box[2]]
+    alpha = rgba[..., 3:].astype(np.float32) / 255.0
+    rgb = (rgba[..., :3] * alpha + 128.0 * (1.0 - alpha)).astype(np.uint8)
+    return rgb, rgba[..., 3] > 0
+
+
+def dct_matrix(n: int) -> np.ndarray:
+    k = np.arange(n)
+    matrix = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n)) * np.sqrt(2.0 / n)
+    matrix[0] /= np.sqrt(2.0)
+    return matrix
+
+
+def bits(values: np.ndarray) -> str:
+    return f"{int(''.join('1' if v else '0' for v in values.ravel()), 2):016x}"
+
+
+def fingerprint(path: Path, keyed: bool = True) -> dict:
+    rgb, mask = subject_pixels(load_rgba(path, keyed))
+    gray = Image.fromarray(rgb).convert("L")
+    thumb = np.asarray(gray.resize((HASH_SAMPLE, HASH_SAMPLE), Image.LANCZOS), dtype=np.float64)
+    dct = dct_matrix(HASH_SAMPLE)
+    low = (dct @ thumb @ dct.T)[:HASH_SIZE, :HASH_SIZE]
+    phash = low > np.median(low.ravel()[1:])  # DC term left out of the median
+    grad = np.asarray(gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.LANCZOS), dtype=np.int16)
+    dhash = grad[:, 1:] > grad[:, :-1]
+
+    subject_rgb = rgb[mask] if mask.any() else rgb.reshape(-1, 3)
+    buckets = (subject_rgb // (256 // HIST_LEVELS)).astype(np.int64)
+    codes = (buckets[:, 0] * HIST_LEVELS + buckets[:, 1]) * HIST_LEVELS + buckets[:, 2]
+    hist = np.bincount(codes, minlength=HIST_LEVELS ** 3) / max(1, len(codes))
+    return {"phash": bits(phash), "dhash": bits(dhash), "hist": [round(float(v), 4) for v in hist]}
+
+
+def _fingerprint_job(job: tuple[str, str, bool]) -> tuple[str, dict]:
+    asset, path, keyed = job
+    return asset, fingerprint(Path(path), keyed)
+
+
+def load_index() -> dict:
+    if INDEX_FILE.exists():
+        with open(INDEX_FILE) as f:
+            index = json.load(f)
+        if index.get("version") == INDEX_VERSION:
+            return index
+    return {"version": INDEX_VERSION, "entries": {}}
+
+
+def update_index(jobs: int = os.cpu_count() or 1) -> tuple[dict, int]:
+    """Fingerprint new or changed images; returns the index and how many were hashed."""
+    index = load_index()
+    entries = {}
+    todo = []
+    for asset in IMAGES:
+        path = source_path(asset)
+        if path is None:
+            continue
+        stamp = [path.relative_to(asset_index.PROJECT_ROOT).as_posix(), path.stat().st_mtime_ns,
+                 path.stat().st_size]
+        previous = index["entries"].get(asset)
+        if previous and previous["stamp"] == stamp:
+            entries[asset] = previous
+        else:
+            entries[asset] = {"stamp": stamp}
+            todo.append((asset, str(path), target_size(IMAGES[asset]["prompt"]) is not None))
+    if todo:
+        with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(todo)))) as pool:
+            for asset, fp in pool.map(_fingerprint_job, todo):
+                entries[asset].update(fp)
+    index["entries"] = entries
+    if todo or not INDEX_FILE.exists():
+        RAW_DIR.mkdir(parents=True, exist_ok=True)
+        (RAW_DIR / ".gdignore").touch()
+        with open(INDEX_FILE, "w") as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+    return index, len(todo)
+
+
+def distance(a: dict, b: dict) -> dict:
+    return {
+        "phash": (int(a["phash"], 16) ^ int(b["phash"], 16)).bit_count(),
+        "dhash": (int(a["dhash"], 16) ^ int(b["dhash"], 16)).bit_count(),
+        "hist": round(1.0 - float(np.minimum(a["hist"], b["hist"]).sum()), 3),
+    }
+
+
+def is_near(d: dict) -> bool:
+    return d["phash"] <= PHASH_MAX and d["dhash"] <= DHASH_MAX and d["hist"] <= HIST_MAX
+
+
+def neighbours(fp: dict, entries: dict, k: int = 5, exclude: str | None = None) -> list[tuple[str, dict]]:
+    """The ``k`` closest entries, by perceptual hash distance then colour."""
+    scored = [(asset, distance(fp, entry)) for asset, entry in entries.items() if asset != exclude]
+    scored.sort(key=lambda item: (item[1]["phash"] + item[1]["dhash"] / 2, item[1]["hist"]))
+    return scored[:k]
+
+
+def prompt_words(prompt: str) -> set[str]:
+    words = set()
+    for word in re.findall(r"[a-z]+", subject(prompt).lower()):
+        if word in PROMPT_STOPWORDS:
+            continue
+        for suffix in ("ing", "ed", "es", "s"):
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                word = word[:-len(suffix)]
+                break
+        words.add(word)
+    return words
+
+
+def prompt_vectors(prompts: dict[str, str]) -> dict[str, dict[str, float]]:
+    """Unit TF-IDF vectors of prompt subjects.
+
+    Document frequencies come from the whole manifest, so the style anchor
+    and the vocabulary every sprite shares count for little.
+    """
+    corpus = [prompt_words(config["prompt"]) for config in IMAGES.values()]
+    frequency: dict[str, int] = {}
+    for words in corpus:
+        for word in words:
+            frequency[word] = frequency.get(word, 0) + 1
+    vectors = {}
+    for name, prompt in prompts.items():
+        weights = {word: float(np.log((1 + len(corpus)) / (1 + frequency.get(word, 0)))) + 1.0
+                   for word in prompt_words(prompt)}
+        norm = np.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vectors[name] = {word: w / norm for word, w in weights.items()}
+    return vectors
+
+
+def cosine(a: dict[str, float], b: dict[str, float]) -> float:
+    return round(sum(w * b.get(word, 0.0) for word, w in a.items()), 2)
+
+
+def prompt_match(prompt: str, candidates: dict[str, str]) -> tuple[str, float] | None:
+    """The candidate (asset -> prompt) that ``prompt`` nearly repeats, with its similarity."""
+    target = prompt_vectors({"": prompt})[""]
+    scored = [(asset, cosine(target, vector)) for asset, vector in prompt_vectors(candidates).items()]
+    best = max(scored, key=lambda item: item[1], default=None)
+    return best if best is not None and best[1] >= PROMPT_SIMILARITY else None
+
+
+def links(entries: dict) -> list[tuple[str, str, str]]:
+    """Pairs of indexed images that duplicate each other, and why (``image`` or ``prompt``)."""
+    vectors = prompt_vectors({asset: IMAGES[asset]["prompt"] for asset in entries})
+    assets = list(entries)
+    found = []
+    for i, a in enumerate(assets):
+        for b in assets[i + 1:]:
+            if is_near(distance(entries[a], entries[b])):
+                found.append((a, b, "image"))
+            elif cosine(vectors[a], vectors[b]) >= PROMPT_SIMILARITY:
+                found.append((a, b, "prompt"))
+    return found
+
+
+def clusters(entries: dict) -> list[list[str]]:
+    """Connected groups of duplicates, members in manifest order."""
+    parent = {asset: asset for asset in entries}
+
+    def root(asset: str) -> str:
+        while parent[asset] != asset:
+            parent[asset] = parent[parent[asset]]
+            asset = parent[asset]
+        return asset
+
+    for a, b, _ in links(entries):
+        parent[root(b)] = root(a)
+    groups: dict[str, list[str]] = {}
+    for asset in entries:
+        groups.setdefault(root(asset), []).append(asset)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def consolidation(group: list[str], literals: dict[str, list[str]]) -> dict:
+    """Keep the most referenced member (first in the manifest on a tie) and fold the rest into it."""
+    def refs(asset: str) -> list[str]:
+        return literals.get(f"res://assets/{asset}.png", [])
+
+    keep = max(group, key=lambda asset: len(refs(asset)))
+    drop = [asset for asset in group if asset != keep]
+    return {
+        "keep": keep,
+        "drop": drop,
+        "rewrite": {f"res://assets/{asset}.png": refs(asset) for asset in drop},
+        "saved_bytes": sum((ASSETS_DIR / f"{asset}.png").stat().st_size for asset in drop
+                           if (ASSETS_DIR / f"{asset}.png").exists()),
+    }
+
+
+def print_clusters(entries: dict) -> None:
+    literals, _ = asset_index.scan_references(asset_index.source_files())
+    found = clusters(entries)
+    vectors = prompt_vectors({asset: IMAGES[asset]["prompt"] for asset in entries})
+    print(f"=== Asset Similarity ===")
+    print(f"{len(entries)} images indexed, {len(found)} duplicate clusters")
+    saved = 0
+    for group in found:
+        plan = consolidation(group, literals)
+        saved += plan["saved_bytes"]
+        keep = plan["keep"]
+        print(f"\n  keep {keep}")
+        for asset in plan["drop"]:
+            d = distance(entries[keep], entries[asset])
+            where = plan["rewrite"][f"res://assets/{asset}.png"]
+            print(f"    fold {asset}  (phash {d['phash']}, dhash {d['dhash']}, colour {d['hist']:.2f}, "
+                  f"prompt {cosine(vectors[keep], vectors[asset]):.2f})")
+            rewrite = (f"rewrite res://assets/{asset}.png -> res://assets/{keep}.png in {', '.join(where)}"
+                       if where else "nothing references it")
+            print(f"      {rewrite}; drop its manifest entry")
+    if found:
+        print(f"\nConsolidating removes {saved / 1024:.0f} KB from assets/")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index generated images by perceptual hash and find duplicates.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    sub = parser.add_subparsers(dest="command")
+    query = sub.add_parser("query", help="Nearest neighbours of an asset key or image file")
+    query.add_argument("target")
+    query.add_argument("-k", type=int, default=5)
+    report = sub.add_parser("clusters", help="Report duplicate clusters and suggested consolidation")
+    report.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    index, hashed = update_index(args.jobs)
+    entries = {asset: entry for asset, entry in index["entries"].items() if "phash" in entry}
+    if args.command == "query":
+        if args.target in entries:
+            fp, exclude = entries[args.target], args.target
+        elif Path(args.target).is_file():
+            fp, exclude = fingerprint(Path(args.target)), None
+        else:
+            raise SystemExit(f"{args.target} is neither an indexed asset nor an image file")
+        vectors = prompt_vectors({asset: IMAGES[asset]["prompt"] for asset in entries})
+        for asset, d in neighbours(fp, entries, args.k, exclude):
+            prompt = f", prompt {cosine(vectors[exclude], vectors[asset]):.2f}" if exclude else ""
+            mark = "  IMAGE DUPLICATE" if is_near(d) else ""
+            print(f"  {asset}: phash {d['phash']}, dhash {d['dhash']}, colour {d['hist']:.2f}{prompt}{mark}")
+    elif args.command == "clusters" and args.json:
+        literals, _ = asset_index.scan_references(asset_index.source_files())
+        print(json.dumps([consolidation(group, literals) for group in clusters(entries)], indent=2))
+    else:
+        if hashed:
+            print(f"Hashed {hashed} new or changed images")
+        print_clusters(entries)
+
+
+if __name__ == "__main__":
+    main()
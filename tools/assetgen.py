@@ -0,0 +1,693 @@
+#!/usr/bin/env python3
+"""
+Asset pipeline CLI for Music Label Tycoon.
+Builds a dependency graph over everything in asset_manifest.py:
+
+    generate:<asset> -> process:<asset> -> atlas:<group> -> import
+
+and runs only the dirty nodes, in parallel. A node is dirty when its own
+check says so (missing or stale generation, unprocessed raw output, atlas
+inputs changed) or when any node it depends on ran. Up-to-date nodes are
+counted, not printed, so a prompt tweak shows exactly what it touches.
+
+Tier variants (manifest entries with "variant_of") skip generation: a
+variant:<asset> node in the process stage recolours the processed base
+sprite (tier_variants.py) and feeds the atlas like any other sprite.
+Members of a sprite sheet (asset_manifest.SHEETS) share one request: their
+generate nodes slice the output of generate:sheets/<name> (sprite_sheets.py).
+A bake:spin_wheel node in the atlas stage renders the spin wheel face
+from the casino sprites and SpinWheelData.PRIZES (bake_spin_wheel.py).
+A new image entry whose prompt nearly repeats one that already has a
+result is not paid for unless --allow-similar is passed (asset_similarity.py).
+With --candidates N each image is requested N times concurrently and the
+best-scoring variant is promoted (image_scoring.py); the others stay in the
+generation cache, so asking again only pays for candidates not seen yet.
+
+Usage:
+    python3 tools/assetgen.py
+    python3 tools/assetgen.py --only "sprites/cds/*" --dry-run
+    python3 tools/assetgen.py --stage process --stage atlas --jobs 8
+    python3 tools/assetgen.py --stage process --only "sfx/*" --encode ogg
+    python3 tools/assetgen.py --trace /tmp/run.jsonl   # see tools/telemetry.py
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import asset_similarity
+import bake_spin_wheel
+import build_atlases
+import generate_images
+import generate_music
+import image_scoring
+import process_audio
+import process_sprites
+import sprite_sheets
+import telemetry
+import tier_variants
+from asset_manifest import IMAGES, SHEETS, TRACKS
+from cost_ledger import CostLedger
+from generation_cache import GenerationCache, atomic_copy, request_key
+
+# --- Configuration ---
+PROJECT_ROOT = Path(__file__).parent.parent
+STAGES = ("generate", "process", "atlas", "import")
+DEFAULT_JOBS = os.cpu_count() or 1  # Process/atlas/import nodes; generate nodes have their own pool
+
+
+def _ignore_interrupt() -> None:
+    """Pool worker setup: Ctrl+C is handled by the parent, which shuts the pool down."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class Node:
+    """One unit of pipeline work.
+
+    ``check()`` returns ``fresh``, ``dirty`` or ``skip`` and only reads
+    state (apart from adopting untracked outputs into the cache); ``run()``
+    does the work and returns a status line, or None if there turned out to
+    be nothing to do.
+    """
+
+    def __init__(self, name: str, stage: str, check, run, deps: list[str] | None = None):
+        self.name = name
+        self.stage = stage
+        self.check = check
+        self.run = run
+        self.deps = deps or []
+
+
+class Pipeline:
+    """Shared state for node callbacks: cache, ledger, stamps and lazy clients."""
+
+    def __init__(self, args):
+        self.args = args
+        self.cache = GenerationCache()
+        self.sprite_stamps = process_sprites.load_stamps()
+        self.audio_stamps = process_audio.load_json(process_audio.STAMP_FILE)
+        self.audio_meta = process_audio.load_json(process_audio.META_FILE)
+        self._lock = threading.RLock()
+        self._dirty: set[str] = set()  # "sprites" / "audio": stamps changed since the last flush
+        self._ledger = None
+        self._images = None
+        self._music = None
+        self._pool = None
+        if not args.dry_run:
+            process_sprites.RAW_DIR.mkdir(parents=True, exist_ok=True)
+            (process_sprites.RAW_DIR / ".gdignore").touch()
+
+    # --- Lazily created workers (only paid for when a node needs them) ---
+
+    @property
+    def ledger(self) -> CostLedger:
+        """Opened on first use; dry runs get a read-only view so they leave no database behind."""
+        with self._lock:
+            if self._ledger is None:
+                self._ledger = CostLedger(read_only=self.args.dry_run)
+            return self._ledger
+
+    def images(self) -> generate_images.ImageGenerator:
+        with self._lock:
+            if self._images is None:
+                self._images = generate_images.ImageGenerator(self.cache, self.ledger)
+            return self._images
+
+    def music(self) -> generate_music.MusicGenerator:
+        with self._lock:
+            if self._music is None:
+                self._music = generate_music.MusicGenerator(
+                    self.cache, self.ledger, fake=self.args.fake_music,
+                    resume=not self.args.no_resume, sessions=self.args.music_sessions)
+            return self._music
+
+    def pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=max(1, self.args.jobs), initializer=_ignore_interrupt)
+            return self._pool
+
+    def restart_pool(self) -> None:
+        """Drop the worker processes so the next job runs reloaded processing code."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def close(self) -> None:
+        if self._music is not None:
+            self._music.close()
+        if self._pool is not None:
+            self._pool.shutdown()
+        self.cache.evict()  # Also writes the index once for the whole run
+        self.flush()
+
+    def flush(self) -> None:
+        """Write the cache index and any process stamps changed since the last flush."""
+        self.cache.flush()
+        with self._lock:
+            if "sprites" in self._dirty:
+                process_sprites.save_stamps(self.sprite_stamps)
+            if "audio" in self._dirty:
+                process_audio.save_json(process_audio.STAMP_FILE, self.audio_stamps)
+                process_audio.save_json(process_audio.META_FILE, self.audio_meta)
+            self._dirty.clear()
+
+    # --- generate ---
+
+    def generation_check(self, asset: str, output_path: Path, params: dict, adopt: bool = True):
+        """``adopt=False`` marks definitions an untracked (pre-cache) file cannot have come
+        from, such as a backend the old generators never used; that file is then dirty."""
+        def check() -> str:
+            key = request_key(**params)
+            state = self.cache.status(asset, key, output_path)
+            if state == "untracked" and not adopt:
+                return "dirty"
+            if state == "untracked" and not self.args.dry_run:
+                self.cache.adopt(asset, key, output_path, params)
+            return "fresh" if state in ("fresh", "untracked") else "dirty"
+        return check
+
+    def generate_image(self, asset: str, config: dict):
+        output_path = generate_images.ASSETS_DIR / f"{asset}.png"
+
+        def run() -> str | None:
+            key = request_key(**generate_images.request_params(config))
+            best_of = self.args.candidates > 1
+            if not (best_of and self.args.force) and self.cache.restore(key, output_path):
+                self.cache.record_output(asset, key)
+                return f"RESTORED (cache): {asset}"
+            if not self.args.allow_similar and self.cache.output_key(asset) is None:
+                match = self.similar_result(asset, config)
+                if match is not None:
+                    print(f"  SKIP (similar): {asset} repeats {match[0]} (prompt {match[1]:.2f}); "
+                          f"reuse it or pass --allow-similar")
+                    return None
+            if best_of:
+                return self.best_of(asset, config, output_path)
+            outcome = self.images().generate(asset, config, key)
+            if outcome == "budget":
+                return None
+            if outcome != "generated":
+                raise RuntimeError("image request failed")
+            return f"GENERATED: {asset}"
+        return self.generation_check(asset, output_path, generate_images.request_params(config)), run
+
+    def best_of(self, asset: str, config: dict, output_path: Path) -> str | None:
+        """Fetch --candidates variants concurrently, cached ones for free, and promote the best scoring."""
+        params = generate_images.request_params(config)
+        key = request_key(**params)
+        count = self.args.candidates
+        keys = [image_scoring.candidate_key(params, i) for i in range(count)]
+        if self.cache.get(keys[0]) is None:
+            # The result already in use competes as candidate 1: cached, or from before the cache
+            current = self.cache.get(key)
+            if current is None and self.cache.status(asset, key, output_path) == "untracked":
+                raw = process_sprites.RAW_DIR / f"{asset}.png"
+                current = raw if raw.exists() else output_path
+            if current is not None:
+                self.cache.put_file(keys[0], current, {**params, "candidate": 0})
+
+        work = Path(tempfile.mkdtemp(dir=process_sprites.RAW_DIR, prefix=".candidates-"))
+        try:
+            paths = [work / f"{i}.png" for i in range(count)]
+
+            def fetch(i: int) -> str:
+                if self.cache.restore(keys[i], paths[i]):
+                    return "cached"
+                return self.images().generate(asset, config, keys[i], paths[i])
+            with ThreadPoolExecutor(max_workers=count) as workers:
+                outcomes = list(workers.map(fetch, range(count)))
+            ready = [i for i, outcome in enumerate(outcomes) if outcome in ("cached", "generated")]
+            if not ready:
+                if "budget" in outcomes:
+                    return None
+                raise RuntimeError("image request failed")
+            scores = {i: image_scoring.score(paths[i], params["prompt"]) for i in ready}
+            best = max(ready, key=lambda i: scores[i]["total"])
+            atomic_copy(paths[best], output_path)
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+        self.cache.put_file(key, output_path, {**params, "candidate": best})
+        self.cache.record_output(asset, key)
+        others = ", ".join(f"{scores[i]['total']:.2f}" for i in ready if i != best)
+        return (f"PICKED: {asset} candidate {best + 1} of {len(ready)}, "
+                f"score {image_scoring.describe(scores[best])}" + (f"; others {others}" if others else ""))
+
+    def similar_result(self, asset: str, config: dict) -> tuple[str, float] | None:
+        """An image that already exists (on disk or in the cache) for nearly the same prompt."""
+        def has_result(other: str) -> bool:
+            key = self.cache.output_key(other)
+            return (generate_images.ASSETS_DIR / f"{other}.png").exists() or (
+                key is not None and self.cache.get(key) is not None)
+        candidates = {other: entry["prompt"] for other, entry in IMAGES.items()
+                      if other != asset and has_result(other)}
+        return asset_similarity.prompt_match(config["prompt"], candidates)
+
+    def generate_sheet(self, sheet: str):
+        output_path = sprite_sheets.sheet_path(sheet)
+        config = sprite_sheets.sheet_config(sheet)
+        params = generate_images.request_params(config)
+        sheet_check = self.generation_check(sheet, output_path, params)
+        cells = [(self.generation_check(asset, generate_images.ASSETS_DIR / f"{asset}.png", cell),
+                  request_key(**cell))
+                 for index, asset in enumerate(sprite_sheets.members(sheet))
+                 for cell in [sprite_sheets.cell_params(params, index)]]
+
+        def check() -> str:
+            # Only needed while a member is out of date and not in the cache; the sheet itself never ships
+            if all(cell_check() == "fresh" or self.cache.get(key) is not None for cell_check, key in cells):
+                return "fresh"
+            return sheet_check()
+
+        def run() -> str | None:
+            key = request_key(**params)
+            if self.cache.restore(key, output_path):
+                self.cache.record_output(sheet, key)
+                return f"RESTORED (cache): {sheet}"
+            outcome = self.images().generate(sheet, config, key, output_path)
+            if outcome == "budget":
+                return None
+            if outcome != "generated":
+                raise RuntimeError("image request failed")
+            return f"GENERATED: {sheet} ({len(cells)} icons)"
+        return check, run
+
+    def slice_sheet(self, asset: str, sheet: str):
+        output_path = generate_images.ASSETS_DIR / f"{asset}.png"
+        sheet_params = generate_images.request_params(sprite_sheets.sheet_config(sheet))
+        index = sprite_sheets.members(sheet).index(asset)
+        params = sprite_sheets.cell_params(sheet_params, index)
+
+        def run() -> str | None:
+            key = request_key(**params)
+            if self.cache.restore(key, output_path):
+                self.cache.record_output(asset, key)
+                return f"RESTORED (cache): {asset}"
+            sheet_key, sheet_path = request_key(**sheet_params), sprite_sheets.sheet_path(sheet)
+            if self.cache.status(sheet, sheet_key, sheet_path) != "fresh":
+                if not self.cache.restore(sheet_key, sheet_path):
+                    return None  # Sheet skipped (budget) or not generated yet
+                self.cache.record_output(sheet, sheet_key)
+            width, height = sprite_sheets.write_cell(sheet, index, output_path)
+            self.cache.put_file(key, output_path, params)
+            self.cache.record_output(asset, key)
+            return f"SLICED: {asset} <- {sheet} cell {index + 1} ({width}x{height})"
+        return self.generation_check(asset, output_path, params), run
+
+    def generate_track(self, track: str, config: dict):
+        output_path = generate_music.AUDIO_DIR / f"{track}.wav"
+
+        def run() -> str | None:
+            key = request_key(**generate_music.request_params(config))
+            if self.cache.restore(key, output_path):
+                self.cache.record_output(track, key)
+                return f"RESTORED (cache): {track}"
+            if "synth" in config:
+                generate_music.synthesize(track, config, key, self.cache, self.ledger)
+                return f"SYNTHESIZED: {track}"
+            if not self.music().generate(track, config, key):
+                raise RuntimeError("Lyria session failed")
+            return f"GENERATED: {track}"
+        # Untracked audio predates the synth, so a track with a synth recipe re-renders it
+        params = generate_music.request_params(config)
+        return self.generation_check(track, output_path, params, adopt="synth" not in config), run
+
+    # --- process ---
+
+    def process_sprite(self, asset: str, config: dict):
+        def check() -> str:
+            return process_sprites.sprite_state(asset, config, self.sprite_stamps)
+
+        def run() -> str | None:
+            prepared = process_sprites.prepare_job(asset, config)
+            if prepared is None:
+                return None
+            job, stamp = prepared
+            _, raw_bytes, out_bytes = self.pool().submit(process_sprites._process_job, job).result()
+            with self._lock:
+                self.sprite_stamps[asset] = stamp
+                self._dirty.add("sprites")
+            return f"PROCESSED: {asset} ({raw_bytes // 1024} KB -> {out_bytes} bytes)"
+        return check, run
+
+    def process_track(self, track: str):
+        def check() -> str:
+            return process_audio.track_state(track, self.audio_stamps, self.args.encode)
+
+        def run() -> str | None:
+            with self._lock:
+                stamps = {track: self.audio_stamps[track]} if track in self.audio_stamps else {}
+            meta = {}
+            line = process_audio.process_one(track, stamps, meta, self.args.encode)
+            if line is None:
+                return None
+            with self._lock:
+                self.audio_stamps.update(stamps)
+                self.audio_meta.update(meta)
+                self._dirty.add("audio")
+            return f"PROCESSED:{line[1:]}"
+        return check, run
+
+    def variant(self, asset: str, config: dict):
+        def check() -> str:
+            return tier_variants.variant_state(asset, config, self.sprite_stamps)
+
+        def run() -> str | None:
+            with self._lock:
+                stamps = dict(self.sprite_stamps)
+            size = tier_variants.build_variant(asset, config, stamps)
+            if size is None:
+                return None
+            with self._lock:
+                self.sprite_stamps[asset] = stamps[asset]
+                self._dirty.add("sprites")
+            return f"VARIANT: {asset} <- {config['variant_of']} ({size} bytes)"
+        return check, run
+
+    # --- atlas / import ---
+
+    def atlas(self, group: str):
+        def check() -> str:
+            return build_atlases.atlas_state(group)
+
+        def run() -> str | None:
+            line = build_atlases.build_group(group)
+            with self._lock:
+                build_atlases.write_index()
+            return f"ATLAS: {line}"
+        return check, run
+
+    def spin_wheel(self):
+        def check() -> str:
+            return bake_spin_wheel.wheel_state()
+
+        def run() -> str | None:
+            return f"BAKED: {bake_spin_wheel.bake()}"
+        return check, run
+
+    def godot_import(self):
+        def check() -> str:
+            return "fresh"  # Only runs when something upstream changed
+
+        def run() -> str | None:
+            godot = shutil.which(os.environ.get("GODOT", "godot"))
+            if godot is None:
+                return "IMPORT: godot not found (set GODOT), open the editor to reimport"
+            subprocess.run([godot, "--headless", "--path", str(PROJECT_ROOT), "--import"],
+                           check=True, capture_output=True)
+            return "IMPORT: reimported changed resources"
+        return check, run
+
+
+def atlas_group(asset: str) -> str | None:
+    for group, subdir in build_atlases.ATLAS_GROUPS.items():
+        if asset.startswith(subdir + "/"):
+            return group
+    return None
+
+
+def build_graph(pipeline: Pipeline, only: list[str]) -> dict[str, Node]:
+    """Create nodes for every manifest entry matching ``only`` (all if empty)."""
+    def selected(key: str) -> bool:
+        return not only or any(fnmatch.fnmatch(key, pattern) for pattern in only)
+
+    nodes: dict[str, Node] = {}
+
+    def add(name, stage, check_run, deps=None):
+        check, run = check_run
+        nodes[name] = Node(name, stage, check, run, deps)
+
+    atlas_deps: dict[str, list[str]] = {}
+    sprite_nodes: dict[str, str] = {}  # asset -> node producing its final sprite
+    for asset, config in IMAGES.items():
+        if not selected(asset) or "variant_of" in config:
+            continue
+        sheet = sprite_sheets.sheet_of(asset)
+        if sheet is None:
+            add(f"generate:{asset}", "generate", pipeline.generate_image(asset, config))
+        else:
+            if f"generate:{sheet}" not in nodes:
+                add(f"generate:{sheet}", "generate", pipeline.generate_sheet(sheet))
+            add(f"generate:{asset}", "generate", pipeline.slice_sheet(asset, sheet), [f"generate:{sheet}"])
+        last = f"generate:{asset}"
+        if process_sprites.target_size(config["prompt"]) is not None:
+            add(f"process:{asset}", "process", pipeline.process_sprite(asset, config), [last])
+            last = f"process:{asset}"
+        sprite_nodes[asset] = last
+        group = atlas_group(asset)
+        if group is not None:
+            atlas_deps.setdefault(group, []).append(last)
+
+    # Variants go second: their base and effect sprites can appear anywhere in the manifest
+    for asset, config in tier_variants.variants().items():
+        if not selected(asset):
+            continue
+        deps = [sprite_nodes[source] for source in tier_variants.inputs(config) if source in sprite_nodes]
+        add(f"variant:{asset}", "process", pipeline.variant(asset, config), deps)
+        group = atlas_group(asset)
+        if group is not None:
+            atlas_deps.setdefault(group, []).append(f"variant:{asset}")
+
+    for track, config in TRACKS.items():
+        if not selected(track):
+            continue
+        add(f"generate:{track}", "generate", pipeline.generate_track(track, config))
+        add(f"process:{track}", "process", pipeline.process_track(track), [f"generate:{track}"])
+
+    for group, deps in atlas_deps.items():
+        add(f"atlas:{group}", "atlas", pipeline.atlas(group), deps)
+
+    wheel_sources = bake_spin_wheel.source_assets()
+    if not only or any(selected(asset) for asset in wheel_sources):
+        add("bake:spin_wheel", "atlas", pipeline.spin_wheel(),
+            [sprite_nodes[asset] for asset in wheel_sources if asset in sprite_nodes])
+
+    leaves = [name for name in nodes if not any(name in node.deps for node in nodes.values())]
+    add("import", "import", pipeline.godot_import(), leaves)
+    return nodes
+
+
+def plan(nodes: dict[str, Node], stages: set[str], force: bool) -> list[str]:
+    """Nodes that would run, in dependency order, assuming dirty nodes change their outputs."""
+    would_run: list[str] = []
+    for name in topological_order(nodes):
+        node = nodes[name]
+        if node.stage not in stages:
+            continue
+        if force or any(dep in would_run for dep in node.deps) or node.check() == "dirty":
+            would_run.append(name)
+    return would_run
+
+
+def topological_order(nodes: dict[str, Node]) -> list[str]:
+    order, seen = [], set()
+
+    def visit(name):
+        if name in seen:
+            return
+        seen.add(name)
+        for dep in nodes[name].deps:
+            visit(dep)
+        order.append(name)
+
+    for name in nodes:
+        visit(name)
+    return order
+
+
+def io_jobs(music_sessions: int) -> int:
+    """Generate nodes in flight: enough to fill the image request slots and the Lyria sessions at once."""
+    return generate_images.MAX_CONCURRENCY + max(1, music_sessions)
+
+
+def execute(nodes: dict[str, Node], stages: set[str], jobs: int, force: bool,
+            timings: dict[str, float] | None = None, io: int | None = None) -> dict[str, str]:
+    """Run the graph with up to ``jobs`` CPU-stage nodes in flight.
+
+    Generate nodes mostly wait on the network, so they run in a separate
+    pool of ``io`` threads (default ``io_jobs()``) and their concurrency is
+    left to the image and Lyria clients' own limits rather than the CPU
+    count. Each node starts as soon as its dependencies finish. Returns node name
+    -> ``ran``, ``fresh``, ``skip`` or ``failed``; nodes downstream of a
+    failure are marked ``blocked``. Seconds spent in each node's check and
+    run are stored in ``timings`` if given.
+    """
+    results: dict[str, str] = {}
+    waiting = {name: set(node.deps) for name, node in nodes.items()}
+    dependents: dict[str, list[str]] = {name: [] for name in nodes}
+    for name, node in nodes.items():
+        for dep in node.deps:
+            dependents[dep].append(name)
+
+    ready: dict[str, float] = {}
+
+    def submit(name: str):
+        ready[name] = telemetry.now_us()
+        return (io_pool if nodes[name].stage == "generate" else cpu_pool).submit(work, name)
+
+    def work(name: str) -> str:
+        node = nodes[name]
+        lane = name.split(":", 1)[1] if node.stage in ("generate", "process") else name
+        with telemetry.lane(lane):
+            telemetry.complete("queued", ready[name], "queue")
+            start = time.perf_counter()
+            with telemetry.span(node.stage, "node", node=name, deps=node.deps) as span_args:
+                try:
+                    span_args["outcome"] = outcome = attempt(name)
+                    return outcome
+                finally:
+                    if timings is not None:
+                        timings[name] = time.perf_counter() - start
+
+    def attempt(name: str) -> str:
+        node = nodes[name]
+        if node.stage not in stages:
+            return "skip"
+        if any(results[dep] in ("failed", "blocked") for dep in node.deps):
+            return "blocked"
+        upstream_ran = any(results[dep] == "ran" for dep in node.deps)
+        if not (force or upstream_ran or node.check() == "dirty"):
+            return "fresh"
+        try:
+            line = node.run()
+        except Exception as e:
+            print(f"  FAILED: {name}: {e}")
+            return "failed"
+        if line is None:
+            return "skip"
+        print(f"  {line}")
+        return "ran"
+
+    io = io_jobs(generate_music.MAX_SESSIONS) if io is None else io
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as cpu_pool, \
+            ThreadPoolExecutor(max_workers=max(1, io)) as io_pool:
+        running = {submit(name): name for name, deps in waiting.items() if not deps}
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+                for child in dependents[name]:
+                    waiting[child].discard(name)
+                    if not waiting[child]:
+                        running[submit(child)] = child
+    return results
+
+
+def estimate_cost(nodes: dict[str, Node], names: list[str], candidates: int = 1) -> float:
+    """Image spend of the generate nodes in ``names``, at most.
+
+    Sheet members are paid for by their sheet, and other images ``candidates``
+    times over (cached candidates end up free).
+    """
+    total = 0.0
+    for name in names:
+        if nodes[name].stage != "generate":
+            continue
+        key = name.split(":", 1)[1]
+        if key in SHEETS:
+            config, copies = sprite_sheets.sheet_config(key), 1
+        elif key in IMAGES and sprite_sheets.sheet_of(key) is None:
+            config, copies = IMAGES[key], candidates
+        else:
+            continue
+        total += copies * generate_images.get_image_cost(generate_images.request_params(config)["size"])
+    return total
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Generate, process and pack game assets.")
+    parser.add_argument("--only", action="append", default=[], help="Glob over asset keys (repeatable)")
+    parser.add_argument("--stage", action="append", choices=STAGES, help="Limit to these stages (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would run and the estimated cost")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help="Process/atlas nodes run in parallel (generate nodes are paced by "
+                             "IMAGE_GEN_CONCURRENCY and --music-sessions)")
+    parser.add_argument("--force", action="store_true", help="Run every selected node")
+    parser.add_argument("--yes", action="store_true", help="Don't ask before exceeding the image budget")
+    parser.add_argument("--allow-similar", action="store_true",
+                        help="Generate new images even if their prompt repeats an existing one")
+    parser.add_argument("--candidates", type=int, default=1, metavar="N",
+                        help="Request N variants of each standalone image, keep the best scoring (image_scoring.py)")
+    parser.add_argument("--music-sessions", type=int, default=generate_music.MAX_SESSIONS,
+                        help="Concurrent Lyria sessions")
+    parser.add_argument("--encode", choices=["ogg"], help="Also write compressed audio (process_audio.py)")
+    parser.add_argument("--fake-music", action="store_true", default=os.environ.get("LYRIA_FAKE") == "1",
+                        help="Use the local Lyria stand-in (also LYRIA_FAKE=1)")
+    parser.add_argument("--no-resume", action="store_true", help="Discard partial Lyria captures")
+    parser.add_argument("--timings", type=Path, help="Write per-node outcome and seconds to this JSON file")
+    parser.add_argument("--trace", type=Path, default=os.environ.get("ASSETGEN_TRACE") or None,
+                        help="Write JSONL trace events here, replacing the last run's, and print a summary "
+                             "(also ASSETGEN_TRACE)")
+    args = parser.parse_args(argv)
+    if not 1 <= args.candidates <= image_scoring.MAX_CANDIDATES:
+        parser.error(f"--candidates must be between 1 and {image_scoring.MAX_CANDIDATES}")
+    stages = set(args.stage or STAGES)
+
+    pipeline = Pipeline(args)
+    nodes = build_graph(pipeline, args.only)
+    pending = plan(nodes, stages, args.force)
+    pipeline.flush()  # Outputs adopted while checking, even if nothing runs
+    cost = estimate_cost(nodes, pending, args.candidates)
+    remaining = generate_images.BUDGET_CAP_USD - pipeline.ledger.committed(generate_images.PROVIDER)
+
+    print(f"=== Asset Pipeline ===")
+    print(f"Nodes: {len(nodes)}, to run: {len(pending)}, up to date: {len(nodes) - len(pending)}")
+    print(f"Estimated image cost: ${cost:.2f} (budget left: ${remaining:.2f})")
+
+    if args.dry_run:
+        for name in pending:
+            print(f"  would run: {name}")
+        return
+    if not pending:
+        return
+    if cost > remaining and not args.yes:
+        print(f"WARNING: Estimated cost exceeds the remaining image budget; "
+              f"images past the cap will be skipped")
+        if input("Continue anyway? (y/n): ").strip().lower() != "y":
+            print("Aborted.")
+            return
+
+    timings: dict[str, float] = {}
+    telemetry.configure(args.trace)
+    try:
+        results = execute(nodes, stages, args.jobs, args.force, timings, io_jobs(args.music_sessions))
+    finally:
+        pipeline.close()
+        telemetry.configure(None)
+    if args.timings:
+        with open(args.timings, "w") as f:
+            json.dump({name: {"stage": nodes[name].stage, "outcome": outcome, "seconds": round(timings[name], 4)}
+                       for name, outcome in results.items()}, f, indent=2)
+
+    counts = {}
+    for outcome in results.values():
+        counts[outcome] = counts.get(outcome, 0) + 1
+    print()
+    print(f"=== Pipeline Complete ===")
+    print(", ".join(f"{outcome}: {n}" for outcome, n in sorted(counts.items())))
+    print(f"Total spent: ${pipeline.ledger.spent():.2f}")
+    if args.trace:
+        summary = telemetry.summarize(telemetry.load(args.trace))
+        with open(args.trace.with_suffix(".summary.json"), "w") as f:
+            json.dump(summary, f, indent=2)
+        print()
+        telemetry.print_summary(summary)
+        print(f"Trace: {args.trace} (summary: {args.trace.with_suffix('.summary.json')})")
+    if counts.get("failed"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
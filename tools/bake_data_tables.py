@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Bake the game's data tables into precomputed lookups for Music Label Tycoon.
+Parses scripts/data/*.gd and scripts/systems/gambling/*.gd (via
+gdscript_data.py) and writes scripts/data/baked_tables.gd, a generated
+BakedTables class holding:
+
+  - UpgradeData.cost_at_level() for every level below max_level
+  - ArtistData.purchase_cost(), upgrade_cost() and production_at_level()
+    per tier, up to PURCHASE_COST_COUNT owned and MAX_LEVEL
+  - alias tables for the CD spawn roll at every Marketing Reach level, and
+    for GachaData.POOL and SpinWheelData.PRIZES
+
+so the spawn roll, prize picks and UI cost labels are O(1) lookups instead
+of pow() calls and weight walks. The baked distributions match the old
+weight walks exactly, including main_screen.gd's roll against the
+unadjusted total (weight Marketing Reach removes falls through to the last
+tier).
+
+The file is only as fresh as its last bake: rerun after editing a table.
+--check regenerates in memory and exits 1 if the checked-in file differs
+(run by the web deploy workflow).
+
+Usage:
+    python3 tools/bake_data_tables.py
+    python3 tools/bake_data_tables.py --check
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from gdscript_data import load_tables
+
+# --- Configuration ---
+PROJECT_ROOT = Path(__file__).parent.parent
+SOURCE_DIRS = (PROJECT_ROOT / "scripts" / "data", PROJECT_ROOT / "scripts" / "systems" / "gambling")
+OUTPUT_FILE = PROJECT_ROOT / "scripts" / "data" / "baked_tables.gd"
+PURCHASE_COST_COUNT = 100  # Artists of one tier with a baked price; beyond this pow() is used
+VALUES_PER_LINE = 8
+
+
+def source_files() -> list[Path]:
+    return sorted(path for folder in SOURCE_DIRS for path in folder.glob("*.gd") if path != OUTPUT_FILE)
+
+
+def alias_table(weights: list[float]) -> tuple[list[float], list[int]]:
+    """Vose's alias method: pick i uniformly, keep it if randf() < prob[i], else take alias[i]."""
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob, alias = [1.0] * n, list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s], alias[s] = scaled[s], l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    return prob, alias
+
+
+def cd_spawn_probabilities(tables: dict) -> tuple[list[int], list[list[float]]]:
+    """Tier ids and, per Marketing Reach level 0..max_level, the chance of each tier.
+
+    Mirrors main_screen.gd: the roll is against the unadjusted total while
+    the walk uses adjusted weights, so any shortfall lands on the last tier.
+    """
+    cd, upgrade = tables["CdData"], tables["UpgradeData"]
+    marketing = upgrade["UPGRADES"][upgrade["UpgradeId"]["MARKETING_REACH"]]
+    tier_ids = list(cd["TIERS"])
+    weights = [float(cd["TIERS"][t]["drop_weight"]) for t in tier_ids]
+    total = sum(weights)
+    levels = []
+    for level in range(marketing["max_level"] + 1):
+        bonus = level * marketing["effect_per_level"]
+        cumulative, probs = 0.0, []
+        for tier, weight in zip(tier_ids, weights):
+            weight *= max(0.1, 1.0 - bonus) if tier <= cd["CdTier"]["EP"] else 1.0 + bonus
+            start, cumulative = cumulative, min(total, cumulative + weight)
+            probs.append((cumulative - start) / total)
+        probs[-1] += 1.0 - sum(probs)
+        levels.append(probs)
+    return tier_ids, levels
+
+
+def bake(tables: dict) -> dict[str, object]:
+    """Constant name -> value for the generated script, in output order."""
+    artist, upgrade = tables["ArtistData"], tables["UpgradeData"]
+    milestones = sorted(artist["MILESTONES"].items())
+
+    def production(tier: int, level: int) -> float:
+        mult = 1.0
+        for at, value in milestones:
+            if level >= at:
+                mult = value
+        return artist["TIERS"][tier]["base_production"] * (1.0 + level * artist["LEVEL_PRODUCTION_BOOST"]) * mult
+
+    tier_ids, spawn = cd_spawn_probabilities(tables)
+    cd_alias = [alias_table(probs) for probs in spawn]
+    gacha = alias_table([float(item["weight"]) for item in tables["GachaData"]["POOL"]])
+    wheel = alias_table([float(prize["weight"]) for prize in tables["SpinWheelData"]["PRIZES"]])
+    return {
+        "UPGRADE_COST": {uid: [data["base_cost"] * data["cost_growth"] ** level for level in range(data["max_level"])]
+                         for uid, data in upgrade["UPGRADES"].items()},
+        "ARTIST_PURCHASE_COST": {t: [data["base_cost"] * artist["COST_GROWTH_RATE"] ** n
+                                     for n in range(PURCHASE_COST_COUNT)]
+                                 for t, data in artist["TIERS"].items()},
+        "ARTIST_LEVEL_COST": {t: [data["base_cost"] * artist["LEVEL_COST_GROWTH"] ** level * 0.5
+                                  for level in range(artist["MAX_LEVEL"])]
+                              for t, data in artist["TIERS"].items()},
+        "ARTIST_PRODUCTION": {t: [production(t, level) for level in range(artist["MAX_LEVEL"] + 1)]
+                              for t in artist["TIERS"]},
+        "CD_TIER_IDS": tier_ids,
+        "CD_ALIAS_PROB": [prob for prob, _ in cd_alias],
+        "CD_ALIAS": [alias for _, alias in cd_alias],
+        "GACHA_ALIAS_PROB": gacha[0],
+        "GACHA_ALIAS": gacha[1],
+        "SPIN_ALIAS_PROB": wheel[0],
+        "SPIN_ALIAS": wheel[1],
+    }
+
+
+DOCS = {
+    "UPGRADE_COST": "UpgradeData.cost_at_level(): {upgrade_id: [cost at level 0 .. max_level - 1]}",
+    "ARTIST_PURCHASE_COST": "ArtistData.purchase_cost(): {tier: [cost with 0 .. %d owned]}" % (PURCHASE_COST_COUNT - 1),
+    "ARTIST_LEVEL_COST": "ArtistData.upgrade_cost(): {tier: [cost at level 0 .. MAX_LEVEL - 1]}",
+    "ARTIST_PRODUCTION": "ArtistData.production_at_level(): {tier: [production at level 0 .. MAX_LEVEL]}",
+    "CD_TIER_IDS": "CD spawn roll, one alias table per Marketing Reach level (values index CD_TIER_IDS)",
+    "GACHA_ALIAS_PROB": "GachaData.POOL weighted pick (values index POOL)",
+    "SPIN_ALIAS_PROB": "SpinWheelData.PRIZES weighted pick (values index PRIZES)",
+}
+
+
+def gd_value(value, indent: int = 0) -> str:
+    pad = "\t" * indent
+    if isinstance(value, dict):
+        lines = [f"{pad}\t{key}: {gd_value(item, indent + 1).lstrip()}," for key, item in value.items()]
+        return "{\n" + "\n".join(lines) + f"\n{pad}}}"
+    if isinstance(value, list):
+        if value and isinstance(value[0], list):
+            return "[\n" + "\n".join(f"{pad}\t{gd_value(item, indent + 1)}," for item in value) + f"\n{pad}]"
+        items = [gd_value(item) for item in value]
+        if len(items) <= VALUES_PER_LINE:
+            return "[" + ", ".join(items) + "]"
+        rows = [", ".join(items[i:i + VALUES_PER_LINE]) for i in range(0, len(items), VALUES_PER_LINE)]
+        return "[\n" + ",\n".join(f"{pad}\t{row}" for row in rows) + f",\n{pad}]"
+    if isinstance(value, float):
+        text = repr(value)
+        return text if any(c in text for c in ".en") else text + ".0"
+    return str(value)
+
+
+def render(tables: dict) -> str:
+    out = [
+        "class_name BakedTables",
+        "extends RefCounted",
+        "",
+        "## GENERATED by tools/bake_data_tables.py from scripts/data and",
+        "## scripts/systems/gambling. Do not edit: change the source table and rebake.",
+    ]
+    for name, value in bake(tables).items():
+        if name in DOCS:
+            out.append("")
+            out.append(f"## {DOCS[name]}")
+        kind = "Dictionary" if isinstance(value, dict) else "Array"
+        out.append(f"const {name}: {kind} = {gd_value(value)}")
+    out += [
+        "",
+        "## Draw an index from an alias table in O(1).",
+        "static func pick(prob: Array, alias: Array) -> int:",
+        "\tvar i := randi() % prob.size()",
+        "\treturn i if randf() < prob[i] else alias[i]",
+        "",
+    ]
+    return "\n".join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake GDScript data tables into O(1) lookup tables.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the baked file is out of date")
+    args = parser.parse_args()
+
+    files = source_files()
+    text = render(load_tables())
+    current = OUTPUT_FILE.read_text() if OUTPUT_FILE.exists() else None
+    name = OUTPUT_FILE.relative_to(PROJECT_ROOT)
+    if args.check:
+        if current != text:
+            sys.exit(f"{name} is out of date: run python3 tools/bake_data_tables.py")
+        print(f"{name} is up to date")
+        return
+    if current == text:
+        print(f"{name} is up to date")
+        return
+    OUTPUT_FILE.write_text(text)
+    print(f"Wrote {name} ({len(text) // 1024} KB) from {len(files)} source files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Bake the spin wheel face for Music Label Tycoon.
+Reads SpinWheelData.PRIZES (via gdscript_data.py) and renders the wheel
+base, a tint per prize colour, each prize icon and its outlined label
+into one texture at the size spin_wheel.tscn shows it, using the same
+layout spin_wheel.gd builds at runtime: segment i centred at
+i * 360 / count - 90 degrees (0 under the pointer), icons on a ring at
+ICON_RADIUS, labels under the icons. Also writes a metadata file with each
+segment's angles, so the wheel is a single TextureRect to rotate instead
+of a node per icon and label.
+
+Only rebakes when the prize table, a source sprite or the settings below
+changed since the last bake (tracked in the metadata, like build_atlases.py).
+assetgen.py runs this as the bake:spin_wheel node after the casino sprites
+are processed; spin_wheel.gd falls back to building the wheel from nodes
+while no up-to-date bake exists.
+
+Usage:
+    python3 tools/bake_spin_wheel.py
+    python3 tools/bake_spin_wheel.py --force
+"""
+
+import argparse
+import hashlib
+import json
+import math
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageColor, ImageDraw, ImageFont
+
+from build_atlases import file_digest, res_path
+from gdscript_data import Script
+from process_sprites import save_png
+
+# --- Configuration ---
+PROJECT_ROOT = Path(__file__).parent.parent
+PRIZES_SCRIPT = PROJECT_ROOT / "scripts" / "systems" / "gambling" / "spin_wheel_data.gd"
+BASE_SPRITE = "res://assets/sprites/casino/spin_wheel_base.png"
+OUTPUT_DIR = PROJECT_ROOT / "assets" / "baked"
+TEXTURE_FILE = OUTPUT_DIR / "spin_wheel.png"
+META_FILE = OUTPUT_DIR / "spin_wheel.json"
+WHEEL_SIZE = 240  # WheelContainer in spin_wheel.tscn
+ICON_SIZE = 36
+ICON_RADIUS = 0.3  # Fraction of WHEEL_SIZE from the centre to each icon's centre
+LABEL_FONT_SIZE = 9
+LABEL_STROKE = 2  # Pixels of black outline around label text
+SEGMENT_TINT = 0.35  # Opacity of each prize colour over its slice of the base art
+BAKER_VERSION = 1  # Bump when the rendering changes
+X11_COLORS = {  # Godot names whose colour differs from the CSS one PIL knows (Godot has WEB_* for those)
+    "GRAY": (190, 190, 190),
+    "GREEN": (0, 255, 0),
+    "MAROON": (176, 48, 96),
+    "PURPLE": (160, 32, 240),
+}
+
+
+def local_path(res: str) -> Path:
+    return PROJECT_ROOT / res.removeprefix("res://")
+
+
+def load_prizes() -> list[dict]:
+    return Script(PRIZES_SCRIPT, lambda class_name, member: None).get("PRIZES")
+
+
+def godot_color(text: str) -> tuple[int, int, int, int]:
+    """RGBA for a colour kept as source text: ``Color.GOLD`` or ``Color(1, 0.5, 0[, a])``."""
+    if text.startswith("Color("):
+        parts = [float(p) for p in text[len("Color("):-1].split(",")]
+        return tuple(round(min(max(p, 0.0), 1.0) * 255) for p in (parts + [1.0])[:4])
+    name = text.removeprefix("Color.")
+    if name in X11_COLORS:
+        return (*X11_COLORS[name], 255)
+    try:
+        return (*ImageColor.getrgb(name.removeprefix("WEB_").replace("_", "").lower())[:3], 255)
+    except ValueError:
+        raise ValueError(f"unknown colour {text!r}") from None
+
+
+def sources(prizes: list[dict]) -> list[str]:
+    """Sprites the face is drawn from, without repeats."""
+    return list(dict.fromkeys([BASE_SPRITE, *(p["sprite"] for p in prizes if p.get("sprite"))]))
+
+
+def source_assets() -> list[str]:
+    """Manifest keys of the source sprites, for assetgen's dependency graph."""
+    return [res.removeprefix("res://assets/").removesuffix(".png") for res in sources(load_prizes())]
+
+
+def segments(prizes: list[dict]) -> list[dict]:
+    """Angles in degrees, clockwise from +x like Control.rotation; 0 rotation puts segment 0 under the pointer."""
+    span = 360.0 / len(prizes)
+    out = []
+    for i, prize in enumerate(prizes):
+        center = i * span - 90.0
+        out.append({"label": prize["label"], "type": prize["type"], "center_deg": center,
+                    "start_deg": center - span / 2, "end_deg": center + span / 2})
+    return out
+
+
+def inputs(prizes: list[dict]) -> dict[str, str]:
+    settings = [BAKER_VERSION, WHEEL_SIZE, ICON_SIZE, ICON_RADIUS, LABEL_FONT_SIZE, LABEL_STROKE, SEGMENT_TINT]
+    digests = {"prizes": hashlib.sha1(json.dumps([settings, prizes], sort_keys=True).encode()).hexdigest()}
+    digests.update({res: file_digest(local_path(res)) for res in sources(prizes) if local_path(res).exists()})
+    return digests
+
+
+def wheel_state() -> str:
+    """Classify the bake as ``skip`` (no base sprite yet), ``fresh`` or ``dirty``."""
+    if not local_path(BASE_SPRITE).exists():
+        return "skip"
+    if not TEXTURE_FILE.exists() or not META_FILE.exists():
+        return "dirty"
+    with open(META_FILE) as f:
+        previous = json.load(f)
+    return "fresh" if previous.get("inputs") == inputs(load_prizes()) else "dirty"
+
+
+def fit(path: Path, size: int) -> Image.Image:
+    """Scale a sprite to ``size`` square: nearest when enlarging pixel art, Lanczos for raw output."""
+    with Image.open(path) as image:
+        image = image.convert("RGBA")
+    if image.size == (size, size):
+        return image
+    resample = Image.NEAREST if max(image.size) <= size else Image.LANCZOS
+    return image.resize((size, size), resample)
+
+
+def render(prizes: list[dict]) -> Image.Image:
+    face = fit(local_path(BASE_SPRITE), WHEEL_SIZE)
+
+    tint = Image.new("RGBA", face.size)
+    draw = ImageDraw.Draw(tint)
+    for prize, segment in zip(prizes, segments(prizes)):
+        r, g, b, a = godot_color(prize["color"])
+        draw.pieslice((0, 0, WHEEL_SIZE - 1, WHEEL_SIZE - 1), segment["start_deg"], segment["end_deg"],
+                      fill=(r, g, b, round(a * SEGMENT_TINT)))
+    tint.putalpha(ImageChops.multiply(tint.getchannel("A"), face.getchannel("A")))  # Keep the base's outline
+    face.alpha_composite(tint)
+
+    font = ImageFont.load_default(LABEL_FONT_SIZE)
+    draw = ImageDraw.Draw(face)
+    radius = WHEEL_SIZE * ICON_RADIUS
+    for prize, segment in zip(prizes, segments(prizes)):
+        x, y = ring_point(radius, segment["center_deg"])
+        left, top = round(x - ICON_SIZE / 2), round(y - ICON_SIZE / 2)
+        if prize.get("sprite") and local_path(prize["sprite"]).exists():
+            face.alpha_composite(fit(local_path(prize["sprite"]), ICON_SIZE), (left, top))
+        draw.text((left + ICON_SIZE / 2, top + ICON_SIZE), prize["label"], font=font, anchor="ma",
+                  fill=(255, 255, 255, 255), stroke_width=LABEL_STROKE, stroke_fill=(0, 0, 0, 255))
+    return face
+
+
+def ring_point(radius: float, degrees: float) -> tuple[float, float]:
+    angle = math.radians(degrees)
+    return WHEEL_SIZE / 2 + math.cos(angle) * radius, WHEEL_SIZE / 2 + math.sin(angle) * radius
+
+
+def bake(force: bool = False) -> str:
+    """Render the face and metadata if needed and return a status line."""
+    state = wheel_state()
+    if state == "skip":
+        return f"no {BASE_SPRITE} yet"
+    if state == "fresh" and not force:
+        return f"{res_path(TEXTURE_FILE)} up to date"
+    prizes = load_prizes()
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    save_png(render(prizes), TEXTURE_FILE)
+    meta = {"texture": res_path(TEXTURE_FILE), "size": [WHEEL_SIZE, WHEEL_SIZE],
+            "segments": segments(prizes), "inputs": inputs(prizes), "baker_version": BAKER_VERSION}
+    with open(META_FILE, "w") as f:
+        json.dump(meta, f, indent=2)
+    return f"{res_path(TEXTURE_FILE)} ({len(prizes)} segments, {TEXTURE_FILE.stat().st_size // 1024} KB)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the spin wheel face and segment metadata.")
+    parser.add_argument("--force", action="store_true", help="Rebake even if nothing changed")
+    args = parser.parse_args()
+    print(bake(args.force))
+
+
+if __name__ == "__main__":
+    main()
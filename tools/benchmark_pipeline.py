@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Benchmark the asset pipeline end-to-end against fake providers.
+Copies the tools into a scratch project, starts the fake image endpoint
+from fake_providers.py and runs tools/assetgen.py one stage at a time
+(generate, process, atlas, then a no-op rerun) with the fake Lyria client.
+Nothing under the real assets/ or generation cache is touched, and no API
+key is needed.
+
+Each stage reports throughput (assets/min), p50/p95 node latency, peak RSS
+of the stage process and bytes written under the scratch root. The
+generate stage also reports what the fake endpoint saw (requests, 429s,
+500s, peak concurrency). Results are written as JSON, and --compare prints
+the change against an earlier run so scheduling, caching and
+post-processing regressions show up between commits.
+
+Usage:
+    python3 tools/benchmark_pipeline.py
+    python3 tools/benchmark_pipeline.py --latency 1.5 --jitter 1 --error-rate 0.05 --rate-limit-every 6
+    python3 tools/benchmark_pipeline.py --only "sprites/*" --compare tools/benchmarks/abc1234.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from fake_providers import FakeImageServer
+from telemetry import percentile
+
+# --- Configuration ---
+TOOLS_DIR = Path(__file__).parent
+PROJECT_ROOT = TOOLS_DIR.parent
+RESULTS_DIR = TOOLS_DIR / "benchmarks"
+STAGES = {  # Benchmark stage -> assetgen --stage arguments
+    "generate": ["generate"],
+    "process": ["process"],
+    "atlas": ["atlas"],
+    "noop": ["generate", "process", "atlas"],  # Everything fresh: measures check overhead
+}
+SCRATCH_DIRS = ("assets", "art_raw", "tools")  # Where stages write under the scratch root
+INPUT_DIRS = ("scripts",)  # Game sources the graph reads (bake_spin_wheel parses the prize table)
+LOG_TAIL = 15  # Lines of a failed stage's log to print
+COMPARE_KEYS = ("wall_s", "throughput_per_min", "p50_s", "p95_s", "peak_rss_mb", "bytes_written")
+
+
+def snapshot(root: Path) -> dict[str, tuple[int, int]]:
+    """Size and mtime of every file the pipeline can write."""
+    files = {}
+    for name in SCRATCH_DIRS:
+        for path in (root / name).rglob("*"):
+            if path.is_file() and "__pycache__" not in path.parts:
+                stat = path.stat()
+                files[str(path)] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def bytes_written(before: dict, after: dict) -> int:
+    return sum(size for path, (size, mtime) in after.items() if before.get(path) != (size, mtime))
+
+
+def prepare_root(root: Path) -> None:
+    """Copy the current tools and game sources into a scratch project (state from earlier runs is kept)."""
+    (root / "tools").mkdir(parents=True, exist_ok=True)
+    (root / "assets").mkdir(exist_ok=True)
+    (root / "art_raw").mkdir(exist_ok=True)
+    for script in TOOLS_DIR.glob("*.py"):
+        shutil.copy2(script, root / "tools" / script.name)
+    for name in INPUT_DIRS:
+        shutil.copytree(PROJECT_ROOT / name, root / name, dirs_exist_ok=True)
+
+
+def run_stage(root: Path, stage: str, args, env: dict) -> dict:
+    """Run one assetgen invocation and measure it."""
+    timings_path = root / f"timings_{stage}.json"
+    timings_path.unlink(missing_ok=True)
+    command = [sys.executable, str(root / "tools" / "assetgen.py"), "--yes", f"--jobs={args.jobs}",
+               f"--music-sessions={args.music_sessions}", "--fake-music", f"--timings={timings_path}",
+               *[f"--stage={name}" for name in STAGES[stage]], *[f"--only={glob}" for glob in args.only]]
+
+    before = snapshot(root)
+    with open(root / f"{stage}.log", "w") as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen(command, cwd=root, env=env, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+
+    timings = {}
+    if timings_path.exists():
+        with open(timings_path) as f:
+            timings = json.load(f)
+    outcomes = {}
+    for entry in timings.values():
+        outcomes[entry["outcome"]] = outcomes.get(entry["outcome"], 0) + 1
+    ran = [entry["seconds"] for entry in timings.values() if entry["outcome"] == "ran"]
+    rss_scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KiB elsewhere
+    return {
+        "exit_code": proc.returncode,
+        "wall_s": round(wall, 3),
+        "assets": len(ran),
+        "outcomes": outcomes,
+        "throughput_per_min": round(len(ran) / wall * 60, 1) if wall > 0 else None,
+        "p50_s": percentile(ran, 50),
+        "p95_s": percentile(ran, 95),
+        "peak_rss_mb": round(usage.ru_maxrss * rss_scale / (1024 * 1024), 1),
+        "bytes_written": bytes_written(before, snapshot(root)),
+    }
+
+
+def provider_stats(server: FakeImageServer) -> dict:
+    requests = list(server.requests)
+    done = [r for r in requests if "end" in r]
+    return {
+        "requests": len(requests),
+        "rate_limited": sum(r.get("status") == 429 for r in requests),
+        "server_errors": sum(r.get("status") == 500 for r in requests),
+        "max_in_flight": server.max_in_flight,
+        "bytes_served": sum(r.get("bytes", 0) for r in done),
+        "request_p50_s": percentile([r["end"] - r["time"] for r in done], 50),
+        "request_p95_s": percentile([r["end"] - r["time"] for r in done], 95),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: dict, previous: dict) -> None:
+    print(f"\n=== Change vs {previous.get('commit', '?')} ({previous.get('timestamp', '?')}) ===")
+    for stage, result in current["stages"].items():
+        old = previous.get("stages", {}).get(stage)
+        if old is None:
+            continue
+        parts = []
+        for key in COMPARE_KEYS:
+            new_value, old_value = result.get(key), old.get(key)
+            if new_value is None or not old_value:
+                continue
+            parts.append(f"{key} {(new_value - old_value) / old_value * 100:+.0f}%")
+        print(f"  {stage:<9} " + ", ".join(parts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the asset pipeline against fake providers.")
+    parser.add_argument("--only", action="append", default=[], help="Glob over asset keys (repeatable)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="assetgen --jobs")
+    parser.add_argument("--asset-root", type=Path,
+                        help="Scratch project to run in and keep (default: a temporary directory)")
+    parser.add_argument("--out", type=Path, help="Results JSON (default: tools/benchmarks/<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="Earlier results JSON to diff against")
+    images = parser.add_argument_group("fake image endpoint")
+    images.add_argument("--latency", type=float, default=0.2, help="Seconds per successful response")
+    images.add_argument("--jitter", type=float, default=0.1, help="Extra random latency, up to this many seconds")
+    images.add_argument("--payload-kb", type=int, default=1024, help="Padding added to each PNG")
+    images.add_argument("--image-size", type=int, default=256, help="Pixel size of the fake renders")
+    images.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with a 500")
+    images.add_argument("--rate-limit-every", type=int, default=0, help="Answer every Nth request with a 429")
+    images.add_argument("--retry-after", type=float, default=0.5, help="Retry-After sent with each 429")
+    images.add_argument("--rpm", type=float, default=600, help="Generator requests/minute (IMAGE_GEN_RPM)")
+    images.add_argument("--concurrency", type=int, default=4, help="Generator requests in flight")
+    music = parser.add_argument_group("fake Lyria client")
+    music.add_argument("--lyria-speed", type=float, default=0, help="Real-time multiple (0: unpaced)")
+    music.add_argument("--lyria-latency", type=float, default=0.0, help="Seconds to open a session")
+    music.add_argument("--lyria-error-rate", type=float, default=0.0, help="Fraction of sessions that drop")
+    music.add_argument("--music-sessions", type=int, default=3, help="Concurrent sessions")
+    args = parser.parse_args()
+
+    scratch = None
+    root = args.asset_root
+    if root is None:
+        scratch = tempfile.TemporaryDirectory(prefix="assetgen-bench-")
+        root = Path(scratch.name)
+    root = root.resolve()
+    prepare_root(root)
+
+    server = FakeImageServer(image_size=args.image_size, rate_limit_every=args.rate_limit_every,
+                             retry_after=args.retry_after, latency=args.latency, jitter=args.jitter,
+                             payload_bytes=args.payload_kb * 1024, error_rate=args.error_rate)
+    env = {
+        **os.environ,
+        "OPENAI_API_BASE": server.url,
+        "OPENAI_API_KEY": "fake",
+        "IMAGE_GEN_RPM": str(args.rpm),
+        "IMAGE_GEN_MAX_RPM": str(args.rpm),
+        "IMAGE_GEN_CONCURRENCY": str(args.concurrency),
+        "LYRIA_FAKE_SPEED": str(args.lyria_speed),
+        "LYRIA_FAKE_LATENCY": str(args.lyria_latency),
+        "LYRIA_FAKE_ERROR_RATE": str(args.lyria_error_rate),
+        "GODOT": "",  # Never reimport into a scratch project
+        "PYTHONUNBUFFERED": "1",
+    }
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "config": {key: (str(value) if isinstance(value, Path) else value) for key, value in vars(args).items()
+                   if key not in ("out", "compare", "asset_root")},
+        "stages": {},
+    }
+    print(f"=== Pipeline Benchmark ({results['commit']}) ===")
+    print(f"Scratch root: {root}")
+    with server:
+        for stage in STAGES:
+            result = run_stage(root, stage, args, env)
+            if stage == "generate":
+                result["provider"] = provider_stats(server)
+            results["stages"][stage] = result
+            p50, p95 = result["p50_s"], result["p95_s"]
+            print(f"  {stage:<9} {result['wall_s']:>7.2f}s  {result['assets']:>3} assets "
+                  f"({result['throughput_per_min'] or 0:.0f}/min)  "
+                  f"p50 {p50 if p50 is not None else '-'}s  p95 {p95 if p95 is not None else '-'}s  "
+                  f"rss {result['peak_rss_mb']} MB  wrote {result['bytes_written'] / 1024:.0f} KB"
+                  + (f"  {result['outcomes'].get('failed', 0)} failed, exit {result['exit_code']} "
+                     f"(see {root / (stage + '.log')})" if result["exit_code"] else ""))
+
+    provider = results["stages"]["generate"]["provider"]
+    print(f"  provider: {provider['requests']} requests, {provider['rate_limited']} x 429, "
+          f"{provider['server_errors']} x 500, peak {provider['max_in_flight']} in flight")
+    failed = [stage for stage, result in results["stages"].items() if result["exit_code"]]
+    if failed:
+        # A failed stage measures the failure, not the pipeline: keep it out of the results history
+        for stage in failed:
+            tail = (root / f"{stage}.log").read_text().splitlines()[-LOG_TAIL:]
+            print(f"\n--- {stage}.log (last {len(tail)} lines) ---\n" + "\n".join(tail))
+        sys.exit(f"\nStage(s) failed: {', '.join(failed)}; no results written")
+
+    out = args.out or RESULTS_DIR / f"{results['commit']}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results: {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+    if scratch is not None:
+        scratch.cleanup()
+
+
+if __name__ == "__main__":
+    main()
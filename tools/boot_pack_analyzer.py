@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Boot pack analyzer for the web build.
+Walks the resource graph from what the game loads before its first
+interactive frame and splits assets/ into a minimal boot pack plus one
+lazily fetched pack per screen. The walk follows:
+
+    .tscn/.tres   every res:// path (ext_resources, sub-resource paths)
+    .gd           preload() always; the script's other res:// literals
+                  (load() targets, path consts, data tables) when the
+                  script was reached as a resource or its class is used
+                  by a script that loads things
+    path tables   flat const Dictionaries of paths (AudioManager.SFX,
+                  SceneRouter.SCENES): an entry counts where its key is
+                  passed to the table's call (play_sfx("collect_cd")), or
+                  everywhere a loop walks the table, unless the loop only
+                  loads entries that ResourceLoader.exists() finds mounted
+
+The boot pack starts from project.godot (main scene, autoloads, icon).
+Each SceneRouter screen, plus the music SCREEN_BGM plays there, then claims
+what boot does not already hold, in SCENES order. A pack smaller than
+MIN_PACK_BYTES folds back into boot, since another request costs more
+than it saves. .wav files resolve to their .ogg sibling and atlased
+sprites to their atlas, as at runtime. Assets the asset index counts as
+used but the walk never reaches stay in boot. Scripts and scenes always
+ship in boot, so the router can fetch a screen's packs before loading it.
+
+--write saves the split to assets/packs.json, which SceneRouter reads to
+mount packs, and writes the export presets: the boot preset excludes
+every pack asset, and each pack gets a "Web pack <name>" preset listing
+its files for godot --export-pack.
+
+Usage:
+    python3 tools/boot_pack_analyzer.py            # report
+    python3 tools/boot_pack_analyzer.py --json
+    python3 tools/boot_pack_analyzer.py --write    # packs.json + export presets (CI)
+    python3 tools/boot_pack_analyzer.py --names    # pack names from packs.json, one per line
+"""
+
+import argparse
+import fnmatch
+import json
+import re
+import sys
+from pathlib import Path
+
+import asset_index
+from asset_index import ASSETS_DIR, DATA_SUFFIXES, PLACEHOLDER_PATTERN, PRESETS_FILE, PROJECT_ROOT, REF_PATTERN, local_path
+
+# --- Configuration ---
+PROJECT_FILE = PROJECT_ROOT / "project.godot"
+PACK_INDEX = ASSETS_DIR / "packs.json"
+PACK_URL = "packs/{}.pck"  # Relative to index.html
+BOOT_PRESET = "Web"
+PACK_PRESET = "Web pack {}"
+ROUTER_SCRIPT = "res://scripts/autoload/scene_router.gd"
+SCREEN_TABLE = "SCENES"
+SCREEN_BGM_TABLE = "SCREEN_BGM"
+BGM_TABLE = "BGM_TRACKS"
+TABLE_CALLS = {"SFX": "play_sfx", "BGM_TRACKS": "play_bgm"}  # Path table -> call that loads one entry
+MIN_PACK_BYTES = 16 * 1024  # Smaller packs fold into boot
+CLASS_PATTERN = re.compile(r"(?m)^class_name\s+(\w+)")
+PRELOAD_PATTERN = re.compile(r'preload\(\s*"(res://[^"]+)"')
+LOADER_PATTERN = re.compile(r"(?<!pre)load\(|get_texture\(")
+TABLE_PATTERN = re.compile(r"(?ms)^const (\w+)\s*:\s*Dictionary\s*=\s*\{\n(.*?)^\}")
+ENTRY_PATTERN = re.compile(r'\s*"(\w+)"\s*:\s*"([^"]*)",?\s*(?:#.*)?')
+
+
+def path_tables(text: str) -> dict[str, dict[str, str]]:
+    """Flat const Dictionaries of string keys to string values."""
+    tables = {}
+    for name, body in TABLE_PATTERN.findall(text):
+        lines = [line for line in body.splitlines() if line.strip() and not line.strip().startswith("#")]
+        entries = [ENTRY_PATTERN.fullmatch(line) for line in lines]
+        if entries and all(entries):
+            tables[name] = dict(match.groups() for match in entries)
+    return tables
+
+
+def eager_loops(text: str, tables: set[str]) -> set[str]:
+    """Tables a ``for`` loop walks and loads unconditionally."""
+    eager = set()
+    for match in re.finditer(r"(?m)^(\t*)for \w+ in (\w+)\s*:\n((?:\1\t.*\n|[ \t]*\n)*)", text):
+        if match.group(2) in tables and "ResourceLoader.exists" not in match.group(3):
+            eager.add(match.group(2))
+    return eager
+
+
+def parse_script(path: str, classes: set[str], table_names: set[str]) -> dict:
+    text = local_path(path).read_text(encoding="utf-8", errors="replace")
+    code = "\n".join(line for line in text.splitlines() if not line.lstrip().startswith("#"))
+    in_tables = {value for entries in path_tables(code).values() for value in entries.values()}
+    preloads = set(PRELOAD_PATTERN.findall(code))
+    calls = []
+    for table, call in TABLE_CALLS.items():
+        keys = re.findall(rf'\b{call}\(\s*"(\w+)"', code)
+        keys += re.findall(rf'call_deferred\(\s*"{call}"\s*,\s*"(\w+)"', code)
+        calls.extend((table, key) for key in keys)
+    own = CLASS_PATTERN.search(code)
+    uses = {name for name in classes if re.search(rf"\b{name}\b", code)}
+    return {
+        "preloads": preloads,
+        "literals": {ref.rstrip(",;") for ref in REF_PATTERN.findall(code)} - in_tables - preloads,
+        "calls": calls,
+        "eager_tables": eager_loops(code + "\n", table_names),
+        "uses": uses - {own.group(1)} if own else uses,
+        "loader": bool(LOADER_PATTERN.search(code)),
+    }
+
+
+def load_project() -> dict:
+    """Scripts, classes and path tables of the whole project."""
+    sources = [asset_index.res_path(path) for path in asset_index.source_files()]
+    scripts = [path for path in sources if path.endswith(".gd")]
+    classes, tables = {}, {}
+    for path in scripts:
+        text = local_path(path).read_text(encoding="utf-8", errors="replace")
+        if match := CLASS_PATTERN.search(text):
+            classes[match.group(1)] = path
+        tables.update(path_tables(text))
+    return {
+        "scripts": {path: parse_script(path, set(classes), set(tables)) for path in scripts},
+        "classes": classes,
+        "tables": tables,
+        "on_disk": asset_index.disk_assets(),
+    }
+
+
+def expand(ref: str, on_disk: set[str]) -> list[str]:
+    if PLACEHOLDER_PATTERN.search(ref) or ref.endswith("/"):
+        pattern = PLACEHOLDER_PATTERN.sub("*", ref) + ("*" if ref.endswith("/") else "")
+        return fnmatch.filter(on_disk, pattern)
+    return [ref]
+
+
+def reach(project: dict, roots: list[str]) -> dict[str, str]:
+    """Every res:// path loaded from ``roots``, mapped to the path that first pulled it in."""
+    scripts, classes, tables = project["scripts"], project["classes"], project["tables"]
+    parent: dict[str, str] = {root: "" for root in roots}
+    with_data: dict[str, bool] = {}
+    stack = [(root, True) for root in roots]
+    while stack:
+        path, data = stack.pop()
+        if with_data.get(path) is True or (path in with_data and not data):
+            continue
+        with_data[path] = data
+        targets: list[str] = []
+        if path in scripts:
+            info = scripts[path]
+            targets += info["preloads"]
+            if data:
+                targets += [ref for literal in info["literals"] for ref in expand(literal, project["on_disk"])]
+            targets += [tables[table][key] for table, key in info["calls"] if key in tables.get(table, {})]
+            targets += [value for table in info["eager_tables"] for value in tables[table].values()]
+            for name in info["uses"]:
+                parent.setdefault(classes[name], path)
+                stack.append((classes[name], info["loader"]))
+        elif path.endswith((".tscn", ".tres")) and local_path(path).exists():
+            text = local_path(path).read_text(encoding="utf-8", errors="replace")
+            targets += [ref.rstrip(",;") for ref in REF_PATTERN.findall(text)]
+        for target in targets:
+            parent.setdefault(target, path)
+            stack.append((target, True))
+    return resolve(parent, project["on_disk"])
+
+
+def resolve(parent: dict[str, str], on_disk: set[str]) -> dict[str, str]:
+    """Swap in what the game actually loads (.ogg siblings, atlases) and drop what is not on disk."""
+    atlas_index = {}
+    if asset_index.ATLAS_INDEX in parent and local_path(asset_index.ATLAS_INDEX).exists():
+        with open(local_path(asset_index.ATLAS_INDEX)) as f:
+            atlas_index = json.load(f)
+    resolved = {}
+    for path, source in parent.items():
+        if path.endswith(".wav") and path[:-4] + ".ogg" in on_disk:
+            path = path[:-4] + ".ogg"  # AudioManager prefers the encoded sibling
+        if path in atlas_index:
+            resolved.setdefault(atlas_index[path]["atlas"], path)
+        resolved.setdefault(path, source)
+    return {path: source for path, source in resolved.items()
+            if path in on_disk or not path.startswith("res://assets/")}
+
+
+def is_asset(path: str) -> bool:
+    return path.startswith("res://assets/")
+
+
+def is_data(path: str) -> bool:
+    """Read with FileAccess, so packed through include_filter rather than as a resource."""
+    return Path(path).suffix in DATA_SUFFIXES
+
+
+def nbytes(paths) -> int:
+    return sum(local_path(path).stat().st_size for path in paths)
+
+
+def analyze() -> dict:
+    project = load_project()
+    index = asset_index.build_index()
+    used = project["on_disk"] - set(index["unused"])
+    project_text = PROJECT_FILE.read_text()
+    router = local_path(ROUTER_SCRIPT).read_text()
+    tables = project["tables"]
+
+    boot_graph = reach(project, [ref for ref in REF_PATTERN.findall(project_text)])
+    boot = {path for path in boot_graph if is_asset(path)} & used
+    default_bgm = re.search(rf'{SCREEN_BGM_TABLE}\.get\(\s*\w+\s*,\s*"(\w+)"', router)
+    screen_assets = {}
+    for screen, scene in tables[SCREEN_TABLE].items():
+        bgm = tables.get(SCREEN_BGM_TABLE, {}).get(screen, default_bgm and default_bgm.group(1))
+        roots = [scene] + ([tables[BGM_TABLE][bgm]] if bgm in tables.get(BGM_TABLE, {}) else [])
+        screen_assets[screen] = {path for path in reach(project, roots) if is_asset(path)} & used
+
+    packs: dict[str, set[str]] = {}
+    for screen, assets in screen_assets.items():
+        claimed = set().union(boot, *packs.values())
+        if assets - claimed:
+            packs[screen] = assets - claimed
+    folded = [name for name, files in packs.items() if nbytes(files) < MIN_PACK_BYTES]
+    for name in folded:
+        boot |= packs.pop(name)
+    unattributed = used - boot - set().union(*packs.values())
+    boot |= unattributed
+
+    owner = {path: name for name, files in packs.items() for path in files}
+    return {
+        "boot": sorted(boot),
+        "boot_reason": {path: boot_graph.get(path, "") for path in boot},
+        "unattributed": sorted(unattributed),
+        "folded": folded,
+        "packs": {name: sorted(files) for name, files in packs.items()},
+        "screens": {screen: sorted({owner[path] for path in assets if path in owner})
+                    for screen, assets in screen_assets.items() if any(path in owner for path in assets)},
+        "index": index,
+    }
+
+
+def pack_index(result: dict) -> dict:
+    """The runtime view of the split, as SceneRouter reads it from packs.json."""
+    return {
+        "packs": {name: {"url": PACK_URL.format(name),
+                         "probe": next((path for path in files if not is_data(path)), files[0])}
+                  for name, files in result["packs"].items()},
+        "screens": result["screens"],
+    }
+
+
+def write_pack_presets(packs: dict[str, list[str]]) -> None:
+    """Replace the generated "Web pack" presets, renumbering so preset indices stay contiguous."""
+    text = PRESETS_FILE.read_text()
+    presets = []  # [body, options body] per preset index
+    for section in re.split(r"(?m)^(?=\[)", text):
+        match = re.match(r"\[preset\.(\d+)(\.options)?\]\n", section)
+        if not match:
+            continue
+        body = section[match.end():]
+        if match.group(2):
+            presets[-1][1] = body
+        else:
+            presets.append([body, ""])
+    presets = [preset for preset in presets if not re.search(r'(?m)^name="' + re.escape(PACK_PRESET.format("")),
+                                                             preset[0])]
+    for name, files in packs.items():
+        data = [path.removeprefix("res://") for path in files if is_data(path)]
+        listed = ", ".join(f'"{path}"' for path in files if not is_data(path))
+        presets.append([
+            f'\nname="{PACK_PRESET.format(name)}"\nplatform="Web"\nrunnable=false\ndedicated_server=false\n'
+            f'custom_features=""\nexport_filter="resources"\nexport_files=PackedStringArray({listed})\n'
+            f'include_filter="{", ".join(data)}"\nexclude_filter=""\nexport_path=""\n\n',
+            '\ncustom_template/debug=""\ncustom_template/release=""\n\n',
+        ])
+    out = "".join(f"[preset.{i}]\n{body}[preset.{i}.options]\n{options}" for i, (body, options) in enumerate(presets))
+    PRESETS_FILE.write_text(out.rstrip("\n") + "\n")
+
+
+def write(result: dict) -> None:
+    text = json.dumps(pack_index(result), indent=2, sort_keys=True) + "\n"
+    if not PACK_INDEX.exists() or PACK_INDEX.read_text() != text:
+        PACK_INDEX.write_text(text)
+    include, exclude = asset_index.export_filters(asset_index.build_index())
+    in_packs = {path.removeprefix("res://") for files in result["packs"].values() for path in files}
+    if not asset_index.write_preset(BOOT_PRESET, [p for p in include if p not in in_packs],
+                                    sorted(set(exclude) | in_packs)):
+        sys.exit(f"No export preset named {BOOT_PRESET!r} in {PRESETS_FILE.name}")
+    write_pack_presets(result["packs"])
+
+
+def mb(n: int) -> str:
+    return f"{n / (1024 * 1024):.2f} MB"
+
+
+def print_report(result: dict) -> None:
+    boot_bytes = nbytes(result["boot"])
+    pack_bytes = {name: nbytes(files) for name, files in result["packs"].items()}
+    total = boot_bytes + sum(pack_bytes.values())
+    print(f"=== Boot Pack Analysis ===")
+    print(f"\nBoot pack: {len(result['boot'])} assets, {mb(boot_bytes)}")
+    for path in sorted(result["boot"], key=lambda p: -local_path(p).stat().st_size)[:10]:
+        reason = result["boot_reason"][path] or "unattributed"
+        print(f"  {local_path(path).stat().st_size // 1024:>6} KB  {path}  <- {reason}")
+    if result["unattributed"]:
+        print(f"  ({len(result['unattributed'])} used assets not reached by the walk stay in boot)")
+    print(f"\nSecondary packs ({len(result['packs'])}):")
+    for name, files in result["packs"].items():
+        users = [screen for screen, packs in result["screens"].items() if name in packs]
+        print(f"  {name}: {len(files)} assets, {mb(pack_bytes[name])}  (screens: {', '.join(users)})")
+    if result["folded"]:
+        print(f"  folded into boot (under {MIN_PACK_BYTES // 1024} KB): {', '.join(result['folded'])}")
+    print(f"\nBefore first interactive frame: {mb(boot_bytes)} instead of {mb(total)} "
+          f"({mb(total - boot_bytes)} saved, {(total - boot_bytes) / max(1, total):.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split assets into a boot pack and lazily fetched packs.")
+    parser.add_argument("--json", action="store_true", help="Print the split as JSON")
+    parser.add_argument("--write", action="store_true", help="Write packs.json and the export presets")
+    parser.add_argument("--names", action="store_true", help="Print pack names from packs.json")
+    args = parser.parse_args()
+
+    if args.names:
+        if PACK_INDEX.exists():
+            print("\n".join(json.loads(PACK_INDEX.read_text())["packs"]))
+        return
+    result = analyze()
+    if args.json:
+        print(json.dumps({key: value for key, value in result.items() if key != "index"}, indent=2))
+    else:
+        print_report(result)
+    if args.write:
+        write(result)
+        print(f"\nWrote {PACK_INDEX.relative_to(PROJECT_ROOT)} and {len(result['packs']) + 1} export presets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Texture atlas packer for Music Label Tycoon.
+Packs the processed sprites of each group (cds/, artists/, casino/, ui/,
+effects/) into one atlas per group with padding and edge extrusion, and
+writes a region manifest the game resolves through SpriteAtlas.
+
+An atlas is only rebuilt when one of its input sprites (or the packing
+settings) changed since the last build.
+
+Usage:
+    python3 tools/process_sprites.py   # Atlases expect sprite-sized inputs
+    python3 tools/build_atlases.py
+    python3 tools/build_atlases.py --only cds --force
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from process_sprites import save_png
+
+# --- Configuration ---
+PROJECT_ROOT = Path(__file__).parent.parent
+ASSETS_DIR = PROJECT_ROOT / "assets"
+ATLAS_DIR = ASSETS_DIR / "atlases"
+INDEX_FILE = ATLAS_DIR / "atlases.json"
+
+ATLAS_GROUPS = {
+    "cds": "sprites/cds",
+    "artists": "sprites/artists",
+    "casino": "sprites/casino",
+    "ui": "sprites/ui",
+    "effects": "sprites/effects",
+}
+PADDING = 2  # Gutter around each region, filled by edge extrusion
+MAX_SPRITE_SIZE = 256  # Larger inputs are unprocessed raw output and are skipped
+MAX_ATLAS_SIZE = 2048
+PACKER_VERSION = 1  # Bump to force a rebuild when packing logic changes
+
+
+def res_path(path: Path) -> str:
+    return "res://" + path.relative_to(PROJECT_ROOT).as_posix()
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def pack_shelves(sizes: list[tuple[int, int]], width: int) -> tuple[list[tuple[int, int]], int] | None:
+    """Shelf-pack rectangles (already padded) into a strip of ``width``.
+
+    Returns per-rectangle positions and the used height, or None if a
+    rectangle is wider than the strip. Callers sort by height first, which
+    keeps shelves tight for the near-uniform sprite sizes used here.
+    """
+    positions = []
+    x = y = shelf_height = 0
+    for w, h in sizes:
+        if w > width:
+            return None
+        if x + w > width:
+            y += shelf_height
+            x = shelf_height = 0
+        positions.append((x, y))
+        x += w
+        shelf_height = max(shelf_height, h)
+    return positions, y + shelf_height
+
+
+def choose_layout(sizes: list[tuple[int, int]]) -> tuple[int, int, list[tuple[int, int]]]:
+    """Try power-of-two widths and keep the layout with the smallest area."""
+    best = None
+    width = 16
+    while width <= MAX_ATLAS_SIZE:
+        packed = pack_shelves(sizes, width)
+        if packed is not None:
+            positions, used_height = packed
+            height = 1 << max(0, (used_height - 1).bit_length())
+            if height <= MAX_ATLAS_SIZE and (best is None or width * height < best[0] * best[1]):
+                best = (width, height, positions)
+        width *= 2
+    if best is None:
+        raise ValueError("sprites do not fit in a single atlas")
+    return best
+
+
+def extrude(canvas: np.ndarray, x: int, y: int, w: int, h: int, pad: int) -> None:
+    """Copy a region's edge pixels outward into its padding to stop filtering bleed."""
+    top, bottom, left, right = y, y + h, x, x + w
+    for i in range(1, pad + 1):
+        if top - i >= 0:
+            canvas[top - i, left:right] = canvas[top, left:right]
+        if bottom - 1 + i < canvas.shape[0]:
+            canvas[bottom - 1 + i, left:right] = canvas[bottom - 1, left:right]
+    rows = slice(max(0, top - pad), min(canvas.shape[0], bottom + pad))
+    for i in range(1, pad + 1):
+        if left - i >= 0:
+            canvas[rows, left - i] = canvas[rows, left]
+        if right - 1 + i < canvas.shape[1]:
+            canvas[rows, right - 1 + i] = canvas[rows, right - 1]
+
+
+def build_atlas(group: str, sources: list[Path]) -> dict:
+    """Pack ``sources`` into ATLAS_DIR/<group>.png and return its manifest."""
+    images = [np.asarray(Image.open(path).convert("RGBA")) for path in sources]
+    order = sorted(range(len(images)), key=lambda i: (-images[i].shape[0], -images[i].shape[1]))
+    padded = [(images[i].shape[1] + 2 * PADDING, images[i].shape[0] + 2 * PADDING) for i in order]
+    width, height, positions = choose_layout(padded)
+
+    canvas = np.zeros((height, width, 4), dtype=np.uint8)
+    regions = {}
+    for i, (px, py) in zip(order, positions):
+        image = images[i]
+        h, w = image.shape[:2]
+        x, y = px + PADDING, py + PADDING
+        canvas[y:y + h, x:x + w] = image
+        extrude(canvas, x, y, w, h, PADDING)
+        regions[res_path(sources[i])] = [x, y, w, h]
+
+    atlas_path = ATLAS_DIR / f"{group}.png"
+    save_png(Image.fromarray(canvas, "RGBA"), atlas_path)
+    return {"texture": res_path(atlas_path), "size": [width, height], "regions": regions}
+
+
+def group_sources(group: str, verbose: bool = False) -> list[Path]:
+    """Processed sprites of ``group``, skipping raw generator output."""
+    sources = []
+    for path in sorted((ASSETS_DIR / ATLAS_GROUPS[group]).glob("*.png")):
+        with Image.open(path) as image:
+            if max(image.size) > MAX_SPRITE_SIZE:
+                if verbose:
+                    print(f"  SKIP (raw size {image.width}x{image.height}, run process_sprites.py): {res_path(path)}")
+                continue
+        sources.append(path)
+    return sources
+
+
+def atlas_state(group: str) -> str:
+    """Classify an atlas as ``skip`` (no sprites), ``fresh`` or ``dirty``."""
+    sources = group_sources(group)
+    if not sources:
+        return "skip"
+    manifest_path = ATLAS_DIR / f"{group}.json"
+    if not manifest_path.exists() or not (ATLAS_DIR / f"{group}.png").exists():
+        return "dirty"
+    with open(manifest_path) as f:
+        previous = json.load(f)
+    inputs = {res_path(path): file_digest(path) for path in sources}
+    if previous.get("inputs") == inputs and previous.get("packer_version") == PACKER_VERSION:
+        return "fresh"
+    return "dirty"
+
+
+def build_group(group: str, force: bool = False, verbose: bool = False) -> str:
+    """Rebuild one group's atlas if needed and return a status line."""
+    sources = group_sources(group, verbose)
+    if not sources:
+        return f"[{group}] no processed sprites"
+    if not force and atlas_state(group) == "fresh":
+        return f"[{group}] up to date ({len(sources)} sprites)"
+
+    ATLAS_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = build_atlas(group, sources)
+    manifest["inputs"] = {res_path(path): file_digest(path) for path in sources}
+    manifest["packer_version"] = PACKER_VERSION
+    with open(ATLAS_DIR / f"{group}.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+    width, height = manifest["size"]
+    return f"[{group}] packed {len(sources)} sprites into {width}x{height}"
+
+
+def write_index() -> int:
+    """Write the combined sprite path -> region index, the only file the game reads."""
+    index = {}
+    for group in ATLAS_GROUPS:
+        manifest_path = ATLAS_DIR / f"{group}.json"
+        if not manifest_path.exists():
+            continue
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        for sprite, region in manifest["regions"].items():
+            index[sprite] = {"atlas": manifest["texture"], "region": region}
+    ATLAS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(INDEX_FILE, "w") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    return len(index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack sprite groups into texture atlases.")
+    parser.add_argument("--only", action="append", default=[], choices=sorted(ATLAS_GROUPS))
+    parser.add_argument("--force", action="store_true", help="Rebuild even if inputs are unchanged")
+    args = parser.parse_args()
+
+    print(f"=== Atlas Builder ===")
+    for group in ATLAS_GROUPS:
+        if args.only and group not in args.only:
+            continue
+        print(build_group(group, args.force, verbose=True))
+
+    count = write_index()
+    print(f"Index: {count} sprites in {INDEX_FILE.relative_to(PROJECT_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
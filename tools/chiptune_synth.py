@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Procedural 8-bit synthesizer for Music Label Tycoon sound effects.
+Renders the "synth" recipes in asset_manifest.TRACKS locally instead of
+through a Lyria session: deterministic for a given recipe and seed, no
+network, and hundreds of times faster than real time.
+
+A recipe is a seed plus a list of voices. Each voice picks a waveform
+(square with duty cycle, triangle or noise) and an ADSR envelope, and
+plays a list of notes. A note is ``[pitch, start, length]`` in seconds,
+or a dict that can also override voice settings. Pitch sweeps, arpeggios
+and vibrato are computed per sample as a semitone offset, so every note
+renders as a handful of whole-array NumPy operations.
+
+Voice/note keys:
+    wave      "square", "triangle" or "noise"
+    duty      square duty cycle (0.125, 0.25, 0.5 ...)
+    adsr      [attack, decay, sustain level, release] in seconds/level
+    volume    linear gain
+    sweep     semitones glided over the note
+    arp       semitone offsets cycled at arp_rate Hz
+    vibrato   [depth in semitones, rate in Hz]
+    bits      amplitude resolution, for the crunchy 4-bit DAC sound
+    repeat    {"count", "interval", "growth"}: replay the notes with each
+              gap ``growth`` times longer than the last (ritardando)
+
+Usage:
+    python3 tools/chiptune_synth.py sfx/collect_cd --out /tmp/collect_cd.wav
+    python3 tools/chiptune_synth.py --bench
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+# --- Configuration ---
+ENGINE = "chiptune-synth-1"  # Part of the cache key; bump when rendering changes
+SAMPLE_RATE = 48000
+PEAK = 0.89  # Output peak after mixing (about -1 dBFS)
+DEFAULT_VOICE = {
+    "wave": "square",
+    "duty": 0.5,
+    "adsr": [0.005, 0.05, 0.7, 0.1],
+    "volume": 0.5,
+    "sweep": 0.0,
+    "arp": [0],
+    "arp_rate": 0.0,
+    "vibrato": [0.0, 0.0],
+    "bits": 0,
+}
+NOTE_PATTERN = re.compile(r"^([A-G])(#|b)?(-?\d)$")
+SEMITONES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+
+def note_frequency(pitch) -> float:
+    """Frequency in Hz of a note name ("C#5") or a number already in Hz."""
+    if isinstance(pitch, (int, float)):
+        return float(pitch)
+    match = NOTE_PATTERN.match(pitch)
+    if not match:
+        raise ValueError(f"bad note name: {pitch!r}")
+    name, accidental, octave = match.groups()
+    midi = 12 * (int(octave) + 1) + SEMITONES[name] + {"#": 1, "b": -1}.get(accidental, 0)
+    return 440.0 * 2.0 ** ((midi - 69) / 12)
+
+
+def envelope(n: int, sample_rate: int, attack: float, decay: float, sustain: float,
+             release: float) -> np.ndarray:
+    """ADSR envelope for a note of ``n`` samples; the release ends with the note."""
+    length = n / sample_rate
+    gate = max(0.0, length - release)
+    attack = min(attack, gate)
+    decay = min(decay, gate - attack)
+    level_at_gate = sustain if gate >= attack + decay else 1.0
+    times = [0.0, attack, attack + decay, gate, length]
+    levels = [0.0, 1.0, sustain, level_at_gate, 0.0]
+    return np.interp(np.arange(n) / sample_rate, times, levels).astype(np.float32)
+
+
+def oscillator(wave: str, phase: np.ndarray, duty: float, rng: np.random.Generator) -> np.ndarray:
+    """Waveform for a phase signal measured in cycles."""
+    frac = phase % 1.0
+    if wave == "square":
+        return np.where(frac < duty, 1.0, -1.0)
+    if wave == "triangle":
+        return 4.0 * np.abs(frac - 0.5) - 1.0
+    if wave == "noise":
+        # Sample-and-hold noise clocked at the note frequency, like a noise channel
+        steps = phase.astype(np.int64)
+        return rng.uniform(-1.0, 1.0, int(steps[-1]) + 1)[steps]
+    raise ValueError(f"unknown waveform: {wave!r}")
+
+
+def render_note(note: dict, sample_rate: int, rng: np.random.Generator) -> np.ndarray:
+    n = int(note["length"] * sample_rate)
+    if n <= 0:
+        return np.zeros(0, dtype=np.float32)
+    t = np.arange(n) / sample_rate
+
+    # Per-sample pitch offset in semitones: sweep + arpeggio + vibrato
+    offset = note["sweep"] * t / note["length"]
+    arp = np.asarray(note["arp"], dtype=np.float64)
+    if note["arp_rate"] > 0 and len(arp) > 1:
+        offset = offset + arp[(t * note["arp_rate"]).astype(np.int64) % len(arp)]
+    else:
+        offset = offset + arp[0]
+    depth, rate = note["vibrato"]
+    if depth:
+        offset = offset + depth * np.sin(2 * np.pi * rate * t)
+
+    freq = note_frequency(note["pitch"]) * np.exp2(offset / 12.0)
+    phase = np.cumsum(freq) / sample_rate
+    wave = oscillator(note["wave"], phase, note["duty"], rng)
+    if note["bits"]:
+        levels = 2 ** (note["bits"] - 1)
+        wave = np.round(wave * levels) / levels
+    return (wave * envelope(n, sample_rate, *note["adsr"]) * note["volume"]).astype(np.float32)
+
+
+def expand_notes(voice: dict) -> list[dict]:
+    """Resolve a voice's notes (and repeats) into fully specified note dicts."""
+    settings = {**DEFAULT_VOICE, **{k: v for k, v in voice.items() if k not in ("notes", "repeat")}}
+    notes = []
+    for entry in voice["notes"]:
+        if isinstance(entry, dict):
+            notes.append({**settings, **entry})
+        else:
+            pitch, start, length = entry
+            notes.append({**settings, "pitch": pitch, "start": start, "length": length})
+
+    repeat = voice.get("repeat")
+    if not repeat:
+        return notes
+    expanded = []
+    offset, gap = 0.0, repeat["interval"]
+    for _ in range(repeat["count"]):
+        expanded.extend({**note, "start": note["start"] + offset} for note in notes)
+        offset += gap
+        gap *= repeat.get("growth", 1.0)
+    return expanded
+
+
+def render(recipe: dict, duration: float, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Render a recipe to a mono float32 signal of ``duration`` seconds."""
+    rng = np.random.default_rng(recipe.get("seed", 0))
+    out = np.zeros(int(duration * sample_rate), dtype=np.float32)
+    for voice in recipe["voices"]:
+        for note in expand_notes(voice):
+            start = int(note["start"] * sample_rate)
+            if start >= len(out):
+                continue
+            samples = render_note(note, sample_rate, rng)[:len(out) - start]
+            out[start:start + len(samples)] += samples
+    peak = np.abs(out).max()
+    if peak > 0:
+        out *= PEAK / peak
+    return out
+
+
+def to_pcm16(signal: np.ndarray, channels: int = 2) -> bytes:
+    """Interleaved 16-bit PCM, duplicating the mono signal across channels."""
+    pcm = np.clip(np.round(signal * 32767.0), -32768, 32767).astype("<i2")
+    return np.repeat(pcm, channels).tobytes()
+
+
+def main():
+    from asset_manifest import TRACKS
+    from generate_music import save_wav
+
+    synth_tracks = {name: config for name, config in TRACKS.items() if "synth" in config}
+    parser = argparse.ArgumentParser(description="Render chiptune SFX recipes from the asset manifest.")
+    parser.add_argument("track", nargs="?", choices=sorted(synth_tracks))
+    parser.add_argument("--out", type=Path, help="Output WAV path")
+    parser.add_argument("--bench", action="store_true", help="Time rendering the whole SFX set")
+    args = parser.parse_args()
+
+    if args.bench:
+        audio_seconds = sum(config["duration"] for config in synth_tracks.values())
+        start = time.perf_counter()
+        for config in synth_tracks.values():
+            render(config["synth"], config["duration"])
+        elapsed = time.perf_counter() - start
+        print(f"Rendered {len(synth_tracks)} tracks ({audio_seconds}s of audio) in {elapsed * 1000:.1f} ms "
+              f"({audio_seconds / elapsed:.0f}x real time)")
+        return
+    if args.track is None or args.out is None:
+        parser.error("track and --out are required unless --bench is given")
+    config = synth_tracks[args.track]
+    save_wav(to_pcm16(render(config["synth"], config["duration"])), args.out)
+
+
+if __name__ == "__main__":
+    main()
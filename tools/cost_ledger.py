@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Crash-safe cost ledger shared by every generator.
+Spend lives in an SQLite database in WAL mode instead of a JSON file that
+is rewritten after every asset. Each generation is one row: it is inserted
+as a reservation before the request is sent and marked spent once the
+asset is saved, so a killed run never corrupts the history and at worst
+leaves a reservation that expires after RESERVATION_TTL.
+
+Reservations are checked against the cap inside a BEGIN IMMEDIATE
+transaction, which holds SQLite's write lock across the check and the
+insert. Parallel generator runs (separate processes) therefore share one
+budget and can never overshoot it together.
+
+Older JSON cost logs are imported once, the first time the ledger opens.
+
+Usage:
+    python3 tools/cost_ledger.py summary
+    python3 tools/cost_ledger.py summary --by provider --by day
+"""
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# --- Configuration ---
+TOOLS_DIR = Path(__file__).parent
+LEDGER_PATH = TOOLS_DIR / "generation_costs.db"
+LEGACY_LOGS = [  # JSON logs written by earlier versions of the generators
+    TOOLS_DIR / "image_generation_costs.json",
+    TOOLS_DIR / "extras_generation_costs.json",
+    TOOLS_DIR / "music_generation_costs.json",
+    TOOLS_DIR / "generation_costs.json",
+]
+LEGACY_PROVIDERS = {"image_generation_costs.json": "images", "extras_generation_costs.json": "images",
+                    "music_generation_costs.json": "music"}
+RESERVATION_TTL = 15 * 60  # Seconds before an unsettled reservation stops counting
+BUSY_TIMEOUT = 30.0  # Seconds to wait for another writer's lock
+GROUP_COLUMNS = {
+    "provider": "provider",
+    "model": "COALESCE(model, '')",
+    "size": "COALESCE(size, '')",
+    "day": "date(created, 'unixepoch', 'localtime')",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledger (
+    id INTEGER PRIMARY KEY,
+    provider TEXT NOT NULL,
+    asset TEXT NOT NULL,
+    model TEXT,
+    size TEXT,
+    duration REAL,
+    cost REAL NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('reserved', 'spent')),
+    created REAL NOT NULL,
+    expires REAL
+);
+CREATE INDEX IF NOT EXISTS ledger_provider_status ON ledger (provider, status);
+CREATE TABLE IF NOT EXISTS imported (file TEXT PRIMARY KEY);
+"""
+
+
+class CostLedger:
+    """SQLite-backed spend ledger with cross-process budget reservations.
+
+    Each thread gets its own connection; SQLite's locking handles other
+    threads and processes writing the same file.
+
+    ``read_only`` ledgers only answer queries and never create a file:
+    they read the database as a snapshot (without the WAL of a run still
+    in progress), or an empty in-memory ledger if there is none yet.
+    """
+
+    def __init__(self, path: Path = LEDGER_PATH, read_only: bool = False):
+        self.path = Path(path)
+        self.read_only = read_only
+        self._local = threading.local()
+        if not read_only:
+            self._connect().executescript(SCHEMA)
+            self._import_legacy()
+
+    def _connect(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            if not self.read_only:
+                db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+            elif self.path.exists():
+                # immutable=1 skips the -wal/-shm files a WAL reader would otherwise create
+                db = sqlite3.connect(f"{self.path.resolve().as_uri()}?immutable=1", uri=True, isolation_level=None)
+            else:
+                db = sqlite3.connect(":memory:", isolation_level=None)
+                db.executescript(SCHEMA)
+            self._local.db = db
+        return db
+
+    def _transaction(self):
+        return _Transaction(self._connect())
+
+    # --- Budget ---
+
+    def reserve(self, provider: str, asset: str, cost: float, cap: float, **details) -> int | None:
+        """Reserve ``cost`` against ``provider``'s cap. Returns the row id, or None if it won't fit."""
+        now = time.time()
+        with self._transaction() as db:
+            committed = self._committed(db, provider, now)
+            if committed + cost > cap + 1e-9:
+                return None
+            cursor = db.execute(
+                "INSERT INTO ledger (provider, asset, model, size, duration, cost, status, created, expires)"
+                " VALUES (?, ?, ?, ?, ?, ?, 'reserved', ?, ?)",
+                (provider, asset, details.get("model"), details.get("size"), details.get("duration"),
+                 cost, now, now + RESERVATION_TTL))
+            return cursor.lastrowid
+
+    def commit(self, reservation: int) -> None:
+        """Turn a reservation into actual spend."""
+        with self._transaction() as db:
+            db.execute("UPDATE ledger SET status = 'spent', expires = NULL, created = ? WHERE id = ?",
+                       (time.time(), reservation))
+
+    def release(self, reservation: int) -> None:
+        """Drop a reservation without spending it."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM ledger WHERE id = ? AND status = 'reserved'", (reservation,))
+
+    def record(self, provider: str, asset: str, cost: float, **details) -> None:
+        """Append spend that needed no reservation (free or already settled)."""
+        with self._transaction() as db:
+            db.execute(
+                "INSERT INTO ledger (provider, asset, model, size, duration, cost, status, created)"
+                " VALUES (?, ?, ?, ?, ?, ?, 'spent', ?)",
+                (provider, asset, details.get("model"), details.get("size"), details.get("duration"),
+                 cost, details.get("created", time.time())))
+
+    @staticmethod
+    def _committed(db: sqlite3.Connection, provider: str, now: float) -> float:
+        row = db.execute(
+            "SELECT COALESCE(SUM(cost), 0) FROM ledger WHERE provider = ?"
+            " AND (status = 'spent' OR expires > ?)", (provider, now)).fetchone()
+        return row[0]
+
+    # --- Queries ---
+
+    def spent(self, provider: str | None = None) -> float:
+        """Settled spend, for one provider or in total."""
+        sql = "SELECT COALESCE(SUM(cost), 0) FROM ledger WHERE status = 'spent'"
+        args = ()
+        if provider is not None:
+            sql += " AND provider = ?"
+            args = (provider,)
+        return self._connect().execute(sql, args).fetchone()[0]
+
+    def committed(self, provider: str) -> float:
+        """Settled spend plus live reservations: what the cap is checked against."""
+        return self._committed(self._connect(), provider, time.time())
+
+    def count(self, provider: str | None = None) -> int:
+        sql = "SELECT COUNT(*) FROM ledger WHERE status = 'spent'"
+        args = ()
+        if provider is not None:
+            sql += " AND provider = ?"
+            args = (provider,)
+        return self._connect().execute(sql, args).fetchone()[0]
+
+    def summary(self, by: list[str]) -> list[tuple]:
+        """Settled spend grouped by any of GROUP_COLUMNS: ``(*keys, count, cost)`` rows."""
+        columns = [GROUP_COLUMNS[name] for name in by]
+        select = ", ".join(columns + ["COUNT(*)", "ROUND(SUM(cost), 4)"])
+        sql = f"SELECT {select} FROM ledger WHERE status = 'spent'"
+        if columns:
+            sql += f" GROUP BY {', '.join(columns)} ORDER BY {', '.join(columns)}"
+        return self._connect().execute(sql).fetchall()
+
+    # --- Legacy JSON logs ---
+
+    def _import_legacy(self) -> None:
+        for path in LEGACY_LOGS:
+            if not path.exists():
+                continue
+            with self._transaction() as db:
+                if db.execute("SELECT 1 FROM imported WHERE file = ?", (path.name,)).fetchone():
+                    continue
+                with open(path) as f:
+                    data = json.load(f)
+                default_provider = LEGACY_PROVIDERS.get(path.name, "images")
+                for entry in data.get("log", []) + data.get("images", []):
+                    created = _parse_timestamp(entry.get("timestamp"))
+                    db.execute(
+                        "INSERT INTO ledger (provider, asset, size, duration, cost, status, created)"
+                        " VALUES (?, ?, ?, ?, ?, 'spent', ?)",
+                        (entry.get("provider", default_provider),
+                         entry.get("asset") or entry.get("track") or entry.get("path", ""),
+                         entry.get("size"), entry.get("duration"), entry.get("cost", 0.0), created))
+                db.execute("INSERT INTO imported (file) VALUES (?)", (path.name,))
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolling back if the block raises."""
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, exc_type, *exc) -> None:
+        self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+def _parse_timestamp(value: str | None) -> float:
+    if value:
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            pass
+    return 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the generation cost ledger.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    summary = sub.add_parser("summary", help="Spend grouped by provider, model, size and/or day")
+    summary.add_argument("--by", action="append", choices=sorted(GROUP_COLUMNS),
+                         help="Group column (repeatable, default: model, size, day)")
+    args = parser.parse_args()
+
+    ledger = CostLedger()
+    if args.command == "summary":
+        by = args.by or ["model", "size", "day"]
+        print("  ".join(f"{name:<12}" for name in by) + f"  {'count':>5}  {'cost':>8}")
+        for row in ledger.summary(by):
+            *keys, count, cost = row
+            print("  ".join(f"{key or '-':<12}" for key in keys) + f"  {count:>5}  ${cost:>7.2f}")
+        print(f"Total spent: ${ledger.spent():.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo economy simulator for Music Label Tycoon.
+Reads the balancing tables straight from the game's GDScript (CdData,
+ArtistData, UpgradeData, GameConfig, DailyRewardsData and the gambling
+tables in scripts/systems/gambling/) and plays many simulated players at
+once as NumPy arrays, one row per player.
+
+Each player alternates play sessions and time away. While playing they
+collect spawned CDs (tier rolled exactly like main_screen.gd, including
+the Marketing Reach weight shift), earn artist production, buy whichever
+artist, level or studio upgrade pays back fastest, spin the wheel when its
+cooldown is up and, depending on temperament, pull gacha crates with the
+game's pity rules. Coming back pays offline earnings the way the welcome
+back popup does and runs the daily login streak.
+
+Reports time-to-unlock curves for every GameConfig *_UNLOCK threshold and
+artist tier, and currency distributions at the end of each day. Work is
+split into chunks of players run on a process pool.
+
+Usage:
+    python3 tools/economy_sim.py
+    python3 tools/economy_sim.py --players 2000000 --days 14 --workers 8
+    python3 tools/economy_sim.py --set GameConfig.GACHA_PITY_RARE=20 --set UpgradeData.UPGRADES.0.cost_growth=1.4
+    python3 tools/economy_sim.py --json /tmp/economy.json
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from bake_data_tables import cd_spawn_probabilities
+from gdscript_data import load_tables
+
+# --- Configuration ---
+DEFAULT_PLAYERS = 20_000
+DEFAULT_DAYS = 3
+CHUNK_PLAYERS = 10_000  # Players per worker task
+STEP_SECONDS = 6.0  # Simulation tick while playing
+PURCHASES_PER_STEP = 3  # Buy decisions a player makes per tick
+MAX_OWNED = 400  # Artists of one tier a player will buy (cost 1.15^400 is out of reach anyway)
+PERCENTILES = (10, 50, 90)
+CURVE_HOURS = (0.25, 0.5, 1, 2, 4, 8, 12, 24, 48, 72, 120, 168)
+
+# Player model: each simulated player draws their habits from these ranges
+SESSION_MINUTES = (8.0, 0.8, 1.0, 45.0)  # Per session: lognormal median, sigma, clamp min, clamp max
+SESSIONS_PER_DAY = (2.0, 8.0)  # Uniform range
+TAP_ACCURACY = (0.4, 0.95)  # Share of spawned CDs collected
+GACHA_APPETITE = (0.0, 0.2)  # Chance per tick of pulling when unlocked and affordable
+OFFLINE_DOUBLE_RATE = 0.5  # Share of players who press "Double" on the welcome back popup
+
+# Effects hard-coded in SpinWheelData.apply_prize, keyed by PrizeType member
+SPIN_WHEEL_EFFECTS = {
+    "CDS_SMALL": ("cds", 50),
+    "CDS_MEDIUM": ("cds", 200),
+    "CDS_LARGE": ("cds", 1000),
+    "BOOST_2X": ("ad_boost", 0),
+    "PREMIUM_SMALL": ("gems", 5),
+    "NOTHING": ("none", 0),
+}
+GACHA_FREE_ARTIST_TIERS = ("INDIE_ARTIST", "GARAGE_BAND", "BUSKER")  # GachaData.apply_prize order
+
+
+def apply_override(tables: dict, assignment: str) -> None:
+    """Apply "Class.CONST[.key...]=value" to the parsed tables."""
+    target, _, raw = assignment.partition("=")
+    if not raw:
+        raise SystemExit(f"--set needs NAME=VALUE, got {assignment!r}")
+    parts = target.split(".")
+    node = tables
+    try:
+        for part in parts[:-1]:
+            node = node[int(part) if isinstance(node, list) or (part.isdigit() and int(part) in node) else part]
+        key = parts[-1]
+        if isinstance(node, list) or (key.isdigit() and int(key) in node):
+            key = int(key)
+        node[key]
+    except (KeyError, IndexError, TypeError, ValueError):
+        raise SystemExit(f"--set: no table value {target!r}")
+    node[key] = json.loads(raw)
+
+
+def build_model(tables: dict) -> dict:
+    """Flatten the GDScript tables into the arrays the simulation needs."""
+    config = tables["GameConfig"]
+    cd, artist, upgrade = tables["CdData"], tables["ArtistData"], tables["UpgradeData"]
+    gacha, wheel = tables["GachaData"], tables["SpinWheelData"]
+
+    # CD spawns: chance of each tier per Marketing Reach level, exactly as main_screen.gd rolls it
+    tier_ids, spawn = cd_spawn_probabilities(tables)
+    values = np.array([cd["TIERS"][t]["value"] for t in tier_ids], dtype=np.float64)
+    spawn_p = np.array(spawn)
+    marketing = upgrade["UPGRADES"][upgrade["UpgradeId"]["MARKETING_REACH"]]
+    quality = upgrade["UPGRADES"][upgrade["UpgradeId"]["RECORDING_QUALITY"]]
+
+    # Artists: production per level, milestones included
+    artist_ids = list(artist["TIERS"])
+    max_level = artist["MAX_LEVEL"]
+    level_axis = np.arange(max_level + 2)
+    milestone = np.ones(len(level_axis))
+    for at, mult in sorted(artist["MILESTONES"].items()):
+        milestone[level_axis >= at] = mult
+    base_production = np.array([artist["TIERS"][t]["base_production"] for t in artist_ids])
+    production = base_production[:, None] * (1.0 + level_axis * artist["LEVEL_PRODUCTION_BOOST"]) * milestone
+    base_cost = np.array([artist["TIERS"][t]["base_cost"] for t in artist_ids])
+    owned_axis = np.arange(MAX_OWNED + 1)
+    with np.errstate(over="ignore"):
+        buy_cost = base_cost[:, None] * float(artist["COST_GROWTH_RATE"]) ** owned_axis
+        level_cost = base_cost[:, None] * float(artist["LEVEL_COST_GROWTH"]) ** level_axis * 0.5
+        quality_cost = quality["base_cost"] * quality["cost_growth"] ** np.arange(quality["max_level"] + 1)
+        marketing_cost = marketing["base_cost"] * marketing["cost_growth"] ** np.arange(marketing["max_level"] + 1)
+    buy_cost[:, -1] = np.inf  # Stop buying at MAX_OWNED
+    level_gain = np.diff(production, axis=1, append=production[:, -1:])
+    level_gain[:, max_level:] = 0.0  # MAX_LEVEL reached
+
+    rarity = gacha["Rarity"]
+    action_codes = {"cds": 0, "boost": 1, "artist": 2}
+    spin_effects = {value: SPIN_WHEEL_EFFECTS[name] for name, value in wheel["PrizeType"].items()}
+    effects = [spin_effects[prize["type"]] for prize in wheel["PRIZES"]]
+    rewards = tables["DailyRewardsData"]["REWARDS"]
+
+    milestones = [(name, float(value)) for name, value in config.items() if name.endswith("_UNLOCK")]
+    milestones += [(f"ARTIST_{name}", float(artist["TIERS"][tier]["unlock_threshold"]))
+                   for name, tier in artist["ArtistTier"].items()]
+    milestones.sort(key=lambda item: item[1])
+
+    return {
+        "spawn_interval": float(config["CD_SPAWN_INTERVAL"]),
+        "cd_values": values,
+        "spawn_p": spawn_p,
+        "artist_unlock": np.array([artist["TIERS"][t]["unlock_threshold"] for t in artist_ids]),
+        "buy_cost": buy_cost,
+        "level_cost": level_cost,
+        "max_level": max_level,
+        "production": production,
+        "level_gain": level_gain,
+        "level_offsets": np.arange(len(artist_ids)) * len(level_axis),
+        "owned_offsets": np.arange(len(artist_ids)) * (MAX_OWNED + 1),
+        "spawn_value": spawn_p @ values,
+        "free_artist": [artist_ids.index(artist["ArtistTier"][name]) for name in GACHA_FREE_ARTIST_TIERS],
+        "quality_cost": quality_cost,
+        "quality_effect": quality["effect_per_level"],
+        "marketing_cost": marketing_cost,
+        "offline_cap": config["OFFLINE_EARNINGS_MAX_HOURS"] * 3600.0,
+        "offline_rate": float(config["OFFLINE_EARNINGS_RATE"]),
+        "gacha_unlock": float(config["GACHA_UNLOCK"]),
+        "gacha_single": float(config["GACHA_SINGLE_COST"]),
+        "gacha_ten": float(config["GACHA_TEN_PULL_COST"]),
+        "pity_rare": int(config["GACHA_PITY_RARE"]),
+        "pity_legendary": int(config["GACHA_PITY_LEGENDARY"]),
+        "rare": rarity["RARE"],
+        "legendary": rarity["LEGENDARY"],
+        "rarity_names": {value: name for name, value in rarity.items()},
+        "pool_cumulative": np.cumsum([item["weight"] for item in gacha["POOL"]], dtype=np.float64),
+        "pool_rarity": np.array([item["rarity"] for item in gacha["POOL"]]),
+        "pool_action": np.array([action_codes[item["action"]] for item in gacha["POOL"]]),
+        "pool_amount": np.array([item["amount"] for item in gacha["POOL"]], dtype=np.float64),
+        "spin_unlock": float(config["SPIN_WHEEL_UNLOCK"]),
+        "spin_cooldown": float(config["SPIN_WHEEL_COOLDOWN"]),
+        "spin_cumulative": np.cumsum([prize["weight"] for prize in wheel["PRIZES"]], dtype=np.float64),
+        "spin_effect": effects,
+        "ad_boost": (float(config["AD_BOOST_MULTIPLIER"]), float(config["AD_BOOST_DURATION"])),
+        "streak_length": int(config["LOGIN_STREAK_LENGTH"]),
+        "rewards": rewards,
+        "milestones": milestones,
+    }
+
+
+class Players:
+    """State of a chunk of simulated players, one array row per player."""
+
+    def __init__(self, model: dict, n: int, rng: np.random.Generator):
+        self.m = model
+        self.n = n
+        self.rng = rng
+        tiers = len(model["artist_unlock"])
+        self.cds = np.zeros(n)
+        self.total = np.zeros(n)
+        self.owned = np.zeros((n, tiers), dtype=np.int64)
+        self.levels = np.zeros((n, tiers), dtype=np.int64)
+        self.quality = np.zeros(n, dtype=np.int64)
+        self.marketing = np.zeros(n, dtype=np.int64)
+        self.boost = np.ones(n)
+        self.boost_left = np.zeros(n)
+        self.pity = np.zeros(n, dtype=np.int64)
+        self.last_spin = np.full(n, -np.inf)
+        self.clock = np.zeros(n)
+        self.streak = np.zeros(n, dtype=np.int64)
+        self.login_day = np.full(n, -1, dtype=np.int64)
+        self.production = np.zeros(n)
+        self.next_cost = np.zeros(n)
+        self.stats = {"pulls": np.zeros(n), "forced_rare": np.zeros(n), "forced_legendary": np.zeros(n),
+                      "spins": np.zeros(n), "gems": np.zeros(n), "offline": np.zeros(n),
+                      "tap": np.zeros(n), "idle": np.zeros(n), "gacha_cds": np.zeros(n)}
+        self.rarity_counts = np.zeros(len(model["rarity_names"]))
+        self.unlocked = np.full((len(model["milestones"]), n), np.inf)
+        self.thresholds = np.array([value for _, value in model["milestones"]])
+
+        # Habits
+        self.gap_mean = 86400.0 / rng.uniform(*SESSIONS_PER_DAY, n)
+        self.accuracy = rng.uniform(*TAP_ACCURACY, n)
+        self.appetite = rng.uniform(*GACHA_APPETITE, n)
+        self.doubles = rng.random(n) < OFFLINE_DOUBLE_RATE
+
+    def session_ticks(self, rows) -> np.ndarray:
+        median, sigma, low, high = SESSION_MINUTES
+        minutes = np.clip(self.rng.lognormal(np.log(median), sigma, rows.size), low, high)
+        return np.ceil(minutes * 60.0 / STEP_SECONDS).astype(np.int64)
+
+    # --- GameManager ---
+
+    def add_cds(self, rows, amount) -> None:
+        boosted = amount * self.boost[rows]
+        self.cds[rows] += boosted
+        self.total[rows] += boosted
+
+    def activate_boost(self, rows, multiplier, duration) -> None:
+        self.boost[rows] = multiplier
+        self.boost_left[rows] = duration
+
+    def update_production(self, rows) -> None:
+        per_artist = self.m["production"].take(self.levels[rows] + self.m["level_offsets"])
+        base = (per_artist * self.owned[rows]).sum(axis=1)
+        self.production[rows] = base * (1.0 + self.quality[rows] * self.m["quality_effect"])
+
+    def record_unlocks(self, rows) -> None:
+        times = self.unlocked[:, rows]
+        reached = (self.total[rows][None, :] >= self.thresholds[:, None]) & np.isinf(times)
+        self.unlocked[:, rows] = np.where(reached, self.clock[rows][None, :], times)
+
+    # --- Player behaviour ---
+
+    def purchase(self, rows) -> np.ndarray:
+        """Buy the affordable option with the best production gain per CD spent.
+
+        Returns the rows that bought something. Rows that cannot afford
+        their cheapest option (a lower bound kept from the last look) are
+        skipped without building the candidate table.
+        """
+        m = self.m
+        rows = rows[self.cds[rows] >= self.next_cost[rows]]
+        if not rows.size:
+            return rows
+        tiers = self.owned.shape[1]
+        owned, levels = self.owned[rows], self.levels[rows]
+        quality, marketing = self.quality[rows], self.marketing[rows]
+        quality_mult = (1.0 + quality * m["quality_effect"])[:, None]
+        q_max, k_max = len(m["quality_cost"]) - 1, len(m["marketing_cost"]) - 1
+
+        # Flat gathers from the per-tier tables (row offsets precomputed in the model)
+        at_level = levels + m["level_offsets"]
+        per_artist = m["production"].take(at_level)
+        buy_cost = m["buy_cost"].take(owned + m["owned_offsets"])
+        buy_gain = np.where(self.total[rows][:, None] >= m["artist_unlock"], per_artist * quality_mult, 0.0)
+        level_cost = m["level_cost"].take(at_level)
+        level_gain = m["level_gain"].take(at_level) * owned * quality_mult
+        q_cost = m["quality_cost"][np.minimum(quality, q_max)]
+        q_gain = np.where(quality < q_max, (per_artist * owned).sum(axis=1) * m["quality_effect"], 0.0)
+        k_cost = m["marketing_cost"][np.minimum(marketing, k_max)]
+        ev = m["spawn_value"]
+        k_gain = np.where(marketing < k_max, self.accuracy[rows] / m["spawn_interval"]
+                          * (ev[np.minimum(marketing + 1, k_max)] - ev[marketing]), 0.0)
+
+        cost = np.concatenate([buy_cost, level_cost, q_cost[:, None], k_cost[:, None]], axis=1)
+        gain = np.concatenate([buy_gain, level_gain, q_gain[:, None], k_gain[:, None]], axis=1)
+        score = np.where((cost <= self.cds[rows][:, None]) & (gain > 0), gain / cost, -1.0)
+        choice = score.argmax(axis=1)
+        buying = score[np.arange(rows.size), choice] > 0
+        # Costs only rise, so today's cheapest option bounds the next affordable one
+        self.next_cost[rows[~buying]] = cost[~buying].min(axis=1)
+        rows, choice = rows[buying], choice[buying]
+        if not rows.size:
+            return rows
+        self.cds[rows] -= cost[buying][np.arange(rows.size), choice]
+        buy = choice < tiers
+        self.owned[rows[buy], choice[buy]] += 1
+        lvl = (choice >= tiers) & (choice < 2 * tiers)
+        self.levels[rows[lvl], choice[lvl] - tiers] += 1
+        self.quality[rows[choice == 2 * tiers]] += 1
+        self.marketing[rows[choice == 2 * tiers + 1]] += 1
+        self.update_production(rows)
+        return rows
+
+    def pull(self, rows) -> None:
+        """GachaData.pull() and apply_prize() for each row."""
+        m = self.m
+        self.pity[rows] += 1
+        self.stats["pulls"][rows] += 1
+        cumulative = m["pool_cumulative"]
+        item = np.minimum(np.searchsorted(cumulative, self.rng.random(rows.size) * cumulative[-1]),
+                          len(cumulative) - 1)
+        natural_rare = m["pool_rarity"][item] >= m["rare"]
+        forced_legendary = self.pity[rows] >= m["pity_legendary"]
+        forced_rare = ~forced_legendary & (self.pity[rows] >= m["pity_rare"]) & ~natural_rare
+        for mask, rarity in ((forced_legendary, m["legendary"]), (forced_rare, m["rare"])):
+            if mask.any():
+                candidates = np.flatnonzero(m["pool_rarity"] == rarity)
+                item[mask] = candidates[self.rng.integers(0, candidates.size, mask.sum())]
+        # A forced rare does not reset the counter in GachaData.pull(), only a natural one does
+        self.pity[rows[forced_legendary | natural_rare]] = 0
+        self.stats["forced_rare"][rows] += forced_rare
+        self.stats["forced_legendary"][rows] += forced_legendary
+        self.rarity_counts += np.bincount(m["pool_rarity"][item], minlength=self.rarity_counts.size)
+
+        action, amount = m["pool_action"][item], m["pool_amount"][item]
+        cds = action == 0
+        before = self.cds[rows[cds]].copy()
+        self.add_cds(rows[cds], amount[cds])
+        self.stats["gacha_cds"][rows[cds]] += self.cds[rows[cds]] - before
+        boost = action == 1
+        self.activate_boost(rows[boost], 2.0, amount[boost])
+        artist_rows = rows[action == 2]
+        for tier in m["free_artist"]:
+            if not artist_rows.size:
+                break
+            ok = self.total[artist_rows] >= m["artist_unlock"][tier]
+            self.owned[artist_rows[ok], tier] += 1
+            artist_rows = artist_rows[~ok]
+
+    def spin(self, rows) -> None:
+        m = self.m
+        self.last_spin[rows] = self.clock[rows]
+        self.stats["spins"][rows] += 1
+        cumulative = m["spin_cumulative"]
+        prize = np.minimum(np.searchsorted(cumulative, self.rng.random(rows.size) * cumulative[-1]),
+                           len(cumulative) - 1)
+        for index, (kind, amount) in enumerate(m["spin_effect"]):
+            hit = rows[prize == index]
+            if not hit.size:
+                continue
+            if kind == "cds":
+                self.add_cds(hit, amount)
+            elif kind == "ad_boost":
+                self.activate_boost(hit, *m["ad_boost"])
+            elif kind == "gems":
+                self.stats["gems"][hit] += amount
+
+    def step(self, rows) -> None:
+        """One STEP_SECONDS tick for the players in ``rows``."""
+        m = self.m
+        # Taps: collected CDs per tier with the marketing-shifted roll (a Poisson
+        # count split over tiers is one independent Poisson per tier)
+        rate = self.accuracy[rows] * STEP_SECONDS / m["spawn_interval"]
+        taps = self.rng.poisson(rate[:, None] * m["spawn_p"][self.marketing[rows]]) @ m["cd_values"]
+        idle = self.production[rows] * STEP_SECONDS
+        self.stats["tap"][rows] += taps * self.boost[rows]
+        self.stats["idle"][rows] += idle * self.boost[rows]
+        self.add_cds(rows, taps + idle)
+
+        self.boost_left[rows] -= STEP_SECONDS
+        expired = rows[self.boost_left[rows] <= 0]
+        self.boost[expired] = 1.0
+        self.boost_left[expired] = 0.0
+
+        spin = rows[(self.total[rows] >= m["spin_unlock"])
+                    & (self.clock[rows] - self.last_spin[rows] >= m["spin_cooldown"])]
+        if spin.size:
+            self.spin(spin)
+
+        buyers = rows
+        for _ in range(PURCHASES_PER_STEP):
+            buyers = self.purchase(buyers)
+
+        gamble = rows[(self.total[rows] >= m["gacha_unlock"]) & (self.cds[rows] >= m["gacha_single"])
+                      & (self.rng.random(rows.size) < self.appetite[rows])]
+        if gamble.size:
+            ten = gamble[self.cds[gamble] >= m["gacha_ten"]]
+            single = gamble[self.cds[gamble] < m["gacha_ten"]]
+            self.cds[ten] -= m["gacha_ten"]
+            self.cds[single] -= m["gacha_single"]
+            self.pull(single)
+            for _ in range(10):
+                self.pull(ten)
+            self.update_production(gamble)
+
+        self.clock[rows] += STEP_SECONDS
+        self.record_unlocks(rows)
+
+    def come_back(self, rows, away) -> None:
+        """Cold start after ``away`` seconds: offline earnings popup and daily login."""
+        m = self.m
+        self.boost[rows] = 1.0
+        self.boost_left[rows] = 0.0
+        elapsed = np.minimum(away, m["offline_cap"])
+        earned = self.production[rows] * m["offline_rate"] * elapsed
+        shown = (elapsed >= 60.0) & (earned > 100)
+        # Claim adds nothing (the popup assumes SaveManager already paid out); Double adds one round
+        paid = shown & self.doubles[rows]
+        self.add_cds(rows[paid], earned[paid])
+        self.stats["offline"][rows[paid]] += earned[paid]
+
+        day = (self.clock[rows] // 86400).astype(np.int64)
+        new_day = day != self.login_day[rows]
+        consecutive = (day == self.login_day[rows] + 1) | (self.login_day[rows] == -1)
+        streak = np.where(consecutive, np.minimum(self.streak[rows] + 1, m["streak_length"]), 1)
+        self.streak[rows] = np.where(new_day, streak, self.streak[rows])
+        self.login_day[rows] = day
+        for index, reward in enumerate(m["rewards"]):
+            hit = rows[new_day & (self.streak[rows] - 1 == index)]
+            if reward["type"] == "cds":
+                self.add_cds(hit, float(reward["amount"]))
+            elif reward["type"] == "boost":
+                self.activate_boost(hit, 2.0, float(reward["duration"]))
+        self.record_unlocks(rows)
+
+
+def simulate_chunk(task: tuple) -> dict:
+    """Play ``players`` simulated players for ``days``. Returns per-player arrays.
+
+    Every tick steps all players who are in a session; a player whose
+    session just ended jumps over their time away right there, so the
+    batch stays full instead of waiting for the longest session.
+    """
+    model, players, days, seed = task
+    rng = np.random.default_rng(seed)
+    p = Players(model, players, rng)
+    horizon = days * 86400.0
+    snapshots = np.full((days, 3, players), np.nan)  # End-of-day cds, total earned, production
+
+    def snapshot(rows):
+        day = np.minimum(p.clock[rows] // 86400, days - 1).astype(np.int64)
+        snapshots[day, 0, rows] = p.cds[rows]
+        snapshots[day, 1, rows] = p.total[rows]
+        snapshots[day, 2, rows] = p.production[rows]
+
+    alive = np.arange(players)
+    p.come_back(alive, np.zeros(players))
+    ticks_left = p.session_ticks(alive)
+    while alive.size:
+        p.step(alive)
+        ticks_left[alive] -= 1
+        ended = alive[(ticks_left[alive] <= 0) | (p.clock[alive] >= horizon)]
+        if ended.size:
+            snapshot(ended)
+            away = rng.exponential(p.gap_mean[ended])
+            p.clock[ended] += away
+            back = p.clock[ended] < horizon
+            p.come_back(ended[back], away[back])
+            ticks_left[ended[back]] = p.session_ticks(ended[back])
+            alive = alive[p.clock[alive] < horizon]
+
+    # Days a player never played carry the previous day's state forward
+    for day in range(1, days):
+        gap = np.isnan(snapshots[day])
+        snapshots[day][gap] = snapshots[day - 1][gap]
+    return {"unlocked": p.unlocked, "snapshots": snapshots, "rarity_counts": p.rarity_counts,
+            **{f"stat_{name}": values for name, values in p.stats.items()}}
+
+
+def merge(parts: list[dict]) -> dict:
+    merged = {}
+    for key in parts[0]:
+        if key == "rarity_counts":
+            merged[key] = sum(part[key] for part in parts)
+        else:
+            merged[key] = np.concatenate([part[key] for part in parts], axis=-1)
+    return merged
+
+
+def summarize(model: dict, result: dict, days: int) -> dict:
+    """Time-to-unlock curves, currency percentiles and gambling stats."""
+    players = result["unlocked"].shape[1]
+    unlocks = {}
+    for (name, threshold), times in zip(model["milestones"], result["unlocked"]):
+        reached = times[np.isfinite(times)]
+        unlocks[name] = {
+            "threshold": threshold,
+            "reached": round(reached.size / players, 4),
+            **{f"p{q}_h": (round(float(np.percentile(reached, q)) / 3600, 3) if reached.size else None)
+               for q in PERCENTILES},
+            "curve": {f"{h}h": round(float((times <= h * 3600).mean()), 4)
+                      for h in CURVE_HOURS if h <= days * 24},
+        }
+    currency = {}
+    for day in range(days):
+        cds, total, production = result["snapshots"][day]
+        currency[f"day{day + 1}"] = {
+            label: {f"p{q}": round(float(np.nanpercentile(values, q)), 1) for q in PERCENTILES}
+            for label, values in (("cds", cds), ("total_earned", total), ("production_per_s", production))
+        }
+    income = {name: float(result[f"stat_{name}"].sum()) for name in ("tap", "idle", "offline", "gacha_cds")}
+    earned = sum(income.values()) or 1.0
+    pulls = result["stat_pulls"].sum()
+    return {
+        "players": players,
+        "days": days,
+        "unlocks": unlocks,
+        "currency": currency,
+        "income_share": {name: round(value / earned, 4) for name, value in income.items()},
+        "gacha": {
+            "pullers": round(float((result["stat_pulls"] > 0).mean()), 4),
+            "pulls_per_puller": round(float(pulls / max(1, (result["stat_pulls"] > 0).sum())), 1),
+            "rarity": {model["rarity_names"][i]: round(float(count / max(1, pulls)), 4)
+                       for i, count in enumerate(result["rarity_counts"])},
+            "forced_rare": round(float(result["stat_forced_rare"].sum() / max(1, pulls)), 4),
+            "forced_legendary": round(float(result["stat_forced_legendary"].sum() / max(1, pulls)), 4),
+        },
+        "spin_wheel": {"spins_per_player": round(float(result["stat_spins"].mean()), 2),
+                       "gems_per_player": round(float(result["stat_gems"].mean()), 1)},
+    }
+
+
+def format_hours(hours: float | None) -> str:
+    if hours is None:
+        return "-"
+    if hours < 1:
+        return f"{hours * 60:.0f}m"
+    return f"{hours:.1f}h" if hours < 48 else f"{hours / 24:.1f}d"
+
+
+def print_report(summary: dict, elapsed: float) -> None:
+    print(f"=== Economy Simulation ({summary['players']:,} players, {summary['days']} days, {elapsed:.1f}s) ===")
+    print(f"\n  {'milestone':<26} {'threshold':>12} {'reached':>8} {'p10':>7} {'p50':>7} {'p90':>7}")
+    for name, u in summary["unlocks"].items():
+        print(f"  {name:<26} {u['threshold']:>12,.0f} {u['reached'] * 100:>7.1f}% "
+              f"{format_hours(u['p10_h']):>7} {format_hours(u['p50_h']):>7} {format_hours(u['p90_h']):>7}")
+    print("\n  Unlocked by (share of players):")
+    hours = list(next(iter(summary["unlocks"].values()))["curve"])
+    print(f"  {'':<26} " + " ".join(f"{h:>6}" for h in hours))
+    for name, u in summary["unlocks"].items():
+        print(f"  {name:<26} " + " ".join(f"{u['curve'][h] * 100:>5.0f}%" for h in hours))
+    print("\n  End of day (p10 / p50 / p90):")
+    for day, c in summary["currency"].items():
+        print(f"  {day:<6} " + "  ".join(
+            f"{label} {v['p10']:.3g} / {v['p50']:.3g} / {v['p90']:.3g}" for label, v in c.items()))
+    share = summary["income_share"]
+    print("\n  Income: " + ", ".join(f"{name} {value * 100:.1f}%" for name, value in share.items()))
+    g = summary["gacha"]
+    print(f"  Gacha: {g['pullers'] * 100:.0f}% of players pull, {g['pulls_per_puller']} pulls each; "
+          + ", ".join(f"{name.lower()} {rate * 100:.1f}%" for name, rate in g["rarity"].items())
+          + f"; forced rare {g['forced_rare'] * 100:.1f}%, forced legendary {g['forced_legendary'] * 100:.1f}%")
+    w = summary["spin_wheel"]
+    print(f"  Spin wheel: {w['spins_per_player']} spins, {w['gems_per_player']} gems per player")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate player sessions against the game's data tables.")
+    parser.add_argument("--players", type=int, default=DEFAULT_PLAYERS, help="Simulated players")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Days of play per player")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="Override a table value, e.g. GameConfig.GACHA_UNLOCK=2000 (repeatable)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the summary as JSON")
+    args = parser.parse_args()
+
+    tables = load_tables()
+    for assignment in args.set:
+        apply_override(tables, assignment)
+    model = build_model(tables)
+
+    chunks = [min(CHUNK_PLAYERS, args.players - start) for start in range(0, args.players, CHUNK_PLAYERS)]
+    seeds = np.random.SeedSequence(args.seed).spawn(len(chunks))
+    tasks = [(model, size, args.days, seed) for size, seed in zip(chunks, seeds)]
+    start = time.perf_counter()
+    if args.workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            parts = list(pool.map(simulate_chunk, tasks))
+    else:
+        parts = [simulate_chunk(task) for task in tasks]
+    summary = summarize(model, merge(parts), args.days)
+    summary["overrides"] = args.set
+    print_report(summary, time.perf_counter() - start)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"\nSummary: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Local stand-ins for the paid generation APIs.
+Serves an OpenAI-compatible /v1/images/generations endpoint on localhost so
+the generators can be exercised offline, including 429 rate-limit responses,
+and provides an in-process Lyria RealTime client that streams synthetic PCM.
+Both take latency, payload size and error-rate knobs so benchmark_pipeline.py
+can model a slow or flaky provider.
+
+Usage:
+    python3 tools/fake_providers.py images --port 8765 --rate-limit-every 4
+    python3 tools/fake_providers.py images --latency 2 --jitter 1 --error-rate 0.1 --payload-kb 1500
+    OPENAI_API_BASE=http://127.0.0.1:8765/v1 OPENAI_API_KEY=fake python3 tools/generate_images.py
+    LYRIA_FAKE_SPEED=20 python3 tools/generate_music.py --fake
+"""
+
+import argparse
+import array
+import asyncio
+import base64
+import json
+import math
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+GRID_PATTERN = re.compile(r"grid of (\d+) columns and (\d+) rows")  # sprite_sheets.py prompts
+
+
+def make_png(width: int, height: int, rgb: tuple[int, int, int], padding: int = 0,
+             grid: tuple[int, int] | None = None) -> bytes:
+    """Encode a solid-colour RGB PNG without any imaging dependency.
+
+    ``padding`` bytes go into a private ancillary chunk that decoders skip,
+    so the payload can be sized like a real 1024px render. ``grid`` (columns,
+    rows) draws a square of the inverse colour in the middle of each cell,
+    standing in for the icons of a sprite sheet.
+    """
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    background = bytes(rgb)
+    lines = [b"\x00" + background * width] * height
+    if grid:
+        cols, rows = grid
+        icon = bytes(255 - c for c in rgb)
+        cell_w, cell_h = width / cols, height / rows
+        for y in range(height):
+            if abs((y % cell_h) - cell_h / 2) < cell_h / 4:
+                lines[y] = b"\x00" + b"".join(icon if abs((x % cell_w) - cell_w / 2) < cell_w / 4 else background
+                                             for x in range(width))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    pad = chunk(b"fkPd", bytes(padding)) if padding else b""
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + pad
+            + chunk(b"IDAT", zlib.compress(b"".join(lines))) + chunk(b"IEND", b""))
+
+
+class FakeImageServer:
+    """Threaded HTTP server mimicking the DALL-E image generation endpoint.
+
+    ``rate_limit_every`` answers every Nth request with a 429 carrying
+    ``retry_after`` seconds, and ``error_rate`` answers that fraction with a
+    500. Successful responses take ``latency`` seconds (plus up to
+    ``jitter``) and carry ``payload_bytes`` of padding. Request timings and
+    statuses are kept in ``requests`` so tests and benchmarks can assert on
+    concurrency and pacing.
+    """
+
+    def __init__(self, port: int = 0, image_size: int = 64, rate_limit_every: int = 0,
+                 retry_after: float = 1.0, latency: float = 0.0, jitter: float = 0.0,
+                 payload_bytes: int = 0, error_rate: float = 0.0, seed: int = 0):
+        self.image_size = image_size
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.latency = latency
+        self.jitter = jitter
+        self.payload_bytes = payload_bytes
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self.requests: list[dict] = []
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeImageServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeImageServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _respond(self, payload: dict, record: dict) -> tuple[int, dict, bytes]:
+        with self._lock:
+            n = len(self.requests) + 1
+            record.update(n=n, time=time.monotonic(), prompt=payload.get("prompt", ""))
+            self.requests.append(record)
+            fail = self._rng.random() < self.error_rate
+            delay = self.latency + self._rng.uniform(0.0, self.jitter)
+        if self.rate_limit_every and n % self.rate_limit_every == 0:
+            body = json.dumps({"error": {"message": "Rate limit exceeded", "type": "rate_limit"}})
+            return 429, {"Retry-After": f"{self.retry_after:g}"}, body.encode()
+        if fail:
+            body = json.dumps({"error": {"message": "The server had an error", "type": "server_error"}})
+            return 500, {}, body.encode()
+        time.sleep(delay)
+        seed = zlib.crc32(payload.get("prompt", "").encode())
+        rgb = (seed & 0xFF, (seed >> 8) & 0xFF, (seed >> 16) & 0xFF)
+        sheet = GRID_PATTERN.search(payload.get("prompt", ""))
+        grid = (int(sheet.group(1)), int(sheet.group(2))) if sheet else None
+        png = make_png(self.image_size, self.image_size, rgb, self.payload_bytes, grid)
+        body = json.dumps({
+            "created": int(time.time()),
+            "data": [{"revised_prompt": payload.get("prompt", ""),
+                      "b64_json": base64.b64encode(png).decode()}],
+        })
+        return 200, {}, body.encode()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if not self.path.endswith("/images/generations"):
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with server._lock:
+                    server._in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server._in_flight)
+                record = {}
+                try:
+                    status, headers, body = server._respond(payload, record)
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+                record.update(status=status, end=time.monotonic(), bytes=len(body))
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        return Handler
+
+
+# Stand-ins for google.genai.types used when building Lyria session requests
+LYRIA_TYPES = SimpleNamespace(WeightedPrompt=SimpleNamespace, LiveMusicGenerationConfig=SimpleNamespace)
+
+
+class FakeLyriaClient:
+    """In-process stand-in for ``genai.Client`` covering ``aio.live.music``.
+
+    Each session streams a deterministic tone (pitch seeded by the prompt,
+    pulsed at the configured BPM) as 16-bit PCM in ``chunk_seconds`` chunks,
+    paced at ``speed`` times real time (0 streams as fast as possible).
+    Connecting takes ``latency`` seconds, and ``error_rate`` of sessions
+    drop partway through the stream. ``sessions`` and ``max_active`` let
+    tests assert on concurrency.
+    """
+
+    def __init__(self, speed: float = 1.0, chunk_seconds: float = 0.5,
+                 sample_rate: int = 48000, channels: int = 2, latency: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0):
+        self.speed = speed
+        self.chunk_seconds = chunk_seconds
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.latency = latency
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self.sessions = 0
+        self.active = 0
+        self.max_active = 0
+        self.aio = SimpleNamespace(live=SimpleNamespace(music=SimpleNamespace(connect=self.connect)))
+
+    def connect(self, model: str) -> "FakeLyriaSession":
+        return FakeLyriaSession(self)
+
+
+class FakeLyriaSession:
+    def __init__(self, client: FakeLyriaClient):
+        self.client = client
+        self.prompt = ""
+        self.bpm = 120
+        self.playing = False
+
+    async def __aenter__(self) -> "FakeLyriaSession":
+        client = self.client
+        client.sessions += 1
+        client.active += 1
+        client.max_active = max(client.max_active, client.active)
+        # Seconds of audio streamed before this session drops, if it does
+        self.drop_after = client._rng.uniform(0.0, 30.0) if client._rng.random() < client.error_rate else None
+        await asyncio.sleep(client.latency)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.client.active -= 1
+
+    async def set_weighted_prompts(self, prompts) -> None:
+        self.prompt = " ".join(p.text for p in prompts)
+
+    async def set_music_generation_config(self, config) -> None:
+        self.bpm = getattr(config, "bpm", None) or self.bpm
+
+    async def play(self) -> None:
+        self.playing = True
+
+    def _beat_pcm(self) -> bytes:
+        """One beat of audio: a decaying tone, repeated for the whole session."""
+        rate, channels = self.client.sample_rate, self.client.channels
+        freq = 220.0 * 2 ** ((zlib.crc32(self.prompt.encode()) % 24) / 12)
+        frames = int(rate * 60 / self.bpm)
+        samples = array.array("h")
+        for i in range(frames):
+            value = int(8000 * math.exp(-4.0 * i / frames) * math.sin(2 * math.pi * freq * i / rate))
+            samples.extend([value] * channels)
+        return samples.tobytes()
+
+    async def receive(self):
+        client = self.client
+        beat = self._beat_pcm()
+        frame_bytes = 2 * client.channels
+        chunk_bytes = int(client.sample_rate * client.chunk_seconds) * frame_bytes
+        loop = (beat * (chunk_bytes // len(beat) + 2))
+        offset = 0
+        start = time.monotonic()
+        sent = 0.0
+        while self.playing:
+            if self.drop_after is not None and sent >= self.drop_after:
+                raise ConnectionError("fake Lyria session dropped")
+            data = loop[offset:offset + chunk_bytes]
+            offset = (offset + chunk_bytes) % len(beat)
+            yield SimpleNamespace(server_content=SimpleNamespace(
+                audio_chunks=[SimpleNamespace(data=data)]))
+            sent += client.chunk_seconds
+            if client.speed > 0:
+                await asyncio.sleep(max(0.0, start + sent / client.speed - time.monotonic()))
+            else:
+                await asyncio.sleep(0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local fake generation provider.")
+    sub = parser.add_subparsers(dest="provider", required=True)
+    images = sub.add_parser("images", help="OpenAI-compatible image endpoint")
+    images.add_argument("--port", type=int, default=8765)
+    images.add_argument("--image-size", type=int, default=64)
+    images.add_argument("--rate-limit-every", type=int, default=0)
+    images.add_argument("--retry-after", type=float, default=1.0)
+    images.add_argument("--latency", type=float, default=0.0, help="Seconds per successful response")
+    images.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    images.add_argument("--payload-kb", type=int, default=0, help="Padding added to each PNG")
+    images.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with a 500")
+    args = parser.parse_args()
+
+    server = FakeImageServer(args.port, args.image_size, args.rate_limit_every, args.retry_after,
+                             args.latency, args.jitter, args.payload_kb * 1024, args.error_rate)
+    print(f"Fake image API listening on {server.url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Read the game's data tables straight from GDScript.
+Parses the ``enum`` and ``const`` declarations of every ``class_name``
+script under scripts/ into plain Python values, so balancing tools work
+on the same numbers the game ships with instead of a copy that drifts.
+
+Supported: numbers (with ``_`` separators), strings, true/false/null,
+arrays, dictionaries, unary minus, + - * / arithmetic, enum members and
+references to other constants (``GameConfig.GACHA_PITY_RARE``). Anything
+else, such as ``Color.GOLD`` or ``Color(1, 0, 0)``, is kept as its source
+text.
+
+Usage (library):
+    tables = load_tables()
+    tables["CdData"]["TIERS"][tables["CdData"]["CdTier"]["DEMO"]]["drop_weight"]
+"""
+
+import re
+from pathlib import Path
+
+# --- Configuration ---
+PROJECT_ROOT = Path(__file__).parent.parent
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<space>[ \t\r\n]+|\\\n)
+  | (?P<comment>\#[^\n]*)
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<number>(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][-+]?\d+)?)
+  | (?P<name>[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)
+  | (?P<op>[{}\[\]():,=+\-*/])
+""", re.VERBOSE)
+DECLARATION_PATTERN = re.compile(r"(?m)^(const|enum)\s+(\w+)")
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+LITERALS = {"true": True, "false": False, "null": None, "INF": float("inf"), "PI": 3.141592653589793}
+
+
+class GdParseError(ValueError):
+    pass
+
+
+def tokenize(text: str) -> list[tuple[str, str]]:
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = TOKEN_PATTERN.match(text, pos)
+        if not match:
+            raise GdParseError(f"unexpected character {text[pos]!r}")
+        kind = match.lastgroup
+        if kind not in ("space", "comment"):
+            tokens.append((kind, match.group()))
+        pos = match.end()
+    return tokens
+
+
+class Script:
+    """The enums and constants of one GDScript file, evaluated on demand."""
+
+    def __init__(self, path: Path, resolve):
+        self.path = path
+        self.resolve = resolve  # (class_name, member) -> value, for cross-script references
+        text = path.read_text(encoding="utf-8")
+        match = re.search(r"(?m)^class_name\s+(\w+)", text)
+        self.class_name = match.group(1) if match else path.stem
+        self.enums: dict[str, dict[str, int]] = {}
+        self._pending: dict[str, list[tuple[str, str]]] = {}
+        self._values: dict[str, object] = {}
+        self._evaluating: set[str] = set()
+        for kind, name, body in self._declarations(text):
+            if kind == "enum":
+                self._parse_enum(name, body)
+            else:
+                self._pending[name] = body
+
+    @staticmethod
+    def _declarations(text: str):
+        """(kind, name, tokens) for every top-level enum/const, bracket-balanced over lines."""
+        for match in DECLARATION_PATTERN.finditer(text):
+            tokens = tokenize_statement(text, match.end())
+            yield match.group(1), match.group(2), tokens
+
+    def _parse_enum(self, name: str, tokens: list[tuple[str, str]]) -> None:
+        if not tokens or tokens[0][1] != "{":
+            raise GdParseError(f"{self.path.name}: enum {name} has no body")
+        members: dict[str, int] = {}
+        next_value = 0
+        inner = tokens[1:-1]
+        for entry in split_top_level(inner):
+            if not entry:
+                continue
+            member = entry[0][1]
+            if len(entry) > 2 and entry[1][1] == "=":
+                next_value = int(Parser(entry[2:], self._lookup).expression())
+            members[member] = next_value
+            next_value += 1
+        self.enums[name] = members
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._pending or name in self.enums
+
+    def get(self, name: str):
+        if name in self.enums:
+            return self.enums[name]
+        if name not in self._values:
+            if name in self._evaluating:
+                raise GdParseError(f"{self.class_name}.{name} refers to itself")
+            self._evaluating.add(name)
+            tokens = self._pending[name]
+            if tokens and tokens[0][1] == ":":  # Typed: "const X: Dictionary = ..." or "const X := ..."
+                tokens = tokens[tokens.index(("op", "=")) + 1:] if ("op", "=") in tokens else tokens[1:]
+            elif tokens and tokens[0][1] == "=":
+                tokens = tokens[1:]
+            self._values[name] = Parser(tokens, self._lookup).expression()
+            self._evaluating.discard(name)
+        return self._values[name]
+
+    def constants(self) -> dict[str, object]:
+        values = {name: members for name, members in self.enums.items()}
+        values.update({name: self.get(name) for name in self._pending})
+        return values
+
+    def _lookup(self, dotted: str):
+        """Resolve a name in this script first, then as ClassName.MEMBER[.MEMBER]."""
+        parts = dotted.split(".")
+        if parts[0] in self:
+            value = self.get(parts[0])
+            for part in parts[1:]:
+                value = value[part]
+            return value
+        if len(parts) >= 2:
+            value = self.resolve(parts[0], parts[1])
+            if value is not None:
+                for part in parts[2:]:
+                    value = value[part]
+                return value
+        return None
+
+
+def tokenize_statement(text: str, start: int) -> list[tuple[str, str]]:
+    """Tokens from ``start`` to the end of the statement (newline at bracket depth 0)."""
+    depth = 0
+    pos = start
+    while pos < len(text):
+        char = text[pos]
+        if char in "\"'":
+            match = re.compile(r'"(?:[^"\\]|\\.)*"' if char == '"' else r"'(?:[^'\\]|\\.)*'").match(text, pos)
+            pos = match.end() if match else pos + 1
+            continue
+        if char == "#":
+            end = text.find("\n", pos)
+            pos = len(text) if end < 0 else end
+            continue
+        if char in "{[(":
+            depth += 1
+        elif char in "}])":
+            depth -= 1
+        elif char == "\n" and depth <= 0:
+            break
+        pos += 1
+    return tokenize(text[start:pos])
+
+
+def split_top_level(tokens: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+    """Split a token list on commas outside brackets."""
+    parts, current, depth = [], [], 0
+    for token in tokens:
+        if token[1] in "{[(":
+            depth += 1
+        elif token[1] in "}])":
+            depth -= 1
+        if token == ("op", ",") and depth == 0:
+            parts.append(current)
+            current = []
+        else:
+            current.append(token)
+    parts.append(current)
+    return parts
+
+
+class Parser:
+    """Recursive-descent evaluator for GDScript constant expressions."""
+
+    def __init__(self, tokens: list[tuple[str, str]], lookup):
+        self.tokens = tokens
+        self.pos = 0
+        self.lookup = lookup
+
+    def peek(self) -> str | None:
+        return self.tokens[self.pos][1] if self.pos < len(self.tokens) else None
+
+    def take(self, expected: str | None = None) -> tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise GdParseError("unexpected end of expression")
+        token = self.tokens[self.pos]
+        if expected is not None and token[1] != expected:
+            raise GdParseError(f"expected {expected!r}, got {token[1]!r}")
+        self.pos += 1
+        return token
+
+    def expression(self):
+        value = self.term()
+        while self.peek() in ("+", "-"):
+            op = self.take()[1]
+            right = self.term()
+            value = value + right if op == "+" else value - right
+        return value
+
+    def term(self):
+        value = self.unary()
+        while self.peek() in ("*", "/"):
+            op = self.take()[1]
+            right = self.unary()
+            if op == "*":
+                value = value * right
+            elif isinstance(value, int) and isinstance(right, int):
+                value = int(value / right)  # GDScript integer division truncates
+            else:
+                value = value / right
+        return value
+
+    def unary(self):
+        if self.peek() == "-":
+            self.take()
+            return -self.unary()
+        if self.peek() == "+":
+            self.take()
+        return self.atom()
+
+    def atom(self):
+        kind, text = self.take()
+        if kind == "number":
+            text = text.replace("_", "")
+            return float(text) if any(c in text for c in ".eE") else int(text)
+        if kind == "string":
+            return ESCAPE_PATTERN.sub(lambda m: ESCAPES.get(m.group(1), m.group(1)), text[1:-1])
+        if text == "(":
+            value = self.expression()
+            self.take(")")
+            return value
+        if text == "[":
+            return self.sequence("]")
+        if text == "{":
+            return self.mapping()
+        if kind == "name":
+            if text in LITERALS:
+                return LITERALS[text]
+            if self.peek() == "(":  # Constructor call such as Color(1, 0.9, 0.3): keep as text
+                start = self.pos - 1
+                self.skip_group()
+                return " ".join(t for _, t in self.tokens[start:self.pos]).replace("( ", "(").replace(" )", ")")
+            value = self.lookup(text)
+            return text if value is None else value
+        raise GdParseError(f"unexpected token {text!r}")
+
+    def skip_group(self) -> None:
+        depth = 0
+        while True:
+            text = self.take()[1]
+            if text in "{[(":
+                depth += 1
+            elif text in "}])":
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def sequence(self, close: str) -> list:
+        items = []
+        while self.peek() != close:
+            items.append(self.expression())
+            if self.peek() == ",":
+                self.take()
+        self.take(close)
+        return items
+
+    def mapping(self) -> dict:
+        items = {}
+        while self.peek() != "}":
+            key = self.expression()
+            self.take(":")  # Lua-style "key = value" dictionaries are not used in this project
+            items[key] = self.expression()
+            if self.peek() == ",":
+                self.take()
+        self.take("}")
+        return items
+
+
+def load_tables(root: Path = SCRIPTS_DIR) -> dict[str, dict[str, object]]:
+    """class_name -> {constant or enum name: value} for every script under ``root``."""
+    scripts: dict[str, Script] = {}
+
+    def resolve(class_name: str, member: str):
+        script = scripts.get(class_name)
+        if script is None or member not in script:
+            return None
+        return script.get(member)
+
+    for path in sorted(root.rglob("*.gd")):
+        script = Script(path, resolve)
+        scripts[script.class_name] = script
+    return {name: values for name, script in scripts.items() if (values := script.constants())}
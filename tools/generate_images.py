@@ -3,208 +3,153 @@
 DALL-E 3 asset generator for Music Label Tycoon.
 Generates all pixel art sprites, backgrounds, and UI elements.
 Tracks cost per image and enforces a budget cap.
+
+Asset prompts live in asset_manifest.py. Running this script is the same as
+running the generate stage of tools/assetgen.py for the core images.
 """
 
 import os
-import sys
-import json
-import time
 import base64
+import tempfile
+import threading
+import time
 import requests
 from pathlib import Path
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from asset_manifest import CORE_IMAGES
+from asset_scheduler import RateLimited, TokenBucket, call_with_retry, parse_retry_after
+import telemetry
+from cost_ledger import CostLedger
 
 # --- Configuration ---
 API_KEY = os.environ.get("OPENAI_API_KEY", "")
-BUDGET_CAP_USD = 5.00  # Maximum spend in USD
+API_BASE = os.environ.get("OPENAI_API_BASE", "https://api.openai.com/v1")
+BUDGET_CAP_USD = 7.00  # Maximum spend in USD (core set $5 + casino/studio extras $2)
 COST_PER_IMAGE = {
     "1024x1024": {"standard": 0.04, "hd": 0.08},
     "1024x1792": {"standard": 0.08, "hd": 0.12},
     "1792x1024": {"standard": 0.08, "hd": 0.12},
 }
+MODEL = "dall-e-3"
 DEFAULT_SIZE = "1024x1024"
 DEFAULT_QUALITY = "standard"
+PROVIDER = "images"  # Cost ledger provider name
+
+# Concurrency: requests kept in flight and adaptive pacing (requests/minute).
+# The limiter starts at IMAGE_GEN_RPM, halves on every 429 and recovers
+# towards IMAGE_GEN_MAX_RPM while requests succeed.
+MAX_CONCURRENCY = int(os.environ.get("IMAGE_GEN_CONCURRENCY", "4"))
+REQUESTS_PER_MINUTE = float(os.environ.get("IMAGE_GEN_RPM", "5"))
+MAX_REQUESTS_PER_MINUTE = float(os.environ.get("IMAGE_GEN_MAX_RPM", "15"))
+HTTP_RETRIES = 3  # Connection errors and 503 responses, with exponential backoff
+STREAM_CHUNK_BYTES = 64 * 1024
 
 # Project root
 PROJECT_ROOT = Path(__file__).parent.parent
 ASSETS_DIR = PROJECT_ROOT / "assets"
 
-# Cost tracking file
-COST_LOG = PROJECT_ROOT / "tools" / "image_generation_costs.json"
-
-# --- Style Anchors ---
-PIXEL_ART_ANCHOR = "16-bit pixel art style, limited color palette, black outline, transparent background, game asset, clean crisp pixels, retro video game aesthetic"
-BACKGROUND_ANCHOR = "16-bit pixel art style, detailed interior scene, limited color palette, atmospheric lighting, portrait aspect ratio, retro video game background, no characters, no text, no UI elements"
-
-# --- Asset Definitions ---
-ASSETS = {
-    # === CD Sprites (32x32) ===
-    "sprites/cds/cd_demo": {
-        "prompt": f"A simple plain silver compact disc, basic demo CD, minimal design, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered",
-        "size": "1024x1024",
-    },
-    "sprites/cds/cd_single": {
-        "prompt": f"A compact disc in a blue jewel case, music single release, slightly shiny, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, blue color scheme",
-        "size": "1024x1024",
-    },
-    "sprites/cds/cd_ep": {
-        "prompt": f"A compact disc in a green jewel case with small sparkle effects around it, EP music release, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, green color scheme, tiny star sparkles",
-        "size": "1024x1024",
-    },
-    "sprites/cds/cd_album": {
-        "prompt": f"A compact disc in a luxurious gold jewel case with subtle golden glow aura, full album release, premium look, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, gold color scheme",
-        "size": "1024x1024",
-    },
-    "sprites/cds/cd_platinum": {
-        "prompt": f"A platinum colored compact disc with shimmering particle effects surrounding it, platinum certified record, very prestigious, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, white and silver color scheme, glowing particles",
-        "size": "1024x1024",
-    },
-    "sprites/cds/cd_diamond": {
-        "prompt": f"A diamond-encrusted compact disc with rainbow prismatic aura and sparkles, legendary diamond record, most valuable, {PIXEL_ART_ANCHOR}, 32x32 sprite size, single small item centered, cyan and rainbow color scheme, brilliant shine",
-        "size": "1024x1024",
-    },
-
-    # === Artist Sprites (64x64) ===
-    "sprites/artists/artist_busker": {
-        "prompt": f"A street busker character with acoustic guitar, worn casual clothes, hat for tips, humble musician, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, sandy brown warm tones",
-        "size": "1024x1024",
-    },
-    "sprites/artists/artist_garage_band": {
-        "prompt": f"A garage band rock musician with electric guitar, band t-shirt, jeans, energetic casual look, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, slate blue cool tones",
-        "size": "1024x1024",
-    },
-    "sprites/artists/artist_indie": {
-        "prompt": f"A trendy indie artist musician, unique hipster style, headphones around neck, creative outfit, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, medium purple tones",
-        "size": "1024x1024",
-    },
-    "sprites/artists/artist_studio_pro": {
-        "prompt": f"A professional studio musician with studio headphones, clean modern outfit, confident pose, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, orange-red tones",
-        "size": "1024x1024",
-    },
-    "sprites/artists/artist_chart_topper": {
-        "prompt": f"A flashy pop star musician, stylish trendy outfit, microphone, stage presence, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, hot pink tones",
-        "size": "1024x1024",
-    },
-    "sprites/artists/artist_superstar": {
-        "prompt": f"A glamorous music superstar celebrity, gold jewelry and accessories, designer clothes, sunglasses, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, gold tones",
-        "size": "1024x1024",
-    },
-    "sprites/artists/artist_legend": {
-        "prompt": f"An iconic legendary rockstar, dark mysterious aura, legendary status, dramatic cape or coat, chibi proportions, front-facing idle pose, {PIXEL_ART_ANCHOR}, 64x64 character sprite, dark violet purple tones, subtle glow",
-        "size": "1024x1024",
-    },
-
-    # === Backgrounds (portrait) ===
-    "sprites/backgrounds/bg_main_studio": {
-        "prompt": f"Interior of a cozy music recording studio, mixing console desk with knobs and sliders, large speakers on walls, vinyl records hanging as decoration, warm amber lighting, cables on floor, microphone stand visible, {BACKGROUND_ANCHOR}, dark blue-gray color base, warm and inviting atmosphere",
-        "size": "1024x1792",
-    },
-    "sprites/backgrounds/bg_artist_roster": {
-        "prompt": f"Backstage talent agency office interior, music posters on walls, comfortable couch, stage lights visible through a doorway, gold records on display, {BACKGROUND_ANCHOR}, dark blue-purple color base, professional yet creative atmosphere",
-        "size": "1024x1792",
-    },
-    "sprites/backgrounds/bg_studio_upgrades": {
-        "prompt": f"Recording studio control room with equipment racks full of gear, LED level meters glowing, mixing board, patch cables, audio compressors, {BACKGROUND_ANCHOR}, dark red-brown color base, technical and professional atmosphere",
-        "size": "1024x1792",
-    },
-    "sprites/backgrounds/bg_casino": {
-        "prompt": f"Neon-lit casino floor interior, slot machines with colorful lights, card table visible, flashy neon signs, exciting nightlife atmosphere, {BACKGROUND_ANCHOR}, dark green color base, exciting and energetic atmosphere, lots of neon glow",
-        "size": "1024x1792",
-    },
-    "sprites/backgrounds/bg_shop": {
-        "prompt": f"Music merchandise store interior, shelves stocked with CDs and vinyl records, band posters on walls, neon OPEN sign, display cases, {BACKGROUND_ANCHOR}, dark warm gold-brown color base, inviting retail atmosphere",
-        "size": "1024x1792",
-    },
-
-    # === UI Elements ===
-    "sprites/ui/icon_cd_currency": {
-        "prompt": f"A small shiny gold compact disc icon, currency symbol for a game, simple and recognizable, {PIXEL_ART_ANCHOR}, 16x16 sprite size, gold and yellow tones, bright and clear",
-        "size": "1024x1024",
-    },
-    "sprites/ui/icon_nav_music": {
-        "prompt": f"A music note icon, simple eighth note or treble clef, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
-        "size": "1024x1024",
-    },
-    "sprites/ui/icon_nav_artist": {
-        "prompt": f"A microphone icon, simple stage microphone, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
-        "size": "1024x1024",
-    },
-    "sprites/ui/icon_nav_studio": {
-        "prompt": f"A mixing board or equalizer icon with sliders, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
-        "size": "1024x1024",
-    },
-    "sprites/ui/icon_nav_casino": {
-        "prompt": f"A dice and playing card icon, gambling casino symbol, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
-        "size": "1024x1024",
-    },
-    "sprites/ui/icon_nav_shop": {
-        "prompt": f"A shopping bag icon, small retail bag with handle, game navigation button icon, {PIXEL_ART_ANCHOR}, 32x32 sprite size, white on transparent",
-        "size": "1024x1024",
-    },
-    "sprites/ui/icon_gem_premium": {
-        "prompt": f"A small purple gemstone, premium currency gem, faceted jewel, game currency icon, {PIXEL_ART_ANCHOR}, 16x16 sprite size, purple and violet tones, shiny",
-        "size": "1024x1024",
-    },
-    "sprites/ui/mystery_crate_closed": {
-        "prompt": f"A closed treasure chest or loot box, mystery crate, wooden chest with gold trim and a question mark on front, {PIXEL_ART_ANCHOR}, 64x64 sprite size, purple and gold color scheme",
-        "size": "1024x1024",
-    },
-    "sprites/ui/mystery_crate_open": {
-        "prompt": f"An opened treasure chest or loot box with golden light beaming out, mystery crate revealing prizes, {PIXEL_ART_ANCHOR}, 64x64 sprite size, purple and gold color scheme, bright golden glow from inside",
-        "size": "1024x1024",
-    },
-
-    # === Effects ===
-    "sprites/effects/particle_sparkle": {
-        "prompt": f"A small sparkle star burst effect, white and yellow, 4-pointed star twinkle, particle effect for games, {PIXEL_ART_ANCHOR}, 8x8 sprite size, bright white and yellow",
-        "size": "1024x1024",
-    },
-    "sprites/effects/particle_glow": {
-        "prompt": f"A soft circular glow effect, radial gradient from bright center to transparent edge, warm golden light, particle effect for games, {PIXEL_ART_ANCHOR}, 16x16 sprite size, gold and white",
-        "size": "1024x1024",
-    },
-    "sprites/effects/particle_notes": {
-        "prompt": f"Small floating music notes, various musical note symbols scattered, eighth notes and quarter notes, {PIXEL_ART_ANCHOR}, 16x16 sprite size, white and pastel colors",
-        "size": "1024x1024",
-    },
-    "sprites/effects/collect_burst": {
-        "prompt": f"A radial burst explosion effect, lines emanating outward from center point, coin collect impact effect, {PIXEL_ART_ANCHOR}, 16x16 sprite size, gold and white rays",
-        "size": "1024x1024",
-    },
-    "sprites/effects/levelup_flash": {
-        "prompt": f"A bright starburst level up effect with small upward arrows, celebratory flash, upgrade complete effect, {PIXEL_ART_ANCHOR}, 32x32 sprite size, bright yellow and white with upward arrows",
-        "size": "1024x1024",
-    },
-}
-
-
-def load_cost_log() -> dict:
-    """Load or initialize cost tracking."""
-    if COST_LOG.exists():
-        with open(COST_LOG) as f:
-            return json.load(f)
-    return {"total_spent": 0.0, "images_generated": 0, "log": []}
-
 
-def save_cost_log(data: dict) -> None:
-    """Save cost tracking."""
-    with open(COST_LOG, "w") as f:
-        json.dump(data, f, indent=2)
-
-
-def get_image_cost(size: str, quality: str) -> float:
+def get_image_cost(size: str, quality: str = DEFAULT_QUALITY) -> float:
     """Get cost for an image generation."""
     return COST_PER_IMAGE.get(size, {}).get(quality, 0.08)
 
 
-def generate_image(prompt: str, size: str, quality: str = DEFAULT_QUALITY) -> bytes | None:
-    """Call DALL-E 3 API and return image bytes."""
-    headers = {
-        "Authorization": f"Bearer {API_KEY}",
-        "Content-Type": "application/json",
+def request_params(asset_config: dict) -> dict:
+    """Parameters that determine the generated image, used as the cache key."""
+    return {
+        "model": MODEL,
+        "prompt": asset_config["prompt"],
+        "size": asset_config.get("size", DEFAULT_SIZE),
+        "quality": asset_config.get("quality", DEFAULT_QUALITY),
     }
+
+
+class B64FieldDecoder:
+    """Incrementally extract and decode one base64 string field from a JSON stream.
+
+    Feed raw response chunks; each call returns the bytes decoded so far.
+    Only the field's value is ever buffered, and at most a few characters
+    of it, so memory stays constant however large the image is.
+    """
+
+    def __init__(self, field: str = "b64_json"):
+        self.marker = f'"{field}"'.encode()
+        self.state = "search"  # search -> colon -> string -> done
+        self._pending = b""
+
+    @property
+    def done(self) -> bool:
+        return self.state == "done"
+
+    def feed(self, chunk: bytes) -> bytes:
+        data = self._pending + chunk
+        self._pending = b""
+        if self.state == "search":
+            index = data.find(self.marker)
+            if index < 0:
+                self._pending = data[-len(self.marker):]  # Marker may straddle chunks
+                return b""
+            data = data[index + len(self.marker):]
+            self.state = "colon"
+        if self.state == "colon":
+            data = data.lstrip(b" \t\r\n:")
+            if not data:
+                return b""
+            if data[:1] != b'"':
+                raise ValueError(f"{self.marker.decode()} is not a string")
+            data = data[1:]
+            self.state = "string"
+        if self.state != "string":
+            return b""
+        end = data.find(b'"')
+        if end >= 0:
+            data = data[:end]
+            self.state = "done"
+        data = data.replace(b"\\", b"")  # JSON may escape "/" as "\/"
+        if not self.done:
+            usable = len(data) - len(data) % 4
+            data, self._pending = data[:usable], data[usable:]
+        return base64.b64decode(data)
+
+
+def _session() -> requests.Session:
+    """Keep-alive session shared by every worker, retrying transient failures.
+
+    Only refused connections and 503s are retried. A 503 means the service
+    turned the request away, so it should not have been billed; a 500, or a
+    502/504 from a gateway, may come after the upstream already generated
+    (and charged for) the image, so those fail instead, as does a POST that
+    timed out or dropped mid-read. Retrying 503 keeps brief overloads from
+    failing a run, at the small risk of a proxy answering 503 late.
+    429s are not retried here either: they go back to the adaptive limiter,
+    which has to slow every worker down, not just this one.
+    """
+    retry = Retry(total=HTTP_RETRIES, connect=HTTP_RETRIES, read=0, other=0, backoff_factor=1.0,
+                  status=HTTP_RETRIES, status_forcelist=(503,), allowed_methods=None,
+                  respect_retry_after_header=False, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENCY, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Authorization"] = f"Bearer {API_KEY}"
+    return session
+
+
+SESSION = _session()
+
+
+def generate_image(prompt: str, size: str, quality: str, output_path: Path) -> int | None:
+    """Call DALL-E 3 API and stream the image to ``output_path``.
+
+    The response is decoded as it arrives into a temp file next to
+    ``output_path`` that is renamed into place only once complete, so a
+    failed download never leaves a truncated image behind. Returns the
+    number of bytes written.
+    """
     payload = {
-        "model": "dall-e-3",
+        "model": MODEL,
         "prompt": prompt,
         "n": 1,
         "size": size,
@@ -212,107 +157,111 @@ def generate_image(prompt: str, size: str, quality: str = DEFAULT_QUALITY) -> by
         "response_format": "b64_json",
     }
 
-    resp = requests.post(
-        "https://api.openai.com/v1/images/generations",
-        headers=headers,
-        json=payload,
-        timeout=120,
-    )
+    sent = telemetry.now_us()
+    with SESSION.post(f"{API_BASE}/images/generations", json=payload,
+                      timeout=(10, 120), stream=True) as resp:
+        telemetry.complete("await response", sent, "images", status=resp.status_code)
+        if resp.status_code == 429:
+            raise RateLimited(parse_retry_after(resp.headers.get("Retry-After")))
+        if resp.status_code != 200:
+            print(f"  ERROR: {resp.status_code} - {resp.text[:200]}")
+            return None
 
-    if resp.status_code != 200:
-        print(f"  ERROR: {resp.status_code} - {resp.text[:200]}")
-        return None
-
-    data = resp.json()
-    b64 = data["data"][0]["b64_json"]
-    return base64.b64decode(b64)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+        try:
+            decoder = B64FieldDecoder()
+            written = received = 0
+            decode_s = write_s = 0.0
+            download = telemetry.now_us()
+            with os.fdopen(fd, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                    if not received:
+                        telemetry.mark("first byte", "images")
+                    received += len(chunk)
+                    t0 = time.perf_counter()
+                    data = decoder.feed(chunk)
+                    t1 = time.perf_counter()
+                    f.write(data)
+                    decode_s += t1 - t0
+                    write_s += time.perf_counter() - t1
+                    written += len(data)
+                    if decoder.done:
+                        break
+            if not decoder.done:
+                raise ValueError("response ended before the image data was complete")
+            os.replace(tmp, output_path)
+            telemetry.complete("download", download, "images", received=received, written=written,
+                               decode_s=round(decode_s, 4), write_s=round(write_s, 4))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    return written
+
+
+class ImageGenerator:
+    """Budget, pacing and cost tracking shared by every image generation.
+
+    ``generate()`` is safe to call from many threads at once: at most
+    MAX_CONCURRENCY requests are in flight, paced by an adaptive token
+    bucket, and each one reserves its cost in the ledger before it is sent.
+    """
+
+    def __init__(self, cache, ledger: CostLedger):
+        if not API_KEY:
+            raise RuntimeError("Set OPENAI_API_KEY environment variable")
+        self.cache = cache
+        self.ledger = ledger
+        self.limiter = TokenBucket(REQUESTS_PER_MINUTE, burst=MAX_CONCURRENCY,
+                                   max_rate_per_minute=MAX_REQUESTS_PER_MINUTE)
+        self._slots = threading.BoundedSemaphore(MAX_CONCURRENCY)
+
+    def generate(self, asset_path: str, asset_config: dict, key: str, output_path: Path | None = None) -> str:
+        """Generate one image (into assets/ unless ``output_path`` is given).
+
+        Returns ``generated``, ``budget`` or ``error``.
+        """
+        params = request_params(asset_config)
+        output_path = output_path or ASSETS_DIR / f"{asset_path}.png"
+
+        # Reserve budget atomically so parallel workers (and runs) can't overshoot the cap
+        cost = get_image_cost(params["size"], params["quality"])
+        reservation = self.ledger.reserve(PROVIDER, asset_path, cost, BUDGET_CAP_USD,
+                                          model=MODEL, size=params["size"])
+        if reservation is None:
+            print(f"  SKIP (budget): {asset_path} (would exceed ${BUDGET_CAP_USD:.2f})")
+            return "budget"
+
+        print(f"  Generating: {asset_path} (${cost:.2f})...")
+        try:
+            with telemetry.span("await slot", "images"):
+                self._slots.acquire()
+            try:
+                written = call_with_retry(
+                    lambda: generate_image(params["prompt"], params["size"], params["quality"], output_path),
+                    self.limiter)
+            finally:
+                self._slots.release()
+        except BaseException:
+            self.ledger.release(reservation)
+            raise
+        if not written:
+            self.ledger.release(reservation)
+            return "error"
+
+        print(f"  Saved: {output_path} ({written} bytes)")
+        with telemetry.span("cache put", "images"):
+            self.cache.put_file(key, output_path, params)
+        self.cache.record_output(asset_path, key)
+
+        # Track cost
+        self.ledger.commit(reservation)
+        return "generated"
 
 
 def main():
-    if not API_KEY:
-        print("ERROR: Set OPENAI_API_KEY environment variable")
-        sys.exit(1)
-
-    cost_log = load_cost_log()
-    total_assets = len(ASSETS)
-    already_generated = 0
-    skipped_budget = 0
-    errors = 0
-
-    print(f"=== DALL-E 3 Asset Generator ===")
-    print(f"Budget cap: ${BUDGET_CAP_USD:.2f}")
-    print(f"Spent so far: ${cost_log['total_spent']:.2f}")
-    print(f"Assets to generate: {total_assets}")
-    print()
-
-    # Estimate total cost
-    estimated_cost = sum(
-        get_image_cost(asset["size"], DEFAULT_QUALITY)
-        for asset in ASSETS.values()
-    )
-    print(f"Estimated cost for all assets: ${estimated_cost:.2f}")
-
-    if cost_log["total_spent"] + estimated_cost > BUDGET_CAP_USD:
-        print(f"WARNING: Estimated total (${cost_log['total_spent'] + estimated_cost:.2f}) exceeds budget cap (${BUDGET_CAP_USD:.2f})")
-        resp = input("Continue anyway? (y/n): ").strip().lower()
-        if resp != "y":
-            print("Aborted.")
-            return
-
-    print()
-
-    for i, (asset_path, asset_config) in enumerate(ASSETS.items(), 1):
-        output_path = ASSETS_DIR / f"{asset_path}.png"
-
-        # Skip if already generated
-        if output_path.exists():
-            print(f"[{i}/{total_assets}] SKIP (exists): {asset_path}")
-            already_generated += 1
-            continue
-
-        # Check budget
-        cost = get_image_cost(asset_config["size"], DEFAULT_QUALITY)
-        if cost_log["total_spent"] + cost > BUDGET_CAP_USD:
-            print(f"[{i}/{total_assets}] SKIP (budget): {asset_path} (would exceed ${BUDGET_CAP_USD:.2f})")
-            skipped_budget += 1
-            continue
-
-        print(f"[{i}/{total_assets}] Generating: {asset_path} (${cost:.2f})...")
-
-        # Ensure directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Generate
-        image_bytes = generate_image(asset_config["prompt"], asset_config["size"])
-
-        if image_bytes:
-            with open(output_path, "wb") as f:
-                f.write(image_bytes)
-            print(f"  Saved: {output_path} ({len(image_bytes)} bytes)")
-
-            # Track cost
-            cost_log["total_spent"] += cost
-            cost_log["images_generated"] += 1
-            cost_log["log"].append({
-                "asset": asset_path,
-                "cost": cost,
-                "size": asset_config["size"],
-                "timestamp": datetime.now().isoformat(),
-            })
-            save_cost_log(cost_log)
-        else:
-            errors += 1
-
-        # Rate limit: DALL-E 3 allows ~5 req/min on free tier
-        time.sleep(13)
-
-    print()
-    print(f"=== Generation Complete ===")
-    print(f"Generated: {cost_log['images_generated']} images")
-    print(f"Already existed: {already_generated}")
-    print(f"Skipped (budget): {skipped_budget}")
-    print(f"Errors: {errors}")
-    print(f"Total spent: ${cost_log['total_spent']:.2f} / ${BUDGET_CAP_USD:.2f}")
+    from assetgen import main as assetgen_main
+    assetgen_main(["--stage", "generate", *[f"--only={asset}" for asset in CORE_IMAGES]])
 
 
 if __name__ == "__main__":
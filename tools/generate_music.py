@@ -4,93 +4,87 @@ Lyria RealTime music generator for Music Label Tycoon.
 Generates chiptune/retro game music tracks using Google's Lyria API.
 Tracks cost and enforces budget cap.
 
+Audio is streamed to a partial WAV under the generation cache as it
+arrives, so memory stays constant regardless of track length and an
+interrupted session keeps what it captured. The next run resumes the
+partial file instead of starting over (pass --no-resume to discard it).
+
+SFX with a "synth" recipe in the manifest skip Lyria entirely and are
+rendered by the offline chiptune synthesizer (chiptune_synth.py).
+
+Several tracks render at once (LYRIA_CONCURRENCY sessions on one shared
+client). --fake swaps in the local Lyria stand-in from fake_providers.py,
+which streams synthetic PCM at LYRIA_FAKE_SPEED times real time.
+
+Track prompts live in asset_manifest.py. Running this script is the same as
+running the generate stage of tools/assetgen.py for the tracks.
+
 Usage:
     GOOGLE_API_KEY=your_key python3 tools/generate_music.py
+    GOOGLE_API_KEY=your_key python3 tools/generate_music.py --no-resume --jobs 2
+    LYRIA_FAKE_SPEED=20 python3 tools/generate_music.py --fake
 """
 
+import argparse
 import asyncio
-import json
 import os
 import struct
-import sys
+import threading
+import time
 import wave
-from datetime import datetime
 from pathlib import Path
 
+import chiptune_synth
+import telemetry
+from asset_manifest import TRACKS
+from cost_ledger import CostLedger
+from generation_cache import CACHE_DIR
+
 try:
     from google import genai
     from google.genai import types
-except ImportError:
-    print("ERROR: Install google-genai package: pip3 install google-genai")
-    sys.exit(1)
+except ImportError:  # Only required for real sessions, not --fake
+    genai = types = None
 
 # --- Configuration ---
 API_KEY = os.environ.get("GOOGLE_API_KEY", "")
 BUDGET_CAP_USD = 2.00  # Conservative cap (Lyria pricing TBD, may be free)
 MODEL = "models/lyria-realtime-exp"
+MAX_SESSIONS = int(os.environ.get("LYRIA_CONCURRENCY", "3"))  # Concurrent Lyria sessions
+FAKE_SPEED = float(os.environ.get("LYRIA_FAKE_SPEED", "1.0"))  # Real-time multiple for --fake
+FAKE_LATENCY = float(os.environ.get("LYRIA_FAKE_LATENCY", "0"))  # Connect delay for --fake
+FAKE_ERROR_RATE = float(os.environ.get("LYRIA_FAKE_ERROR_RATE", "0"))  # Dropped --fake sessions
+PROGRESS_STEP = 25  # Percent between per-track progress lines
+PROVIDER = "music"  # Cost ledger provider name
 
 # Audio config
 SAMPLE_RATE = 48000
 CHANNELS = 2  # Stereo
 SAMPLE_WIDTH = 2  # 16-bit
+FRAME_BYTES = CHANNELS * SAMPLE_WIDTH
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 AUDIO_DIR = PROJECT_ROOT / "assets" / "audio"
-COST_LOG = PROJECT_ROOT / "tools" / "music_generation_costs.json"
-
-# --- Track Definitions ---
-# Each track: prompt, BPM, duration in seconds, output subpath
-TRACKS = {
-    "music/main_theme": {
-        "prompt": "upbeat chiptune 8-bit retro video game music, catchy melody, energetic but not frantic, positive vibes, lo-fi electronic, synthesizer lead, steady beat",
-        "bpm": 120,
-        "duration": 60,  # 1 minute loop
-        "temperature": 1.0,
-    },
-    "music/casino_theme": {
-        "prompt": "jazzy chiptune casino music, exciting slot machine vibes, playful saxophone-like synth, upbeat swing rhythm, 8-bit retro style, suspenseful but fun",
-        "bpm": 130,
-        "duration": 60,
-        "temperature": 1.0,
-    },
-    "sfx/win_jingle": {
-        "prompt": "short triumphant victory fanfare, chiptune celebration jingle, bright and exciting, level up achievement sound, 8-bit retro game",
-        "bpm": 140,
-        "duration": 8,  # Short jingle
-        "temperature": 0.8,
-    },
-    "sfx/collect_cd": {
-        "prompt": "short satisfying pickup coin collect sound, bright ping chime, single note reward sound, 8-bit retro game sound effect",
-        "bpm": 120,
-        "duration": 3,
-        "temperature": 0.5,
-    },
-    "sfx/spin_wheel": {
-        "prompt": "spinning wheel clicking ratchet sound building suspense, carnival wheel of fortune, ticking getting slower, 8-bit retro",
-        "bpm": 160,
-        "duration": 6,
-        "temperature": 0.8,
-    },
-    "sfx/gacha_reveal": {
-        "prompt": "dramatic reveal unveiling sound, building anticipation then bright sparkle reveal, treasure chest opening, magical shimmer, 8-bit retro",
-        "bpm": 100,
-        "duration": 5,
-        "temperature": 0.8,
-    },
-}
-
-
-def load_cost_log() -> dict:
-    if COST_LOG.exists():
-        with open(COST_LOG) as f:
-            return json.load(f)
-    return {"total_spent": 0.0, "tracks_generated": 0, "log": []}
-
-
-def save_cost_log(data: dict) -> None:
-    with open(COST_LOG, "w") as f:
-        json.dump(data, f, indent=2)
+PARTIAL_DIR = CACHE_DIR / "partial"  # In-progress captures, named by request key
+SYNC_INTERVAL = 2.0  # Seconds between header patches + fsync while streaming
+
+
+def request_params(config: dict) -> dict:
+    """Parameters that determine the generated audio, used as the cache key."""
+    if "synth" in config:
+        return {
+            "model": chiptune_synth.ENGINE,
+            "recipe": config["synth"],
+            "duration": config["duration"],
+        }
+    return {
+        "model": MODEL,
+        "prompt": config["prompt"],
+        "bpm": config["bpm"],
+        "temperature": config.get("temperature", 1.0),
+        "duration": config["duration"],
+    }
 
 
 def save_wav(audio_data: bytes, output_path: Path) -> None:
@@ -105,124 +99,283 @@ def save_wav(audio_data: bytes, output_path: Path) -> None:
           f"{len(audio_data) / (SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH):.1f}s)")
 
 
-async def generate_track(track_name: str, config: dict) -> bytes | None:
-    """Generate a single music track using Lyria RealTime."""
+class WavStreamWriter:
+    """Append PCM to a WAV file as it arrives, keeping the file playable.
+
+    The RIFF and data sizes in the header are patched every SYNC_INTERVAL
+    seconds (and on close), so after a crash the file on disk is a valid,
+    shorter WAV. With ``resume=True`` an existing file is reopened and
+    appended to, dropping any trailing partial frame.
+    """
+
+    HEADER_BYTES = 44
+
+    def __init__(self, path: Path, resume: bool = True):
+        self.path = path
+        self.data_bytes = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self._resumable():
+            self._file = open(path, "r+b")
+            size = path.stat().st_size - self.HEADER_BYTES
+            self.data_bytes = size - size % FRAME_BYTES
+            self._file.truncate(self.HEADER_BYTES + self.data_bytes)
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self._file = open(path, "wb")
+            self._file.write(self._header())
+        self._last_sync = time.monotonic()
+
+    def _resumable(self) -> bool:
+        if not self.path.exists() or self.path.stat().st_size < self.HEADER_BYTES:
+            return False
+        with open(self.path, "rb") as f:
+            header = f.read(self.HEADER_BYTES)
+        expected = self._header()
+        return header[:4] == expected[:4] and header[8:40] == expected[8:40]
+
+    def _header(self) -> bytes:
+        return (b"RIFF" + struct.pack("<I", 36 + self.data_bytes) + b"WAVE"
+                + b"fmt " + struct.pack("<IHHIIHH", 16, 1, CHANNELS, SAMPLE_RATE,
+                                        SAMPLE_RATE * FRAME_BYTES, FRAME_BYTES, SAMPLE_WIDTH * 8)
+                + b"data" + struct.pack("<I", self.data_bytes))
+
+    def write(self, chunk: bytes | memoryview) -> None:
+        self._file.write(chunk)
+        self.data_bytes += len(chunk)
+        if time.monotonic() - self._last_sync >= SYNC_INTERVAL:
+            self.sync()
+
+    def sync(self) -> None:
+        """Patch the header sizes to cover everything written so far and fsync."""
+        self._file.seek(4)
+        self._file.write(struct.pack("<I", 36 + self.data_bytes))
+        self._file.seek(40)
+        self._file.write(struct.pack("<I", self.data_bytes))
+        self._file.seek(0, os.SEEK_END)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def finalize(self, dest: Path) -> None:
+        """Close the file and atomically move it into place at ``dest``."""
+        self.close()
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self.path, dest)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def make_client(fake: bool = False):
+    """Return a Lyria client and the types module to build requests with."""
+    if fake:
+        from fake_providers import LYRIA_TYPES, FakeLyriaClient
+        client = FakeLyriaClient(speed=FAKE_SPEED, sample_rate=SAMPLE_RATE, channels=CHANNELS,
+                                 latency=FAKE_LATENCY, error_rate=FAKE_ERROR_RATE)
+        return client, LYRIA_TYPES
+    if genai is None:
+        raise RuntimeError("Install google-genai package: pip3 install google-genai")
     client = genai.Client(
         api_key=API_KEY,
         http_options={"api_version": "v1alpha"},
     )
+    return client, types
 
-    duration = config["duration"]
-    target_bytes = SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH * duration
-    audio_buffer = bytearray()
-
-    print(f"  Connecting to Lyria RealTime...")
-
-    try:
-        async with client.aio.live.music.connect(model=MODEL) as session:
-            # Set the musical prompt
-            await session.set_weighted_prompts(
-                prompts=[types.WeightedPrompt(text=config["prompt"], weight=1.0)]
-            )
-
-            # Set generation config
-            await session.set_music_generation_config(
-                config=types.LiveMusicGenerationConfig(
-                    bpm=config["bpm"],
-                    temperature=config.get("temperature", 1.0),
-                )
-            )
 
-            # Start generation
-            await session.play()
-            print(f"  Generating {duration}s of audio...")
+def log(track_name: str, message: str) -> None:
+    """Print one progress line tagged with its track, safe to interleave."""
+    print(f"  [{track_name}] {message}", flush=True)
 
-            # Collect audio chunks until we have enough
-            async for message in session.receive():
-                if hasattr(message, "server_content") and message.server_content:
-                    if message.server_content.audio_chunks:
-                        chunk = message.server_content.audio_chunks[0].data
-                        audio_buffer.extend(chunk)
 
-                        # Progress indicator
-                        progress = min(len(audio_buffer) / target_bytes * 100, 100)
-                        sys.stdout.write(f"\r  Progress: {progress:.0f}% ({len(audio_buffer)}/{target_bytes} bytes)")
-                        sys.stdout.flush()
+async def generate_track(track_name: str, config: dict, output_path: Path,
+                         partial_path: Path, client, api_types, resume: bool = True) -> bool:
+    """Generate a single music track using Lyria RealTime, streaming it to disk.
 
-                        if len(audio_buffer) >= target_bytes:
-                            break
-
-            print()  # Newline after progress
-
-            # Trim to exact duration
-            return bytes(audio_buffer[:target_bytes])
-
-    except Exception as e:
-        print(f"  ERROR: {e}")
-        return None
-
-
-async def main():
-    if not API_KEY:
-        print("ERROR: Set GOOGLE_API_KEY environment variable")
-        sys.exit(1)
-
-    cost_log = load_cost_log()
-    total_tracks = len(TRACKS)
-    generated = 0
-    skipped = 0
-    errors = 0
-
-    print(f"=== Lyria RealTime Music Generator ===")
-    print(f"Budget cap: ${BUDGET_CAP_USD:.2f}")
-    print(f"Spent so far: ${cost_log['total_spent']:.2f}")
-    print(f"Tracks to generate: {total_tracks}")
-    print(f"Note: Lyria RealTime is experimental — pricing may be free")
-    print()
-
-    for i, (track_path, track_config) in enumerate(TRACKS.items(), 1):
+    Audio goes to ``partial_path`` and is moved to ``output_path`` once the
+    full duration has been captured. On failure the partial file is kept.
+    """
+    duration = config["duration"]
+    target_bytes = SAMPLE_RATE * FRAME_BYTES * duration
+
+    with WavStreamWriter(partial_path, resume=resume) as writer:
+        if writer.data_bytes >= target_bytes:
+            writer.finalize(output_path)
+            return True
+        if writer.data_bytes:
+            log(track_name, f"Resuming partial capture at {writer.data_bytes / (SAMPLE_RATE * FRAME_BYTES):.1f}s")
+
+        try:
+            await _stream_session(client, api_types, track_name, config, writer, target_bytes)
+        except Exception as e:
+            writer.close()
+            log(track_name, f"ERROR: {e}")
+            log(track_name, f"Kept partial capture ({writer.data_bytes / (SAMPLE_RATE * FRAME_BYTES):.1f}s "
+                            f"of {duration}s): {partial_path}")
+            return False
+
+        if writer.data_bytes < target_bytes:
+            log(track_name, f"ERROR: session ended early, kept partial capture: {partial_path}")
+            return False
+        writer.finalize(output_path)
+
+    log(track_name, f"Saved: {output_path} ({target_bytes} bytes, {duration:.1f}s)")
+    return True
+
+
+async def _stream_session(client, api_types, track_name: str, config: dict,
+                          writer: WavStreamWriter, target_bytes: int) -> None:
+    """Play one Lyria session, writing chunks until ``target_bytes`` are on disk."""
+    log(track_name, "Connecting to Lyria RealTime...")
+    connect = telemetry.now_us()
+    async with client.aio.live.music.connect(model=MODEL) as session:
+        # Set the musical prompt
+        await session.set_weighted_prompts(
+            prompts=[api_types.WeightedPrompt(text=config["prompt"], weight=1.0)]
+        )
+
+        # Set generation config
+        await session.set_music_generation_config(
+            config=api_types.LiveMusicGenerationConfig(
+                bpm=config["bpm"],
+                temperature=config.get("temperature", 1.0),
+            )
+        )
+
+        # Start generation
+        await session.play()
+        telemetry.complete("connect", connect, "lyria")
+        log(track_name, f"Generating {config['duration']}s of audio...")
+        reported = writer.data_bytes * 100 // target_bytes // PROGRESS_STEP * PROGRESS_STEP
+        started, start_bytes = time.monotonic(), writer.data_bytes
+        stream = telemetry.now_us()
+        stats = {"chunks": 0, "ttfc_s": None}
+
+        # Write audio chunks until we have enough, trimming the last one
+        async for message in session.receive():
+            if hasattr(message, "server_content") and message.server_content:
+                if message.server_content.audio_chunks:
+                    chunk = memoryview(message.server_content.audio_chunks[0].data)
+                    writer.write(chunk[:target_bytes - writer.data_bytes])
+                    if stats["ttfc_s"] is None:
+                        stats["ttfc_s"] = round(time.monotonic() - started, 4)
+                        telemetry.mark("first chunk", "lyria", ttfc_s=stats["ttfc_s"])
+                    stats["chunks"] += 1
+
+                    # One progress line per PROGRESS_STEP, tagged with the track
+                    progress = writer.data_bytes * 100 // target_bytes
+                    if progress >= reported + PROGRESS_STEP:
+                        reported = progress // PROGRESS_STEP * PROGRESS_STEP
+                        log(track_name, f"Progress: {reported}% ({writer.data_bytes}/{target_bytes} bytes)")
+                        telemetry.counter("capture speed", "lyria",
+                                          **{track_name: round(_realtime_factor(writer, start_bytes, started), 2)})
+
+                    if writer.data_bytes >= target_bytes:
+                        break
+
+        # Audio seconds captured per wall-clock second (1.0 = real time)
+        audio_s = (writer.data_bytes - start_bytes) / (SAMPLE_RATE * FRAME_BYTES)
+        telemetry.complete("stream", stream, "lyria", audio_s=round(audio_s, 2),
+                           wall_s=round(time.monotonic() - started, 3),
+                           realtime_factor=round(_realtime_factor(writer, start_bytes, started), 2), **stats)
+
+
+def _realtime_factor(writer: WavStreamWriter, start_bytes: int, started: float) -> float:
+    elapsed = time.monotonic() - started
+    audio_s = (writer.data_bytes - start_bytes) / (SAMPLE_RATE * FRAME_BYTES)
+    return audio_s / elapsed if elapsed > 0 else 0.0
+
+
+def synthesize(track_path: str, track_config: dict, key: str, cache, ledger: CostLedger) -> None:
+    """Render a track's chiptune recipe locally; no session, no network."""
+    output_path = AUDIO_DIR / f"{track_path}.wav"
+    with telemetry.span("render", "synth", duration=track_config["duration"]):
+        signal = chiptune_synth.render(track_config["synth"], track_config["duration"], SAMPLE_RATE)
+    with telemetry.span("write", "synth"):
+        save_wav(chiptune_synth.to_pcm16(signal, CHANNELS), output_path)
+    cache.put_file(key, output_path, request_params(track_config))
+    cache.record_output(track_path, key)
+    ledger.record(PROVIDER, track_path, 0.0, model=chiptune_synth.ENGINE,
+                  duration=track_config["duration"])
+
+
+class MusicGenerator:
+    """Runs Lyria sessions on a background event loop for threaded callers.
+
+    One client is shared by every session and at most ``sessions`` render
+    at once. ``generate()`` blocks the calling thread until its track is
+    saved, so graph workers can treat a track like any other job.
+    """
+
+    def __init__(self, cache, ledger: CostLedger, fake: bool = False, resume: bool = True,
+                 sessions: int = MAX_SESSIONS):
+        if not API_KEY and not fake:
+            raise RuntimeError("Set GOOGLE_API_KEY environment variable")
+        self.cache = cache
+        self.ledger = ledger
+        self.resume = resume
+        self.client, self.api_types = make_client(fake)
+        self._sessions = asyncio.Semaphore(max(1, sessions))
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def generate(self, track_path: str, track_config: dict, key: str) -> bool:
+        return asyncio.run_coroutine_threadsafe(
+            self._render(track_path, track_config, key), self._loop).result()
+
+    async def _render(self, track_path: str, track_config: dict, key: str) -> bool:
         output_path = AUDIO_DIR / f"{track_path}.wav"
-
-        # Skip if already generated
-        if output_path.exists():
-            print(f"[{i}/{total_tracks}] SKIP (exists): {track_path}")
-            skipped += 1
-            continue
-
-        print(f"[{i}/{total_tracks}] Generating: {track_path}")
-        print(f"  Prompt: {track_config['prompt'][:80]}...")
-        print(f"  BPM: {track_config['bpm']}, Duration: {track_config['duration']}s")
-
-        audio_data = await generate_track(track_path, track_config)
-
-        if audio_data:
-            save_wav(audio_data, output_path)
-            generated += 1
-
-            # Track cost (estimate until pricing is published)
-            estimated_cost = 0.0  # Free for experimental
-            cost_log["total_spent"] += estimated_cost
-            cost_log["tracks_generated"] += 1
-            cost_log["log"].append({
-                "track": track_path,
-                "duration": track_config["duration"],
-                "cost": estimated_cost,
-                "timestamp": datetime.now().isoformat(),
-            })
-            save_cost_log(cost_log)
-        else:
-            errors += 1
-
-        # Small delay between tracks
-        await asyncio.sleep(2)
-
-    print()
-    print(f"=== Generation Complete ===")
-    print(f"Generated: {generated} tracks")
-    print(f"Skipped: {skipped}")
-    print(f"Errors: {errors}")
-    print(f"Total spent: ${cost_log['total_spent']:.2f} / ${BUDGET_CAP_USD:.2f}")
+        telemetry.set_lane(track_path)  # This task runs on the loop thread, not the caller's
+        waiting = telemetry.now_us()
+        async with self._sessions:
+            telemetry.complete("await session slot", waiting, "lyria")
+            print(f"  Generating: {track_path} "
+                  f"(BPM {track_config['bpm']}, {track_config['duration']}s)")
+            partial_path = PARTIAL_DIR / f"{key}.wav"
+            ok = await generate_track(track_path, track_config, output_path, partial_path,
+                                      self.client, self.api_types, resume=self.resume)
+        if not ok:
+            return False
+        self.cache.put_file(key, output_path, request_params(track_config))
+        self.cache.record_output(track_path, key)
+
+        # Track cost (estimate until pricing is published)
+        estimated_cost = 0.0  # Free for experimental
+        self.ledger.record(PROVIDER, track_path, estimated_cost, model=MODEL,
+                           duration=track_config["duration"])
+        return True
+
+    def close(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate music and SFX tracks with Lyria RealTime.")
+    parser.add_argument("--no-resume", action="store_true", help="Discard partial captures from interrupted runs")
+    parser.add_argument("--jobs", type=int, default=MAX_SESSIONS, help="Concurrent Lyria sessions")
+    parser.add_argument("--fake", action="store_true", default=os.environ.get("LYRIA_FAKE") == "1",
+                        help="Use the local Lyria stand-in (also LYRIA_FAKE=1)")
+    args = parser.parse_args()
+
+    from assetgen import main as assetgen_main
+    argv = ["--stage", "generate", f"--music-sessions={args.jobs}",
+            *[f"--only={track}" for track in TRACKS]]
+    if args.fake:
+        argv.append("--fake-music")
+    if args.no_resume:
+        argv.append("--no-resume")
+    assetgen_main(argv)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for paid generation results.
+Blobs are stored under the SHA-256 of the request that produced them
+(model, prompt, size, quality, bpm, temperature, ...), so an asset whose
+request was already paid for is restored from disk instead of regenerated,
+and an output whose recorded request no longer matches its definition is
+detected as stale.
+
+Usage:
+    python3 tools/generation_cache.py stats
+    python3 tools/generation_cache.py evict --max-mb 256
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# --- Configuration ---
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_DIR = PROJECT_ROOT / "tools" / ".generation_cache"
+MAX_CACHE_BYTES = int(float(os.environ.get("GEN_CACHE_MAX_MB", "1024")) * 1024 * 1024)
+INDEX_VERSION = 1
+
+
+def request_key(**params) -> str:
+    """Hash the parameters of a generation request into a cache key."""
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write bytes to ``path`` via a temp file + rename so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def atomic_copy(src: Path, dest: Path) -> None:
+    """Copy ``src`` to ``dest`` via a temp file + rename, streaming rather than buffering."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class GenerationCache:
+    """Blob store plus an index of which request produced each asset output.
+
+    ``index.json`` holds two maps: ``blobs`` (key -> blob metadata) and
+    ``outputs`` (asset path -> key of the request that wrote it). All
+    methods are thread-safe so generator workers can share one instance.
+    Changes stay in memory until ``flush()``, so a run writes the index once
+    per batch instead of once per stored asset.
+    """
+
+    def __init__(self, root: Path = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.index_path = self.root / "index.json"
+        self._lock = threading.RLock()
+        self._index = self._load_index()
+        self._dirty = False
+
+    def _load_index(self) -> dict:
+        if self.index_path.exists():
+            with open(self.index_path) as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION:
+                return index
+        return {"version": INDEX_VERSION, "blobs": {}, "outputs": {}}
+
+    def save(self) -> None:
+        """Persist the index atomically."""
+        with self._lock:
+            atomic_write(self.index_path, json.dumps(self._index, indent=2).encode())
+            self._dirty = False
+
+    def flush(self) -> None:
+        """Persist the index if anything changed since the last save."""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def _blob_path(self, key: str, suffix: str) -> Path:
+        return self.root / "blobs" / key[:2] / f"{key}{suffix}"
+
+    # --- Blob access ---
+
+    def get(self, key: str) -> Path | None:
+        """Return the blob path for ``key`` if cached, refreshing its LRU timestamp."""
+        with self._lock:
+            entry = self._index["blobs"].get(key)
+            if not entry:
+                return None
+            path = self.root / entry["file"]
+            self._dirty = True  # Either the entry goes or its LRU time moves
+            if not path.exists():
+                del self._index["blobs"][key]
+                return None
+            entry["last_used"] = time.time()
+            return path
+
+    def put(self, key: str, data: bytes, params: dict | None = None, suffix: str = ".png") -> Path:
+        """Store a generation result under ``key``."""
+        path = self._blob_path(key, suffix)
+        atomic_write(path, data)
+        self._add_blob(key, path, params)
+        return path
+
+    def put_file(self, key: str, source: Path, params: dict | None = None) -> Path:
+        """Store an existing file under ``key`` without reading it into memory."""
+        path = self._blob_path(key, source.suffix)
+        atomic_copy(source, path)
+        self._add_blob(key, path, params)
+        return path
+
+    def _add_blob(self, key: str, path: Path, params: dict | None) -> None:
+        now = time.time()
+        with self._lock:
+            self._index["blobs"][key] = {
+                "file": str(path.relative_to(self.root)),
+                "bytes": path.stat().st_size,
+                "created": now,
+                "last_used": now,
+                "params": params or {},
+            }
+            self._dirty = True
+
+    def restore(self, key: str, dest: Path) -> bool:
+        """Copy the cached blob for ``key`` to ``dest``. Returns False on a miss."""
+        blob = self.get(key)
+        if blob is None:
+            return False
+        atomic_copy(blob, dest)
+        return True
+
+    # --- Output tracking ---
+
+    def record_output(self, asset: str, key: str) -> None:
+        """Remember that ``asset`` on disk was produced by request ``key``."""
+        with self._lock:
+            self._index["outputs"][asset] = key
+            self._dirty = True
+
+    def output_key(self, asset: str) -> str | None:
+        with self._lock:
+            return self._index["outputs"].get(asset)
+
+    def status(self, asset: str, key: str, output_path: Path) -> str:
+        """Classify an output as ``fresh``, ``stale``, ``untracked`` or ``missing``.
+
+        ``untracked`` means the file exists but predates the cache, so there
+        is no recorded request to compare against.
+        """
+        if not output_path.exists():
+            return "missing"
+        recorded = self.output_key(asset)
+        if recorded is None:
+            return "untracked"
+        return "fresh" if recorded == key else "stale"
+
+    def adopt(self, asset: str, key: str, output_path: Path, params: dict | None = None) -> None:
+        """Take ownership of an untracked output generated before the cache existed."""
+        self.put_file(key, output_path, params)
+        self.record_output(asset, key)
+
+    # --- Maintenance ---
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(entry["bytes"] for entry in self._index["blobs"].values())
+
+    def evict(self, max_bytes: int | None = None) -> list[str]:
+        """Delete least-recently-used blobs until the store fits in ``max_bytes``, then flush.
+
+        Blobs no longer referenced by any output go first; blobs backing a
+        current output are only evicted if that is still not enough.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        removed = []
+        with self._lock:
+            total = self.total_bytes()
+            if total <= limit:
+                self.flush()
+                return removed
+            live = set(self._index["outputs"].values())
+            order = sorted(
+                self._index["blobs"].items(),
+                key=lambda item: (item[0] in live, item[1]["last_used"]),
+            )
+            for key, entry in order:
+                if total <= limit:
+                    break
+                (self.root / entry["file"]).unlink(missing_ok=True)
+                del self._index["blobs"][key]
+                total -= entry["bytes"]
+                removed.append(key)
+                self._dirty = True
+            self.flush()
+        return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or trim the generation cache.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Show cache size and entry counts")
+    evict = sub.add_parser("evict", help="Evict least-recently-used blobs")
+    evict.add_argument("--max-mb", type=float, default=MAX_CACHE_BYTES / (1024 * 1024))
+    args = parser.parse_args()
+
+    cache = GenerationCache()
+    if args.command == "stats":
+        blobs = cache._index["blobs"]
+        print(f"Cache: {cache.root}")
+        print(f"Blobs: {len(blobs)} ({cache.total_bytes() / (1024 * 1024):.1f} MB)")
+        print(f"Tracked outputs: {len(cache._index['outputs'])}")
+    elif args.command == "evict":
+        removed = cache.evict(int(args.max_mb * 1024 * 1024))
+        print(f"Evicted {len(removed)} blobs, {cache.total_bytes() / (1024 * 1024):.1f} MB left")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Automatic quality scores for generated images.
+Rates a raw DALL-E image on the problems that otherwise only get caught
+by eye, each as a score in [0, 1] computed with NumPy on a strided view:
+
+    background  share of the border in one flat colour (busy scenes and
+                fake transparency checkerboards score low)
+    centring    how close the subject's bounding box sits to the middle
+    fill        whether the subject is neither a speck nor cropped off
+    palette     how few distinct colours the subject uses
+    hue         share of the subject in the colours the prompt names
+                (left out when the prompt names none)
+
+The total is a weighted mean. assetgen.py --candidates N requests N
+variants of each standalone image (sprite-sheet members are single-shot)
+concurrently, promotes the best-scoring one and keeps the rest in the
+generation cache, where this script can list them and promote a
+different one by hand.
+
+Usage:
+    python3 tools/image_scoring.py score assets/sprites/cds/cd_demo.png --asset sprites/cds/cd_demo
+    python3 tools/image_scoring.py candidates sprites/casino/prize_gem
+    python3 tools/image_scoring.py candidates sprites/casino/prize_gem --promote 3
+"""
+
+import argparse
+import re
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from asset_manifest import IMAGES
+from generate_images import ASSETS_DIR, request_params
+from generation_cache import GenerationCache, atomic_copy, request_key
+from process_sprites import KEY_TOLERANCE, SUBJECT_THRESHOLD, background_distance, border_palette
+from sprite_sheets import sheet_of, subject
+from tier_variants import rgb_to_hsv
+
+# --- Configuration ---
+SCORE_SIZE = 256  # Metrics run on a strided view about this large
+WEIGHTS = {"background": 0.25, "centring": 0.2, "fill": 0.2, "palette": 0.15, "hue": 0.2}
+FILL_RANGE = (0.45, 0.9)  # Subject bounding box side as a share of the image side that scores 1
+PALETTE_RANGE = (24, 96)  # Distinct subject colours (5 bits per channel) scoring 1 down to 0
+PALETTE_MIN_SHARE = 0.002  # A colour bucket needs this share of the subject to count
+HUE_TOLERANCE = 30.0  # Degrees either side of a named colour
+HUE_TARGET_SHARE = 0.4  # Share of the subject in named colours that scores 1
+COLOUR_HUES = {
+    "red": 0, "brown": 25, "orange": 30, "gold": 45, "golden": 45, "yellow": 55, "green": 120,
+    "teal": 170, "cyan": 185, "blue": 220, "violet": 270, "purple": 280, "amethyst": 280,
+    "magenta": 300, "pink": 330,
+}
+ACHROMATIC = {"silver", "white", "gray", "grey", "platinum", "black"}
+MAX_CANDIDATES = 8  # Upper bound for assetgen.py --candidates
+
+
+def named_colours(prompt: str) -> tuple[list[float], bool]:
+    """Hues (degrees) and whether an achromatic colour is named in the prompt's subject."""
+    words = re.findall(r"[a-z]+", subject(prompt).lower())
+    return [float(COLOUR_HUES[w]) for w in words if w in COLOUR_HUES], any(w in ACHROMATIC for w in words)
+
+
+def ramp(value: float, good: float, bad: float) -> float:
+    """1 at ``good``, falling linearly to 0 at ``bad`` (either direction)."""
+    return float(np.clip((bad - value) / (bad - good), 0.0, 1.0))
+
+
+def score_pixels(pixels: np.ndarray, prompt: str) -> dict[str, float]:
+    stride = max(1, min(pixels.shape[:2]) // SCORE_SIZE)
+    small = pixels[::stride, ::stride, :3]
+    h, w = small.shape[:2]
+    palette = border_palette(small)
+    ring = np.concatenate([small[0], small[-1], small[:, 0], small[:, -1]])
+    scores = {"background": float((background_distance(ring, palette[:1]) <= KEY_TOLERANCE).mean())}
+
+    mask = background_distance(small, palette) > SUBJECT_THRESHOLD
+    rows, cols = np.flatnonzero(mask.any(axis=1)), np.flatnonzero(mask.any(axis=0))
+    if rows.size == 0:
+        return {**scores, "centring": 0.0, "fill": 0.0, "palette": 0.0, "total": 0.0}
+    offset = max(abs((rows[0] + rows[-1] + 1) / 2 - h / 2) / h, abs((cols[0] + cols[-1] + 1) / 2 - w / 2) / w)
+    scores["centring"] = ramp(offset, 0.0, 0.25)
+    side = max((rows[-1] - rows[0] + 1) / h, (cols[-1] - cols[0] + 1) / w)
+    scores["fill"] = ramp(side, FILL_RANGE[0], 0.0) if side < FILL_RANGE[0] else ramp(side, FILL_RANGE[1], 1.0)
+
+    colours = small[mask]
+    codes = (colours[:, 0].astype(np.int32) >> 3 << 10) | (colours[:, 1] >> 3 << 5) | (colours[:, 2] >> 3)
+    counts = np.bincount(codes, minlength=1 << 15)
+    scores["palette"] = ramp(int((counts >= PALETTE_MIN_SHARE * len(colours)).sum()), *PALETTE_RANGE)
+
+    hues, achromatic = named_colours(prompt)
+    if hues or achromatic:
+        hsv = rgb_to_hsv(colours.astype(np.float32) / 255.0)
+        lit = hsv[:, 2] > 0.2
+        match = np.zeros(len(colours), bool)
+        if hues:
+            gap = np.abs((hsv[:, :1] * 360.0 - np.array(hues) + 180.0) % 360.0 - 180.0).min(axis=1)
+            match |= lit & (hsv[:, 1] > 0.25) & (gap <= HUE_TOLERANCE)
+        if achromatic:
+            match |= lit & (hsv[:, 1] < 0.2)
+        scores["hue"] = min(1.0, float(match.mean()) / HUE_TARGET_SHARE)
+
+    weight = sum(WEIGHTS[name] for name in scores)
+    scores["total"] = sum(WEIGHTS[name] * value for name, value in scores.items()) / weight
+    return scores
+
+
+def score(path: Path, prompt: str) -> dict[str, float]:
+    with Image.open(path) as image:
+        return score_pixels(np.asarray(image.convert("RGB")), prompt)
+
+
+def describe(scores: dict[str, float]) -> str:
+    parts = [f"{name} {scores[name]:.2f}" for name in WEIGHTS if name in scores]
+    return f"{scores['total']:.2f} ({', '.join(parts)})"
+
+
+def candidate_key(params: dict, index: int) -> str:
+    return request_key(**params, candidate=index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score generated images and manage best-of-N candidates.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rate = sub.add_parser("score", help="Score image files")
+    rate.add_argument("files", nargs="+", type=Path)
+    rate.add_argument("--asset", choices=IMAGES, help="Take the prompt from this manifest entry")
+    rate.add_argument("--prompt", default="", help="Prompt to check colours against")
+    picks = sub.add_parser("candidates", help="List an asset's cached candidates, or promote one")
+    picks.add_argument("asset", choices=IMAGES)
+    picks.add_argument("--promote", type=int, metavar="N", help="Copy candidate N into assets/")
+    args = parser.parse_args()
+
+    if args.command == "score":
+        prompt = IMAGES[args.asset]["prompt"] if args.asset else args.prompt
+        for path in args.files:
+            print(f"  {path}: {describe(score(path, prompt))}")
+        return
+
+    if sheet_of(args.asset):
+        raise SystemExit(f"{args.asset} is cut from {sheet_of(args.asset)}; only standalone images have candidates")
+    cache = GenerationCache()
+    params = request_params(IMAGES[args.asset])
+    found = {index + 1: blob for index in range(MAX_CANDIDATES)
+             if (blob := cache.get(candidate_key(params, index))) is not None}
+    if not found:
+        raise SystemExit(f"No cached candidates for {args.asset}: run assetgen.py --candidates N")
+    if args.promote is not None:
+        if args.promote not in found:
+            raise SystemExit(f"No candidate {args.promote}; cached: {', '.join(map(str, found))}")
+        output_path = ASSETS_DIR / f"{args.asset}.png"
+        atomic_copy(found[args.promote], output_path)
+        cache.put_file(request_key(**params), output_path, {**params, "candidate": args.promote - 1})
+        cache.record_output(args.asset, request_key(**params))
+        cache.flush()
+        print(f"Promoted candidate {args.promote} to {output_path} (run assetgen.py to process it)")
+        return
+    for number, blob in found.items():
+        print(f"  {number}: {describe(score(blob, params['prompt']))}  {blob}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Per-platform texture sets for Music Label Tycoon.
+The game references one res:// path per texture, but the right pixels for
+that path depend on where the build runs. Each platform in PLATFORMS gets
+its own set of every manifest image, built from the best source on disk
+(art_raw/ when present, otherwise the file in assets/):
+
+    sprites      exact target size, palette-quantized like process_sprites.py
+                 (the same for every platform, so each is processed once)
+    variants     re-rendered by tier_variants.py from the set's own base sprite
+    backgrounds  scaled to the viewport width times the platform's density,
+                 never up; web quantizes them to 256 colours for download size
+
+Sets live in art_raw/platforms/<platform>/ (gdignored, so Godot never
+imports them twice) and rebuild only the entries whose source or settings
+changed. --apply copies one set over assets/ right before the Godot import,
+first stashing any larger original into art_raw/ so the other platforms
+can still be built from it. --write-preset writes the asset index's
+include/exclude filters into each platform's export preset, so only
+referenced files are packed. CI leaves it off for web: boot_pack_analyzer.py
+writes the Web preset's filters, split into a boot pack and secondary packs.
+
+Usage:
+    python3 tools/platform_variants.py                     # build every set, report sizes
+    python3 tools/platform_variants.py --platform android
+    python3 tools/platform_variants.py --platform web --apply           # CI, before import
+    python3 tools/platform_variants.py --platform android --write-preset
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+import asset_index
+import tier_variants
+from asset_manifest import IMAGES
+from generation_cache import atomic_copy
+from process_sprites import ASSETS_DIR, DEFAULT_COLORS, PROJECT_ROOT, RAW_DIR, process_sprite, save_png, target_size
+
+# --- Configuration ---
+OUTPUT_DIR = RAW_DIR / "platforms"
+PROJECT_FILE = PROJECT_ROOT / "project.godot"
+VERSION = 1  # Part of every stamp; bump when rendering changes
+PLATFORMS = {
+    # background_density: background width as a multiple of the viewport width
+    # background_colors: palette size for backgrounds (None keeps full colour)
+    "web": {"preset": "Web", "background_density": 1.0, "background_colors": 256},
+    "android": {"preset": "Android", "background_density": 2.0, "background_colors": None},
+}
+
+
+def viewport_width() -> int:
+    match = re.search(r"(?m)^window/size/viewport_width=(\d+)$", PROJECT_FILE.read_text())
+    return int(match.group(1))
+
+
+def set_dir(platform: str) -> Path:
+    return OUTPUT_DIR / platform
+
+
+def source_path(asset: str) -> Path | None:
+    for root in (RAW_DIR, ASSETS_DIR):
+        path = root / f"{asset}.png"
+        if path.exists():
+            return path
+    return None
+
+
+def settings(config: dict, platform: str, width: int) -> tuple:
+    """How one non-variant image is rendered for ``platform``; equal settings give equal files."""
+    size = target_size(config["prompt"])
+    if size is not None:
+        return ("sprite", *size, DEFAULT_COLORS)
+    options = PLATFORMS[platform]
+    return ("background", round(width * options["background_density"]), options["background_colors"])
+
+
+def render(source: Path, setting: tuple) -> Image.Image:
+    kind, *params = setting
+    if kind == "sprite":
+        width, height, colors = params
+        with Image.open(source) as image:
+            if image.width <= width and image.height <= height:
+                return image.copy()  # Already processed
+        return process_sprite(source, width, height, colors)
+
+    width, colors = params
+    image = Image.open(source).convert("RGB")
+    if image.width > width:
+        image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+    if colors:
+        image = image.quantize(colors, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+    return image
+
+
+def _render_job(job: tuple) -> tuple[list[str], int]:
+    source, setting, outputs = job
+    image = render(Path(source), setting)
+    for output in outputs:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        save_png(image, Path(output))
+    return outputs, Path(outputs[0]).stat().st_size
+
+
+def load_stamps(platform: str) -> dict:
+    path = set_dir(platform) / "stamps.json"
+    if path.exists():
+        with open(path) as f:
+            return json.load(f)
+    return {}
+
+
+def save_stamps(platform: str, stamps: dict) -> None:
+    set_dir(platform).mkdir(parents=True, exist_ok=True)
+    with open(set_dir(platform) / "stamps.json", "w") as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+
+
+def _stamp(source: Path, setting: tuple) -> dict:
+    return {"source": str(source.relative_to(PROJECT_ROOT)), "source_mtime": source.stat().st_mtime,
+            "settings": list(setting), "version": VERSION}
+
+
+def _variant_stamp(config: dict, root: Path) -> dict | None:
+    digest = hashlib.sha256(json.dumps([VERSION, DEFAULT_COLORS, config], sort_keys=True).encode())
+    for asset in tier_variants.inputs(config):
+        path = root / f"{asset}.png"
+        if not path.exists():
+            return None
+        digest.update(path.read_bytes())
+    return {"variant": digest.hexdigest()}
+
+
+def build(platforms: list[str], jobs: int, force: bool = False) -> dict[str, int]:
+    """Bring every set up to date; returns how many files were written per platform."""
+    width = viewport_width()
+    stamps = {platform: load_stamps(platform) for platform in platforms}
+    written = dict.fromkeys(platforms, 0)
+
+    # Platforms sharing a setting (every sprite, so far) share one render
+    grouped: dict[tuple, list[str]] = {}
+    for asset, config in IMAGES.items():
+        source = source_path(asset)
+        if "variant_of" in config or source is None:
+            continue
+        for platform in platforms:
+            setting = settings(config, platform, width)
+            output = set_dir(platform) / f"{asset}.png"
+            stamp = _stamp(source, setting)
+            if not force and output.exists() and stamps[platform].get(asset) == stamp:
+                continue
+            stamps[platform][asset] = stamp
+            written[platform] += 1
+            grouped.setdefault((str(source), setting), []).append(str(output))
+
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as pool:
+        for outputs, nbytes in pool.map(_render_job, [(s, t, o) for (s, t), o in grouped.items()]):
+            for output in outputs:
+                print(f"  {Path(output).relative_to(OUTPUT_DIR)}: {nbytes / 1024:.1f} KB")
+
+    # Variants come from the set's own processed bases, so they run second
+    for asset, config in tier_variants.variants().items():
+        for platform in platforms:
+            root = set_dir(platform)
+            stamp = _variant_stamp(config, root)
+            output = root / f"{asset}.png"
+            if stamp is None or (not force and output.exists() and stamps[platform].get(asset) == stamp):
+                continue
+            output.parent.mkdir(parents=True, exist_ok=True)
+            save_png(tier_variants.render_variant(config, DEFAULT_COLORS, root), output)
+            stamps[platform][asset] = stamp
+            written[platform] += 1
+            print(f"  {output.relative_to(OUTPUT_DIR)}: {output.stat().st_size / 1024:.1f} KB")
+
+    for platform in platforms:
+        save_stamps(platform, stamps[platform])
+    return written
+
+
+def set_files(platform: str) -> dict[str, Path]:
+    """Asset key -> file in the platform's set."""
+    root = set_dir(platform)
+    return {asset: root / f"{asset}.png" for asset in IMAGES if (root / f"{asset}.png").exists()}
+
+
+def apply(platform: str) -> int:
+    """Copy a set over assets/, stashing larger originals into art_raw/ first. Returns files replaced."""
+    replaced = 0
+    for asset, path in set_files(platform).items():
+        output_path = ASSETS_DIR / f"{asset}.png"
+        if output_path.exists():
+            if output_path.read_bytes() == path.read_bytes():
+                continue
+            raw_path = RAW_DIR / f"{asset}.png"
+            with Image.open(output_path) as current, Image.open(path) as variant:
+                larger = current.width > variant.width or current.height > variant.height
+            if larger and not raw_path.exists():
+                atomic_copy(output_path, raw_path)
+        atomic_copy(path, output_path)
+        replaced += 1
+    return replaced
+
+
+def print_report(platforms: list[str], index: dict) -> None:
+    """Shipped bytes per platform, counting only assets the export includes."""
+    unused = set(index["unused"])
+    current = index["used_bytes"]
+    print(f"\nShipped assets today: {current / (1024 * 1024):.1f} MB")
+    for platform in platforms:
+        before = after = 0
+        for asset, path in set_files(platform).items():
+            original = ASSETS_DIR / f"{asset}.png"
+            if f"res://assets/{asset}.png" in unused or not original.exists():
+                continue
+            before += original.stat().st_size
+            after += path.stat().st_size
+        shipped = current - before + after
+        print(f"  {platform}: textures {before / (1024 * 1024):.1f} MB -> {after / (1024 * 1024):.1f} MB, "
+              f"shipped {shipped / (1024 * 1024):.1f} MB ({shipped / max(1, current):.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build per-platform texture sets and export filters.")
+    parser.add_argument("--platform", action="append", choices=PLATFORMS,
+                        help="Platform to build (repeatable; default all)")
+    parser.add_argument("--apply", action="store_true", help="Copy the built set over assets/ (one platform)")
+    parser.add_argument("--write-preset", action="store_true",
+                        help="Write export filters into each platform's preset")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    args = parser.parse_args()
+
+    platforms = args.platform or list(PLATFORMS)
+    if args.apply and len(platforms) != 1:
+        parser.error("--apply needs exactly one --platform")
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+    (RAW_DIR / ".gdignore").touch()
+
+    print(f"=== Platform Texture Sets ===")
+    written = build(platforms, args.jobs, args.force)
+    print(", ".join(f"{platform}: {count} rebuilt, {len(set_files(platform))} in set"
+                    for platform, count in written.items()))
+
+    index = asset_index.build_index()
+    print_report(platforms, index)
+    if args.apply:
+        print(f"Applied {platforms[0]}: {apply(platforms[0])} files replaced in assets/")
+    if args.write_preset:
+        include, exclude = asset_index.export_filters(index)
+        for platform in platforms:
+            preset = PLATFORMS[platform]["preset"]
+            if not asset_index.write_preset(preset, include, exclude):
+                sys.exit(f"No export preset named {preset!r} in {asset_index.PRESETS_FILE.name}")
+            print(f"Updated preset {preset!r}: {len(include)} included, {len(exclude)} excluded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Audio post-processor for Music Label Tycoon.
+Cleans up raw Lyria output written by generate_music.py:
+  - SFX: trim leading/trailing silence, downmix to mono, resample to 22.05 kHz
+  - Music: trim leading silence and find a seamless loop point by
+    autocorrelation, crossfading the loop seam
+  - Both: loudness-normalize with a peak ceiling
+
+Processed files are written as 16-bit WAV with a "smpl" loop chunk, which
+Godot's WAV importer picks up (loop mode "Detect From WAV"), and a loop
+manifest at assets/audio/audio_meta.json. With --encode ogg (needs ffmpeg on
+PATH) an Ogg Vorbis copy is written next to each WAV; AudioManager prefers
+it and applies the loop offset from the manifest.
+
+Raw originals are kept under art_raw/audio/ so tracks can be reprocessed.
+
+Usage:
+    python3 tools/process_audio.py
+    python3 tools/process_audio.py --only "music/*" --encode ogg
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# --- Configuration ---
+PROJECT_ROOT = Path(__file__).parent.parent
+AUDIO_DIR = PROJECT_ROOT / "assets" / "audio"
+RAW_ROOT = PROJECT_ROOT / "art_raw"  # Ignored by Godot via .gdignore
+RAW_DIR = RAW_ROOT / "audio"
+STAMP_FILE = RAW_DIR / "process_stamps.json"
+META_FILE = AUDIO_DIR / "audio_meta.json"
+
+SFX_SAMPLE_RATE = 22050
+SILENCE_DB = -50.0  # Windows quieter than this count as silence
+WINDOW_SECONDS = 0.01
+SFX_TAIL_SECONDS = 0.05  # Kept after the last loud window, then faded out
+TARGET_RMS_DB = {"sfx": -16.0, "music": -18.0}  # Gated RMS loudness targets
+PEAK_CEILING_DB = -1.0
+GATE_DB = -40.0  # Windows below this are ignored when measuring loudness
+
+LOOP_START_SECONDS = 0.5  # Loop region starts after the attack settles
+LOOP_MATCH_SECONDS = 0.25  # Length of audio compared at the loop seam
+LOOP_MIN_SECONDS = 8.0  # Shortest acceptable loop
+LOOP_DECIMATION = 8  # Coarse search runs on a decimated mono signal
+CROSSFADE_SECONDS = 0.02
+PROCESSOR_VERSION = 1
+
+
+def db_to_amp(db: float) -> float:
+    return 10.0 ** (db / 20.0)
+
+
+def read_wav(path: Path) -> tuple[np.ndarray, int]:
+    """Read a 16-bit PCM WAV into float32 ``(frames, channels)`` in [-1, 1]."""
+    with wave.open(str(path), "rb") as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM is supported")
+        frames = wav.readframes(wav.getnframes())
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+    audio = np.frombuffer(frames, dtype="<i2").reshape(-1, channels)
+    return audio.astype(np.float32) / 32768.0, rate
+
+
+def write_wav(path: Path, audio: np.ndarray, rate: int, loop: tuple[int, int] | None = None) -> None:
+    """Write 16-bit PCM WAV atomically, with an optional "smpl" forward loop."""
+    pcm = np.clip(np.round(audio * 32767.0), -32768, 32767).astype("<i2")
+    channels = pcm.shape[1]
+    fmt = struct.pack("<HHIIHH", 1, channels, rate, rate * channels * 2, channels * 2, 16)
+    data = pcm.tobytes()
+    chunks = b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    chunks += b"data" + struct.pack("<I", len(data)) + data + (b"\x00" if len(data) % 2 else b"")
+    if loop is not None:
+        begin, end = loop
+        smpl = struct.pack("<9I", 0, 0, 1_000_000_000 // rate, 60, 0, 0, 0, 1, 0)
+        smpl += struct.pack("<6I", 0, 0, begin, end - 1, 0, 0)  # End sample is inclusive
+        chunks += b"smpl" + struct.pack("<I", len(smpl)) + smpl
+    blob = b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE" + chunks
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def window_levels(audio: np.ndarray, rate: int) -> tuple[np.ndarray, int]:
+    """Peak level in dBFS of consecutive short windows."""
+    win = max(1, int(rate * WINDOW_SECONDS))
+    peak = np.abs(audio).max(axis=1)
+    count = len(peak) // win
+    levels = peak[:count * win].reshape(count, win).max(axis=1)
+    return 20.0 * np.log10(levels + 1e-9), win
+
+
+def trim_silence(audio: np.ndarray, rate: int, trim_end: bool) -> np.ndarray:
+    """Cut leading (and optionally trailing) silence, fading out the new tail."""
+    levels, win = window_levels(audio, rate)
+    loud = np.flatnonzero(levels > SILENCE_DB)
+    if loud.size == 0:
+        return audio
+    start = loud[0] * win
+    if not trim_end:
+        return audio[start:]
+    tail = int(rate * SFX_TAIL_SECONDS)
+    end = min(len(audio), (loud[-1] + 1) * win + tail)
+    trimmed = audio[start:end].copy()
+    fade = min(tail, len(trimmed))
+    trimmed[-fade:] *= np.linspace(1.0, 0.0, fade, dtype=np.float32)[:, None]
+    return trimmed
+
+
+def resample(audio: np.ndarray, rate: int, new_rate: int) -> np.ndarray:
+    """Band-limited resampling by truncating/zero-padding the spectrum."""
+    if rate == new_rate:
+        return audio
+    frames = int(round(len(audio) * new_rate / rate))
+    spectrum = np.fft.rfft(audio, axis=0)
+    bins = frames // 2 + 1
+    if bins <= spectrum.shape[0]:
+        spectrum = spectrum[:bins]
+    else:
+        spectrum = np.vstack([spectrum, np.zeros((bins - spectrum.shape[0], audio.shape[1]), spectrum.dtype)])
+    return (np.fft.irfft(spectrum, n=frames, axis=0) * (frames / len(audio))).astype(np.float32)
+
+
+def normalize(audio: np.ndarray, rate: int, target_db: float) -> np.ndarray:
+    """Scale to a gated RMS loudness target without exceeding the peak ceiling."""
+    win = max(1, int(rate * 0.4))  # 400 ms blocks, as in loudness metering
+    mono = audio.mean(axis=1)
+    count = len(mono) // win
+    if count == 0:
+        blocks = mono[None, :]
+    else:
+        blocks = mono[:count * win].reshape(count, win)
+    rms = np.sqrt((blocks ** 2).mean(axis=1))
+    gated = rms[20.0 * np.log10(rms + 1e-9) > GATE_DB]
+    if gated.size == 0:
+        return audio
+    loudness = 20.0 * np.log10(np.sqrt((gated ** 2).mean()))
+    gain = db_to_amp(target_db - loudness)
+    peak = np.abs(audio).max()
+    if peak * gain > db_to_amp(PEAK_CEILING_DB):
+        gain = db_to_amp(PEAK_CEILING_DB) / peak
+    return audio * gain
+
+
+def find_loop_end(audio: np.ndarray, rate: int, begin: int) -> int | None:
+    """Find where the track best matches its loop start, by cross-correlation.
+
+    A reference window right after ``begin`` is correlated (via FFT) against
+    every candidate position past LOOP_MIN_SECONDS on a decimated mono
+    signal. The best normalized match is then refined sample-accurately at
+    the full rate. Jumping from the returned end back to ``begin`` lands on
+    near-identical audio.
+    """
+    mono = audio.mean(axis=1)
+    match = int(rate * LOOP_MATCH_SECONDS)
+    earliest = begin + int(rate * LOOP_MIN_SECONDS)
+    if earliest + match >= len(mono):
+        return None
+
+    def best_offset(signal: np.ndarray, ref: np.ndarray, lo: int, hi: int) -> int:
+        region = signal[lo:hi + len(ref)]
+        n = 1 << (len(region) + len(ref) - 1).bit_length()
+        corr = np.fft.irfft(np.fft.rfft(region, n) * np.conj(np.fft.rfft(ref, n)), n)[:hi - lo + 1]
+        energy = np.convolve(region ** 2, np.ones(len(ref)), mode="valid")[:hi - lo + 1]
+        score = corr / (np.sqrt(energy * (ref ** 2).sum()) + 1e-9)
+        return lo + int(np.argmax(score))
+
+    d = LOOP_DECIMATION
+    coarse = mono[:len(mono) // d * d].reshape(-1, d).mean(axis=1)
+    ref = coarse[begin // d:(begin + match) // d]
+    hi = (len(mono) - match) // d - 1
+    lo = earliest // d
+    if hi <= lo:
+        return None
+    candidate = best_offset(coarse, ref, lo, hi) * d
+
+    lo = max(earliest, candidate - 2 * d)
+    hi = min(len(mono) - match, candidate + 2 * d)
+    return best_offset(mono, mono[begin:begin + match], lo, hi)
+
+
+def crossfade_seam(audio: np.ndarray, rate: int, begin: int, end: int) -> np.ndarray:
+    """Blend the audio leading into ``end`` with the audio leading into ``begin``."""
+    fade = min(int(rate * CROSSFADE_SECONDS), begin, end - begin)
+    if fade <= 0:
+        return audio[:end]
+    looped = audio[:end].copy()
+    ramp = np.linspace(0.0, 1.0, fade, dtype=np.float32)[:, None]
+    looped[end - fade:end] = looped[end - fade:end] * (1.0 - ramp) + audio[begin - fade:begin] * ramp
+    return looped
+
+
+def process_track(kind: str, source: Path, dest: Path) -> dict:
+    """Process one track and return its loop/format metadata."""
+    audio, rate = read_wav(source)
+    loop = None
+    if kind == "sfx":
+        audio = trim_silence(audio, rate, trim_end=True)
+        audio = audio.mean(axis=1, keepdims=True)
+        audio = resample(audio, rate, SFX_SAMPLE_RATE)
+        rate = SFX_SAMPLE_RATE
+    else:
+        audio = trim_silence(audio, rate, trim_end=False)
+        begin = int(rate * LOOP_START_SECONDS)
+        end = find_loop_end(audio, rate, begin)
+        if end is not None:
+            audio = crossfade_seam(audio, rate, begin, end)
+            loop = (begin, end)
+    audio = normalize(audio, rate, TARGET_RMS_DB[kind])
+    write_wav(dest, audio, rate, loop)
+
+    meta = {"sample_rate": rate, "channels": audio.shape[1], "frames": len(audio),
+            "duration": round(len(audio) / rate, 4)}
+    if loop is not None:
+        meta.update(loop_begin=loop[0], loop_end=loop[1], loop_offset=round(loop[0] / rate, 4))
+    return meta
+
+
+def encode_ogg(wav_path: Path, meta: dict) -> Path | None:
+    """Encode an Ogg Vorbis copy with ffmpeg. Returns None if ffmpeg is missing."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return None
+    ogg_path = wav_path.with_suffix(".ogg")
+    cmd = [ffmpeg, "-y", "-loglevel", "error", "-i", str(wav_path)]
+    if "loop_end" in meta:
+        cmd += ["-t", f"{meta['loop_end'] / meta['sample_rate']:.6f}"]  # Ogg loops the whole file
+    cmd += ["-c:a", "libvorbis", "-q:a", "4", str(ogg_path)]
+    subprocess.run(cmd, check=True)
+    return ogg_path
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def load_json(path: Path) -> dict:
+    if path.exists():
+        with open(path) as f:
+            return json.load(f)
+    return {}
+
+
+def save_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def track_state(track: str, stamps: dict, encode: str | None = None) -> str:
+    """Classify a track as ``skip`` (no source), ``fresh`` or ``dirty``."""
+    output_path = AUDIO_DIR / f"{track}.wav"
+    raw_path = RAW_DIR / f"{track}.wav"
+    stamp = stamps.get(track, {})
+    # Anything in assets/ we did not write ourselves is fresh raw output
+    if output_path.exists() and stamp.get("output_digest") != file_digest(output_path):
+        return "dirty"
+    if not raw_path.exists():
+        return "skip"
+    settings = {"version": PROCESSOR_VERSION, "encode": encode}
+    if stamp.get("raw_digest") == file_digest(raw_path) and stamp.get("settings") == settings:
+        return "fresh"
+    return "dirty"
+
+
+def process_one(track: str, stamps: dict, meta_index: dict, encode: str | None = None) -> str | None:
+    """Stash, process and record one track. Returns a summary line, or None without a source."""
+    kind = track.split("/", 1)[0]
+    output_path = AUDIO_DIR / f"{track}.wav"
+    raw_path = RAW_DIR / f"{track}.wav"
+    stamp = stamps.get(track, {})
+    if output_path.exists() and stamp.get("output_digest") != file_digest(output_path):
+        raw_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(output_path, raw_path)
+    if not raw_path.exists():
+        return None
+
+    meta = process_track(kind, raw_path, output_path)
+    line = f"  {track}: {raw_path.stat().st_size // 1024} KB -> {output_path.stat().st_size // 1024} KB"
+    if "loop_end" in meta:
+        line += f", loop {meta['loop_begin'] / meta['sample_rate']:.2f}s-{meta['loop_end'] / meta['sample_rate']:.2f}s"
+    ogg_path = encode_ogg(output_path, meta) if encode == "ogg" else None
+    if ogg_path is not None:
+        line += f", ogg {ogg_path.stat().st_size // 1024} KB"
+    else:
+        if encode == "ogg":
+            line += " (ffmpeg not found, no ogg)"
+            encode = None
+        # AudioManager prefers the .ogg, so one left from an earlier encode would shadow the new WAV
+        stale = output_path.with_suffix(".ogg")
+        if stale.exists():
+            stale.unlink()
+            line += ", removed stale ogg"
+
+    meta_index[f"res://{output_path.relative_to(PROJECT_ROOT).as_posix()}"] = meta
+    stamps[track] = {"raw_digest": file_digest(raw_path), "output_digest": file_digest(output_path),
+                     "settings": {"version": PROCESSOR_VERSION, "encode": encode}}
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trim, loop and normalize generated audio.")
+    parser.add_argument("--only", action="append", default=[], help="Glob over track keys, e.g. 'sfx/*'")
+    parser.add_argument("--encode", choices=["ogg"], help="Also write a compressed copy (needs ffmpeg)")
+    parser.add_argument("--force", action="store_true", help="Reprocess even if up to date")
+    args = parser.parse_args()
+
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+    (RAW_ROOT / ".gdignore").touch()
+    stamps = load_json(STAMP_FILE)
+    meta_index = load_json(META_FILE)
+    processed = 0
+
+    print(f"=== Audio Post-Processor ===")
+    for kind in ("sfx", "music"):
+        for output_path in sorted((AUDIO_DIR / kind).glob("*.wav")):
+            track = f"{kind}/{output_path.stem}"
+            if args.only and not any(fnmatch.fnmatch(track, pattern) for pattern in args.only):
+                continue
+            if not args.force and track_state(track, stamps, args.encode) != "dirty":
+                continue
+            line = process_one(track, stamps, meta_index, args.encode)
+            if line:
+                print(line)
+                processed += 1
+
+    save_json(STAMP_FILE, stamps)
+    save_json(META_FILE, meta_index)
+    print(f"Processed: {processed} tracks")
+
+
+if __name__ == "__main__":
+    main()
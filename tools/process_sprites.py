@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Sprite post-processor for Music Label Tycoon.
+Downscales raw 1024px DALL-E output to the sprite size named in each image
+prompt in asset_manifest.py ("32x32 sprite", "64x64 character sprite", ...) with a pixel-art-aware
+block filter, keys the generated backdrop out to transparency (DALL-E
+ignores "transparent background" and returns opaque RGB), quantizes to a
+limited palette and writes a compact indexed PNG in place of the original.
+
+Full-resolution originals are kept under art_raw/ (ignored by Godot via
+.gdignore, and by git: it is local generation state, like the cache) so
+the sprites can be reprocessed with different settings.
+
+Usage:
+    python3 tools/process_sprites.py
+    python3 tools/process_sprites.py --only "sprites/cds/*" --colors 12
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import shutil
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from asset_manifest import IMAGES as ASSETS
+
+# --- Configuration ---
+PROJECT_ROOT = Path(__file__).parent.parent
+ASSETS_DIR = PROJECT_ROOT / "assets"
+RAW_DIR = PROJECT_ROOT / "art_raw"
+STAMP_FILE = RAW_DIR / "process_stamps.json"
+
+DEFAULT_COLORS = 16  # Per-sprite palette (style guide caps the game at 32)
+SAMPLES_PER_PIXEL = 8  # Source samples per output pixel axis for the block filter
+SUBJECT_THRESHOLD = 48.0  # RGB distance from the border colour that counts as subject
+SUBJECT_MARGIN = 0.04  # Padding kept around the detected subject, as a fraction
+CROP_STRIDE = 4  # Subsampling used when locating the subject
+BORDER_BUCKET = 32  # Colour bucket width when looking for dominant border colours
+BORDER_MIN_SHARE = 0.1  # Share of the border a colour needs to count as backdrop
+BORDER_MAX_COLOURS = 4
+KEY_TOLERANCE = 40.0  # RGB distance to a backdrop colour that keys to transparent
+KEY_COVERAGE = 0.5  # Share of backdrop samples that makes an output pixel transparent
+FRINGE_FACTOR = 1.5  # Edge pixels within this multiple of the tolerance are fringe
+KMEANS_ITERATIONS = 16
+SIZE_PATTERN = re.compile(r"(\d+)x(\d+)\s+(?:character\s+)?sprite", re.IGNORECASE)
+
+
+def target_size(prompt: str) -> tuple[int, int] | None:
+    """Parse the intended sprite size ("32x32 sprite") out of a prompt."""
+    match = SIZE_PATTERN.search(prompt)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def border_palette(pixels: np.ndarray) -> np.ndarray:
+    """Dominant colours of the outermost pixel ring, taken as the backdrop.
+
+    DALL-E often paints a fake "transparency" checkerboard instead of a flat
+    backdrop, so every colour covering a meaningful share of the border is
+    returned rather than a single median. Colours are peeled off greedily:
+    the most common bucket seeds a cluster of everything within the key
+    tolerance, which is then removed before looking for the next one.
+    """
+    ring = np.concatenate([pixels[0], pixels[-1], pixels[:, 0], pixels[:, -1]])[:, :3].astype(np.float32)
+    colours = []
+    remaining = ring
+    while len(remaining) >= BORDER_MIN_SHARE * len(ring) and len(colours) < BORDER_MAX_COLOURS:
+        buckets = (remaining // BORDER_BUCKET).astype(np.int32)
+        codes = (buckets[:, 0] << 16) | (buckets[:, 1] << 8) | buckets[:, 2]
+        values, inverse, counts = np.unique(codes, return_inverse=True, return_counts=True)
+        seed = np.median(remaining[inverse.ravel() == np.argmax(counts)], axis=0)
+        member = np.linalg.norm(remaining - seed, axis=1) < KEY_TOLERANCE
+        if member.sum() < BORDER_MIN_SHARE * len(ring):
+            break
+        colours.append(np.median(remaining[member], axis=0))
+        remaining = remaining[~member]
+    if not colours:
+        colours.append(np.median(ring, axis=0))
+    return np.array(colours, dtype=np.float32)
+
+
+def background_distance(pixels: np.ndarray, palette: np.ndarray) -> np.ndarray:
+    """Per-pixel RGB distance to the nearest backdrop colour."""
+    rgb = pixels[..., :3].astype(np.float32)
+    return np.sqrt(((rgb[..., None, :] - palette) ** 2).sum(-1).min(-1))
+
+
+def crop_to_subject(pixels: np.ndarray, backdrop: np.ndarray) -> np.ndarray:
+    """Crop to a square around everything that differs from the backdrop."""
+    h, w = pixels.shape[:2]
+    # A strided view is plenty to find the bounding box and is 16x cheaper
+    dist = background_distance(pixels[::CROP_STRIDE, ::CROP_STRIDE], backdrop)
+    rows = np.flatnonzero((dist > SUBJECT_THRESHOLD).any(axis=1)) * CROP_STRIDE
+    cols = np.flatnonzero((dist > SUBJECT_THRESHOLD).any(axis=0)) * CROP_STRIDE
+    if rows.size == 0 or cols.size == 0:
+        return pixels
+    cy = (rows[0] + rows[-1] + 1) / 2.0
+    cx = (cols[0] + cols[-1] + 1) / 2.0
+    side = max(rows[-1] - rows[0], cols[-1] - cols[0]) + 1
+    side = min(int(side * (1.0 + 2 * SUBJECT_MARGIN)), h, w)
+    top = int(np.clip(round(cy - side / 2.0), 0, h - side))
+    left = int(np.clip(round(cx - side / 2.0), 0, w - side))
+    return pixels[top:top + side, left:left + side]
+
+
+def block_downscale(pixels: np.ndarray, width: int, height: int,
+                    background: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Downscale by taking the per-channel median of each output pixel's block.
+
+    Sampling a fixed grid of points per block and reducing with a median
+    keeps hard pixel-art edges and flat colours, where a box or bilinear
+    filter would smear them into new in-between colours.
+
+    With a ``background`` mask, backdrop samples are left out of the median
+    (so edge pixels take the subject's colour, not a blend with the
+    backdrop) and the per-block backdrop fraction is returned alongside.
+    """
+    h, w = pixels.shape[:2]
+    k = max(1, min(SAMPLES_PER_PIXEL, h // height, w // width))
+    ys = ((np.arange(height * k) + 0.5) * h / (height * k)).astype(np.intp)
+    xs = ((np.arange(width * k) + 0.5) * w / (width * k)).astype(np.intp)
+    blocks = pixels[ys[:, None], xs[None, :]].reshape(height, k, width, k, -1).astype(np.float32)
+    if background is None:
+        return np.median(blocks, axis=(1, 3)).astype(np.uint8), np.zeros((height, width))
+
+    mask = background[ys[:, None], xs[None, :]].reshape(height, k, width, k)
+    fraction = mask.mean(axis=(1, 3))
+    subject = np.where(mask[..., None], np.nan, blocks)
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # All-backdrop blocks
+        colour = np.nanmedian(subject, axis=(1, 3))
+    colour = np.where(np.isnan(colour), np.median(blocks, axis=(1, 3)), colour)
+    return colour.astype(np.uint8), fraction
+
+
+def flood_from_border(candidate: np.ndarray) -> np.ndarray:
+    """Cells of ``candidate`` 4-connected to the image border (vectorized dilation)."""
+    filled = np.zeros_like(candidate)
+    filled[[0, -1], :] = candidate[[0, -1], :]
+    filled[:, [0, -1]] = candidate[:, [0, -1]]
+    while True:
+        grown = filled.copy()
+        grown[1:] |= filled[:-1]
+        grown[:-1] |= filled[1:]
+        grown[:, 1:] |= filled[:, :-1]
+        grown[:, :-1] |= filled[:, 1:]
+        grown &= candidate
+        if np.array_equal(grown, filled):
+            return filled
+        filled = grown
+
+
+def touches(mask: np.ndarray) -> np.ndarray:
+    """Cells with at least one 4-neighbour set in ``mask``."""
+    near = np.zeros_like(mask)
+    near[1:] |= mask[:-1]
+    near[:-1] |= mask[1:]
+    near[:, 1:] |= mask[:, :-1]
+    near[:, :-1] |= mask[:, 1:]
+    return near
+
+
+def key_alpha(rgb: np.ndarray, fraction: np.ndarray, palette: np.ndarray) -> np.ndarray:
+    """Turn the backdrop into transparency, keeping outlines intact.
+
+    Cells mostly covered by backdrop and connected to the border become
+    transparent; enclosed backdrop-coloured areas (the hole of a CD, gaps
+    between fingers) stay opaque. Then one pass of edge cleanup drops the
+    anti-aliased fringe: cells next to the new transparency that are still
+    close to the backdrop colour. Dark outline pixels are far from any
+    backdrop colour and are never touched.
+    """
+    clear = flood_from_border(fraction >= KEY_COVERAGE)
+    fringe = touches(clear) & ~clear & (background_distance(rgb, palette) < KEY_TOLERANCE * FRINGE_FACTOR)
+    clear |= fringe & (fraction > 0)
+    return np.where(clear, 0, 255).astype(np.uint8)
+
+
+def quantize(pixels: np.ndarray, colors: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce an RGB(A) image to ``colors`` entries with k-means.
+
+    Returns ``(indices, palette)``. Fully transparent pixels, if any, get a
+    dedicated palette slot 0 so they survive as a tRNS entry.
+    """
+    h, w, channels = pixels.shape
+    flat = pixels.reshape(-1, channels).astype(np.float32)
+    opaque = flat[:, 3] > 0 if channels == 4 else np.ones(len(flat), dtype=bool)
+    data = flat[opaque, :3]
+    unique = np.unique(data, axis=0)
+    k = min(colors - (0 if opaque.all() else 1), len(unique))
+
+    if k <= 0:
+        centers = np.zeros((0, 3), dtype=np.float32)
+        labels = np.zeros(0, dtype=np.intp)
+    elif len(unique) <= k:
+        centers = unique
+        labels = np.argmin(((data[:, None, :] - centers[None]) ** 2).sum(-1), axis=1)
+    else:
+        # k-means++ seeding, then Lloyd iterations; all distances vectorized
+        rng = np.random.default_rng(seed)
+        centers = [data[rng.integers(len(data))]]
+        for _ in range(1, k):
+            d2 = ((data[:, None, :] - np.array(centers)[None]) ** 2).sum(-1).min(axis=1)
+            centers.append(data[rng.choice(len(data), p=d2 / d2.sum())])
+        centers = np.array(centers)
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmin(((data[:, None, :] - centers[None]) ** 2).sum(-1), axis=1)
+            sums = np.zeros_like(centers)
+            np.add.at(sums, labels, data)
+            counts = np.bincount(labels, minlength=k)[:, None]
+            moved = np.where(counts > 0, sums / np.maximum(counts, 1), centers)
+            if np.allclose(moved, centers):
+                break
+            centers = moved
+        labels = np.argmin(((data[:, None, :] - centers[None]) ** 2).sum(-1), axis=1)
+
+    offset = 0 if opaque.all() else 1
+    indices = np.zeros(len(flat), dtype=np.uint8)
+    indices[opaque] = labels + offset
+    palette = np.round(centers).astype(np.uint8)
+    if offset:
+        palette = np.vstack([np.zeros((1, 3), dtype=np.uint8), palette])
+    return indices.reshape(h, w), palette
+
+
+def to_indexed_png(indices: np.ndarray, palette: np.ndarray, transparent: bool) -> Image.Image:
+    """Build a PNG-8 image from palette indices (index 0 transparent if requested)."""
+    image = Image.fromarray(indices, mode="P")
+    image.putpalette(palette.flatten().tolist())
+    if transparent:
+        image.info["transparency"] = 0
+    return image
+
+
+def process_sprite(source: Path, width: int, height: int, colors: int, key: bool = True) -> Image.Image:
+    """Run the full post-processing chain on one raw sprite."""
+    pixels = np.asarray(Image.open(source).convert("RGB"))
+    backdrop = border_palette(pixels)
+    pixels = crop_to_subject(pixels, backdrop)
+    if not key:
+        small, _ = block_downscale(pixels, width, height)
+        indices, palette = quantize(small, colors)
+        return to_indexed_png(indices, palette, transparent=False)
+
+    background = background_distance(pixels, backdrop) < KEY_TOLERANCE
+    small, fraction = block_downscale(pixels, width, height, background)
+    rgba = np.dstack([small, key_alpha(small, fraction, backdrop)])
+    indices, palette = quantize(rgba, colors)
+    return to_indexed_png(indices, palette, transparent=bool((rgba[..., 3] == 0).any()))
+
+
+def save_png(image: Image.Image, path: Path) -> None:
+    """Save atomically so a crash never leaves a truncated sprite behind."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        image.save(tmp, format="PNG", optimize=True)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def stash_raw(asset: str, output_path: Path, width: int, height: int) -> Path | None:
+    """Locate the full-resolution source for an asset, stashing fresh output first.
+
+    A file in assets/ that is larger than its target size is raw generator
+    output: it is moved into art_raw/ before being replaced by the
+    processed sprite.
+    """
+    raw_path = RAW_DIR / f"{asset}.png"
+    if output_path.exists():
+        with Image.open(output_path) as image:
+            is_raw = image.width > width or image.height > height
+        if is_raw:
+            raw_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(output_path, raw_path)
+    return raw_path if raw_path.exists() else None
+
+
+def load_stamps() -> dict:
+    if STAMP_FILE.exists():
+        with open(STAMP_FILE) as f:
+            return json.load(f)
+    return {}
+
+
+def save_stamps(stamps: dict) -> None:
+    with open(STAMP_FILE, "w") as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+
+
+def _stamp(source: Path, width: int, height: int, colors: int, key: bool) -> dict:
+    return {"source_mtime": source.stat().st_mtime, "size": [width, height],
+            "colors": colors, "key": key}
+
+
+def sprite_state(asset: str, config: dict, stamps: dict,
+                 colors: int = DEFAULT_COLORS, key: bool = True) -> str:
+    """Classify a sprite as ``skip``, ``fresh`` or ``dirty`` without touching disk.
+
+    ``skip`` covers full-frame art (no sprite size in the prompt), palette
+    swaps built by tier_variants.py and sprites with no source yet.
+    """
+    size = target_size(config["prompt"])
+    if size is None or "variant_of" in config:
+        return "skip"
+    width, height = size
+    output_path = ASSETS_DIR / f"{asset}.png"
+    raw_path = RAW_DIR / f"{asset}.png"
+    if output_path.exists():
+        with Image.open(output_path) as image:
+            if image.width > width or image.height > height:
+                return "dirty"  # Fresh generator output waiting to be processed
+    if not raw_path.exists():
+        return "fresh" if output_path.exists() else "skip"
+    stamp = _stamp(raw_path, width, height, colors, key)
+    return "fresh" if output_path.exists() and stamps.get(asset) == stamp else "dirty"
+
+
+def prepare_job(asset: str, config: dict, colors: int = DEFAULT_COLORS,
+                key: bool = True) -> tuple[tuple, dict] | None:
+    """Stash the raw source for ``asset`` and return its process job and stamp."""
+    size = target_size(config["prompt"])
+    if size is None or "variant_of" in config:
+        return None
+    width, height = size
+    output_path = ASSETS_DIR / f"{asset}.png"
+    source = stash_raw(asset, output_path, width, height)
+    if source is None:
+        return None
+    job = (asset, str(source), str(output_path), width, height, colors, key)
+    return job, _stamp(source, width, height, colors, key)
+
+
+def _process_job(job: tuple) -> tuple[str, int, int]:
+    asset, source, output_path, width, height, colors, key = job
+    image = process_sprite(Path(source), width, height, colors, key)
+    save_png(image, Path(output_path))
+    return asset, Path(source).stat().st_size, Path(output_path).stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Downscale and palette-quantize generated sprites.")
+    parser.add_argument("--only", action="append", default=[], help="Glob over asset keys (repeatable)")
+    parser.add_argument("--colors", type=int, default=DEFAULT_COLORS, help="Palette size per sprite")
+    parser.add_argument("--no-key", action="store_true", help="Keep the generated backdrop opaque")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="Reprocess even if up to date")
+    args = parser.parse_args()
+
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+    (RAW_DIR / ".gdignore").touch()
+    stamps = load_stamps()
+
+    jobs = []
+    skipped = 0
+    for asset, config in ASSETS.items():
+        if args.only and not any(fnmatch.fnmatch(asset, pattern) for pattern in args.only):
+            continue
+        if target_size(config["prompt"]) is None:
+            continue  # Backgrounds and other full-frame art keep their resolution
+        if "variant_of" in config:
+            continue  # Derived from another sprite by tier_variants.py
+        if not args.force and sprite_state(asset, config, stamps, args.colors, not args.no_key) == "fresh":
+            skipped += 1
+            continue
+        prepared = prepare_job(asset, config, args.colors, not args.no_key)
+        if prepared is None:
+            print(f"SKIP (no source): {asset}")
+            continue
+        job, stamps[asset] = prepared
+        jobs.append(job)
+
+    print(f"=== Sprite Post-Processor ===")
+    print(f"Sprites to process: {len(jobs)} (up to date: {skipped})")
+
+    raw_total = out_total = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for asset, raw_bytes, out_bytes in pool.map(_process_job, jobs):
+            raw_total += raw_bytes
+            out_total += out_bytes
+            print(f"  {asset}: {raw_bytes // 1024} KB -> {out_bytes} bytes")
+    save_stamps(stamps)
+
+    if jobs:
+        print(f"Total: {raw_total / (1024 * 1024):.1f} MB -> {out_total / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Sprite-sheet batching for small icons.
+Members of a sheet in asset_manifest.SHEETS are generated together: one
+DALL-E request asks for a grid with one icon per cell, and the sheet is
+cut back into a raw image per member, which then goes through
+process_sprites.py like any other generator output. One request replaces
+one per icon, and icons drawn side by side share a style.
+
+Cells are found in the image rather than assumed. The backdrop comes
+from the sheet border (process_sprites.border_palette), foreground
+occupancy is projected onto columns and rows, and each cut between cells
+goes into the widest empty gutter near its nominal grid line (or the
+emptiest line there if icons touch). Each cell is then trimmed to its
+subject. An empty cell fails its asset rather than shipping a blank
+sprite.
+
+Usage:
+    python3 tools/sprite_sheets.py prompt sheets/ui_nav
+    python3 tools/sprite_sheets.py slice sheets/ui_nav --out /tmp/cells   # preview the cut
+"""
+
+import argparse
+import functools
+import math
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from asset_manifest import IMAGES, PIXEL_ART_ANCHOR, SHEETS
+from process_sprites import (RAW_DIR, SIZE_PATTERN, SUBJECT_MARGIN, SUBJECT_THRESHOLD, background_distance,
+                             border_palette, save_png)
+
+# --- Configuration ---
+SLICER_VERSION = 1  # Part of each member's cache key; bump when cutting changes
+GUTTER_OCCUPANCY = 0.002  # Lines with at most this share of foreground count as gutter
+CUT_SLACK = 0.6  # How far a cut may move from its grid line, as a fraction of half a cell
+MIN_SUBJECT_SHARE = 0.002  # A cell with less foreground than this is empty
+DETECT_SIZE = 256  # Detection runs on a strided view about this large
+
+
+class SheetError(ValueError):
+    pass
+
+
+def sheet_of(asset: str) -> str | None:
+    for name, sheet in SHEETS.items():
+        if asset in sheet["members"]:
+            return name
+    return None
+
+
+def members(name: str) -> list[str]:
+    return SHEETS[name]["members"]
+
+
+def grid(count: int) -> tuple[int, int]:
+    """Columns and rows for ``count`` cells, as square as possible."""
+    cols = math.ceil(math.sqrt(count))
+    return cols, math.ceil(count / cols)
+
+
+def sheet_path(name: str) -> Path:
+    return RAW_DIR / f"{name}.png"
+
+
+def subject(prompt: str) -> str:
+    """A member's prompt without the shared style anchor, sprite size or framing."""
+    before, _, after = prompt.partition(PIXEL_ART_ANCHOR)
+    extras = [part.strip() for part in after.split(",")
+              if part.strip() and not SIZE_PATTERN.search(part) and "centered" not in part]
+    return ", ".join([before.strip().rstrip(","), *extras])
+
+
+def sheet_config(name: str) -> dict:
+    """Manifest-style config (prompt, size, quality) for the sheet's single request."""
+    configs = [IMAGES[asset] for asset in members(name)]
+    sizes = {(config.get("size"), config.get("quality")) for config in configs}
+    if len(sizes) > 1:
+        raise SheetError(f"{name}: members ask for different image sizes or qualities")
+    cols, rows = grid(len(configs))
+    items = "; ".join(f"{i}) {subject(config['prompt'])}" for i, config in enumerate(configs, 1))
+    empty = cols * rows - len(configs)
+    prompt = (f"A sprite sheet of {len(configs)} separate game icons in a grid of {cols} columns and {rows} rows, "
+              f"each icon small and centered in its own cell, wide empty gutters of plain flat background "
+              f"between cells, nothing crossing into another cell, left to right then top to bottom: {items}"
+              f"{f'; the last {empty} cells empty' if empty else ''}, {PIXEL_ART_ANCHOR}, "
+              f"one consistent style and palette across all icons")
+    config = {"prompt": prompt}
+    size, quality = sizes.pop()
+    if size:
+        config["size"] = size
+    if quality:
+        config["quality"] = quality
+    return config
+
+
+def cell_params(params: dict, index: int) -> dict:
+    """Cache key parameters for one member: the sheet request plus where it was cut from."""
+    return {**params, "cell": index, "slicer": SLICER_VERSION}
+
+
+def cut_positions(occupancy: np.ndarray, parts: int) -> list[int]:
+    """Boundaries splitting a projected occupancy profile into ``parts`` cells."""
+    n = len(occupancy)
+    empty = occupancy <= GUTTER_OCCUPANCY
+    reach = n / parts / 2 * CUT_SLACK
+    cuts = [0]
+    for k in range(1, parts):
+        expected = k * n / parts
+        lo = max(cuts[-1] + 1, int(expected - reach))
+        hi = min(n - 1, int(math.ceil(expected + reach)))
+        gaps = np.flatnonzero(empty[lo:hi]) + lo
+        if gaps.size:
+            runs = np.split(gaps, np.flatnonzero(np.diff(gaps) > 1) + 1)
+            best = max(runs, key=lambda run: (len(run), -abs((run[0] + run[-1]) / 2 - expected)))
+            cuts.append(int(round((best[0] + best[-1]) / 2)))
+        else:
+            cuts.append(lo + int(np.argmin(occupancy[lo:hi])))
+    cuts.append(n)
+    return cuts
+
+
+def find_cells(pixels: np.ndarray, count: int) -> list[tuple[int, int, int, int] | None]:
+    """(left, top, right, bottom) of each member's subject in reading order, None for empty cells."""
+    h, w = pixels.shape[:2]
+    stride = max(1, min(h, w) // DETECT_SIZE)
+    small = pixels[::stride, ::stride]
+    foreground = background_distance(small, border_palette(pixels)) > SUBJECT_THRESHOLD
+    cols, rows = grid(count)
+    xs = cut_positions(foreground.mean(axis=0), cols)
+    ys = cut_positions(foreground.mean(axis=1), rows)
+
+    boxes = []
+    for i in range(count):
+        r, c = divmod(i, cols)
+        x0, x1, y0, y1 = xs[c], xs[c + 1], ys[r], ys[r + 1]
+        cell = foreground[y0:y1, x0:x1]
+        if cell.mean() < MIN_SUBJECT_SHARE:
+            boxes.append(None)
+            continue
+        used_rows = np.flatnonzero(cell.any(axis=1))
+        used_cols = np.flatnonzero(cell.any(axis=0))
+        margin = int(round(max(x1 - x0, y1 - y0) * SUBJECT_MARGIN))
+        left = max(x0, x0 + used_cols[0] - margin) * stride
+        top = max(y0, y0 + used_rows[0] - margin) * stride
+        right = min(w, min(x1, x0 + used_cols[-1] + 1 + margin) * stride)
+        bottom = min(h, min(y1, y0 + used_rows[-1] + 1 + margin) * stride)
+        boxes.append((int(left), int(top), int(right), int(bottom)))
+    return boxes
+
+
+@functools.lru_cache(maxsize=8)
+def _cells(path: str, mtime_ns: int, count: int) -> tuple:
+    pixels = np.asarray(Image.open(path).convert("RGB"))
+    return tuple(find_cells(pixels, count))
+
+
+def write_cell(name: str, index: int, output_path: Path) -> tuple[int, int]:
+    """Cut member ``index`` out of the sheet on disk into ``output_path``; returns its size."""
+    path = sheet_path(name)
+    box = _cells(str(path), path.stat().st_mtime_ns, len(members(name)))[index]
+    if box is None:
+        raise SheetError(f"{name}: cell {index + 1} is empty")
+    with Image.open(path) as sheet:
+        cell = sheet.convert("RGB").crop(box)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    save_png(cell, output_path)
+    return cell.size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show sheet prompts or preview how a sheet is cut.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    prompt = sub.add_parser("prompt", help="Print the request a sheet is generated from")
+    prompt.add_argument("sheet", choices=SHEETS)
+    cut = sub.add_parser("slice", help="Cut a sheet into its member images")
+    cut.add_argument("sheet", choices=SHEETS)
+    cut.add_argument("--out", type=Path, required=True, help="Directory for the cut images")
+    args = parser.parse_args()
+
+    if args.command == "prompt":
+        print(sheet_config(args.sheet)["prompt"])
+        return
+    if not sheet_path(args.sheet).exists():
+        raise SystemExit(f"No sheet at {sheet_path(args.sheet)}: run assetgen.py first")
+    for index, asset in enumerate(members(args.sheet)):
+        try:
+            width, height = write_cell(args.sheet, index, args.out / f"{asset}.png")
+            print(f"  {asset}: {width}x{height}")
+        except SheetError as e:
+            print(f"  {asset}: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Structured run telemetry for the asset pipeline.
+Generators wrap each phase of an asset's life in a span (queued, waiting
+for a slot or the rate limiter, request sent, first byte, body
+downloaded and decoded, written, post-processed) and Lyria sessions add
+time-to-first-chunk and capture speed versus real time. Events are
+written to a JSONL file, one Chrome trace event per line, as they happen,
+so a crashed run still leaves its trace behind. Each run replaces the
+file rather than appending to it.
+
+Every asset gets its own lane (a trace "thread" named after the asset), so
+spans from worker threads and Lyria coroutines line up per asset in a
+trace viewer. Lanes follow a context variable: assetgen sets it for each
+node and anything the node calls inherits it.
+
+Tracing is off until configure() is called; span() then costs a context
+variable lookup.
+
+Usage:
+    python3 tools/assetgen.py --trace /tmp/run.jsonl
+    python3 tools/telemetry.py summary /tmp/run.jsonl
+    python3 tools/telemetry.py chrome /tmp/run.jsonl /tmp/run.json   # open in Perfetto / chrome://tracing
+"""
+
+import argparse
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# --- Configuration ---
+PID = 1  # Single logical process in the trace, lanes are per asset
+HISTOGRAM_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60, 120)  # Seconds, upper bounds
+
+_lane: contextvars.ContextVar[str] = contextvars.ContextVar("telemetry_lane", default="pipeline")
+
+
+class Tracer:
+    """Writes Chrome trace events to a fresh JSONL file from any thread."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", buffering=1)
+        self._lock = threading.Lock()
+        self._lanes: dict[str, int] = {}
+        self._origin = time.perf_counter()
+
+    def now_us(self) -> float:
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def _tid(self, lane: str) -> int:
+        tid = self._lanes.get(lane)
+        if tid is None:
+            tid = self._lanes[lane] = len(self._lanes) + 1
+            self._write({"name": "thread_name", "ph": "M", "pid": PID, "tid": tid, "args": {"name": lane}})
+        return tid
+
+    def _write(self, event: dict) -> None:
+        self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+    def emit(self, event: dict, lane: str) -> None:
+        with self._lock:
+            event.update(pid=PID, tid=self._tid(lane))
+            self._write(event)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+_tracer: Tracer | None = None
+
+
+def configure(path: Path | None) -> None:
+    """Start writing events to ``path`` (None turns tracing off)."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+    _tracer = Tracer(path) if path else None
+
+
+def set_lane(lane: str) -> None:
+    """Attribute later events in this context (thread or task) to ``lane``."""
+    _lane.set(lane)
+
+
+@contextmanager
+def lane(name: str):
+    token = _lane.set(name)
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+@contextmanager
+def span(name: str, cat: str = "pipeline", **args):
+    """Record the enclosed block as a complete event; yields a dict for extra args."""
+    if _tracer is None:
+        yield args
+        return
+    start = _tracer.now_us()
+    try:
+        yield args
+    finally:
+        if _tracer is not None:
+            _tracer.emit({"name": name, "cat": cat, "ph": "X", "ts": round(start, 1),
+                          "dur": round(_tracer.now_us() - start, 1), "args": args}, _lane.get())
+
+
+def complete(name: str, start_us: float, cat: str = "pipeline", **args) -> None:
+    """Record a span that started at ``start_us`` (from now_us()) and ends now."""
+    if _tracer is not None:
+        _tracer.emit({"name": name, "cat": cat, "ph": "X", "ts": round(start_us, 1),
+                      "dur": round(_tracer.now_us() - start_us, 1), "args": args}, _lane.get())
+
+
+def mark(name: str, cat: str = "pipeline", **args) -> None:
+    """Record an instant event (e.g. first byte received)."""
+    if _tracer is not None:
+        _tracer.emit({"name": name, "cat": cat, "ph": "i", "s": "t", "ts": round(_tracer.now_us(), 1),
+                      "args": args}, _lane.get())
+
+
+def counter(name: str, cat: str = "pipeline", **values) -> None:
+    """Record counter values, drawn as a graph in the trace viewer."""
+    if _tracer is not None:
+        _tracer.emit({"name": name, "cat": cat, "ph": "C", "ts": round(_tracer.now_us(), 1),
+                      "args": values}, _lane.get())
+
+
+def now_us() -> float:
+    return _tracer.now_us() if _tracer is not None else 0.0
+
+
+# --- Summary ---
+
+
+def load(path: Path) -> list[dict]:
+    events = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                events.append(json.loads(line))
+    return events
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """Nearest-rank percentile, None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, round(q / 100 * len(ordered) + 0.5) - 1))]
+
+
+def histogram(values: list[float]) -> dict[str, int]:
+    counts = {}
+    for value in values:
+        bound = next((b for b in HISTOGRAM_BUCKETS if value <= b), None)
+        label = f"<={bound}s" if bound is not None else f">{HISTOGRAM_BUCKETS[-1]}s"
+        counts[label] = counts.get(label, 0) + 1
+    order = [f"<={b}s" for b in HISTOGRAM_BUCKETS] + [f">{HISTOGRAM_BUCKETS[-1]}s"]
+    return {label: counts[label] for label in order if label in counts}
+
+
+def critical_path(nodes: dict[str, dict]) -> list[dict]:
+    """Chain of node spans that gated the end of the run.
+
+    Starts from the node that finished last and repeatedly steps to the
+    dependency that finished last, i.e. the one it was waiting for.
+    """
+    path = []
+    current = max(nodes.values(), key=lambda e: e["ts"] + e["dur"], default=None)
+    while current is not None:
+        path.append(current)
+        deps = [nodes[d] for d in current["args"].get("deps", []) if d in nodes]
+        current = max(deps, key=lambda e: e["ts"] + e["dur"], default=None)
+    return path[::-1]
+
+
+def summarize(events: list[dict]) -> dict:
+    """Per-span-name latency stats, Lyria stream stats and the critical path."""
+    lanes = {e["tid"]: e["args"]["name"] for e in events if e.get("ph") == "M"}
+    spans = [e for e in events if e.get("ph") == "X"]
+    if not spans:
+        return {"wall_s": 0.0, "spans": {}, "lyria": [], "critical_path": []}
+
+    by_name: dict[str, list[float]] = {}
+    for e in spans:
+        by_name.setdefault(f"{e['cat']}:{e['name']}", []).append(e["dur"] / 1e6)
+    stats = {
+        name: {"count": len(values), "total_s": round(sum(values), 3),
+               "p50_s": round(percentile(values, 50), 4), "p95_s": round(percentile(values, 95), 4),
+               "max_s": round(max(values), 4), "histogram": histogram(values)}
+        for name, values in sorted(by_name.items())
+    }
+
+    lyria = [{"track": lanes.get(e["tid"], "?"), **e["args"]}
+             for e in spans if e["cat"] == "lyria" and e["name"] == "stream"]
+    nodes = {e["args"]["node"]: e for e in spans if e["cat"] == "node"}
+    path = critical_path(nodes)
+    start = min(e["ts"] for e in spans)
+    end = max(e["ts"] + e["dur"] for e in spans)
+    return {
+        "wall_s": round((end - start) / 1e6, 3),
+        "spans": stats,
+        "lyria": lyria,
+        "critical_path": [{"node": e["args"]["node"], "start_s": round((e["ts"] - start) / 1e6, 3),
+                           "dur_s": round(e["dur"] / 1e6, 3)} for e in path],
+    }
+
+
+def print_summary(summary: dict) -> None:
+    print(f"=== Trace Summary ({summary['wall_s']:.2f}s) ===")
+    print(f"  {'span':<32} {'count':>5} {'total':>8} {'p50':>8} {'p95':>8} {'max':>8}")
+    for name, s in summary["spans"].items():
+        print(f"  {name:<32} {s['count']:>5} {s['total_s']:>7.2f}s {s['p50_s']:>7.3f}s "
+              f"{s['p95_s']:>7.3f}s {s['max_s']:>7.3f}s")
+    for stream in summary["lyria"]:
+        print(f"  lyria {stream['track']}: first chunk {stream.get('ttfc_s', 0):.2f}s, "
+              f"{stream.get('audio_s', 0):.1f}s audio at {stream.get('realtime_factor', 0):.1f}x real time")
+    if summary["critical_path"]:
+        print("  Critical path:")
+        for step in summary["critical_path"]:
+            print(f"    {step['start_s']:>8.2f}s  +{step['dur_s']:.2f}s  {step['node']}")
+
+
+def to_chrome(events: list[dict]) -> dict:
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize or convert pipeline traces.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    summary = sub.add_parser("summary", help="Latency histograms, Lyria stats and the critical path")
+    summary.add_argument("trace", type=Path)
+    summary.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    chrome = sub.add_parser("chrome", help="Convert JSONL to a Chrome/Perfetto trace file")
+    chrome.add_argument("trace", type=Path)
+    chrome.add_argument("out", type=Path)
+    args = parser.parse_args()
+
+    events = load(args.trace)
+    if args.command == "summary":
+        result = summarize(events)
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print_summary(result)
+    elif args.command == "chrome":
+        with open(args.out, "w") as f:
+            json.dump(to_chrome(events), f)
+        print(f"Wrote {len(events)} events to {args.out} ({os.path.getsize(args.out) // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
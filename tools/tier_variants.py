@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Palette-swap tier variants for Music Label Tycoon sprites.
+Tier families (the CD tiers) differ mainly in colour scheme, so instead of
+one paid DALL-E call per tier, manifest entries with a "variant_of" key are
+derived locally from the processed base sprite:
+
+    "variant_of": "sprites/cds/cd_demo",
+    "remap": {"hue": 215, "min_saturation": 0.55},
+    "overlays": [{"effect": "sprites/effects/particle_sparkle", "at": [22, 2]}],
+
+The remap runs on the whole sprite at once in HSV space. ``hue`` replaces
+the hue (``hue_shift`` rotates it, ``rainbow`` sweeps it around the sprite
+centre), ``saturation``/``value`` scale it and ``min_saturation`` lets a
+grey base pick up the new colour. Near-black outline pixels keep their
+value, so the outline survives any tint. Overlays composite processed
+sprites/effects/* art over (or ``under``, for auras) the result at integer
+``scale``, and the variant is re-quantized like any processed sprite.
+
+The whole family renders in milliseconds, and every tier shares the base's
+shapes and shading, so the set stays stylistically consistent.
+
+Usage:
+    python3 tools/tier_variants.py
+    python3 tools/tier_variants.py --only "sprites/cds/*" --force
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import process_sprites
+from asset_manifest import IMAGES
+from process_sprites import ASSETS_DIR, DEFAULT_COLORS
+
+# --- Configuration ---
+VERSION = 1  # Part of the stamp; bump when the remap changes
+OUTLINE_VALUE = 0.12  # Pixels darker than this are outline and keep their colour
+
+
+def variants() -> dict[str, dict]:
+    return {asset: config for asset, config in IMAGES.items() if "variant_of" in config}
+
+
+def rgb_to_hsv(rgb: np.ndarray) -> np.ndarray:
+    """Vectorized RGB -> HSV for float arrays in [0, 1]; hue in [0, 1)."""
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    high = rgb.max(axis=-1)
+    low = rgb.min(axis=-1)
+    delta = high - low
+    safe = np.where(delta > 0, delta, 1.0)
+    hue = np.select(
+        [high == r, high == g],
+        [((g - b) / safe) % 6.0, (b - r) / safe + 2.0],
+        (r - g) / safe + 4.0,
+    ) / 6.0
+    hue = np.where(delta > 0, hue, 0.0)
+    saturation = np.where(high > 0, delta / np.where(high > 0, high, 1.0), 0.0)
+    return np.stack([hue, saturation, high], axis=-1)
+
+
+def hsv_to_rgb(hsv: np.ndarray) -> np.ndarray:
+    """Vectorized HSV -> RGB, the inverse of rgb_to_hsv."""
+    h, s, v = hsv[..., 0] * 6.0, hsv[..., 1], hsv[..., 2]
+    sector = np.floor(h).astype(np.int64) % 6
+    f = h - np.floor(h)
+    p, q, t = v * (1 - s), v * (1 - s * f), v * (1 - s * (1 - f))
+    choices = [(v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q)]
+    channels = [np.choose(sector, [c[i] for c in choices]) for i in range(3)]
+    return np.stack(channels, axis=-1)
+
+
+def remap(rgba: np.ndarray, hue: float | None = None, hue_shift: float = 0.0, rainbow: bool = False,
+          saturation: float = 1.0, min_saturation: float = 0.0, value: float = 1.0) -> np.ndarray:
+    """Recolour an RGBA uint8 sprite; angles are in degrees."""
+    hsv = rgb_to_hsv(rgba[..., :3].astype(np.float32) / 255.0)
+    h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+    outline = v < OUTLINE_VALUE
+
+    if rainbow:
+        ys, xs = np.indices(h.shape)
+        cy, cx = (np.array(h.shape) - 1) / 2.0
+        h = (np.arctan2(ys - cy, xs - cx) / (2 * np.pi) + (hue or 0.0) / 360.0) % 1.0
+    elif hue is not None:
+        h = np.full_like(h, hue / 360.0)
+    h = (h + hue_shift / 360.0) % 1.0
+    s = np.clip(np.maximum(s * saturation, min_saturation), 0.0, 1.0)
+    v = np.clip(v * value, 0.0, 1.0)
+
+    recoloured = hsv_to_rgb(np.stack([h, s, v], axis=-1))
+    rgb = np.where(outline[..., None], rgba[..., :3] / 255.0, recoloured)
+    return np.dstack([np.round(rgb * 255.0).astype(np.uint8), rgba[..., 3]])
+
+
+def composite(base: np.ndarray, effect: np.ndarray, at: tuple[int, int], mode: str = "over",
+              opacity: float = 1.0) -> np.ndarray:
+    """Alpha-composite ``effect`` onto ``base`` at pixel offset ``at`` (clipped to the sprite)."""
+    out = base.astype(np.float32) / 255.0
+    x, y = at
+    h, w = out.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + effect.shape[1], w), min(y + effect.shape[0], h)
+    if x0 >= x1 or y0 >= y1:
+        return base
+    src = effect[y0 - y:y1 - y, x0 - x:x1 - x].astype(np.float32) / 255.0
+    dst = out[y0:y1, x0:x1]
+    src_a = src[..., 3:] * opacity
+    dst_a = dst[..., 3:]
+
+    if mode == "add":
+        rgb = np.clip(dst[..., :3] + src[..., :3] * src_a, 0.0, 1.0)
+        alpha = np.maximum(dst_a, src_a)
+    else:
+        top, top_a, bottom, bottom_a = (src, src_a, dst, dst_a) if mode == "over" else (dst, dst_a, src, src_a)
+        alpha = top_a + bottom_a * (1 - top_a)
+        rgb = (top[..., :3] * top_a + bottom[..., :3] * bottom_a * (1 - top_a)) / np.maximum(alpha, 1e-6)
+    out[y0:y1, x0:x1] = np.dstack([rgb, alpha])
+    return np.round(out * 255.0).astype(np.uint8)
+
+
+def load_rgba(asset: str, root: Path = ASSETS_DIR) -> np.ndarray:
+    with Image.open(root / f"{asset}.png") as image:
+        return np.asarray(image.convert("RGBA"))
+
+
+def render_variant(config: dict, colors: int = DEFAULT_COLORS, root: Path = ASSETS_DIR) -> Image.Image:
+    """Derive one variant from its (already processed) base sprite under ``root``."""
+    rgba = remap(load_rgba(config["variant_of"], root), **config.get("remap", {}))
+    for overlay in config.get("overlays", []):
+        effect = load_rgba(overlay["effect"], root)
+        scale = overlay.get("scale", 1)
+        if scale != 1:
+            effect = effect.repeat(scale, axis=0).repeat(scale, axis=1)
+        rgba = composite(rgba, effect, tuple(overlay.get("at", (0, 0))), overlay.get("mode", "over"),
+                         overlay.get("opacity", 1.0))
+    indices, palette = process_sprites.quantize(rgba, colors)
+    return process_sprites.to_indexed_png(indices, palette, transparent=bool((rgba[..., 3] == 0).any()))
+
+
+def inputs(config: dict) -> list[str]:
+    """Processed sprites a variant is built from, without repeats."""
+    effects = [overlay["effect"] for overlay in config.get("overlays", [])]
+    return list(dict.fromkeys([config["variant_of"], *effects]))
+
+
+def _stamp(config: dict, colors: int) -> dict | None:
+    digest = hashlib.sha256(json.dumps([VERSION, colors, config], sort_keys=True).encode())
+    for asset in inputs(config):
+        path = ASSETS_DIR / f"{asset}.png"
+        if not path.exists():
+            return None
+        digest.update(path.read_bytes())
+    return {"variant": digest.hexdigest()}
+
+
+def _ready(asset: str) -> bool:
+    """True once an input sprite exists at its processed size (not raw generator output)."""
+    path = ASSETS_DIR / f"{asset}.png"
+    size = process_sprites.target_size(IMAGES[asset]["prompt"])
+    if not path.exists() or size is None:
+        return path.exists()
+    with Image.open(path) as image:
+        return image.width <= size[0] and image.height <= size[1]
+
+
+def variant_state(asset: str, config: dict, stamps: dict, colors: int = DEFAULT_COLORS) -> str:
+    """``skip`` until every input is processed, then ``fresh`` or ``dirty`` by stamp."""
+    if not all(_ready(source) for source in inputs(config)):
+        return "skip"
+    output_path = ASSETS_DIR / f"{asset}.png"
+    fresh = output_path.exists() and stamps.get(asset) == _stamp(config, colors)
+    return "fresh" if fresh else "dirty"
+
+
+def build_variant(asset: str, config: dict, stamps: dict, colors: int = DEFAULT_COLORS) -> int | None:
+    """Render and save one variant, updating ``stamps``. Returns the output size in bytes."""
+    if not all(_ready(source) for source in inputs(config)):
+        return None
+    output_path = ASSETS_DIR / f"{asset}.png"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    process_sprites.save_png(render_variant(config, colors), output_path)
+    stamps[asset] = _stamp(config, colors)
+    return output_path.stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derive tier variants from base sprites by palette remapping.")
+    parser.add_argument("--only", action="append", default=[], help="Glob over asset keys (repeatable)")
+    parser.add_argument("--colors", type=int, default=DEFAULT_COLORS, help="Palette size per sprite")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    args = parser.parse_args()
+
+    stamps = process_sprites.load_stamps()
+    built = fresh = 0
+    start = time.perf_counter()
+    print("=== Tier Variants ===")
+    for asset, config in variants().items():
+        if args.only and not any(fnmatch.fnmatch(asset, pattern) for pattern in args.only):
+            continue
+        state = variant_state(asset, config, stamps, args.colors)
+        if state == "skip":
+            print(f"SKIP (base not processed): {asset}")
+            continue
+        if state == "fresh" and not args.force:
+            fresh += 1
+            continue
+        size = build_variant(asset, config, stamps, args.colors)
+        built += 1
+        print(f"  {asset} <- {config['variant_of']} ({size} bytes)")
+    process_sprites.save_stamps(stamps)
+    print(f"Built {built} variants in {(time.perf_counter() - start) * 1000:.0f} ms (up to date: {fresh})")
+
+
+if __name__ == "__main__":
+    main()